@@ -13,6 +13,7 @@ from introspective_parser_module.models import (
     AetheroIntrospectiveEntity,
     ASLCognitiveTag
 )
+from introspective_parser_module.tag_store import ColumnarTagStore
 
 def create_sample_scenarios():
     """Vytvorí vzorové scenáre pre demonstráciu kognitívnych stavov"""
@@ -178,8 +179,14 @@ def demonstrate_validation_errors():
         except ValueError as e:
             print(f"   ✅ Validácia správne zachytila chybu: {str(e).split(',')[0]}")
 
-def export_demo_results(tags):
-    """Exportuje výsledky demo do JSON súboru"""
+def export_demo_results(tags, export_format="json"):
+    """Exportuje výsledky demo do JSON súboru (alebo do stĺpcového úložiska)"""
+    
+    if export_format == "columnar":
+        store = ColumnarTagStore("aethero_demo_tag_store")
+        store.append(tag for tag in tags if tag)
+        print(f"\n💾 Výsledky pripojené do: {store.directory} ({len(store)} tagov)")
+        return
     
     export_data = {
         "export_timestamp": datetime.now().isoformat(),
@@ -213,6 +220,13 @@ def export_demo_results(tags):
 def main():
     """Hlavná funkcia demo aplikácie"""
     
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Aethero Introspective Demo')
+    parser.add_argument('--format', choices=['json', 'columnar'], default='json',
+                        help='Export format (columnar appends to the memmap-readable tag store)')
+    args = parser.parse_args()
+    
     print("🚀 AETHERO INTROSPECTIVE DEMO - Pydantic v2")
     print("=" * 60)
     print("Demonštrácia kognitívnych tagov s modernizovanými modelmi")
@@ -231,7 +245,7 @@ def main():
     demonstrate_validation_errors()
     
     # Export výsledkov
-    export_demo_results(created_tags)
+    export_demo_results(created_tags, args.format)
     
     # Súhrn
     print(f"\n{'='*60}")
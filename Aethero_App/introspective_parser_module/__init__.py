@@ -6,16 +6,27 @@ with cognitive coherence analysis, consciousness tracking, and constitutional co
 
 Core Components:
 - ASLMetaParser: Advanced introspective parser with cognitive flow tracking
+- scan_line / ASLDialect: Single-pass front-end for the comment, brace and inline ASL dialects
 - ASLCognitiveTag: Sophisticated cognitive tag model with built-in validation
+- CompactCognitiveTag: Slotted in-memory tag with enum codes and lazy ids, accepted by the analyzers
 - CognitiveMetricsAnalyzer: Deep cognitive analysis and coherence metrics
+- AetheroCognitiveAnalyzer: Cognitive analyzer with Python and vectorized NumPy backends
+- OnlineCognitiveAnalyzer: Real-time analyzer with O(1) update per tag
+- BoundedHistory: Ring buffer with retention and spill-to-disk for long-running histories
 - AetheroReflectionAgent: Full introspective reflection and analysis agent
+- CognitiveEngines: Shared, pre-warmed engines with per-request sessions
+- CognitiveExecutor: Inline, thread or process pool execution with a bounded job queue
+- ResultCache: Content-addressed LRU/TTL result cache with an optional shared tier
+- parse_file_parallel / parse_document_parallel: Chunked multi-process parsing of large documents
+- IncrementalASLParser: Re-parses only the changed lines of resubmitted documents
 
 Legacy Components (for backward compatibility):
 - ASLTagModel: Alias for ASLCognitiveTag
 - ReflectionAgent: Simplified wrapper for AetheroReflectionAgent
 """
 
-from .parser import ASLMetaParser, IntrospectiveLogger
+from .parser import ASLMetaParser, IntrospectiveLogger, CognitiveLogPolicy, configure_cognitive_logging
+from .asl_frontend import ASLBlock, ASLDialect, scan_line, iter_asl_blocks
 from .models import (
     ASLCognitiveTag, 
     ASLTagModel,  # Alias for backward compatibility
@@ -24,17 +35,32 @@ from .models import (
     EmotionToneEnum, 
     TemporalContextEnum
 )
+from .compact_tags import CompactCognitiveTag, compact_tags
+from .tag_store import ColumnarTagStore
+from .tag_query import TagQuery, TagQueryEngine
+from .text_index import CognitiveTextIndex, TextSearchHit
+from .memory_recall import MemoryRecallIndex, HashingVectorizer, RecallHit
+from .report_archive import ReportArchive, ArchivedReport
 from .metrics import (
     CognitiveMetricsAnalyzer,
+    AetheroCognitiveAnalyzer,
+    CognitiveMetricsBackend,
     # The following legacy functions are not implemented in metrics.py and are commented out to prevent ImportError
     # calculate_success_rate,
     # analyze_cognitive_load,
     # generate_introspection_report
 )
+from .bounded_history import BoundedHistory, HistoryPolicy
+from .online_metrics import OnlineCognitiveAnalyzer, create_online_analyzer
 from .reflection_agent import AetheroReflectionAgent, ReflectionAgent
+from .engines import CognitiveEngines, get_shared_engines
+from .executor import CognitiveExecutor, ExecutionBackend, ExecutorSaturatedError
+from .result_cache import ResultCache
+from .parallel_parsing import parse_file_parallel, parse_document_parallel
+from .incremental_parsing import IncrementalASLParser
 
 # Version and module metadata
-__version__ = "2.0.0-introspective"
+__version__ = "2.1.0-introspective"
 __author__ = "Aethero Introspective Systems Ministry"
 __description__ = "Advanced introspective parsing system for Aethero consciousness architecture"
 
@@ -42,10 +68,43 @@ __description__ = "Advanced introspective parsing system for Aethero consciousne
 __all__ = [
     # Core Introspective Components
     "ASLMetaParser",
+    "ASLBlock",
+    "ASLDialect",
+    "scan_line",
+    "iter_asl_blocks",
     "ASLCognitiveTag", 
+    "CompactCognitiveTag",
+    "compact_tags",
+    "ColumnarTagStore",
+    "TagQuery",
+    "TagQueryEngine",
+    "CognitiveTextIndex",
+    "TextSearchHit",
+    "MemoryRecallIndex",
+    "HashingVectorizer",
+    "RecallHit",
+    "ReportArchive",
+    "ArchivedReport",
     "CognitiveMetricsAnalyzer",
+    "AetheroCognitiveAnalyzer",
+    "CognitiveMetricsBackend",
+    "OnlineCognitiveAnalyzer",
+    "create_online_analyzer",
+    "BoundedHistory",
+    "HistoryPolicy",
     "AetheroReflectionAgent",
+    "CognitiveEngines",
+    "get_shared_engines",
+    "CognitiveExecutor",
+    "ExecutionBackend",
+    "ExecutorSaturatedError",
+    "ResultCache",
+    "parse_file_parallel",
+    "parse_document_parallel",
+    "IncrementalASLParser",
     "IntrospectiveLogger",
+    "CognitiveLogPolicy",
+    "configure_cognitive_logging",
     "AetheroIntrospectiveEntity",
     
     # Enums for structured cognitive states
@@ -0,0 +1,181 @@
+"""
+Unified front-end for the three ASL dialects
+
+ASL tags appear in three syntaxes:
+
+- comment:  ``# [ASL] thought_stream: ... mental_state: focused``  (whole line)
+- brace:    ``{mental_state: 'focused', certainty_level: 0.85}``
+- inline:   ``[@cognitive_load:7 @certainty:0.85 @mental_state:focused] free text``
+
+scan_line() finds the blocks of every dialect in one left-to-right pass over a
+line and emits them as ASLBlock records with canonical key names and raw
+(unconverted) values, so parsing, validation and metrics consume a single
+normalized component stream no matter how a document mixes the dialects.
+
+Blocks are line-local - a brace or inline block must close on the line it
+opens. The line stays the unit of parsing, which keeps chunked parallel and
+incremental re-parsing exact. Braces and brackets are common in code and
+prose, so a brace or inline block counts only when at least one of its keys
+is an ASLCognitiveTag field (or a legacy/short alias of one); the comment
+dialect is marked explicitly and needs no such check.
+"""
+
+from typing import Iterable, Iterator, List, NamedTuple, Tuple
+from enum import Enum
+import re
+
+from .asl_scanner import scan_key_values
+from .models import ASLCognitiveTag
+
+
+class ASLDialect(str, Enum):
+    """Syntax in which an ASL block was written"""
+    COMMENT = "comment"
+    BRACE = "brace"
+    INLINE = "inline"
+
+
+class ASLBlock(NamedTuple):
+    """One ASL block of a line - pairs carry canonical keys and stripped raw values"""
+    dialect: ASLDialect
+    start: int
+    end: int
+    pairs: List[Tuple[str, str]]
+
+
+# Any block opener - one search per block instead of one pass per dialect; the
+# single-character prefix search skips plain text at C speed
+_OPENER_START = re.compile(r'[#{[]')
+_BLOCK_OPENER = re.compile(r'(?P<comment>#\s*\[ASL\])|(?P<brace>\{)|(?P<inline>\[@)', re.IGNORECASE)
+_INLINE_KEY = re.compile(r'@(\w+)\s*:')
+_IDENTIFIER = re.compile(r'\w+')
+
+# Short forms used by the inline dialect
+KEY_ALIASES = {
+    'certainty': 'certainty_level',
+    'emotion': 'emotion_tone',
+}
+
+
+# Keys that make a brace or inline block ASL - tag fields plus the legacy
+# names ASLMetaParser._map_legacy_fields() still maps
+ASL_FIELD_NAMES = frozenset(ASLCognitiveTag.model_fields) | {'statement', 'law'}
+
+
+def _is_asl(pairs: List[Tuple[str, str]]) -> bool:
+    return any(key in ASL_FIELD_NAMES for key, _ in pairs)
+
+
+def _canonical_key(key: str) -> str:
+    return KEY_ALIASES.get(key, key)
+
+
+def _brace_pairs(content: str) -> List[Tuple[str, str]]:
+    """``key: value, key: value`` - keys that are not identifiers (dict literals, prose) are skipped"""
+    pairs = []
+    for pair in content.split(','):
+        key, colon, value = pair.partition(':')
+        key = key.strip()
+        if colon and _IDENTIFIER.fullmatch(key):
+            pairs.append((_canonical_key(key), value.strip()))
+    return pairs
+
+
+def _inline_pairs(content: str) -> List[Tuple[str, str]]:
+    """``@key:value @key:value`` - a value runs up to the next @key: token"""
+    pairs = []
+    tokens = list(_INLINE_KEY.finditer(content))
+    for index, token in enumerate(tokens):
+        value_end = tokens[index + 1].start() if index + 1 < len(tokens) else len(content)
+        pairs.append((_canonical_key(token.group(1)), content[token.end():value_end].strip()))
+    return pairs
+
+
+def scan_line(line: str) -> List[ASLBlock]:
+    """
+    Find the ASL blocks of one line in a single pass
+
+    A comment block must start the line and takes the rest of it. Brace and
+    inline blocks may appear anywhere and several times; an inline block
+    without thought_stream takes the free text that follows it (up to the
+    next block) as its thought_stream.
+
+    Args:
+        line: Single line of text without line terminator
+
+    Returns:
+        Blocks in line order; empty when the line has no ASL
+    """
+    blocks: List[ASLBlock] = []
+    position = 0
+    # Opener kinds whose closing character does not occur after position
+    unclosed = set()
+
+    while True:
+        candidate = _OPENER_START.search(line, position)
+        if candidate is None:
+            break
+        opener = _BLOCK_OPENER.match(line, candidate.start())
+        if opener is None:
+            position = candidate.end()
+            continue
+        kind = opener.lastgroup
+        position = opener.end()
+
+        if kind == 'comment':
+            if line[:opener.start()].strip():
+                # Only a whole-line comment is an ASL comment
+                continue
+            content = line[position:].strip()
+            if content:
+                pairs = [(KEY_ALIASES.get(key, key), value) for key, value in scan_key_values(content)]
+                _append_block(blocks, line, ASLBlock(ASLDialect.COMMENT, opener.start(), len(line), pairs))
+            break
+
+        if kind in unclosed:
+            continue
+        closing = line.find('}' if kind == 'brace' else ']', position)
+        if closing == -1:
+            unclosed.add(kind)
+            continue
+        if kind == 'brace':
+            block = ASLBlock(ASLDialect.BRACE, opener.start(), closing + 1, _brace_pairs(line[position:closing]))
+        else:
+            # Keep the '@' of the opener - it belongs to the first key
+            block = ASLBlock(ASLDialect.INLINE, opener.start(), closing + 1, _inline_pairs(line[position - 1:closing]))
+        if _is_asl(block.pairs):
+            _append_block(blocks, line, block)
+            position = closing + 1
+
+    if blocks:
+        _attach_free_text(blocks[-1], line[blocks[-1].end:])
+    return blocks
+
+
+def _append_block(blocks: List[ASLBlock], line: str, block: ASLBlock) -> None:
+    if blocks:
+        _attach_free_text(blocks[-1], line[blocks[-1].end:block.start])
+    blocks.append(block)
+
+
+def _attach_free_text(block: ASLBlock, text: str) -> None:
+    """Free text after an inline block is its thought_stream unless the block names one"""
+    if block.dialect is not ASLDialect.INLINE:
+        return
+    text = text.strip()
+    if text and all(key not in ('thought_stream', 'statement') for key, _ in block.pairs):
+        block.pairs.append(('thought_stream', text))
+
+
+def iter_asl_blocks(lines: Iterable[str]) -> Iterator[Tuple[int, List[ASLBlock]]]:
+    """
+    Normalized block stream of a document
+
+    Yields:
+        (1-based line number, blocks) for every line that contains ASL
+    """
+    for line_number, line in enumerate(lines, 1):
+        blocks = scan_line(line)
+        if blocks:
+            yield line_number, blocks
+
@@ -0,0 +1,76 @@
+"""
+Linear-time key/value scanner for ASL comment lines
+
+The original key_value pattern ``(\\w+):\\s*(.+?)(?=\\s*\\w+:|$)`` re-runs its
+lookahead after every character of a value, so a long thought_stream costs
+close to O(n^2) per line and a hostile line can stall a worker. scan_key_values()
+produces the same pairs in a single left-to-right pass: key tokens are found
+only at word boundaries, and each value runs from its first non-space
+character to the whitespace before the next key token.
+
+Differences from the regex are deliberate and limited to quoted values: a
+value that starts with ' or " extends at least to its closing quote, so
+"note: see below" stays one value instead of starting a new key.
+"""
+
+from typing import List, Tuple
+import re
+
+# Reference pattern the scanner replaces - kept for regression comparisons
+LEGACY_KEY_VALUE_PATTERN = re.compile(r'(\w+):\s*(.+?)(?=\s*\w+:|$)')
+
+# A key token starts at a word boundary, so each word run is tried once
+_KEY_TOKEN = re.compile(r'(?<!\w)(\w+):')
+_WHITESPACE = re.compile(r'\s*')
+_QUOTES = frozenset('"\'')
+
+
+def scan_key_values(content: str) -> List[Tuple[str, str]]:
+    """
+    Split the content of one ASL comment into (key, raw value) pairs
+
+    Args:
+        content: Text after ``# [ASL]`` on a single line (no newlines)
+
+    Returns:
+        Pairs in line order, values unstripped exactly as the legacy
+        key_value regex returns them with findall()
+    """
+    pairs: List[Tuple[str, str]] = []
+    length = len(content)
+    token = _KEY_TOKEN.search(content)
+    if token is None:
+        return pairs
+    key, key_end = token.group(1), token.end()
+
+    while True:
+        value_start = _WHITESPACE.match(content, key_end).end()
+        if value_start == length:
+            # Only whitespace after the colon - the value is its last character
+            if value_start > key_end:
+                pairs.append((key, content[-1]))
+            return pairs
+
+        search_from = value_start
+        if content[value_start] in _QUOTES:
+            closing = content.find(content[value_start], value_start + 1)
+            if closing != -1:
+                search_from = closing + 1
+
+        token = _KEY_TOKEN.search(content, search_from)
+        # A value is at least one character, so a one-letter key right at the value start is part of it
+        while token is not None and token.start() == value_start and len(token.group(1)) == 1:
+            token = _KEY_TOKEN.search(content, token.end())
+
+        if token is None:
+            pairs.append((key, content[value_start:]))
+            return pairs
+
+        if token.start() == value_start:
+            # Longer key at the value start: the value takes its first character, the key the rest
+            pairs.append((key, content[value_start]))
+            key, key_end = token.group(1)[1:], token.end()
+            continue
+
+        pairs.append((key, content[value_start:token.start()].rstrip()))
+        key, key_end = token.group(1), token.end()
@@ -0,0 +1,247 @@
+"""
+Columnar batch validation for ASL cognitive tags
+
+ASLBatchValidator checks the same enum, range and coherence rules as
+ASLCognitiveTag, but over whole columns of components at once and without
+constructing a Pydantic model (uuid4, datetime.now(), two root validators and
+a .dict() round trip) per row. Model objects are materialized only on demand.
+"""
+
+from typing import Dict, Any, List, Optional, Sequence, Mapping, Iterator, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime
+import math
+import uuid
+
+from .models import ASLCognitiveTag, MentalStateEnum, EmotionToneEnum, TemporalContextEnum
+
+# Messages mirror the root validators of ASLCognitiveTag
+CALM_HIGH_LOAD_ERROR = "Vysoká kognitívna záťaž nie je kompatibilná s pokojným stavom"
+CONFUSED_LOW_LOAD_ERROR = "Nízka kognitívna záťaž pri zmätenom stave je nekonzistentná"
+UNCERTAIN_HIGH_CERTAINTY_ERROR = "Vysoká istota pri neistom stave je protirečenie"
+DECISIVE_LOW_CERTAINTY_ERROR = "Nízka istota pri rozhodnom stave je nelogická"
+
+REQUIRED_STRING_FIELDS = ("thought_stream", "aeth_mem_link", "constitutional_law")
+OPTIONAL_STRING_FIELDS = ("enhancement_suggestion", "diplomatic_enhancement", "entity_id")
+OPTIONAL_UNIT_FLOAT_FIELDS = ("consciousness_level", "introspective_depth")
+
+# Enum lookup tables - accept both the member and its string value
+_ENUM_FIELDS = {
+    "mental_state": MentalStateEnum,
+    "emotion_tone": EmotionToneEnum,
+    "temporal_context": TemporalContextEnum,
+}
+_ENUM_LOOKUPS: Dict[str, Dict[Any, Any]] = {
+    name: {**{member.value: member for member in enum}, **{member: member for member in enum}}
+    for name, enum in _ENUM_FIELDS.items()
+}
+
+_MISSING = object()
+
+
+def _coerce_int(value: Any) -> Optional[int]:
+    """Lax integer coercion matching Pydantic (bools, integral floats, numeric strings)"""
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return int(value) if math.isfinite(value) and value.is_integer() else None
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            return None
+    return None
+
+
+def _coerce_float(value: Any) -> Optional[float]:
+    """Lax float coercion matching Pydantic (ints, bools, numeric strings)"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            return None
+    return None
+
+
+@dataclass
+class BatchValidationResult:
+    """Výsledok dávkovej validácie - stĺpce, maska platnosti a chyby po riadkoch"""
+    columns: Dict[str, List[Any]]
+    valid: List[bool]
+    errors: List[Optional[str]]
+    extras: List[Dict[str, Any]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    @property
+    def valid_count(self) -> int:
+        return sum(self.valid)
+
+    @property
+    def failed_count(self) -> int:
+        return len(self.valid) - self.valid_count
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Normalized components of one row (enum members, coerced numbers)"""
+        row = {name: column[index] for name, column in self.columns.items() if column[index] is not _MISSING}
+        if self.extras and self.extras[index]:
+            row.update(self.extras[index])
+        return row
+
+    def materialize(self, index: int) -> ASLCognitiveTag:
+        """
+        Build the full ASLCognitiveTag for one already validated row
+
+        Raises:
+            ValueError: If the row did not pass validation
+        """
+        if not self.valid[index]:
+            raise ValueError(f"Row {index} failed validation: {self.errors[index]}")
+        row = self.row(index)
+        # Fill default_factory fields here - model_construct resolves them slowly per call
+        row.setdefault("entity_id", str(uuid.uuid4()))
+        row.setdefault("creation_moment", datetime.now())
+        row.setdefault("consciousness_resonance", {})
+        return ASLCognitiveTag.model_construct(**row)
+
+    def iter_valid_rows(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Iterate (index, normalized row) for valid rows without building models"""
+        for index, is_valid in enumerate(self.valid):
+            if is_valid:
+                yield index, self.row(index)
+
+    def iter_valid_models(self) -> Iterator[ASLCognitiveTag]:
+        """Lazily materialize models for valid rows"""
+        for index, is_valid in enumerate(self.valid):
+            if is_valid:
+                yield self.materialize(index)
+
+
+class ASLBatchValidator:
+    """
+    Dávkový validátor ASL kognitívnych tagov nad stĺpcami komponentov.
+
+    Expects components already mapped to ASLCognitiveTag field names
+    (see ASLMetaParser._map_legacy_fields). Unknown keys are ignored for
+    validation, exactly as Pydantic ignores extra fields.
+    """
+
+    MODEL_FIELDS = (
+        REQUIRED_STRING_FIELDS
+        + tuple(_ENUM_FIELDS)
+        + ("cognitive_load", "certainty_level", "creation_moment")
+        + OPTIONAL_STRING_FIELDS
+        + OPTIONAL_UNIT_FLOAT_FIELDS
+    )
+
+    def validate(self, components: Sequence[Mapping[str, Any]]) -> BatchValidationResult:
+        """
+        Validate a batch of component dicts in a single columnar pass
+
+        Args:
+            components: Sequence of mapped ASL component dictionaries
+
+        Returns:
+            BatchValidationResult with normalized columns, validity mask and errors
+        """
+        columns = {
+            name: [row.get(name, _MISSING) for row in components]
+            for name in self.MODEL_FIELDS
+        }
+        count = len(components)
+        errors: List[Optional[str]] = [None] * count
+
+        # Enum columns - normalize to members, None for unknown values
+        for name, lookup in _ENUM_LOOKUPS.items():
+            raw_column = columns[name]
+            normalized = []
+            for index, raw in enumerate(raw_column):
+                try:
+                    member = lookup.get(raw)
+                except TypeError:  # unhashable input
+                    member = None
+                if member is None and errors[index] is None:
+                    errors[index] = f"{name}: invalid enum value {raw!r}" if raw is not _MISSING else f"{name}: field required"
+                normalized.append(member)
+            columns[name] = normalized
+
+        loads = [_coerce_int(raw) for raw in columns["cognitive_load"]]
+        certainties = [_coerce_float(raw) for raw in columns["certainty_level"]]
+        states = columns["mental_state"]
+
+        # Coherence rules run before field validation in the model (pre root validators)
+        for index in range(count):
+            state = states[index]
+            load = loads[index]
+            certainty = certainties[index]
+            coherence_error = None
+            if state is MentalStateEnum.CALM and load is not None and load > 7:
+                coherence_error = CALM_HIGH_LOAD_ERROR
+            elif state is MentalStateEnum.CONFUSED and load is not None and load < 3:
+                coherence_error = CONFUSED_LOW_LOAD_ERROR
+            elif state is MentalStateEnum.UNCERTAIN and certainty is not None and certainty > 0.6:
+                coherence_error = UNCERTAIN_HIGH_CERTAINTY_ERROR
+            elif state is MentalStateEnum.DECISIVE and certainty is not None and certainty < 0.7:
+                coherence_error = DECISIVE_LOW_CERTAINTY_ERROR
+            if coherence_error is not None:
+                errors[index] = coherence_error
+
+        # Range rules
+        for index, load in enumerate(loads):
+            if errors[index] is None and (load is None or not 1 <= load <= 10):
+                errors[index] = f"cognitive_load: expected integer in [1, 10], got {columns['cognitive_load'][index]!r}"
+        for index, certainty in enumerate(certainties):
+            if errors[index] is None and (certainty is None or not 0.0 <= certainty <= 1.0):
+                errors[index] = f"certainty_level: expected float in [0.0, 1.0], got {columns['certainty_level'][index]!r}"
+        columns["cognitive_load"] = loads
+        columns["certainty_level"] = certainties
+
+        # String rules
+        for name in REQUIRED_STRING_FIELDS:
+            for index, raw in enumerate(columns[name]):
+                if errors[index] is None and not isinstance(raw, str):
+                    errors[index] = f"{name}: field required" if raw is _MISSING else f"{name}: expected string"
+        for name in OPTIONAL_STRING_FIELDS:
+            for index, raw in enumerate(columns[name]):
+                if errors[index] is None and raw is not _MISSING and raw is not None and not isinstance(raw, str):
+                    errors[index] = f"{name}: expected string"
+
+        # Optional unit-interval floats
+        for name in OPTIONAL_UNIT_FLOAT_FIELDS:
+            column = columns[name]
+            for index, raw in enumerate(column):
+                if raw is _MISSING:
+                    continue
+                value = _coerce_float(raw)
+                if errors[index] is None and (value is None or not 0.0 <= value <= 1.0):
+                    errors[index] = f"{name}: expected float in [0.0, 1.0]"
+                column[index] = value if value is not None else raw
+
+        # creation_moment - datetime or ISO string
+        column = columns["creation_moment"]
+        for index, raw in enumerate(column):
+            if raw is _MISSING or isinstance(raw, datetime):
+                continue
+            try:
+                column[index] = datetime.fromisoformat(raw)
+            except (TypeError, ValueError):
+                if errors[index] is None:
+                    errors[index] = "creation_moment: expected datetime"
+
+        # Keep extra model fields (e.g. consciousness_resonance) for materialization
+        known = set(self.MODEL_FIELDS)
+        model_fields = set(ASLCognitiveTag.model_fields)
+        extras = [
+            {key: value for key, value in row.items() if key not in known and key in model_fields}
+            for row in components
+        ]
+
+        return BatchValidationResult(
+            columns=columns,
+            valid=[error is None for error in errors],
+            errors=errors,
+            extras=extras
+        )
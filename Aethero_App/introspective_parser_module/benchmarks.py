@@ -0,0 +1,248 @@
+"""
+Performance benchmarks for the Introspective Parser Module
+
+Usage:
+    python -m introspective_parser_module.benchmarks
+    python -m introspective_parser_module.benchmarks --tags 100000
+    python -m introspective_parser_module.benchmarks --suite metrics --tags 1000000
+    python -m introspective_parser_module.benchmarks --suite scanner --line-kb 10
+    python -m introspective_parser_module.benchmarks --suite parallel --lines 2000000 --workers 8
+"""
+
+from typing import Dict, Any, List
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from .models import ASLCognitiveTag, MentalStateEnum, EmotionToneEnum, TemporalContextEnum
+from .batch_validation import ASLBatchValidator
+from .metrics import AetheroCognitiveAnalyzer, CognitiveMetricsBackend
+from .vectorized_metrics import CognitiveTagArrays
+from .asl_scanner import scan_key_values, LEGACY_KEY_VALUE_PATTERN
+from .parser import ASLMetaParser
+from .parallel_parsing import parse_file_parallel
+
+
+def generate_components(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    Deterministic synthetic ASL components in ASLCognitiveTag field names
+
+    Roughly a fifth of the rows break a coherence or range rule, so both the
+    accept and the reject paths are exercised.
+    """
+    rng = random.Random(seed)
+    states = [state.value for state in MentalStateEnum]
+    tones = [tone.value for tone in EmotionToneEnum]
+    contexts = [context.value for context in TemporalContextEnum]
+    return [
+        {
+            "thought_stream": f"Synthetic thought {index}",
+            "mental_state": rng.choice(states),
+            "emotion_tone": rng.choice(tones),
+            "cognitive_load": rng.randint(0, 11),
+            "temporal_context": rng.choice(contexts),
+            "certainty_level": round(rng.random(), 3),
+            "aeth_mem_link": f"aeth_mem_{index % 97:04d}",
+            "constitutional_law": "transparency_principle",
+        }
+        for index in range(count)
+    ]
+
+
+def _rate(count: int, seconds: float) -> float:
+    return count / seconds if seconds > 0 else float("inf")
+
+
+def benchmark_batch_validation(count: int = 20000, seed: int = 42) -> Dict[str, Any]:
+    """
+    Compare per-row Pydantic validation with the columnar batch validator
+
+    Returns:
+        Tags/sec for the per-row path (model + .dict(), as validate_asl_block
+        does), batch validation alone, and batch validation with every valid
+        row materialized into a model.
+    """
+    components = generate_components(count, seed)
+
+    start = time.perf_counter()
+    per_row_valid = 0
+    for row in components:
+        try:
+            ASLCognitiveTag(**row).model_dump()
+            per_row_valid += 1
+        except ValueError:
+            pass
+    per_row_seconds = time.perf_counter() - start
+
+    validator = ASLBatchValidator()
+    start = time.perf_counter()
+    result = validator.validate(components)
+    batch_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    materialized = sum(1 for _ in result.iter_valid_models())
+    materialize_seconds = time.perf_counter() - start
+
+    return {
+        "tags": count,
+        "valid_per_row": per_row_valid,
+        "valid_batch": result.valid_count,
+        "per_row_tags_per_sec": _rate(count, per_row_seconds),
+        "batch_tags_per_sec": _rate(count, batch_seconds),
+        "batch_with_materialization_tags_per_sec": _rate(count, batch_seconds + materialize_seconds),
+        "materialized": materialized,
+        "speedup": per_row_seconds / batch_seconds if batch_seconds > 0 else float("inf"),
+    }
+
+
+def benchmark_vectorized_metrics(count: int = 20000, seed: int = 42,
+                                 python_limit: int = 20000) -> Dict[str, Any]:
+    """
+    Compare the Python and NumPy backends of AetheroCognitiveAnalyzer
+
+    The Python backend is timed on at most python_limit tags (it is linear, so
+    the rate extrapolates); the NumPy backend runs on every valid tag, encoded
+    straight from the batch validation columns.
+
+    Returns:
+        Tags/sec for both backends, NumPy compute time and the largest
+        absolute metric difference on the shared prefix.
+    """
+    result = ASLBatchValidator().validate(generate_components(count, seed))
+    arrays = CognitiveTagArrays.from_batch(result)
+    tags = [model for _, model in zip(range(python_limit), result.iter_valid_models())]
+
+    python_analyzer = AetheroCognitiveAnalyzer(backend=CognitiveMetricsBackend.PYTHON)
+    start = time.perf_counter()
+    python_metrics = python_analyzer.analyze_cognitive_tags(tags).to_dict()
+    python_seconds = time.perf_counter() - start
+
+    numpy_analyzer = AetheroCognitiveAnalyzer(backend=CognitiveMetricsBackend.NUMPY)
+    prefix_metrics = numpy_analyzer.analyze_cognitive_tags(tags).to_dict()
+    start = time.perf_counter()
+    numpy_analyzer.analyze_tag_arrays(arrays)
+    numpy_seconds = time.perf_counter() - start
+
+    return {
+        "tags": len(arrays),
+        "python_tags": len(tags),
+        "python_tags_per_sec": _rate(len(tags), python_seconds),
+        "numpy_tags_per_sec": _rate(len(arrays), numpy_seconds),
+        "numpy_seconds": numpy_seconds,
+        "max_abs_difference": max(
+            abs(python_metrics[key] - prefix_metrics[key])
+            for key, value in python_metrics.items() if isinstance(value, float)
+        ),
+    }
+
+
+def benchmark_key_value_scanning(line_kb: int = 10, repeats: int = 5) -> Dict[str, Any]:
+    """
+    Compare the legacy key_value regex with scan_key_values on long lines
+
+    Two ~line_kb KB lines are timed: a natural thought_stream of short words
+    and a hostile one whose value is a single unbroken word, the worst case
+    for the regex lookahead.
+
+    Returns:
+        Seconds per line for both implementations and both lines.
+    """
+    size = line_kb * 1024
+    words = "reflecting on the cognitive flow of the system "
+    natural = "thought_stream: " + (words * (size // len(words) + 1))[:size] + " mental_state: focused"
+    hostile = "thought_stream: " + "a" * size + " mental_state: focused"
+
+    results: Dict[str, Any] = {"line_bytes": size}
+    for name, line in (("natural", natural), ("hostile", hostile)):
+        assert scan_key_values(line) == LEGACY_KEY_VALUE_PATTERN.findall(line)
+        for implementation, split in (("regex", LEGACY_KEY_VALUE_PATTERN.findall), ("scanner", scan_key_values)):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                split(line)
+            results[f"{name}_{implementation}_seconds_per_line"] = (time.perf_counter() - start) / repeats
+        results[f"{name}_speedup"] = (
+            results[f"{name}_regex_seconds_per_line"] / results[f"{name}_scanner_seconds_per_line"]
+        )
+    return results
+
+
+def benchmark_parallel_parsing(lines: int = 200000, workers: int = 0, seed: int = 42) -> Dict[str, Any]:
+    """
+    Compare sequential iter_parse_file with chunked multi-process parsing
+
+    A synthetic ASL file (every fourth line plain text) is written to a
+    temporary directory; both runs log with the "off" policy.
+
+    Returns:
+        Lines/sec for both runs, the speedup and whether both produced the
+        same ordered parsing results.
+    """
+    workers = workers or os.cpu_count() or 1
+    components = generate_components(lines, seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.asl")
+        with open(path, "w", encoding="utf-8") as handle:
+            for index, row in enumerate(components):
+                if index % 4 == 3:
+                    handle.write("Plain commentary line without tags\n")
+                    continue
+                handle.write("# [ASL] " + " ".join(f"{key}: {value}" for key, value in row.items()) + "\n")
+
+        sequential_parser = ASLMetaParser(log_policy="off")
+        sequential_parser.retain_blocks = False
+        start = time.perf_counter()
+        sequential = [(result["line_number"], result["is_valid"]) for result in sequential_parser.iter_parse_file(path)]
+        sequential_seconds = time.perf_counter() - start
+
+        parallel_parser = ASLMetaParser(log_policy="off")
+        parallel_parser.retain_blocks = False
+        start = time.perf_counter()
+        report = parse_file_parallel(path, parallel_parser, max_workers=workers,
+                                     chunk_bytes=max(1 << 20, os.path.getsize(path) // (workers * 4)))
+        parallel_seconds = time.perf_counter() - start
+
+    return {
+        "lines": lines,
+        "workers": workers,
+        "sequential_lines_per_sec": _rate(lines, sequential_seconds),
+        "parallel_lines_per_sec": _rate(lines, parallel_seconds),
+        "speedup": sequential_seconds / parallel_seconds if parallel_seconds > 0 else float("inf"),
+        "identical_results": sequential == [(result["line_number"], result["is_valid"]) for result in report["parsing_results"]],
+    }
+
+
+def _print_results(title: str, results: Dict[str, Any]) -> None:
+    print(title)
+    for key, value in results.items():
+        print(f"  {key:<42} {value:,.1f}" if isinstance(value, float) and value >= 1 else f"  {key:<42} {value}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Introspective Parser Module benchmarks")
+    parser.add_argument("--tags", type=int, default=20000, help="Number of synthetic tags")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for synthetic data")
+    parser.add_argument("--line-kb", type=int, default=10, help="Line size for the scanner benchmark")
+    parser.add_argument("--lines", type=int, default=200000, help="Document lines for the parallel benchmark")
+    parser.add_argument("--workers", type=int, default=0, help="Processes for the parallel benchmark (0 = CPU count)")
+    parser.add_argument("--suite", choices=["validation", "metrics", "scanner", "parallel", "all"], default="all",
+                        help="Which benchmark to run")
+    args = parser.parse_args()
+
+    if args.suite in ("validation", "all"):
+        _print_results("Batch validation vs per-row ASLCognitiveTag construction",
+                       benchmark_batch_validation(args.tags, args.seed))
+    if args.suite in ("metrics", "all"):
+        _print_results("Cognitive metrics: Python vs NumPy backend",
+                       benchmark_vectorized_metrics(args.tags, args.seed))
+    if args.suite in ("scanner", "all"):
+        _print_results("ASL key/value splitting: legacy regex vs linear scanner",
+                       benchmark_key_value_scanning(args.line_kb))
+    if args.suite in ("parallel", "all"):
+        _print_results("Chunked multi-process parsing vs sequential iter_parse_file",
+                       benchmark_parallel_parsing(args.lines, args.workers, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Bounded history buffers for long-running analyzers, agents and monitors
+
+BoundedHistory is a ring buffer with a fixed capacity, optional time-based
+retention and optional spill-to-disk of evicted entries as compact JSON lines.
+It supports the list operations the existing histories rely on (append, len,
+iteration, negative indexing and slicing), so it can replace an unbounded list
+in place.
+"""
+
+from typing import Any, Callable, Deque, Generic, Iterator, List, Optional, TypeVar, Union
+from collections import deque
+from dataclasses import dataclass, is_dataclass, asdict
+import itertools
+import json
+import os
+import threading
+import time
+
+T = TypeVar("T")
+
+DEFAULT_HISTORY_CAPACITY = 1000
+
+
+def compact_record(item: Any) -> Any:
+    """Default spill serializer - to_dict(), dataclass fields or the item itself"""
+    to_dict = getattr(item, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    if is_dataclass(item) and not isinstance(item, type):
+        return asdict(item)
+    return item
+
+
+class BoundedHistory(Generic[T]):
+    """
+    Ohraničená história - kruhový buffer s voliteľnou retenciou a spill na disk.
+
+    Args:
+        capacity: Maximum number of retained entries
+        max_age_seconds: Drop entries older than this (None = keep until evicted by capacity)
+        spill_path: Append evicted entries to this JSON-lines file (None = discard)
+        serializer: Converts an entry to a JSON-serializable record for spilling
+        clock: Time source in seconds, injectable for tests
+    """
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_CAPACITY,
+                 max_age_seconds: Optional[float] = None,
+                 spill_path: Optional[str] = None,
+                 serializer: Callable[[T], Any] = compact_record,
+                 clock: Callable[[], float] = time.time):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.max_age_seconds = max_age_seconds
+        self.spill_path = spill_path
+        self.serializer = serializer
+        self.clock = clock
+        self._items: Deque[T] = deque()
+        self._timestamps: Deque[float] = deque()
+        self._lock = threading.Lock()
+        self.total_appended = 0
+        self.evicted_count = 0
+        self.spilled_count = 0
+
+    def append(self, item: T) -> None:
+        """Pridanie záznamu; najstarší záznam nad kapacitu je vyradený"""
+        now = self.clock()
+        with self._lock:
+            self._items.append(item)
+            self._timestamps.append(now)
+            self.total_appended += 1
+            evicted = []
+            while len(self._items) > self.capacity:
+                evicted.append((self._timestamps.popleft(), self._items.popleft()))
+            evicted.extend(self._pop_expired(now))
+            self._spill(evicted)
+
+    def extend(self, items) -> None:
+        for item in items:
+            self.append(item)
+
+    def latest(self, limit: Optional[int] = None) -> List[T]:
+        """Posledných `limit` záznamov (všetky pre None/0) bez prechodu celej histórie"""
+        self.prune()
+        with self._lock:
+            if not limit or limit >= len(self._items):
+                return list(self._items)
+            return list(itertools.islice(reversed(self._items), limit))[::-1]
+
+    def prune(self) -> None:
+        """Vyradenie záznamov starších ako max_age_seconds"""
+        if self.max_age_seconds is None:
+            return
+        with self._lock:
+            self._spill(self._pop_expired(self.clock()))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._timestamps.clear()
+
+    def to_list(self) -> List[T]:
+        return self.latest()
+
+    def _pop_expired(self, now: float) -> List[tuple]:
+        expired = []
+        if self.max_age_seconds is not None:
+            cutoff = now - self.max_age_seconds
+            while self._timestamps and self._timestamps[0] < cutoff:
+                expired.append((self._timestamps.popleft(), self._items.popleft()))
+        return expired
+
+    def _spill(self, evicted: List[tuple]) -> None:
+        if not evicted:
+            return
+        self.evicted_count += len(evicted)
+        if self.spill_path is None:
+            return
+        directory = os.path.dirname(self.spill_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.spill_path, "a", encoding="utf-8") as spill_file:
+            for timestamp, item in evicted:
+                spill_file.write(json.dumps(
+                    {"ts": timestamp, "item": self.serializer(item)},
+                    separators=(",", ":"), default=str, ensure_ascii=False
+                ) + "\n")
+        self.spilled_count += len(evicted)
+
+    def __len__(self) -> int:
+        self.prune()
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.latest())
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        self.prune()
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._items))
+            # Chvostové slice ako history[-5:] nekopírujú celý buffer
+            if stop == len(self._items) and (step or 1) == 1:
+                return self.latest(stop - start) if stop > start else []
+            return list(self._items)[index]
+        return self._items[index]
+
+    def __repr__(self) -> str:
+        return f"BoundedHistory(len={len(self._items)}, capacity={self.capacity}, evicted={self.evicted_count})"
+
+
+@dataclass
+class HistoryPolicy:
+    """Konfigurácia ohraničených histórií jednej komponenty"""
+    capacity: int = DEFAULT_HISTORY_CAPACITY
+    max_age_seconds: Optional[float] = None
+    spill_dir: Optional[str] = None
+
+    def create(self, name: str, capacity: Optional[int] = None,
+               serializer: Callable[[Any], Any] = compact_record) -> BoundedHistory:
+        """
+        Build a BoundedHistory for one named history
+
+        Evicted entries of `name` are spilled to `<spill_dir>/<name>.jsonl`
+        when spill_dir is set.
+        """
+        spill_path = os.path.join(self.spill_dir, f"{name}.jsonl") if self.spill_dir else None
+        return BoundedHistory(
+            capacity=capacity or self.capacity,
+            max_age_seconds=self.max_age_seconds,
+            spill_path=spill_path,
+            serializer=serializer
+        )
@@ -0,0 +1,211 @@
+"""
+Compact in-memory representation of validated cognitive tags
+
+An ASLCognitiveTag instance carries the Pydantic model machinery, a uuid4
+string, a datetime and an empty consciousness_resonance dict - well over a
+kilobyte per tag. CompactCognitiveTag keeps the same data in __slots__:
+enum fields as small integer codes (interned by CPython), the creation moment
+as a float timestamp, the entity id generated on first access and the
+resonance dict only once something resonates. Default depth and
+consciousness levels share one float object.
+
+The tag exposes the ASLCognitiveTag attributes (enum members, datetime,
+entity_id, dict()), so AetheroCognitiveAnalyzer, the online analyzer and the
+reflection agent accept it directly. to_model() materializes the Pydantic
+model only when it is really needed.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+from datetime import datetime
+import time
+import uuid
+
+from .models import ASLCognitiveTag, MentalStateEnum, EmotionToneEnum, TemporalContextEnum
+
+MENTAL_STATES: List[MentalStateEnum] = list(MentalStateEnum)
+EMOTION_TONES: List[EmotionToneEnum] = list(EmotionToneEnum)
+TEMPORAL_CONTEXTS: List[TemporalContextEnum] = list(TemporalContextEnum)
+
+# str enums hash like their values, so members and plain strings share one lookup
+_MENTAL_CODES = {member: code for code, member in enumerate(MENTAL_STATES)}
+_EMOTION_CODES = {member: code for code, member in enumerate(EMOTION_TONES)}
+_TEMPORAL_CODES = {member: code for code, member in enumerate(TEMPORAL_CONTEXTS)}
+
+_DEFAULT_LEVEL = 0.5
+
+
+def _shared_level(value: float) -> float:
+    """Default levels reuse one float object instead of one per tag"""
+    return _DEFAULT_LEVEL if value == _DEFAULT_LEVEL else float(value)
+
+
+def _timestamp(moment: Union[datetime, str, float, None]) -> float:
+    if moment is None:
+        return time.time()
+    if isinstance(moment, str):
+        moment = datetime.fromisoformat(moment)
+    if isinstance(moment, datetime):
+        return moment.timestamp()
+    return float(moment)
+
+
+class CompactCognitiveTag:
+    """
+    Kompaktný kognitívny tag - __slots__, enum kódy a lenivé entity_id.
+
+    Build it from an already validated source (from_model, from_components);
+    the constructor does not re-run the ASLCognitiveTag validators.
+    """
+    __slots__ = (
+        "mental_state_code", "emotion_tone_code", "temporal_context_code",
+        "cognitive_load", "certainty_level", "thought_stream",
+        "aeth_mem_link", "constitutional_law",
+        "enhancement_suggestion", "diplomatic_enhancement",
+        "consciousness_level", "introspective_depth",
+        "_entity_id", "_created_at", "_resonance"
+    )
+
+    def __init__(self, thought_stream: str, mental_state: Union[MentalStateEnum, str],
+                 emotion_tone: Union[EmotionToneEnum, str], cognitive_load: int,
+                 temporal_context: Union[TemporalContextEnum, str], certainty_level: float,
+                 aeth_mem_link: str, constitutional_law: str,
+                 enhancement_suggestion: Optional[str] = None,
+                 diplomatic_enhancement: Optional[str] = None,
+                 consciousness_level: float = _DEFAULT_LEVEL,
+                 introspective_depth: float = _DEFAULT_LEVEL,
+                 entity_id: Optional[str] = None,
+                 creation_moment: Union[datetime, str, float, None] = None,
+                 consciousness_resonance: Optional[Dict[str, Any]] = None):
+        self.mental_state_code = _MENTAL_CODES[mental_state]
+        self.emotion_tone_code = _EMOTION_CODES[emotion_tone]
+        self.temporal_context_code = _TEMPORAL_CODES[temporal_context]
+        self.cognitive_load = int(cognitive_load)
+        self.certainty_level = float(certainty_level)
+        self.thought_stream = thought_stream
+        self.aeth_mem_link = aeth_mem_link
+        self.constitutional_law = constitutional_law
+        self.enhancement_suggestion = enhancement_suggestion
+        self.diplomatic_enhancement = diplomatic_enhancement
+        self.consciousness_level = _shared_level(consciousness_level)
+        self.introspective_depth = _shared_level(introspective_depth)
+        self._entity_id = entity_id
+        self._created_at = _timestamp(creation_moment)
+        self._resonance = dict(consciousness_resonance) if consciousness_resonance else None
+
+    @classmethod
+    def from_model(cls, tag: ASLCognitiveTag) -> "CompactCognitiveTag":
+        """Compact copy of a validated ASLCognitiveTag - its entity_id is kept"""
+        return cls(
+            tag.thought_stream, tag.mental_state, tag.emotion_tone, tag.cognitive_load,
+            tag.temporal_context, tag.certainty_level, tag.aeth_mem_link, tag.constitutional_law,
+            tag.enhancement_suggestion, tag.diplomatic_enhancement,
+            tag.consciousness_level, tag.introspective_depth,
+            tag.entity_id, tag.creation_moment, tag.consciousness_resonance
+        )
+
+    @classmethod
+    def from_components(cls, components: Mapping[str, Any]) -> "CompactCognitiveTag":
+        """Compact tag from a validated model dump (parser validated_model, JSON export)"""
+        return cls(
+            components["thought_stream"], components["mental_state"], components["emotion_tone"],
+            components["cognitive_load"], components["temporal_context"], components["certainty_level"],
+            components["aeth_mem_link"], components["constitutional_law"],
+            components.get("enhancement_suggestion"), components.get("diplomatic_enhancement"),
+            components.get("consciousness_level", _DEFAULT_LEVEL),
+            components.get("introspective_depth", _DEFAULT_LEVEL),
+            components.get("entity_id"), components.get("creation_moment"),
+            components.get("consciousness_resonance")
+        )
+
+    # ASLCognitiveTag compatible attributes
+
+    @property
+    def mental_state(self) -> MentalStateEnum:
+        return MENTAL_STATES[self.mental_state_code]
+
+    @property
+    def emotion_tone(self) -> EmotionToneEnum:
+        return EMOTION_TONES[self.emotion_tone_code]
+
+    @property
+    def temporal_context(self) -> TemporalContextEnum:
+        return TEMPORAL_CONTEXTS[self.temporal_context_code]
+
+    @property
+    def entity_id(self) -> str:
+        """Generated on first access - most analyzed tags are never addressed by id"""
+        if self._entity_id is None:
+            self._entity_id = str(uuid.uuid4())
+        return self._entity_id
+
+    @property
+    def creation_moment(self) -> datetime:
+        return datetime.fromtimestamp(self._created_at)
+
+    @property
+    def consciousness_resonance(self) -> Dict[str, Any]:
+        if self._resonance is None:
+            self._resonance = {}
+        return self._resonance
+
+    def enhance_consciousness(self, depth: float) -> None:
+        """Zvýšenie introspektívnej hĺbky vedomia"""
+        self.introspective_depth = min(1.0, self.introspective_depth + depth)
+        self.consciousness_level = min(1.0, self.consciousness_level + depth * 0.1)
+
+    def resonate_with_memory(self, memory_data: Dict[str, Any]) -> None:
+        """Rezonancia s pamäťovými štruktúrami"""
+        self.consciousness_resonance.update(memory_data)
+
+    def dict(self) -> Dict[str, Any]:
+        """Same fields and value types as ASLCognitiveTag.dict()"""
+        return {
+            "entity_id": self.entity_id,
+            "creation_moment": self.creation_moment,
+            "consciousness_level": self.consciousness_level,
+            "thought_stream": self.thought_stream,
+            "mental_state": self.mental_state,
+            "emotion_tone": self.emotion_tone,
+            "cognitive_load": self.cognitive_load,
+            "temporal_context": self.temporal_context,
+            "certainty_level": self.certainty_level,
+            "aeth_mem_link": self.aeth_mem_link,
+            "constitutional_law": self.constitutional_law,
+            "enhancement_suggestion": self.enhancement_suggestion,
+            "diplomatic_enhancement": self.diplomatic_enhancement,
+            "introspective_depth": self.introspective_depth,
+            "consciousness_resonance": dict(self.consciousness_resonance)
+        }
+
+    def to_model(self) -> ASLCognitiveTag:
+        """Materialize the Pydantic model - the data was validated when the tag was compacted"""
+        return ASLCognitiveTag.model_construct(**self.dict())
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CompactCognitiveTag):
+            return NotImplemented
+        return self.dict() == other.dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"CompactCognitiveTag(mental_state={self.mental_state.value!r}, "
+                f"emotion_tone={self.emotion_tone.value!r}, cognitive_load={self.cognitive_load}, "
+                f"certainty_level={self.certainty_level}, thought_stream={self.thought_stream[:40]!r})")
+
+
+# Anything the analyzers and the reflection agent accept as a tag
+CognitiveTagLike = Union[ASLCognitiveTag, CompactCognitiveTag]
+
+
+def compact_tags(tags: Iterable[Union[ASLCognitiveTag, CompactCognitiveTag, Mapping[str, Any]]]) -> List[CompactCognitiveTag]:
+    """Compact a mix of models, model dumps and already compact tags"""
+    compacted = []
+    for tag in tags:
+        if isinstance(tag, CompactCognitiveTag):
+            compacted.append(tag)
+        elif isinstance(tag, ASLCognitiveTag):
+            compacted.append(CompactCognitiveTag.from_model(tag))
+        else:
+            compacted.append(CompactCognitiveTag.from_components(tag))
+    return compacted
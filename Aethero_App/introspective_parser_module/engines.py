@@ -0,0 +1,72 @@
+"""
+Shared, pre-warmed cognitive engines for long-running services
+
+Building an ASLMetaParser, CognitiveMetricsAnalyzer or AetheroReflectionAgent
+per request repeats logger and handler setup, validator construction and the
+vectorized lookup tables. CognitiveEngines builds them once per process; each
+request then works on a lightweight session (new_session()) with its own
+counters and histories.
+"""
+
+from typing import Optional
+import threading
+
+from .parser import ASLMetaParser
+from .metrics import CognitiveMetricsAnalyzer
+from .reflection_agent import AetheroReflectionAgent
+from .incremental_parsing import IncrementalASLParser
+
+# Warm-up document - touches pattern matching, value processing and validation
+_WARM_UP_DOCUMENT = (
+    "# [ASL] thought_stream: Engine warm-up mental_state: focused emotion_tone: analytical "
+    "cognitive_load: 5 certainty_level: 0.8 temporal_context: present"
+)
+
+
+class CognitiveEngines:
+    """
+    Zdieľané kognitívne enginy jedného procesu.
+
+    The prototypes are never used to process requests directly - only their
+    sessions are, so concurrent requests cannot corrupt each other's state.
+    """
+
+    def __init__(self, warm_up: bool = True):
+        self.parser = ASLMetaParser()
+        self.metrics_analyzer = CognitiveMetricsAnalyzer()
+        self.reflection_agent = AetheroReflectionAgent()
+        # The agent shares the same parser and analyzer prototypes
+        self.reflection_agent.parser = self.parser
+        self.reflection_agent.metrics_analyzer = self.metrics_analyzer
+        # Per-document line caches for clients that resubmit edited documents
+        self.incremental_parser = IncrementalASLParser(self.parser)
+        if warm_up:
+            self.warm_up()
+
+    def warm_up(self) -> None:
+        """Predzahriatie - vektorizovaný engine a jeden parsovací prechod"""
+        self.metrics_analyzer.warm_up()
+        self.parser.new_session().parse_and_validate(_WARM_UP_DOCUMENT)
+
+    def parser_session(self) -> ASLMetaParser:
+        return self.parser.new_session()
+
+    def analyzer_session(self) -> CognitiveMetricsAnalyzer:
+        return self.metrics_analyzer.new_session()
+
+    def reflection_session(self) -> AetheroReflectionAgent:
+        return self.reflection_agent.new_session()
+
+
+_shared_engines: Optional[CognitiveEngines] = None
+_shared_engines_lock = threading.Lock()
+
+
+def get_shared_engines() -> CognitiveEngines:
+    """Process-wide CognitiveEngines, created and warmed up on first use"""
+    global _shared_engines
+    if _shared_engines is None:
+        with _shared_engines_lock:
+            if _shared_engines is None:
+                _shared_engines = CognitiveEngines()
+    return _shared_engines
@@ -0,0 +1,255 @@
+"""
+Execution backends for CPU-bound cognitive processing in async services
+
+Parsing, metrics and reflection are pure-Python CPU work. CognitiveExecutor
+runs them on a thread pool or on a process pool of workers that import and
+warm up introspective_parser_module once at start. Small payloads skip the
+pool and run on the shared worker threads of run_in_threadpool; running
+on the event loop itself is opt-in (the inline backend).
+The number of jobs waiting for the pool is bounded; when it is saturated
+run() raises ExecutorSaturatedError so the service can answer 503 with
+Retry-After instead of queueing without limit.
+
+Configuration via environment (see CognitiveExecutor.from_env()):
+    AETHERO_EXECUTION_BACKEND       inline | thread | process (default: thread)
+    AETHERO_EXECUTION_WORKERS       pool size (default: CPU count)
+    AETHERO_INLINE_MAX_CHARS        payloads below this size skip the pool (default: 8192)
+    AETHERO_EXECUTION_MAX_PENDING   bounded queue size (default: 4 x workers)
+    AETHERO_RETRY_AFTER_SECONDS     Retry-After hint when saturated (default: 1)
+"""
+
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+import asyncio
+import logging
+import os
+import threading
+
+try:
+    # Starlette's shared worker threads - the ones FastAPI runs sync endpoints on
+    from starlette.concurrency import run_in_threadpool
+except ImportError:
+    run_in_threadpool = asyncio.to_thread
+
+from .engines import get_shared_engines
+from .compact_tags import CompactCognitiveTag
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionBackend(str, Enum):
+    """Where CPU-bound cognitive jobs run"""
+    INLINE = "inline"  # on the event loop - for tests and single-request tools
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when the bounded job queue is full"""
+
+    def __init__(self, pending: int, retry_after_seconds: int):
+        super().__init__(f"Cognitive executor saturated ({pending} jobs pending)")
+        self.pending = pending
+        self.retry_after_seconds = retry_after_seconds
+
+
+# Job functions - module level so that process pool workers can unpickle them
+
+def run_parse_job(text: str) -> Dict[str, Any]:
+    """Parsovanie a validácia dokumentu v session zdieľaných enginov"""
+    return get_shared_engines().parser_session().parse_and_validate(text)
+
+
+def run_incremental_parse_job(document_id: str, text: str) -> Dict[str, Any]:
+    """Inkrementálne parsovanie - len zmenené riadky dokumentu; musí bežať v procese API"""
+    return get_shared_engines().incremental_parser.parse(document_id, text)
+
+
+def run_metrics_job(data: str) -> Optional[Dict[str, Any]]:
+    """
+    Parsovanie a introspektívny report nad validovanými tagmi
+
+    Returns:
+        Report, or None when the document contains no valid cognitive tags
+    """
+    engines = get_shared_engines()
+    parsed_result = engines.parser_session().parse_and_validate(data)
+
+    cognitive_tags: List[CompactCognitiveTag] = []
+    for result in parsed_result.get('parsing_results', []):
+        if result.get('is_valid') and result.get('validated_model'):
+            # The parser has already validated the model - compact tag without a second validation
+            cognitive_tags.append(CompactCognitiveTag.from_components(result['validated_model']))
+    if not cognitive_tags:
+        return None
+
+    return engines.analyzer_session().generate_introspective_report(cognitive_tags)
+
+
+def run_reflection_job(text: str) -> Dict[str, Any]:
+    """Introspektívna reflexia dokumentu v request-scoped agentovi"""
+    return get_shared_engines().reflection_session().reflect_on_input(text)
+
+
+def _initialize_worker() -> None:
+    """Process pool initializer - warm up the engines before the first job"""
+    get_shared_engines()
+
+
+class CognitiveExecutor:
+    """
+    Bounded executor for cognitive jobs.
+
+    Args:
+        backend: inline, thread or process
+        max_workers: Pool size (None = CPU count)
+        inline_max_chars: Payloads shorter than this skip the pool (run_in_threadpool)
+        max_pending: Jobs allowed in the pool (running + queued) before run() rejects
+        retry_after_seconds: Retry-After hint carried by ExecutorSaturatedError
+    """
+
+    def __init__(self, backend: ExecutionBackend = ExecutionBackend.THREAD,
+                 max_workers: Optional[int] = None,
+                 inline_max_chars: int = 8192,
+                 max_pending: Optional[int] = None,
+                 retry_after_seconds: int = 1):
+        self.backend = ExecutionBackend(backend)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.inline_max_chars = inline_max_chars
+        self.max_pending = max_pending or self.max_workers * 4
+        self.retry_after_seconds = retry_after_seconds
+
+        self._pool: Optional[Executor] = None
+        self._pool_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self.pending = 0
+        self.inline_jobs = 0
+        self.threadpool_jobs = 0
+        self.pooled_jobs = 0
+        self.rejected_jobs = 0
+
+    @classmethod
+    def from_env(cls) -> "CognitiveExecutor":
+        """Executor configured from AETHERO_EXECUTION_* environment variables"""
+        workers = os.environ.get("AETHERO_EXECUTION_WORKERS")
+        max_pending = os.environ.get("AETHERO_EXECUTION_MAX_PENDING")
+        return cls(
+            backend=ExecutionBackend(os.environ.get("AETHERO_EXECUTION_BACKEND", ExecutionBackend.THREAD.value)),
+            max_workers=int(workers) if workers else None,
+            inline_max_chars=int(os.environ.get("AETHERO_INLINE_MAX_CHARS", "8192")),
+            max_pending=int(max_pending) if max_pending else None,
+            retry_after_seconds=int(os.environ.get("AETHERO_RETRY_AFTER_SECONDS", "1"))
+        )
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    if self.backend == ExecutionBackend.PROCESS:
+                        self._pool = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_initialize_worker)
+                    else:
+                        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="aethero-cognitive")
+                    logger.info(f"Cognitive executor started: {self.backend.value} x {self.max_workers}")
+        return self._pool
+
+    def check_capacity(self) -> None:
+        """Reject up front when the pool queue is already full"""
+        if self.backend != ExecutionBackend.INLINE and self.pending >= self.max_pending:
+            self.rejected_jobs += 1
+            raise ExecutorSaturatedError(self.pending, self.retry_after_seconds)
+
+    def skips_pool(self, payload_size: int) -> bool:
+        """Small payloads (and every job of the inline backend) bypass the bounded pool"""
+        return self.backend == ExecutionBackend.INLINE or payload_size < self.inline_max_chars
+
+    async def run(self, job: Callable[[str], Any], text: str, small: Optional[bool] = None) -> Any:
+        """
+        INTENT: Spustenie kognitívnej úlohy bez blokovania event loopu
+        ACTION: Malé payloady cez run_in_threadpool, inak pool s ohraničenou frontou
+        OUTPUT: Výsledok úlohy
+        HOOK: cognitive_job_dispatched
+
+        Args:
+            small: Override the size-based decision to skip the pool (ignored for the inline backend)
+
+        Raises:
+            ExecutorSaturatedError: max_pending jobs are already in the pool
+        """
+        if self.backend == ExecutionBackend.INLINE:
+            self.inline_jobs += 1
+            return job(text)
+        if small is None:
+            small = self.skips_pool(len(text))
+        if small:
+            self.threadpool_jobs += 1
+            return await run_in_threadpool(job, text)
+
+        with self._pending_lock:
+            if self.pending >= self.max_pending:
+                self.rejected_jobs += 1
+                raise ExecutorSaturatedError(self.pending, self.retry_after_seconds)
+            self.pending += 1
+            self.pooled_jobs += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_pool(), job, text)
+        finally:
+            with self._pending_lock:
+                self.pending -= 1
+
+    async def map_unordered(self, job: Callable[[str], Any],
+                            texts: Sequence[str]) -> AsyncIterator[Tuple[int, Any, Optional[Exception]]]:
+        """
+        INTENT: Paralelné spracovanie dávky dokumentov
+        ACTION: Najviac max_workers úloh naraz v poole, výsledky v poradí dokončenia
+        OUTPUT: (index, result, error) pre každý dokument
+        HOOK: cognitive_batch_dispatched
+
+        A batch whose total size is below the inline threshold skips the pool.
+        A document rejected because the queue is full yields an
+        ExecutorSaturatedError as its error; the rest of the batch continues.
+        """
+        if self.skips_pool(sum(len(text) for text in texts)):
+            for index, text in enumerate(texts):
+                try:
+                    yield index, await self.run(job, text, small=True), None
+                except Exception as e:
+                    yield index, None, e
+            return
+
+        # One batch never holds more pool slots than there are workers
+        slots = asyncio.Semaphore(self.max_workers)
+
+        async def run_document(index: int, text: str) -> Tuple[int, Any, Optional[Exception]]:
+            async with slots:
+                try:
+                    return index, await self.run(job, text, small=False), None
+                except Exception as e:
+                    return index, None, e
+
+        tasks = [asyncio.ensure_future(run_document(index, text)) for index, text in enumerate(texts)]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                yield await completed
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend.value,
+            "max_workers": self.max_workers,
+            "inline_max_chars": self.inline_max_chars,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "inline_jobs": self.inline_jobs,
+            "threadpool_jobs": self.threadpool_jobs,
+            "pooled_jobs": self.pooled_jobs,
+            "rejected_jobs": self.rejected_jobs
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait)
+                self._pool = None
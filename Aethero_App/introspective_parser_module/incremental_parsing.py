@@ -0,0 +1,228 @@
+"""
+Incremental re-parsing of repeatedly submitted documents
+
+Parsing and validating an ASL line depends only on the line's text, so an
+edited document only needs its changed lines processed again. Each document
+session keeps the previous version's lines and parsing results plus a
+line text -> outcome cache. On resubmission:
+
+- the unchanged prefix and suffix are found with C-level list comparisons
+  and their results are reused (suffix line numbers shifted if lines were
+  inserted or removed),
+- lines in the edited region are looked up in the line cache (moved or
+  duplicated lines) and only genuinely new lines go through a parser session,
+- the parse_and_validate() report is rebuilt from the pieces.
+
+Result dicts, validated_model dumps and failure records are shared between
+the reports of one session - treat reports as read-only.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+import bisect
+import math
+import threading
+
+from .parser import ASLMetaParser
+
+# (parsed_components, is_valid, validated_model dump, failure record, certainty factor)
+LineOutcome = Tuple[Dict[str, Any], bool, Optional[Dict[str, Any]], Optional[Dict[str, Any]], float]
+
+
+def _common_prefix_length(old: List[str], new: List[str]) -> int:
+    """Binary search over slice equality - the comparisons run in C"""
+    low, high = 0, min(len(old), len(new))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[low:middle] == new[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix_length(old: List[str], new: List[str], limit: int) -> int:
+    low, high = 0, limit
+    old_length, new_length = len(old), len(new)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[old_length - middle:old_length - low] == new[new_length - middle:new_length - low]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+class IncrementalDocumentSession:
+    """Stav jednej verzie dokumentu - riadky, výsledky a cache výsledkov riadkov"""
+
+    def __init__(self, document_id: str):
+        self.document_id = document_id
+        self.lock = threading.Lock()
+        self.lines: List[str] = []
+        # Aligned per ASL block of the current version
+        self.results: List[Dict[str, Any]] = []
+        self.result_lines: List[int] = []
+        self.failures: List[Optional[Dict[str, Any]]] = []
+        self.factors: List[float] = []
+        # ASL line text -> outcome, for lines that move or repeat
+        self.line_outcomes: Dict[str, LineOutcome] = {}
+        self.revisions = 0
+        self.last_reused_lines = 0
+        self.last_reparsed_lines = 0
+
+
+class IncrementalASLParser:
+    """
+    Inkrementálny parser - opätovne spracuje len zmenené riadky.
+
+    Args:
+        parser: Prototype whose sessions process new lines (default: a new ASLMetaParser)
+        max_documents: Document sessions kept, least recently used are dropped
+    """
+
+    def __init__(self, parser: Optional[ASLMetaParser] = None, max_documents: int = 256):
+        self.parser = parser or ASLMetaParser()
+        self.max_documents = max_documents
+        self._sessions: "OrderedDict[str, IncrementalDocumentSession]" = OrderedDict()
+        self._sessions_lock = threading.Lock()
+
+    def _session(self, document_id: str) -> IncrementalDocumentSession:
+        with self._sessions_lock:
+            session = self._sessions.get(document_id)
+            if session is None:
+                session = self._sessions[document_id] = IncrementalDocumentSession(document_id)
+            self._sessions.move_to_end(document_id)
+            while len(self._sessions) > self.max_documents:
+                self._sessions.popitem(last=False)
+            return session
+
+    def forget(self, document_id: str) -> None:
+        with self._sessions_lock:
+            self._sessions.pop(document_id, None)
+
+    def get_session(self, document_id: str) -> Optional[IncrementalDocumentSession]:
+        with self._sessions_lock:
+            return self._sessions.get(document_id)
+
+    @staticmethod
+    def _process_line(work: ASLMetaParser, line: str) -> Optional[LineOutcome]:
+        """Parsovanie a validácia jedného riadku v pracovnej session"""
+        certainty_before = work.parsing_certainty
+        components = work.parse_line(line)
+        if not components:
+            return None
+        is_valid, validated_model = work.validate_asl_block(components)
+        failure = None if is_valid else work.failed_validations[-1]
+        return (
+            components,
+            is_valid,
+            work._dump_validated_model(validated_model),
+            failure,
+            work.parsing_certainty / certainty_before
+        )
+
+    def parse(self, document_id: str, document: str) -> Dict[str, Any]:
+        """
+        INTENT: Parsovanie novej verzie dokumentu s opätovným použitím nezmenených riadkov
+        ACTION: Zhodný prefix/sufix bez zmeny, cache lookup alebo parse + validácia pre zmenený úsek
+        OUTPUT: Report v tvare parse_and_validate()
+        HOOK: incremental_parsing_completed
+
+        Args:
+            document_id: Stable id of the document across submissions
+            document: Full text of the current version
+        """
+        session = self._session(document_id)
+        lines = document.split('\n')
+
+        with session.lock:
+            old_lines = session.lines
+            prefix = _common_prefix_length(old_lines, lines)
+            suffix = _common_suffix_length(old_lines, lines, min(len(old_lines), len(lines)) - prefix)
+            old_suffix_start = len(old_lines) - suffix
+            shift = len(lines) - len(old_lines)
+
+            # Results of the unchanged prefix and suffix
+            head_end = bisect.bisect_left(session.result_lines, prefix)
+            tail_start = bisect.bisect_left(session.result_lines, old_suffix_start)
+
+            results = session.results[:head_end]
+            result_lines = session.result_lines[:head_end]
+            failures = session.failures[:head_end]
+            factors = session.factors[:head_end]
+
+            # Edited region - cached outcomes for moved lines, parse the rest
+            line_outcomes = session.line_outcomes
+            work: Optional[ASLMetaParser] = None
+            reparsed = 0
+            for index in range(prefix, len(lines) - suffix):
+                line = lines[index]
+                outcome = line_outcomes.get(line)
+                if outcome is None:
+                    if work is None:
+                        work = self.parser.new_session()
+                    outcome = self._process_line(work, line)
+                    reparsed += 1
+                    if outcome is None:
+                        continue
+                    line_outcomes[line] = outcome
+                components, is_valid, dump, failure, certainty_factor = outcome
+                results.append({
+                    "line_number": index + 1,
+                    "line_content": line,
+                    "parsed_components": components,
+                    "is_valid": is_valid,
+                    "validated_model": dump
+                })
+                result_lines.append(index)
+                failures.append(failure)
+                factors.append(certainty_factor)
+
+            tail_results = session.results[tail_start:]
+            if shift:
+                tail_results = [{**result, "line_number": result["line_number"] + shift} for result in tail_results]
+                result_lines.extend(line + shift for line in session.result_lines[tail_start:])
+            else:
+                result_lines.extend(session.result_lines[tail_start:])
+            results.extend(tail_results)
+            failures.extend(session.failures[tail_start:])
+            factors.extend(session.factors[tail_start:])
+
+            session.lines = lines
+            session.results = results
+            session.result_lines = result_lines
+            session.failures = failures
+            session.factors = factors
+            if len(line_outcomes) > 2 * len(results) + 1024:
+                # Forget lines that are no longer part of the document
+                session.line_outcomes = {
+                    result["line_content"]: line_outcomes[result["line_content"]] for result in results
+                }
+            session.revisions += 1
+            session.last_reparsed_lines = reparsed
+            session.last_reused_lines = len(lines) - reparsed
+
+        validated_blocks = [result["validated_model"] for result in results if result["is_valid"]]
+        failed_validations = [failure for failure in failures if failure is not None]
+
+        summary = self.parser.new_session()
+        summary.total_lines_processed = len(lines)
+        summary.current_cognitive_load = len(lines)
+        summary.asl_blocks_found = len(results)
+        summary.validated_count = len(validated_blocks)
+        summary.failed_count = len(failed_validations)
+        summary.parsing_certainty = math.prod(factors)
+        summary.validated_blocks = validated_blocks
+        summary.failed_validations = failed_validations
+
+        return {
+            "session_id": summary.parsing_session_id,
+            "total_lines_processed": len(lines),
+            "asl_blocks_found": len(results),
+            "validated_blocks": validated_blocks,
+            "failed_validations": failed_validations,
+            "parsing_results": list(results),
+            "introspective_reflection": summary._reflect_on_parsing_state(),
+            "cognitive_transparency_report": summary._generate_transparency_report()
+        }
@@ -0,0 +1,558 @@
+"""
+Offline vector recall for archived memories and ingested reports
+
+Embeddings come from a deterministic hashing vectorizer - word unigrams and
+bigrams (lowercased, diacritics folded) hashed with crc32 into a signed,
+log-scaled, L2-normalized float32 vector - so no model download is needed
+and the same text always maps to the same vector in every process.
+
+Vectors live in one growable NumPy matrix. Below ``train_threshold``
+memories a query is an exact matrix-vector product; above it a spherical
+k-means coarse quantizer (IVF) splits the matrix into inverted lists and a
+query only scores the ``n_probe`` lists closest to it. New memories are
+assigned to their nearest list as they arrive; the quantizer is retrained
+after the index has grown 4x since the last training.
+
+MemoryRecallIndex also implements the ``store(data, collection=...)`` /
+``index(data, tags=...)`` calls ArchivusAgent makes on its ChromaDB and
+LlamaIndex objects, so the agent can run with it alone.
+
+On disk an index is a snapshot (vectors-<n>.npy, centroids-<n>.npy and
+recall.json naming them) plus an append-only log recall-<n>.log of the
+memories added or updated since. flush() appends to the log and rewrites
+the snapshot only once the log has grown to a quarter of the index. Snapshot
+files are written under new names and committed by replacing recall.json,
+so a crash leaves either the old or the new snapshot, never a mix.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Union
+from array import array
+import base64
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import threading
+import unicodedata
+import zlib
+
+from .vectorized_metrics import _require_numpy, np
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"\w+")
+_DEFAULT_COLLECTION = "aethero_memory"
+_SNAPSHOT_FILE = "recall.json"
+_SNAPSHOT_FILES = re.compile(r"(vectors|centroids)-\d+\.npy|recall-\d+\.log|(vectors|centroids)\.npy")
+# flush() rewrites the snapshot once the log holds this share of the index
+SNAPSHOT_LOG_RATIO = 0.25
+SNAPSHOT_MIN_LOG = 1024
+
+
+def _fold(text: str) -> str:
+    """Lowercase without diacritics - 'Pamäť' and 'pamat' share features"""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+class HashingVectorizer:
+    """
+    Deterministický hashovací vektorizér textu.
+
+    Args:
+        dim: Vector dimension
+        bigrams: Also hash adjacent word pairs
+    """
+
+    def __init__(self, dim: int = 256, bigrams: bool = True):
+        _require_numpy()
+        self.dim = dim
+        self.bigrams = bigrams
+
+    def _features(self, text: str) -> List[str]:
+        words = _WORD.findall(_fold(text))
+        if self.bigrams:
+            return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+        return words
+
+    def transform_one(self, text: str) -> "np.ndarray":
+        hashes = np.fromiter((zlib.crc32(feature.encode("utf-8")) for feature in self._features(text)), dtype=np.uint32)
+        vector = np.zeros(self.dim, dtype=np.float32)
+        if len(hashes):
+            # Low bits pick the dimension, the top bit the sign (keeps dot products unbiased)
+            signs = np.where(hashes >> 31, -1.0, 1.0)
+            counts = np.bincount(hashes % self.dim, weights=signs, minlength=self.dim)
+            vector[:] = np.sign(counts) * np.log1p(np.abs(counts))
+            norm = np.linalg.norm(vector)
+            if norm:
+                vector /= norm
+        return vector
+
+    def transform(self, texts: Iterable[str]) -> "np.ndarray":
+        texts = list(texts)
+        matrix = np.empty((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            matrix[row] = self.transform_one(text)
+        return matrix
+
+
+class RecallHit(NamedTuple):
+    """Jedna vybavená spomienka - id, kosínusová podobnosť, text a metadáta"""
+    id: str
+    score: float
+    text: str
+    metadata: Dict[str, Any]
+
+
+def memory_text(data: Any) -> str:
+    """Searchable text of an archived payload - its content/text field, else canonical JSON"""
+    if isinstance(data, str):
+        return data
+    if isinstance(data, Mapping):
+        for field in ("content", "text", "thought_stream"):
+            if isinstance(data.get(field), str):
+                return data[field]
+    return json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def memory_id(data: Any) -> str:
+    """Explicit id/ref_code of the payload, else a content hash (so re-archiving merges)"""
+    if isinstance(data, Mapping):
+        for field in ("id", "ref_code", "entity_id", "memory_reference"):
+            if data.get(field):
+                return str(data[field])
+    return hashlib.sha1(memory_text(data).encode("utf-8")).hexdigest()
+
+
+class MemoryRecallIndex:
+    """
+    Lokálny index na vybavovanie spomienok (IVF nad hashovanými vektormi).
+
+    Args:
+        dim: Embedding dimension (ignored when a vectorizer is given)
+        n_lists: Inverted lists of the coarse quantizer (default ~sqrt(size))
+        n_probe: Lists scanned per query
+        train_threshold: Exact search below this many memories
+        vectorizer: Text -> vector function object with transform_one/transform
+    """
+
+    def __init__(self, dim: int = 256, n_lists: Optional[int] = None, n_probe: int = 16,
+                 train_threshold: int = 20000, vectorizer: Optional[HashingVectorizer] = None):
+        _require_numpy()
+        self.vectorizer = vectorizer or HashingVectorizer(dim)
+        self.dim = self.vectorizer.dim
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.train_threshold = train_threshold
+        self._lock = threading.RLock()
+
+        self._vectors = np.empty((0, self.dim), dtype=np.float32)
+        self._count = 0
+        self._ids: List[str] = []
+        self._texts: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+        self._rows: Dict[str, int] = {}
+        self._collections: Dict[str, int] = {}
+        self._collection_codes = array("h")
+
+        self._centroids: Optional["np.ndarray"] = None
+        self._offsets: List[int] = []
+        self._tails: List[array] = []
+        self._trained_count = 0
+
+        # Persistence: ids changed since the last save()/flush() and the log they go to
+        self._unsaved: Dict[str, None] = {}
+        self._saved_directory: Optional[str] = None
+        self._generation = 0
+        self._log_entries = 0
+
+    @classmethod
+    def from_env(cls) -> "MemoryRecallIndex":
+        """Index saved in AETHERO_RECALL_DIR if there is one, otherwise a new empty index"""
+        directory = os.environ.get("AETHERO_RECALL_DIR")
+        if directory and os.path.exists(os.path.join(directory, _SNAPSHOT_FILE)):
+            return cls.load(directory)
+        return cls(n_probe=int(os.environ.get("AETHERO_RECALL_N_PROBE", "16")))
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    # ArchivusAgent interface (ChromaDB store / LlamaIndex index)
+
+    def store(self, data: Any, collection: str = _DEFAULT_COLLECTION) -> str:
+        """Archive a payload into a collection; returns its memory id"""
+        return self.add(memory_text(data), memory_id(data), {"collection": collection, "data": data})
+
+    def index(self, data: Any, tags: Optional[Mapping[str, Any]] = None) -> str:
+        """Index a payload with its ASL tags; returns its memory id"""
+        return self.add(memory_text(data), memory_id(data), {"tags": dict(tags or {}), "data": data})
+
+    # Adding
+
+    def add(self, text: str, memory_id: Optional[str] = None, metadata: Optional[Mapping[str, Any]] = None) -> str:
+        """Add or update one memory; metadata of an existing id is merged"""
+        memory_id = memory_id or hashlib.sha1(text.encode("utf-8")).hexdigest()
+        self.add_vectors(self.vectorizer.transform_one(text)[None, :], [memory_id], [text], [metadata or {}])
+        return memory_id
+
+    def add_many(self, texts: Sequence[str], memory_ids: Optional[Sequence[str]] = None,
+                 metadatas: Optional[Sequence[Mapping[str, Any]]] = None) -> List[str]:
+        memory_ids = list(memory_ids) if memory_ids is not None else [hashlib.sha1(text.encode("utf-8")).hexdigest() for text in texts]
+        self.add_vectors(self.vectorizer.transform(texts), memory_ids, texts, metadatas)
+        return memory_ids
+
+    def add_vectors(self, vectors: "np.ndarray", memory_ids: Sequence[str], texts: Optional[Sequence[str]] = None,
+                    metadatas: Optional[Sequence[Mapping[str, Any]]] = None) -> None:
+        """
+        INTENT: Inkrementálne rozšírenie pamäte bez prestavby indexu
+        ACTION: Zápis vektorov do matice a priradenie k najbližšiemu zoznamu
+        OUTPUT: Nové spomienky sú hneď vyhľadateľné
+        HOOK: memory_recall_added
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected vectors of shape (n, {self.dim}), got {vectors.shape}")
+        with self._lock:
+            new_rows = []
+            for position, memory_id in enumerate(memory_ids):
+                self._unsaved[memory_id] = None
+                metadata = dict(metadatas[position]) if metadatas is not None else {}
+                text = texts[position] if texts is not None else ""
+                row = self._rows.get(memory_id)
+                if row is None:
+                    row = self._append_row(memory_id, text, metadata)
+                    new_rows.append(row)
+                else:
+                    self._metadata[row].update(metadata)
+                    self._texts[row] = text or self._texts[row]
+                    if "collection" in metadata:
+                        self._collection_codes[row] = self._collection_code(metadata["collection"])
+                # An updated memory keeps its list - its score is exact, only its list may be less apt
+                self._vectors[row] = vectors[position]
+
+            if self.is_trained and self._count >= 4 * self._trained_count:
+                self.train()
+            elif self.is_trained:
+                self._assign_tail(np.asarray(new_rows, dtype=np.int64))
+            elif self._count >= self.train_threshold:
+                self.train()
+
+    def _collection_code(self, collection: str) -> int:
+        return self._collections.setdefault(collection, len(self._collections))
+
+    def _append_row(self, memory_id: str, text: str, metadata: Dict[str, Any]) -> int:
+        row = self._count
+        if row == len(self._vectors):
+            grown = np.empty((max(1024, 2 * len(self._vectors)), self.dim), dtype=np.float32)
+            grown[:row] = self._vectors[:row]
+            self._vectors = grown
+        self._count += 1
+        self._ids.append(memory_id)
+        self._texts.append(text)
+        self._metadata.append(metadata)
+        self._rows[memory_id] = row
+        self._collection_codes.append(self._collection_code(metadata.get("collection", _DEFAULT_COLLECTION)))
+        return row
+
+    def add_reports_directory(self, directory: Union[str, os.PathLike]) -> int:
+        """Index aeth_ingest reports - <ref_code>.md with its optional .json metadata"""
+        texts, memory_ids, metadatas = [], [], []
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".md"):
+                continue
+            base = os.path.join(directory, name[:-3])
+            with open(base + ".md", encoding="utf-8") as handle:
+                texts.append(handle.read())
+            metadata = {"collection": "aeth_mem_reports", "source": base + ".md"}
+            if os.path.exists(base + ".json"):
+                with open(base + ".json", encoding="utf-8") as handle:
+                    metadata["report"] = json.load(handle)
+            memory_ids.append(metadata.get("report", {}).get("ref_code", name[:-3]))
+            metadatas.append(metadata)
+        if texts:
+            self.add_many(texts, memory_ids, metadatas)
+        return len(texts)
+
+    # Coarse quantizer
+
+    def train(self, n_lists: Optional[int] = None, iterations: int = 8, sample_size: Optional[int] = None, seed: int = 0) -> None:
+        """
+        INTENT: Rozdelenie pamäte na inverzné zoznamy
+        ACTION: Sférický k-means na vzorke, potom priradenie všetkých vektorov
+        OUTPUT: Natrénovaný hrubý kvantizér (IVF)
+        HOOK: memory_recall_trained
+        """
+        with self._lock:
+            count = self._count
+            if count == 0:
+                return
+            n_lists = n_lists or self.n_lists or min(4096, max(16, int(math.sqrt(count))))
+            n_lists = min(n_lists, count)
+            rng = np.random.default_rng(seed)
+            sample_size = min(count, sample_size or 64 * n_lists)
+            sample = self._vectors[np.sort(rng.choice(count, sample_size, replace=False))]
+
+            centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+            for _ in range(iterations):
+                assignment = self._nearest(sample, centroids)
+                order = np.argsort(assignment, kind="stable")
+                members, starts = np.unique(assignment[order], return_index=True)
+                sums = np.add.reduceat(sample[order], starts, axis=0)
+                centroids[members] = sums
+                empty = np.setdiff1d(np.arange(n_lists), members)
+                if len(empty):
+                    centroids[empty] = sample[rng.choice(sample_size, len(empty), replace=False)]
+                norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+                centroids /= np.where(norms == 0, 1.0, norms)
+
+            self._centroids = centroids
+            self._pack()
+            logger.info(f"Memory recall quantizer trained: {count} memories in {n_lists} lists")
+
+    @staticmethod
+    def _nearest(vectors: "np.ndarray", centroids: "np.ndarray", chunk: int = 65536) -> "np.ndarray":
+        assignment = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), chunk):
+            assignment[start:start + chunk] = np.argmax(vectors[start:start + chunk] @ centroids.T, axis=1)
+        return assignment
+
+    def _pack(self) -> None:
+        """
+        Renumber rows so that every inverted list is one contiguous block
+
+        A probed list is then scored as a matrix slice, without gathering
+        rows. Memories added later go to per-list tails until the next train().
+        """
+        count = self._count
+        assignment = self._nearest(self._vectors[:count], self._centroids)
+        order = np.argsort(assignment, kind="stable")
+        self._vectors[:count] = self._vectors[order]
+        positions = order.tolist()
+        self._ids = [self._ids[row] for row in positions]
+        self._texts = [self._texts[row] for row in positions]
+        self._metadata = [self._metadata[row] for row in positions]
+        self._collection_codes = array("h", np.frombuffer(self._collection_codes, dtype=np.int16)[order].tobytes())
+        self._rows = {memory_id: row for row, memory_id in enumerate(self._ids)}
+
+        sizes = np.bincount(assignment, minlength=len(self._centroids))
+        self._offsets = np.concatenate(([0], np.cumsum(sizes))).tolist()
+        self._tails = [array("q") for _ in range(len(self._centroids))]
+        self._trained_count = count
+
+    def _assign_tail(self, rows: "np.ndarray") -> None:
+        if len(rows) == 0:
+            return
+        assignment = self._nearest(self._vectors[rows], self._centroids)
+        for member, row in zip(assignment.tolist(), rows.tolist()):
+            self._tails[member].append(row)
+
+    # Searching
+
+    def search(self, query: Union[str, "np.ndarray"], k: int = 5, collection: Optional[str] = None,
+               n_probe: Optional[int] = None) -> List[RecallHit]:
+        """
+        INTENT: Vybavenie najpodobnejších spomienok
+        ACTION: Skóre centroidov, prehľadanie n_probe zoznamov a top-k výber
+        OUTPUT: Spomienky zoradené podľa kosínusovej podobnosti
+        HOOK: memory_recall_searched
+        """
+        vector = self.vectorizer.transform_one(query) if isinstance(query, str) else np.asarray(query, dtype=np.float32)
+        with self._lock:
+            if self._count == 0:
+                return []
+            if self.is_trained:
+                probe = min(n_probe or self.n_probe, len(self._tails))
+                closest = np.argpartition(self._centroids @ vector, -probe)[-probe:].tolist()
+                score_blocks, row_blocks = [], []
+                for member in closest:
+                    start, stop = self._offsets[member], self._offsets[member + 1]
+                    score_blocks.append(self._vectors[start:stop] @ vector)
+                    row_blocks.append(np.arange(start, stop, dtype=np.int64))
+                    if self._tails[member]:
+                        tail = np.array(self._tails[member], dtype=np.int64)
+                        score_blocks.append(self._vectors[tail] @ vector)
+                        row_blocks.append(tail)
+                scores, candidates = np.concatenate(score_blocks), np.concatenate(row_blocks)
+            else:
+                candidates = np.arange(self._count, dtype=np.int64)
+                scores = self._vectors[:self._count] @ vector
+            if collection is not None:
+                code = self._collections.get(collection)
+                codes = np.frombuffer(self._collection_codes, dtype=np.int16)
+                keep = codes[candidates] == code if code is not None else np.zeros(len(candidates), dtype=bool)
+                scores, candidates = scores[keep], candidates[keep]
+            if len(candidates) == 0:
+                return []
+
+            top = min(k, len(scores))
+            best = np.argpartition(scores, -top)[-top:]
+            best = best[np.argsort(scores[best])[::-1]]
+            return [
+                RecallHit(self._ids[row], float(scores[position]), self._texts[row], self._metadata[row])
+                for position, row in zip(best.tolist(), candidates[best].tolist())
+            ]
+
+    def get(self, memory_id: str) -> Optional[RecallHit]:
+        row = self._rows.get(memory_id)
+        if row is None:
+            return None
+        return RecallHit(memory_id, 1.0, self._texts[row], self._metadata[row])
+
+    # Persistence
+
+    def save(self, directory: Union[str, os.PathLike]) -> None:
+        """
+        Full snapshot: vectors-<n>.npy (+ centroids-<n>.npy) and recall.json with ids, texts and metadata
+
+        The new files are written first and recall.json is replaced last, so
+        the directory always holds one consistent snapshot. The log of the
+        previous snapshot and its files are removed afterwards.
+        """
+        with self._lock:
+            os.makedirs(directory, exist_ok=True)
+            snapshot_path = os.path.join(directory, _SNAPSHOT_FILE)
+            generation = 1
+            if os.path.exists(snapshot_path):
+                with open(snapshot_path, encoding="utf-8") as handle:
+                    generation = json.load(handle).get("generation", 0) + 1
+            files = {
+                "vectors": f"vectors-{generation}.npy",
+                "centroids": f"centroids-{generation}.npy" if self.is_trained else None,
+                "log": f"recall-{generation}.log",
+            }
+            _write_atomic(os.path.join(directory, files["vectors"]),
+                          lambda handle: np.save(handle, self._vectors[:self._count]))
+            if self.is_trained:
+                _write_atomic(os.path.join(directory, files["centroids"]),
+                              lambda handle: np.save(handle, self._centroids))
+            state = {
+                "generation": generation,
+                **files,
+                "dim": self.dim,
+                "bigrams": self.vectorizer.bigrams,
+                "n_lists": self.n_lists,
+                "n_probe": self.n_probe,
+                "train_threshold": self.train_threshold,
+                "trained_count": self._trained_count,
+                "ids": self._ids,
+                "texts": self._texts,
+                "metadata": self._metadata,
+            }
+            payload = json.dumps(state, ensure_ascii=False, default=str).encode("utf-8")
+            _write_atomic(snapshot_path, lambda handle: handle.write(payload))
+
+            current = {name for name in files.values() if name}
+            for name in os.listdir(directory):
+                if _SNAPSHOT_FILES.fullmatch(name) and name not in current:
+                    os.remove(os.path.join(directory, name))
+            self._saved_directory = os.path.abspath(directory)
+            self._generation = generation
+            self._log_entries = 0
+            self._unsaved.clear()
+
+    def flush(self, directory: Union[str, os.PathLike]) -> int:
+        """
+        INTENT: Inkrementálne uloženie zmien od posledného save()/flush()
+        ACTION: Pripojenie zmenených spomienok do logu, občas nový snapshot
+        OUTPUT: Počet zapísaných spomienok
+        HOOK: memory_recall_flushed
+
+        A full snapshot is written instead when the directory does not hold
+        this index's snapshot yet, or when the log would reach a quarter of
+        the index (at least SNAPSHOT_MIN_LOG entries).
+        """
+        with self._lock:
+            changed = len(self._unsaved)
+            if (self._saved_directory != os.path.abspath(directory)
+                    or self._log_entries + changed >= max(SNAPSHOT_MIN_LOG, int(self._count * SNAPSHOT_LOG_RATIO))):
+                self.save(directory)
+                return changed
+            if not changed:
+                return 0
+            lines = []
+            for memory_id in self._unsaved:
+                row = self._rows[memory_id]
+                lines.append(json.dumps({
+                    "id": memory_id,
+                    "text": self._texts[row],
+                    "metadata": self._metadata[row],
+                    "vector": base64.b64encode(self._vectors[row].astype("<f4").tobytes()).decode("ascii"),
+                }, ensure_ascii=False, default=str) + "\n")
+            with open(os.path.join(directory, f"recall-{self._generation}.log"), "a", encoding="utf-8") as handle:
+                handle.writelines(lines)
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._log_entries += changed
+            self._unsaved.clear()
+            return changed
+
+    @classmethod
+    def load(cls, directory: Union[str, os.PathLike]) -> "MemoryRecallIndex":
+        """Snapshot from recall.json plus the memories of its log"""
+        with open(os.path.join(directory, _SNAPSHOT_FILE), encoding="utf-8") as handle:
+            state = json.load(handle)
+        recall = cls(n_lists=state["n_lists"], n_probe=state["n_probe"], train_threshold=state["train_threshold"],
+                     vectorizer=HashingVectorizer(state["dim"], state["bigrams"]))
+        vectors = np.load(os.path.join(directory, state.get("vectors", "vectors.npy")))
+        if len(vectors) != len(state["ids"]):
+            raise ValueError(f"Recall snapshot in {directory} has {len(vectors)} vectors for {len(state['ids'])} ids")
+        for memory_id, text, metadata in zip(state["ids"], state["texts"], state["metadata"]):
+            recall._append_row(memory_id, text, metadata)
+        recall._vectors[:len(vectors)] = vectors
+        # Snapshots written before the generation layout name their centroids centroids.npy
+        centroids_name = state["centroids"] if "centroids" in state else "centroids.npy"
+        if centroids_name and os.path.exists(os.path.join(directory, centroids_name)):
+            recall._centroids = np.load(os.path.join(directory, centroids_name))
+            recall._pack()
+            recall._trained_count = state["trained_count"]
+
+        if "log" in state:
+            recall._log_entries = recall._replay_log(os.path.join(directory, state["log"]))
+            recall._saved_directory = os.path.abspath(directory)
+            recall._generation = state["generation"]
+        recall._unsaved.clear()
+        return recall
+
+    def _replay_log(self, path: str) -> int:
+        """Apply the log of a snapshot; a torn last line (crash while appending) is cut off"""
+        if not os.path.exists(path):
+            return 0
+        memory_ids, texts, metadatas, vectors = [], [], [], []
+        valid_end = 0
+        with open(path, "rb") as handle:
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                memory_ids.append(entry["id"])
+                texts.append(entry["text"])
+                metadatas.append(entry["metadata"])
+                vectors.append(base64.b64decode(entry["vector"]))
+                valid_end += len(line)
+        if valid_end < os.path.getsize(path):
+            logger.warning(f"Truncating torn memory recall log {path} at byte {valid_end}")
+            with open(path, "r+b") as handle:
+                handle.truncate(valid_end)
+        if memory_ids:
+            matrix = np.frombuffer(b"".join(vectors), dtype="<f4").reshape(len(memory_ids), self.dim)
+            self.add_vectors(matrix, memory_ids, texts, metadatas)
+        return len(memory_ids)
+
+
+def _write_atomic(path: str, write: Any) -> None:
+    """Write a file under a temporary name, fsync it and move it into place"""
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as handle:
+        write(handle)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, path)
@@ -13,10 +13,22 @@ import logging
 from dataclasses import dataclass, asdict
 from enum import Enum
 from .models import ASLCognitiveTag, MentalStateEnum, EmotionToneEnum, TemporalContextEnum
+from .bounded_history import BoundedHistory, HistoryPolicy
+from .vectorized_metrics import NUMPY_AVAILABLE, CognitiveTagArrays, VectorizedCognitiveEngine
 
 # AETH-TASK-003 :: ROLE: Lucius :: GOAL: Production-ready cognitive metrics
 logger = logging.getLogger(__name__)
 
+# Temporálne horizonty pre hodnotiace tabuľky - TemporalContextEnum nepozná
+# IMMEDIATE/SHORT_TERM/LONG_TERM, kontext sa preto mapuje na horizont
+TEMPORAL_HORIZONS = {
+    TemporalContextEnum.PRESENT: "immediate",
+    TemporalContextEnum.PAST: "short_term",
+    TemporalContextEnum.FUTURE: "short_term",
+    TemporalContextEnum.TIMELESS: "long_term",
+    TemporalContextEnum.CYCLICAL: "long_term",
+}
+
 @dataclass
 class CognitiveMetrics:
     """Štruktúra pre kognitívne metriky s plnou introspekciou"""
@@ -42,6 +54,12 @@ class CognitiveAnalysisMode(Enum):
     BATCH_ANALYSIS = "batch_analysis"
     EMERGENCY_ASSESSMENT = "emergency_assessment"
 
+class CognitiveMetricsBackend(Enum):
+    """Výpočtové backendy kognitívnych metrík"""
+    PYTHON = "python"
+    NUMPY = "numpy"
+    AUTO = "auto"  # NumPy pre väčšie dávky, ak je dostupný
+
 class AetheroCognitiveAnalyzer:
     """
     AETH-CRITICAL-2025-0002 :: Produkčný kognitívny analyzátor
@@ -53,26 +71,63 @@ class AetheroCognitiveAnalyzer:
     pre systém Aethero s plnou produkčnou podporou.
     """
     
-    def __init__(self, analysis_mode: CognitiveAnalysisMode = CognitiveAnalysisMode.STANDARD):
+    def __init__(self, analysis_mode: CognitiveAnalysisMode = CognitiveAnalysisMode.STANDARD,
+                 backend: CognitiveMetricsBackend = CognitiveMetricsBackend.AUTO,
+                 history_policy: Optional[HistoryPolicy] = None):
         """
         Inicializácia produkčného kognitívneho analyzátora
         
         Args:
             analysis_mode: Režim analýzy (STANDARD, DEEP_INTROSPECTION, atď.)
+            backend: Výpočtový backend metrík (PYTHON, NUMPY, AUTO)
+            history_policy: Kapacita, retencia a spill ohraničených histórií
         """
+        if backend == CognitiveMetricsBackend.NUMPY and not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for CognitiveMetricsBackend.NUMPY")
         self.analysis_mode = analysis_mode
+        self.backend = backend
         self.session_id = f"aethero_cognitive_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        self.analysis_history: List[CognitiveMetrics] = []
-        self.cognitive_flow_patterns = []
-        self.mental_state_transitions = []
+        self.history_policy = history_policy or HistoryPolicy()
+        self.analysis_history: BoundedHistory[CognitiveMetrics] = self.history_policy.create("analysis_history")
+        self.cognitive_flow_patterns: BoundedHistory[Dict[str, Any]] = self.history_policy.create(
+            "cognitive_flow_patterns", capacity=min(self.history_policy.capacity, 100)
+        )
+        self.mental_state_transitions: BoundedHistory[Dict[str, Any]] = self.history_policy.create("mental_state_transitions")
+        # Priebežný súčet zdravia za celú session - nezávislý od kapacity histórie
+        self._health_sum = 0.0
         
         # Pokročilé konfiguračné parametre
         self.coherence_threshold = 0.7
         self.complexity_scaling_factor = 1.2
         self.temporal_weight_decay = 0.95
         
+        # Pod touto veľkosťou dávky je čistý Python rýchlejší než réžia NumPy
+        self.vectorized_min_tags = 64
+        self._vectorized_engine: Optional[VectorizedCognitiveEngine] = None
+        
         logger.info(f"AetheroCognitiveAnalyzer initialized in {analysis_mode.value} mode")
     
+    def new_session(self) -> "AetheroCognitiveAnalyzer":
+        """
+        Analyzátor pre jednu požiadavku so zdieľaným predzahriatym enginom
+        
+        The session copies this analyzer's configuration and shares its
+        vectorized engine (lookup tables are read-only), but keeps its own
+        session id and histories.
+        """
+        session = AetheroCognitiveAnalyzer(self.analysis_mode, self.backend, self.history_policy)
+        session.coherence_threshold = self.coherence_threshold
+        session.complexity_scaling_factor = self.complexity_scaling_factor
+        session.temporal_weight_decay = self.temporal_weight_decay
+        session.vectorized_min_tags = self.vectorized_min_tags
+        session._vectorized_engine = self._vectorized_engine
+        return session
+    
+    def warm_up(self) -> None:
+        """Vytvorenie vektorizovaného enginu vopred, aby ho prvá požiadavka nečakala"""
+        if NUMPY_AVAILABLE and self.backend != CognitiveMetricsBackend.PYTHON and self._vectorized_engine is None:
+            self._vectorized_engine = VectorizedCognitiveEngine(self)
+    
     def analyze_cognitive_tags(self, cognitive_tags: List[ASLCognitiveTag]) -> CognitiveMetrics:
         """
         INTENT: Komplexná analýza kognitívnych tagov
@@ -81,7 +136,7 @@ class AetheroCognitiveAnalyzer:
         HOOK: cognitive_analysis_completed
         
         Args:
-            cognitive_tags: Zoznam validovaných ASL kognitívnych tagov
+            cognitive_tags: Zoznam validovaných ASL kognitívnych tagov (ASLCognitiveTag alebo CompactCognitiveTag)
             
         Returns:
             CognitiveMetrics: Kompletné kognitívne metriky
@@ -91,6 +146,9 @@ class AetheroCognitiveAnalyzer:
                 logger.warning("Empty cognitive_tags provided to analyzer")
                 return self._create_empty_metrics()
             
+            if self._use_vectorized_backend(len(cognitive_tags)):
+                return self.analyze_tag_arrays(CognitiveTagArrays.from_tags(cognitive_tags))
+            
             logger.info(f"Analyzing {len(cognitive_tags)} cognitive tags in {self.analysis_mode.value} mode")
             
             # Výpočet jednotlivých metrík
@@ -101,36 +159,94 @@ class AetheroCognitiveAnalyzer:
             temporal_awareness = self.calculate_temporal_awareness_level(cognitive_tags)
             introspective_clarity = self.calculate_introspective_clarity_score(cognitive_tags)
             
-            # Výpočet celkového kognitívneho zdravia
-            overall_health = self._calculate_overall_cognitive_health(
+            return self._finalize_metrics(
                 consciousness_coherence, complexity_index, stability_factor,
-                resonance_depth, temporal_awareness, introspective_clarity
+                resonance_depth, temporal_awareness, introspective_clarity,
+                self._summarize_cognitive_patterns(cognitive_tags)
             )
             
-            # Vytvorenie metrík
-            metrics = CognitiveMetrics(
-                consciousness_coherence_rate=consciousness_coherence,
-                cognitive_complexity_index=complexity_index,
-                mental_stability_factor=stability_factor,
-                emotional_resonance_depth=resonance_depth,
-                temporal_awareness_level=temporal_awareness,
-                introspective_clarity_score=introspective_clarity,
-                overall_cognitive_health=overall_health,
-                analysis_timestamp=datetime.now().isoformat(),
-                session_id=self.session_id
-            )
+        except Exception as e:
+            logger.error(f"Error in cognitive analysis: {str(e)}")
+            return self._create_error_metrics(str(e))
+    
+    def analyze_tag_arrays(self, tag_arrays: CognitiveTagArrays) -> CognitiveMetrics:
+        """
+        INTENT: Vektorizovaná analýza už zakódovaných kognitívnych tagov
+        ACTION: Výpočet všetkých metrík NumPy backendom v jednom prechode
+        OUTPUT: Štruktúrované kognitívne metriky
+        HOOK: cognitive_analysis_completed
+        
+        Args:
+            tag_arrays: Stĺpcovo zakódované tagy (CognitiveTagArrays.from_tags/from_batch)
             
-            # Uloženie do histórie
-            self.analysis_history.append(metrics)
-            self._update_cognitive_patterns(cognitive_tags, metrics)
+        Returns:
+            CognitiveMetrics: Kompletné kognitívne metriky
+        """
+        try:
+            if len(tag_arrays) == 0:
+                logger.warning("Empty tag arrays provided to analyzer")
+                return self._create_empty_metrics()
             
-            logger.info(f"Cognitive analysis completed - Overall health: {overall_health:.3f}")
-            return metrics
+            logger.info(f"Analyzing {len(tag_arrays)} cognitive tags in {self.analysis_mode.value} mode (numpy backend)")
+            
+            if self._vectorized_engine is None:
+                self._vectorized_engine = VectorizedCognitiveEngine(self)
+            values = self._vectorized_engine.compute(tag_arrays)
+            
+            return self._finalize_metrics(
+                values["consciousness_coherence_rate"],
+                values["cognitive_complexity_index"],
+                values["mental_stability_factor"],
+                values["emotional_resonance_depth"],
+                values["temporal_awareness_level"],
+                values["introspective_clarity_score"],
+                values["pattern_summary"]
+            )
             
         except Exception as e:
-            logger.error(f"Error in cognitive analysis: {str(e)}")
+            logger.error(f"Error in vectorized cognitive analysis: {str(e)}")
             return self._create_error_metrics(str(e))
     
+    def _use_vectorized_backend(self, tag_count: int) -> bool:
+        """Rozhodnutie, či použiť NumPy backend pre danú veľkosť dávky"""
+        if self.backend == CognitiveMetricsBackend.NUMPY:
+            return True
+        if self.backend == CognitiveMetricsBackend.AUTO:
+            return NUMPY_AVAILABLE and tag_count >= self.vectorized_min_tags
+        return False
+    
+    def _finalize_metrics(self, consciousness_coherence: float, complexity_index: float,
+                          stability_factor: float, resonance_depth: float,
+                          temporal_awareness: float, introspective_clarity: float,
+                          pattern_summary: Dict[str, Any], record: bool = True) -> CognitiveMetrics:
+        """Výpočet celkového zdravia, vytvorenie metrík a (voliteľne) zápis do histórie"""
+        # Výpočet celkového kognitívneho zdravia
+        overall_health = self._calculate_overall_cognitive_health(
+            consciousness_coherence, complexity_index, stability_factor,
+            resonance_depth, temporal_awareness, introspective_clarity
+        )
+        
+        # Vytvorenie metrík
+        metrics = CognitiveMetrics(
+            consciousness_coherence_rate=consciousness_coherence,
+            cognitive_complexity_index=complexity_index,
+            mental_stability_factor=stability_factor,
+            emotional_resonance_depth=resonance_depth,
+            temporal_awareness_level=temporal_awareness,
+            introspective_clarity_score=introspective_clarity,
+            overall_cognitive_health=overall_health,
+            analysis_timestamp=datetime.now().isoformat(),
+            session_id=self.session_id
+        )
+        
+        if record:
+            # Uloženie do histórie
+            self.analysis_history.append(metrics)
+            self._health_sum += overall_health
+            self._update_cognitive_patterns(pattern_summary, metrics)
+            logger.info(f"Cognitive analysis completed - Overall health: {overall_health:.3f}")
+        return metrics
+    
     def calculate_consciousness_coherence_rate(self, cognitive_tags: List[ASLCognitiveTag]) -> float:
         """
         INTENT: Výpočet miery koherencie vedomia
@@ -141,36 +257,7 @@ class AetheroCognitiveAnalyzer:
         if not cognitive_tags:
             return 0.0
         
-        coherence_scores = []
-        
-        for tag in cognitive_tags:
-            # Koherencia mentálneho stavu a emócie
-            mental_emotion_coherence = self._assess_mental_emotion_coherence(
-                tag.mental_state, tag.emotion_tone
-            )
-            
-            # Koherencia kognitívnej záťaže a istoty
-            load_certainty_coherence = self._assess_load_certainty_coherence(
-                tag.cognitive_load, tag.certainty_level
-            )
-            
-            # Temporálna koherencia
-            temporal_coherence = self._assess_temporal_coherence(
-                tag.temporal_context, tag.cognitive_load
-            )
-            
-            # Introspektívna koherencia
-            introspective_coherence = self._assess_introspective_coherence(tag)
-            
-            # Váhovaný priemer koherencie
-            tag_coherence = (
-                mental_emotion_coherence * 0.3 +
-                load_certainty_coherence * 0.25 +
-                temporal_coherence * 0.25 +
-                introspective_coherence * 0.2
-            )
-            
-            coherence_scores.append(tag_coherence)
+        coherence_scores = [self._score_tag_coherence(tag) for tag in cognitive_tags]
         
         # Výpočet celkovej koherencie s penalizáciou za variabilnosť
         mean_coherence = statistics.mean(coherence_scores)
@@ -191,33 +278,7 @@ class AetheroCognitiveAnalyzer:
         if not cognitive_tags:
             return 0.0
         
-        complexity_factors = []
-        
-        for tag in cognitive_tags:
-            # Komplexnosť kognitívnej záťaže
-            load_complexity = min(tag.cognitive_load / 10.0, 1.0)
-            
-            # Komplexnosť na základe mentálneho stavu
-            mental_complexity = self._get_mental_state_complexity(tag.mental_state)
-            
-            # Komplexnosť emočného tónu
-            emotion_complexity = self._get_emotion_complexity(tag.emotion_tone)
-            
-            # Temporálna komplexnosť
-            temporal_complexity = self._get_temporal_complexity(tag.temporal_context)
-            
-            # Nejistota ako faktor komplexnosti
-            uncertainty_factor = 1.0 - tag.certainty_level
-            
-            tag_complexity = (
-                load_complexity * 0.3 +
-                mental_complexity * 0.25 +
-                emotion_complexity * 0.2 +
-                temporal_complexity * 0.15 +
-                uncertainty_factor * 0.1
-            )
-            
-            complexity_factors.append(tag_complexity)
+        complexity_factors = [self._score_tag_complexity(tag) for tag in cognitive_tags]
         
         # Aplikácia scaling faktora pre pokročilé analýzy
         raw_complexity = statistics.mean(complexity_factors)
@@ -273,29 +334,7 @@ class AetheroCognitiveAnalyzer:
         if not cognitive_tags:
             return 0.0
         
-        emotion_scores = []
-        
-        for tag in cognitive_tags:
-            # Základná emočná intenzita
-            emotion_intensity = self._get_emotion_intensity(tag.emotion_tone)
-            
-            # Súlad s mentálnym stavom
-            mental_emotion_alignment = self._assess_mental_emotion_coherence(
-                tag.mental_state, tag.emotion_tone
-            )
-            
-            # Emočná konzistencia s istotou
-            certainty_emotion_alignment = self._assess_certainty_emotion_alignment(
-                tag.certainty_level, tag.emotion_tone
-            )
-            
-            tag_resonance = (
-                emotion_intensity * 0.4 +
-                mental_emotion_alignment * 0.4 +
-                certainty_emotion_alignment * 0.2
-            )
-            
-            emotion_scores.append(tag_resonance)
+        emotion_scores = [self._score_tag_resonance(tag) for tag in cognitive_tags]
         
         # Výpočet hĺbky s ohľadom na emočnú variabilnosť
         mean_resonance = statistics.mean(emotion_scores)
@@ -319,26 +358,8 @@ class AetheroCognitiveAnalyzer:
         temporal_scores = []
         
         for i, tag in enumerate(cognitive_tags):
-            # Základná temporálna orientácia
-            temporal_orientation = self._get_temporal_orientation_score(tag.temporal_context)
-            
-            # Temporálna kontinuita (ak máme predchádzajúce tagy)
-            if i > 0:
-                continuity = self._assess_temporal_continuity(
-                    cognitive_tags[i-1], tag
-                )
-            else:
-                continuity = 0.8  # Prvý tag má dobrú kontinuitu
-            
-            # Temporálna koherencia s kognitívnou záťažou
-            load_temporal_coherence = self._assess_load_temporal_coherence(
-                tag.cognitive_load, tag.temporal_context
-            )
-            
-            tag_temporal_score = (
-                temporal_orientation * 0.4 +
-                continuity * 0.3 +
-                load_temporal_coherence * 0.3
+            tag_temporal_score = self._score_tag_temporal(
+                tag, cognitive_tags[i-1] if i > 0 else None
             )
             
             # Aplikácia váhového rozkladu pre starší kontext
@@ -357,33 +378,7 @@ class AetheroCognitiveAnalyzer:
         if not cognitive_tags:
             return 0.0
         
-        clarity_scores = []
-        
-        for tag in cognitive_tags:
-            # Jasnosť sebapoznania na základe istoty
-            self_awareness_clarity = tag.certainty_level
-            
-            # Jasnosť mentálnej reflexie
-            mental_clarity = self._assess_mental_clarity(tag.mental_state)
-            
-            # Emočná jasnosť
-            emotional_clarity = self._assess_emotional_clarity(tag.emotion_tone)
-            
-            # Temporálna jasnosť
-            temporal_clarity = self._assess_temporal_clarity(tag.temporal_context)
-            
-            # Kognitívna jasnosť (inverzne úmerná záťaži)
-            cognitive_clarity = max(0.0, 1.0 - (tag.cognitive_load / 12.0))
-            
-            tag_clarity = (
-                self_awareness_clarity * 0.25 +
-                mental_clarity * 0.25 +
-                emotional_clarity * 0.2 +
-                temporal_clarity * 0.15 +
-                cognitive_clarity * 0.15
-            )
-            
-            clarity_scores.append(tag_clarity)
+        clarity_scores = [self._score_tag_clarity(tag) for tag in cognitive_tags]
         
         # Bonus za konzistentnú jasnosť
         clarity_variance = statistics.variance(clarity_scores) if len(clarity_scores) > 1 else 0
@@ -393,6 +388,131 @@ class AetheroCognitiveAnalyzer:
         return min(1.0, mean_clarity + consistency_bonus)
     
     
+    # =================================================================
+    # SKÓRE JEDNÉHO TAGU - ZDIEĽANÉ DÁVKOVOU A ONLINE ANALÝZOU
+    # =================================================================
+    
+    def _score_tag_coherence(self, tag: ASLCognitiveTag) -> float:
+        """Váhovaná koherencia jedného tagu"""
+        # Koherencia mentálneho stavu a emócie
+        mental_emotion_coherence = self._assess_mental_emotion_coherence(
+            tag.mental_state, tag.emotion_tone
+        )
+        
+        # Koherencia kognitívnej záťaže a istoty
+        load_certainty_coherence = self._assess_load_certainty_coherence(
+            tag.cognitive_load, tag.certainty_level
+        )
+        
+        # Temporálna koherencia
+        temporal_coherence = self._assess_temporal_coherence(
+            tag.temporal_context, tag.cognitive_load
+        )
+        
+        # Introspektívna koherencia
+        introspective_coherence = self._assess_introspective_coherence(tag)
+        
+        # Váhovaný priemer koherencie
+        return (
+            mental_emotion_coherence * 0.3 +
+            load_certainty_coherence * 0.25 +
+            temporal_coherence * 0.25 +
+            introspective_coherence * 0.2
+        )
+    
+    def _score_tag_complexity(self, tag: ASLCognitiveTag) -> float:
+        """Komplexnosť jedného tagu"""
+        # Komplexnosť kognitívnej záťaže
+        load_complexity = self._get_load_complexity(tag.cognitive_load)
+        
+        # Komplexnosť na základe mentálneho stavu
+        mental_complexity = self._get_mental_state_complexity(tag.mental_state)
+        
+        # Komplexnosť emočného tónu
+        emotion_complexity = self._get_emotion_complexity(tag.emotion_tone)
+        
+        # Temporálna komplexnosť
+        temporal_complexity = self._get_temporal_complexity(tag.temporal_context)
+        
+        # Nejistota ako faktor komplexnosti
+        uncertainty_factor = 1.0 - tag.certainty_level
+        
+        return (
+            load_complexity * 0.3 +
+            mental_complexity * 0.25 +
+            emotion_complexity * 0.2 +
+            temporal_complexity * 0.15 +
+            uncertainty_factor * 0.1
+        )
+    
+    def _score_tag_resonance(self, tag: ASLCognitiveTag) -> float:
+        """Emočná rezonancia jedného tagu"""
+        # Základná emočná intenzita
+        emotion_intensity = self._get_emotion_intensity(tag.emotion_tone)
+        
+        # Súlad s mentálnym stavom
+        mental_emotion_alignment = self._assess_mental_emotion_coherence(
+            tag.mental_state, tag.emotion_tone
+        )
+        
+        # Emočná konzistencia s istotou
+        certainty_emotion_alignment = self._assess_certainty_emotion_alignment(
+            tag.certainty_level, tag.emotion_tone
+        )
+        
+        return (
+            emotion_intensity * 0.4 +
+            mental_emotion_alignment * 0.4 +
+            certainty_emotion_alignment * 0.2
+        )
+    
+    def _score_tag_temporal(self, tag: ASLCognitiveTag, prev_tag: Optional[ASLCognitiveTag]) -> float:
+        """Temporálne skóre jedného tagu (bez váhového rozkladu)"""
+        # Základná temporálna orientácia
+        temporal_orientation = self._get_temporal_orientation_score(tag.temporal_context)
+        
+        # Temporálna kontinuita (ak máme predchádzajúce tagy)
+        if prev_tag is not None:
+            continuity = self._assess_temporal_continuity(prev_tag, tag)
+        else:
+            continuity = 0.8  # Prvý tag má dobrú kontinuitu
+        
+        # Temporálna koherencia s kognitívnou záťažou
+        load_temporal_coherence = self._assess_load_temporal_coherence(
+            tag.cognitive_load, tag.temporal_context
+        )
+        
+        return (
+            temporal_orientation * 0.4 +
+            continuity * 0.3 +
+            load_temporal_coherence * 0.3
+        )
+    
+    def _score_tag_clarity(self, tag: ASLCognitiveTag) -> float:
+        """Introspektívna jasnosť jedného tagu"""
+        # Jasnosť sebapoznania na základe istoty
+        self_awareness_clarity = tag.certainty_level
+        
+        # Jasnosť mentálnej reflexie
+        mental_clarity = self._assess_mental_clarity(tag.mental_state)
+        
+        # Emočná jasnosť
+        emotional_clarity = self._assess_emotional_clarity(tag.emotion_tone)
+        
+        # Temporálna jasnosť
+        temporal_clarity = self._assess_temporal_clarity(tag.temporal_context)
+        
+        # Kognitívna jasnosť (inverzne úmerná záťaži)
+        cognitive_clarity = self._assess_cognitive_clarity(tag.cognitive_load)
+        
+        return (
+            self_awareness_clarity * 0.25 +
+            mental_clarity * 0.25 +
+            emotional_clarity * 0.2 +
+            temporal_clarity * 0.15 +
+            cognitive_clarity * 0.15
+        )
+    
     # =================================================================
     # PRIVATE HELPER METHODS - KOGNITÍVNE HODNOTENIE
     # =================================================================
@@ -437,32 +557,39 @@ class AetheroCognitiveAnalyzer:
     
     def _assess_load_certainty_coherence(self, cognitive_load: int, certainty_level: float) -> float:
         """Hodnotenie koherencie medzi kognitívnou záťažou a úrovňou istoty"""
-        # Vysoká záťaž by mala korelovať s nižšou istotou
-        expected_certainty = max(0.1, 1.0 - (cognitive_load / 12.0))
-        certainty_difference = abs(certainty_level - expected_certainty)
+        certainty_difference = abs(certainty_level - self._get_expected_certainty(cognitive_load))
         return max(0.0, 1.0 - certainty_difference)
     
+    def _get_expected_certainty(self, cognitive_load: int) -> float:
+        """Očakávaná istota pre danú kognitívnu záťaž"""
+        # Vysoká záťaž by mala korelovať s nižšou istotou
+        return max(0.1, 1.0 - (cognitive_load / 12.0))
+    
+    def _get_load_complexity(self, cognitive_load: int) -> float:
+        """Komplexnosť kognitívnej záťaže"""
+        return min(cognitive_load / 10.0, 1.0)
+    
     def _assess_temporal_coherence(self, temporal_context: TemporalContextEnum, cognitive_load: int) -> float:
         """Hodnotenie temporálnej koherencie"""
         temporal_load_coherence = {
-            TemporalContextEnum.IMMEDIATE: {
+            "immediate": {
                 "low_load": (0, 4, 0.9),
                 "medium_load": (4, 8, 0.8),
                 "high_load": (8, 12, 0.6)
             },
-            TemporalContextEnum.SHORT_TERM: {
+            "short_term": {
                 "low_load": (0, 6, 0.8),
                 "medium_load": (6, 10, 0.9),
                 "high_load": (10, 12, 0.7)
             },
-            TemporalContextEnum.LONG_TERM: {
+            "long_term": {
                 "low_load": (0, 5, 0.7),
                 "medium_load": (5, 9, 0.8),
                 "high_load": (9, 12, 0.9)
             }
         }
         
-        context_mapping = temporal_load_coherence.get(temporal_context, {})
+        context_mapping = temporal_load_coherence.get(TEMPORAL_HORIZONS.get(temporal_context), {})
         for load_category, (min_load, max_load, coherence) in context_mapping.items():
             if min_load <= cognitive_load <= max_load:
                 return coherence
@@ -512,11 +639,11 @@ class AetheroCognitiveAnalyzer:
     def _get_temporal_complexity(self, temporal_context: TemporalContextEnum) -> float:
         """Získanie temporálnej komplexnosti"""
         complexity_mapping = {
-            TemporalContextEnum.IMMEDIATE: 0.3,
-            TemporalContextEnum.SHORT_TERM: 0.6,
-            TemporalContextEnum.LONG_TERM: 0.9
+            "immediate": 0.3,
+            "short_term": 0.6,
+            "long_term": 0.9
         }
-        return complexity_mapping.get(temporal_context, 0.5)
+        return complexity_mapping.get(TEMPORAL_HORIZONS.get(temporal_context), 0.5)
     
     def _count_mental_state_transitions(self, mental_states: List[MentalStateEnum]) -> int:
         """Počítanie prechodov medzi mentálnymi stavmi"""
@@ -551,11 +678,11 @@ class AetheroCognitiveAnalyzer:
     def _get_temporal_orientation_score(self, temporal_context: TemporalContextEnum) -> float:
         """Získanie skóre temporálnej orientácie"""
         orientation_mapping = {
-            TemporalContextEnum.IMMEDIATE: 0.9,  # Vysoká orientácia v prítomnosti
-            TemporalContextEnum.SHORT_TERM: 0.7,  # Dobrá orientácia v blízkej budúcnosti
-            TemporalContextEnum.LONG_TERM: 0.6   # Stredná orientácia v dlhodobom kontexte
+            "immediate": 0.9,  # Vysoká orientácia v prítomnosti
+            "short_term": 0.7,  # Dobrá orientácia v blízkej budúcnosti
+            "long_term": 0.6   # Stredná orientácia v dlhodobom kontexte
         }
-        return orientation_mapping.get(temporal_context, 0.5)
+        return orientation_mapping.get(TEMPORAL_HORIZONS.get(temporal_context), 0.5)
     
     def _assess_temporal_continuity(self, prev_tag: ASLCognitiveTag, current_tag: ASLCognitiveTag) -> float:
         """Hodnotenie temporálnej kontinuity medzi tagmi"""
@@ -571,8 +698,7 @@ class AetheroCognitiveAnalyzer:
         
         # Kontinuita kognitívnej záťaže
         load_difference = abs(prev_tag.cognitive_load - current_tag.cognitive_load)
-        load_continuity = max(0.0, 1.0 - (load_difference / 10.0))
-        continuity_scores.append(load_continuity)
+        continuity_scores.append(self._assess_load_continuity(load_difference))
         
         # Kontinuita istoty
         certainty_difference = abs(prev_tag.certainty_level - current_tag.certainty_level)
@@ -581,16 +707,25 @@ class AetheroCognitiveAnalyzer:
         
         return statistics.mean(continuity_scores) if continuity_scores else 0.5
     
+    def _assess_load_continuity(self, load_difference: int) -> float:
+        """Kontinuita kognitívnej záťaže medzi po sebe idúcimi tagmi"""
+        return max(0.0, 1.0 - (load_difference / 10.0))
+    
     def _assess_load_temporal_coherence(self, cognitive_load: int, temporal_context: TemporalContextEnum) -> float:
         """Hodnotenie koherencie záťaže s temporálnym kontextom"""
+        horizon = TEMPORAL_HORIZONS.get(temporal_context)
         # Dlhodobé úlohy môžu mať vyššiu záťaž
-        if temporal_context == TemporalContextEnum.LONG_TERM:
+        if horizon == "long_term":
             return min(1.0, (cognitive_load / 10.0) + 0.3)
-        elif temporal_context == TemporalContextEnum.SHORT_TERM:
+        elif horizon == "short_term":
             return max(0.3, 1.0 - abs(cognitive_load - 6) / 8.0)
         else:  # IMMEDIATE
             return max(0.2, 1.0 - (cognitive_load / 12.0))
     
+    def _assess_cognitive_clarity(self, cognitive_load: int) -> float:
+        """Hodnotenie kognitívnej jasnosti (inverzne úmerná záťaži)"""
+        return max(0.0, 1.0 - (cognitive_load / 12.0))
+    
     def _assess_mental_clarity(self, mental_state: MentalStateEnum) -> float:
         """Hodnotenie jasnosti mentálneho stavu"""
         clarity_mapping = {
@@ -616,11 +751,11 @@ class AetheroCognitiveAnalyzer:
     def _assess_temporal_clarity(self, temporal_context: TemporalContextEnum) -> float:
         """Hodnotenie temporálnej jasnosti"""
         clarity_mapping = {
-            TemporalContextEnum.IMMEDIATE: 0.9,
-            TemporalContextEnum.SHORT_TERM: 0.7,
-            TemporalContextEnum.LONG_TERM: 0.5
+            "immediate": 0.9,
+            "short_term": 0.7,
+            "long_term": 0.5
         }
-        return clarity_mapping.get(temporal_context, 0.5)
+        return clarity_mapping.get(TEMPORAL_HORIZONS.get(temporal_context), 0.5)
     
     # =================================================================
     # POKROČILÉ ANALYTICKÉ METÓDY
@@ -658,23 +793,26 @@ class AetheroCognitiveAnalyzer:
         
         return min(1.0, weighted_score + balance_bonus)
     
-    def _update_cognitive_patterns(self, cognitive_tags: List[ASLCognitiveTag], metrics: CognitiveMetrics):
-        """Aktualizácia kognitívnych vzorov pre dlhodobú analýzu"""
-        pattern = {
-            'timestamp': metrics.analysis_timestamp,
+    def _summarize_cognitive_patterns(self, cognitive_tags: List[ASLCognitiveTag]) -> Dict[str, Any]:
+        """Súhrn tagov pre kognitívne vzory (Python backend)"""
+        return {
             'tag_count': len(cognitive_tags),
             'dominant_mental_state': self._get_dominant_mental_state(cognitive_tags),
             'dominant_emotion': self._get_dominant_emotion(cognitive_tags),
             'avg_cognitive_load': statistics.mean([tag.cognitive_load for tag in cognitive_tags]),
-            'avg_certainty': statistics.mean([tag.certainty_level for tag in cognitive_tags]),
+            'avg_certainty': statistics.mean([tag.certainty_level for tag in cognitive_tags])
+        }
+    
+    def _update_cognitive_patterns(self, pattern_summary: Dict[str, Any], metrics: CognitiveMetrics):
+        """Aktualizácia kognitívnych vzorov pre dlhodobú analýzu"""
+        pattern = {
+            'timestamp': metrics.analysis_timestamp,
+            **pattern_summary,
             'overall_health': metrics.overall_cognitive_health
         }
         
+        # Kapacita histórie vzorov je ohraničená (predvolene 100)
         self.cognitive_flow_patterns.append(pattern)
-        
-        # Udržiavanie histórie (max 100 vzorov)
-        if len(self.cognitive_flow_patterns) > 100:
-            self.cognitive_flow_patterns.pop(0)
     
     def _get_dominant_mental_state(self, cognitive_tags: List[ASLCognitiveTag]) -> str:
         """Získanie dominantného mentálneho stavu"""
@@ -738,7 +876,7 @@ class AetheroCognitiveAnalyzer:
         complexity_score = (
             self._get_mental_state_complexity(tag.mental_state) * 0.4 +
             self._get_emotion_complexity(tag.emotion_tone) * 0.3 +
-            min(tag.cognitive_load / 10.0, 1.0) * 0.3
+            self._get_load_complexity(tag.cognitive_load) * 0.3
         )
         
         expected_certainty = max(0.1, 1.0 - complexity_score * 0.7)
@@ -762,7 +900,7 @@ class AetheroCognitiveAnalyzer:
         """Hodnotenie temporálnej realistickosti"""
         # Realistickosť kombinácií temporálneho kontextu s ostatnými faktormi
         temporal_complexity = self._get_temporal_complexity(tag.temporal_context)
-        cognitive_complexity = min(tag.cognitive_load / 10.0, 1.0)
+        cognitive_complexity = self._get_load_complexity(tag.cognitive_load)
         
         # Dlhodobé úlohy môžu byť komplexnejšie
         complexity_difference = abs(temporal_complexity - cognitive_complexity)
@@ -789,8 +927,8 @@ class AetheroCognitiveAnalyzer:
             "stability_trend": self._calculate_trend([m.mental_stability_factor for m in recent_metrics]),
             "complexity_trend": self._calculate_trend([m.cognitive_complexity_index for m in recent_metrics]),
             "overall_health_trend": self._calculate_trend([m.overall_cognitive_health for m in recent_metrics]),
-            "session_count": len(self.analysis_history),
-            "average_health": statistics.mean([m.overall_cognitive_health for m in self.analysis_history])
+            "session_count": self.analysis_history.total_appended,
+            "average_health": self._health_sum / self.analysis_history.total_appended
         }
         
         return trends
@@ -821,9 +959,9 @@ class AetheroCognitiveAnalyzer:
             "session_id": self.session_id,
             "analysis_mode": self.analysis_mode.value,
             "analysis_history": [metrics.to_dict() for metrics in self.analysis_history],
-            "cognitive_flow_patterns": self.cognitive_flow_patterns,
+            "cognitive_flow_patterns": self.cognitive_flow_patterns.to_list(),
             "session_summary": {
-                "total_analyses": len(self.analysis_history),
+                "total_analyses": self.analysis_history.total_appended,
                 "session_duration": self._calculate_session_duration(),
                 "average_metrics": self._calculate_average_metrics()
             }
@@ -870,6 +1008,15 @@ class CognitiveMetricsAnalyzer:
         logger.warning("CognitiveMetricsAnalyzer is deprecated. Use AetheroCognitiveAnalyzer instead.")
         self._analyzer = AetheroCognitiveAnalyzer(CognitiveAnalysisMode.STANDARD)
     
+    def new_session(self) -> "CognitiveMetricsAnalyzer":
+        """Legacy wrapper okolo AetheroCognitiveAnalyzer.new_session (bez opakovaného varovania)"""
+        session = object.__new__(type(self))
+        session._analyzer = self._analyzer.new_session()
+        return session
+    
+    def warm_up(self) -> None:
+        self._analyzer.warm_up()
+    
     def calculate_consciousness_coherence_rate(self, cognitive_tags: List[ASLCognitiveTag]) -> float:
         """Legacy metóda - deleguje na nový analyzátor"""
         return self._analyzer.calculate_consciousness_coherence_rate(cognitive_tags)
@@ -879,6 +1026,38 @@ class CognitiveMetricsAnalyzer:
         metrics = self._analyzer.analyze_cognitive_tags(cognitive_tags)
         return metrics.to_dict()
 
+    def generate_introspective_report(self, cognitive_tags: List[ASLCognitiveTag]) -> Dict[str, Any]:
+        """
+        INTENT: Introspektívny report pre /metrics a reflexívneho agenta
+        ACTION: Metriky nového analyzátora, trendy session a hodnotenie ústavného súladu
+        OUTPUT: Metriky + cognitive_evolution_analysis, introspective_insights, aethero_constitutional_compliance
+        HOOK: introspective_report_generated
+        """
+        metrics = self._analyzer.analyze_cognitive_tags(cognitive_tags)
+        compliance_score = (metrics.consciousness_coherence_rate + metrics.introspective_clarity_score) / 2
+
+        insights = []
+        if cognitive_tags:
+            insights.append(f"Dominant mental state: {self._analyzer._get_dominant_mental_state(cognitive_tags)}")
+            insights.append(f"Dominant emotion: {self._analyzer._get_dominant_emotion(cognitive_tags)}")
+        insights.append(f"Overall cognitive health: {metrics.overall_cognitive_health:.3f}")
+
+        report = metrics.to_dict()
+        report.update({
+            "tag_count": len(cognitive_tags),
+            "cognitive_evolution_analysis": self._analyzer.get_cognitive_trends(),
+            "introspective_insights": insights,
+            "aethero_constitutional_compliance": {
+                "overall_compliance_score": compliance_score,
+                "compliance_factors": {
+                    "consciousness_coherence": metrics.consciousness_coherence_rate,
+                    "introspective_clarity": metrics.introspective_clarity_score
+                },
+                "constitutional_status": "compliant" if compliance_score >= 0.8 else "review_required"
+            }
+        })
+        return report
+
 
 # =================================================================
 # FACTORY FUNKCIE PRE JEDNODUCHÉ POUŽITIE
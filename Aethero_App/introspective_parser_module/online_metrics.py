@@ -0,0 +1,160 @@
+"""
+Online cognitive metrics with O(1) update per tag
+
+OnlineCognitiveAnalyzer keeps running sufficient statistics instead of the
+tag list, so a real-time stream does not have to re-run analyze_cognitive_tags
+over everything seen so far whenever a tag arrives. Per-tag scores come from the
+same _score_tag_* methods as the batch analyzer, and snapshot() over the tags
+seen since the last reset() matches analyze_cognitive_tags over the same list.
+"""
+
+from typing import Dict, Iterable, Optional
+import threading
+
+from .models import ASLCognitiveTag
+from .bounded_history import HistoryPolicy
+from .metrics import AetheroCognitiveAnalyzer, CognitiveAnalysisMode, CognitiveMetrics, CognitiveMetricsBackend
+
+
+class _RunningMoments:
+    """Welfordov priebežný priemer a výberový rozptyl"""
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Výberový rozptyl ako statistics.variance (0 pre jeden prvok)"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0
+
+
+class OnlineCognitiveAnalyzer(AetheroCognitiveAnalyzer):
+    """
+    Online kognitívny analyzátor pre real-time prúd tagov.
+
+    update(tag) is O(1); snapshot() is O(1) and does not touch the analysis
+    history unless record=True.
+    """
+
+    def __init__(self, analysis_mode: CognitiveAnalysisMode = CognitiveAnalysisMode.REAL_TIME,
+                 history_policy: Optional[HistoryPolicy] = None):
+        super().__init__(analysis_mode, backend=CognitiveMetricsBackend.PYTHON, history_policy=history_policy)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Začatie nového okna - zahodí priebežné štatistiky"""
+        with self._lock:
+            self.tag_count = 0
+            self._coherence = _RunningMoments()
+            self._clarity = _RunningMoments()
+            self._complexity_sum = 0.0
+            self._resonance_sum = 0.0
+            self._temporal_sum = 0.0
+            self._load_sum = 0.0
+            self._certainty_sum = 0.0
+            self._transitions = 0
+            # Slovníky zachovávajú poradie prvého výskytu ako dávková analýza
+            self._state_counts: Dict[str, int] = {}
+            self._emotion_counts: Dict[str, int] = {}
+            self._prev_tag: Optional[ASLCognitiveTag] = None
+
+    def update(self, tag: ASLCognitiveTag) -> None:
+        """
+        INTENT: Zahrnutie nového tagu do priebežných štatistík
+        ACTION: O(1) aktualizácia všetkých akumulátorov
+        OUTPUT: None
+        HOOK: online_tag_ingested
+        """
+        with self._lock:
+            index = self.tag_count
+            prev_tag = self._prev_tag
+
+            self._coherence.add(self._score_tag_coherence(tag))
+            self._clarity.add(self._score_tag_clarity(tag))
+            self._complexity_sum += self._score_tag_complexity(tag)
+            self._resonance_sum += self._score_tag_resonance(tag)
+            self._temporal_sum += self._score_tag_temporal(tag, prev_tag) * self.temporal_weight_decay ** index
+            self._load_sum += tag.cognitive_load
+            self._certainty_sum += tag.certainty_level
+
+            if prev_tag is not None and prev_tag.mental_state != tag.mental_state:
+                self._transitions += 1
+            state = tag.mental_state.value
+            self._state_counts[state] = self._state_counts.get(state, 0) + 1
+            emotion = tag.emotion_tone.value
+            self._emotion_counts[emotion] = self._emotion_counts.get(emotion, 0) + 1
+
+            self._prev_tag = tag
+            self.tag_count = index + 1
+
+    def update_many(self, cognitive_tags: Iterable[ASLCognitiveTag]) -> None:
+        """Postupné zahrnutie viacerých tagov"""
+        for tag in cognitive_tags:
+            self.update(tag)
+
+    def snapshot(self, record: bool = False) -> CognitiveMetrics:
+        """
+        INTENT: Aktuálne metriky nad oknom od posledného reset()
+        ACTION: O(1) výpočet metrík z priebežných štatistík
+        OUTPUT: CognitiveMetrics zhodné s analyze_cognitive_tags nad rovnakým oknom
+        HOOK: online_snapshot_created
+
+        Args:
+            record: Zapísať snapshot do analysis_history a kognitívnych vzorov
+        """
+        with self._lock:
+            count = self.tag_count
+            if count == 0:
+                return self._create_empty_metrics()
+
+            variance_penalty = min(self._coherence.variance * 0.5, 0.3)
+            consciousness_coherence = max(0.0, min(1.0, self._coherence.mean - variance_penalty))
+
+            complexity_index = min(1.0, (self._complexity_sum / count) * self.complexity_scaling_factor)
+
+            if len(self._state_counts) == 1:
+                base_stability = 0.9
+            else:
+                base_stability = 1.0 - ((self._transitions / (count - 1)) * 0.6)
+            avg_load = self._load_sum / count
+            avg_certainty = self._certainty_sum / count
+            load_factor = 1.0 - min(avg_load / 15.0, 0.3)
+            certainty_factor = avg_certainty * 0.2 + 0.8
+            stability_factor = max(0.0, min(1.0, base_stability * load_factor * certainty_factor))
+
+            variety_bonus = min(len(self._emotion_counts) * 0.1, 0.2)
+            resonance_depth = min(1.0, self._resonance_sum / count + variety_bonus)
+
+            temporal_awareness = self._temporal_sum / count
+
+            consistency_bonus = max(0.0, 0.1 - self._clarity.variance)
+            introspective_clarity = min(1.0, self._clarity.mean + consistency_bonus)
+
+            pattern_summary = {
+                'tag_count': count,
+                'dominant_mental_state': max(self._state_counts, key=self._state_counts.get),
+                'dominant_emotion': max(self._emotion_counts, key=self._emotion_counts.get),
+                'avg_cognitive_load': avg_load,
+                'avg_certainty': avg_certainty
+            }
+
+            return self._finalize_metrics(
+                consciousness_coherence, complexity_index, stability_factor,
+                resonance_depth, temporal_awareness, introspective_clarity,
+                pattern_summary, record=record
+            )
+
+
+def create_online_analyzer() -> OnlineCognitiveAnalyzer:
+    """Vytvorenie online analyzátora pre real-time prúd tagov"""
+    return OnlineCognitiveAnalyzer(CognitiveAnalysisMode.REAL_TIME)
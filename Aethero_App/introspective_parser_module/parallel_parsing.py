@@ -0,0 +1,196 @@
+"""
+Chunked multi-process parsing of very large ASL documents
+
+The input is split on line boundaries into chunks - byte ranges of a file or
+runs of lines of an in-memory document - and every chunk is parsed and
+validated in a process pool by its own parser session. Chunk reports come back
+in submission order and are merged into the parse_and_validate() report shape:
+line numbers are remapped to global ones, counts and failures are summed and
+parsing_results keep document order regardless of which worker finished first.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+from .parser import ASLMetaParser
+
+DEFAULT_CHUNK_BYTES = 32 * 1024 * 1024
+DEFAULT_CHUNK_LINES = 200000
+
+# Per-process parser prototype - every chunk gets a fresh session of it
+_worker_parser: Optional[ASLMetaParser] = None
+
+
+def plan_file_chunks(path: Union[str, os.PathLike], chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> List[Tuple[int, int]]:
+    """
+    Split a file into (start, end) byte ranges that end on a newline
+
+    Only one short read per boundary is needed, so planning a multi-GB file
+    does not scan it.
+    """
+    size = os.path.getsize(path)
+    chunks = []
+    with open(path, "rb") as handle:
+        start = 0
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            if end < size:
+                handle.seek(end)
+                # Extend to the end of the line the raw boundary falls into
+                tail = handle.readline()
+                end += len(tail)
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+
+def _chunk_parser(log_policy: str, log_sample_every: int, retain_blocks: bool) -> ASLMetaParser:
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ASLMetaParser(log_policy, log_sample_every)
+    else:
+        _worker_parser.introspective_logger.set_policy(log_policy, log_sample_every)
+    session = _worker_parser.new_session()
+    session.retain_blocks = retain_blocks
+    return session
+
+
+def _parse_lines(parser: ASLMetaParser, lines: Sequence[str]) -> Dict[str, Any]:
+    parsing_results = list(parser.iter_parse(lines))
+    return {
+        "total_lines_processed": parser.total_lines_processed,
+        "asl_blocks_found": parser.asl_blocks_found,
+        "validated_count": parser.validated_count,
+        "failed_count": parser.failed_count,
+        "current_cognitive_load": parser.current_cognitive_load,
+        "parsing_certainty": parser.parsing_certainty,
+        "validated_blocks": parser.validated_blocks,
+        "failed_validations": parser.failed_validations,
+        "parsing_results": parsing_results
+    }
+
+
+def _parse_file_chunk(task: Tuple[str, int, int, str, str, int, bool]) -> Dict[str, Any]:
+    """Worker: parse one byte range with the same line semantics as iter_parse_file()"""
+    path, start, end, encoding, log_policy, log_sample_every, retain_blocks = task
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        data = handle.read(end - start)
+    lines = data.decode(encoding, errors="replace").split("\n")
+    if data.endswith(b"\n"):
+        # readline() yields no empty line after a final newline
+        lines.pop()
+    # CR is only dropped as part of CRLF - an unterminated last line keeps it
+    terminated = len(lines) if data.endswith(b"\n") else len(lines) - 1
+    for index in range(terminated):
+        if lines[index].endswith("\r"):
+            lines[index] = lines[index][:-1]
+    return _parse_lines(_chunk_parser(log_policy, log_sample_every, retain_blocks), lines)
+
+
+def _parse_text_chunk(task: Tuple[List[str], str, int, bool]) -> Dict[str, Any]:
+    """Worker: parse one run of already split document lines"""
+    lines, log_policy, log_sample_every, retain_blocks = task
+    return _parse_lines(_chunk_parser(log_policy, log_sample_every, retain_blocks), lines)
+
+
+def _run_chunks(worker, tasks: List[tuple], max_workers: Optional[int]) -> Iterator[Dict[str, Any]]:
+    """Chunk reports in task order - in-process for one worker or one chunk"""
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(tasks) <= 1:
+        return map(worker, tasks)
+    return _map_in_pool(worker, tasks, min(max_workers, len(tasks)))
+
+
+def _map_in_pool(worker, tasks: List[tuple], max_workers: int) -> Iterator[Dict[str, Any]]:
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        yield from pool.map(worker, tasks)
+
+
+def merge_chunk_reports(parser: ASLMetaParser, chunk_reports: Iterator[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    INTENT: Zlúčenie výsledkov chunkov do jedného reportu
+    ACTION: Prečíslovanie riadkov na globálne, sčítanie počtov a zlyhaní do session parsera
+    OUTPUT: Report v tvare parse_and_validate()
+    HOOK: parallel_parsing_merged
+
+    Reports must arrive in document order; each chunk's line numbers start at 1.
+    """
+    parsing_results: List[Dict[str, Any]] = []
+    line_offset = 0
+    for report in chunk_reports:
+        for result in report["parsing_results"]:
+            result["line_number"] += line_offset
+            parsing_results.append(result)
+        line_offset += report["total_lines_processed"]
+
+        parser.total_lines_processed += report["total_lines_processed"]
+        parser.asl_blocks_found += report["asl_blocks_found"]
+        parser.validated_count += report["validated_count"]
+        parser.failed_count += report["failed_count"]
+        parser.current_cognitive_load += report["current_cognitive_load"]
+        # Certainty only ever decays multiplicatively, so chunk factors compose
+        parser.parsing_certainty *= report["parsing_certainty"]
+        if parser.retain_blocks:
+            parser.validated_blocks.extend(report["validated_blocks"])
+            parser.failed_validations.extend(report["failed_validations"])
+
+    return {
+        "session_id": parser.parsing_session_id,
+        "total_lines_processed": line_offset,
+        "asl_blocks_found": len(parsing_results),
+        "validated_blocks": parser.validated_blocks,
+        "failed_validations": parser.failed_validations,
+        "parsing_results": parsing_results,
+        "introspective_reflection": parser._reflect_on_parsing_state(),
+        "cognitive_transparency_report": parser._generate_transparency_report()
+    }
+
+
+def parse_file_parallel(path: Union[str, os.PathLike], parser: Optional[ASLMetaParser] = None,
+                        max_workers: Optional[int] = None, chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+                        encoding: str = "utf-8") -> Dict[str, Any]:
+    """
+    Parse and validate a large file on all cores
+
+    Args:
+        path: ASL document on disk
+        parser: Session that receives the merged counters (default: a new ASLMetaParser)
+        max_workers: Process count (None = CPU count, 1 = in-process)
+        chunk_bytes: Target chunk size; chunks are extended to the next line end
+        encoding: Text encoding of the file (must keep b"\\n" as the line separator)
+
+    Returns:
+        Report in the parse_and_validate() shape with global line numbers; line
+        semantics follow iter_parse_file()
+    """
+    parser = parser or ASLMetaParser()
+    logger = parser.introspective_logger
+    tasks = [
+        (os.fspath(path), start, end, encoding, logger.policy.value, logger.sample_every, parser.retain_blocks)
+        for start, end in plan_file_chunks(path, chunk_bytes)
+    ]
+    return merge_chunk_reports(parser, _run_chunks(_parse_file_chunk, tasks, max_workers))
+
+
+def parse_document_parallel(document: str, parser: Optional[ASLMetaParser] = None,
+                            max_workers: Optional[int] = None,
+                            chunk_lines: int = DEFAULT_CHUNK_LINES) -> Dict[str, Any]:
+    """
+    Parallel equivalent of parser.parse_and_validate(document)
+
+    Args:
+        document: Multi-line document
+        parser: Session that receives the merged counters (default: a new ASLMetaParser)
+        max_workers: Process count (None = CPU count, 1 = in-process)
+        chunk_lines: Lines per chunk
+    """
+    parser = parser or ASLMetaParser()
+    logger = parser.introspective_logger
+    lines = document.split("\n")
+    tasks = [
+        (lines[start:start + chunk_lines], logger.policy.value, logger.sample_every, parser.retain_blocks)
+        for start in range(0, len(lines), chunk_lines)
+    ]
+    return merge_chunk_reports(parser, _run_chunks(_parse_text_chunk, tasks, max_workers))
@@ -1,10 +1,17 @@
-from typing import Dict, Any, List, Tuple, Optional, Union
+from typing import Dict, Any, List, Tuple, Optional, Union, Iterable, Iterator, Callable
 import re
 import logging
 import os
 import json
+import mmap
+import itertools
+import threading
 from datetime import datetime
+from enum import Enum
 from .models import ASLTagModel, ASLCognitiveTag, MentalStateEnum, EmotionToneEnum, TemporalContextEnum
+from .batch_validation import ASLBatchValidator, BatchValidationResult
+from .asl_scanner import LEGACY_KEY_VALUE_PATTERN
+from .asl_frontend import scan_line
 
 # Graceful pydantic import with fallback
 try:
@@ -16,32 +23,163 @@ except ImportError:
     class ValidationError(Exception):
         pass
 
+class CognitiveLogPolicy(str, Enum):
+    """Policy controlling how much of the cognitive flow is written to the log"""
+    OFF = "off"
+    SAMPLED = "sampled"
+    ERRORS_ONLY = "errors_only"
+    FULL = "full"
+
+
+def _env_log_defaults() -> Tuple[CognitiveLogPolicy, int]:
+    """
+    Logging defaults from AETHERO_COGNITIVE_LOG_POLICY / AETHERO_COGNITIVE_LOG_SAMPLE_EVERY
+
+    Parsed at import, so an invalid value falls back to full / 100 with a
+    warning instead of making the package unimportable.
+    """
+    policy, sample_every = CognitiveLogPolicy.FULL, 100
+    raw_policy = os.environ.get("AETHERO_COGNITIVE_LOG_POLICY")
+    if raw_policy is not None:
+        try:
+            policy = CognitiveLogPolicy(raw_policy.strip().lower())
+        except ValueError:
+            logging.getLogger(__name__).warning(
+                f"Invalid AETHERO_COGNITIVE_LOG_POLICY={raw_policy!r}, using {policy.value}")
+    raw_sample_every = os.environ.get("AETHERO_COGNITIVE_LOG_SAMPLE_EVERY")
+    if raw_sample_every is not None:
+        try:
+            sample_every = max(1, int(raw_sample_every))
+        except ValueError:
+            logging.getLogger(__name__).warning(
+                f"Invalid AETHERO_COGNITIVE_LOG_SAMPLE_EVERY={raw_sample_every!r}, using {sample_every}")
+    return policy, sample_every
+
+
+# Process-wide defaults, overridable via environment or configure_cognitive_logging()
+_default_log_policy, _default_sample_every = _env_log_defaults()
+
+# Handlers are installed once per process and logger name, not once per parser instance
+_COGNITIVE_LOG_FILE = "aethero_cognitive_flow.log"
+_handler_lock = threading.Lock()
+_shared_file_handler: Optional[logging.Handler] = None
+
+
+def configure_cognitive_logging(policy: Union[CognitiveLogPolicy, str], sample_every: Optional[int] = None) -> None:
+    """
+    Set the process-wide default logging policy for IntrospectiveLogger instances
+    
+    Args:
+        policy: off, sampled (1-in-N), errors_only or full
+        sample_every: N for the sampled policy
+    """
+    global _default_log_policy, _default_sample_every
+    _default_log_policy = CognitiveLogPolicy(policy.lower() if isinstance(policy, str) else policy)
+    if sample_every is not None:
+        _default_sample_every = max(1, int(sample_every))
+
+
+def _install_cognitive_file_handler(logger: logging.Logger) -> None:
+    """Attach the shared cognitive flow file handler to a logger exactly once"""
+    global _shared_file_handler
+    with _handler_lock:
+        if _shared_file_handler is None:
+            _shared_file_handler = logging.FileHandler(_COGNITIVE_LOG_FILE, delay=True)
+            _shared_file_handler.setFormatter(logging.Formatter(
+                "%(asctime)s - COGNITIVE_FLOW [%(name)s] - %(levelname)s - %(message)s"
+            ))
+        if _shared_file_handler not in logger.handlers:
+            logger.addHandler(_shared_file_handler)
+
+
+class _DeferredContext:
+    """Serializes the mental context only if a handler actually formats the record"""
+    __slots__ = ("context",)
+    
+    def __init__(self, context: Union[Dict[str, Any], Callable[[], Dict[str, Any]]]):
+        self.context = context
+    
+    def __str__(self) -> str:
+        context = self.context() if callable(self.context) else self.context
+        return json.dumps(context, default=str)
+
+
 # Configure introspective logging for cognitive transparency
 class IntrospectiveLogger:
     """Introspective logging system for cognitive flow tracking"""
     
-    def __init__(self, module_name: str = "ASLMetaParser"):
+    def __init__(
+        self,
+        module_name: str = "ASLMetaParser",
+        policy: Optional[Union[CognitiveLogPolicy, str]] = None,
+        sample_every: Optional[int] = None
+    ):
         self.module_name = module_name
         self.logger = logging.getLogger(module_name)
         self.logger.setLevel(logging.INFO)
+        self.set_policy(policy if policy is not None else _default_log_policy, sample_every)
         
-        # Create introspective formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - COGNITIVE_FLOW [%(name)s] - %(levelname)s - %(message)s"
-        )
-        
-        # File handler for persistent introspection
-        file_handler = logging.FileHandler("aethero_cognitive_flow.log")
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        # Shared file handler for persistent introspection - opened lazily on first record
+        _install_cognitive_file_handler(self.logger)
+    
+    def set_policy(self, policy: Union[CognitiveLogPolicy, str], sample_every: Optional[int] = None) -> None:
+        """Switch the logging policy at runtime"""
+        self.policy = CognitiveLogPolicy(policy)
+        self.sample_every = max(1, int(sample_every)) if sample_every is not None else _default_sample_every
+        self._sample_counter = itertools.count()
+        # Cheap flag for hot paths - False means no informational cognitive flow record will be emitted
+        self.enabled = self.policy not in (CognitiveLogPolicy.OFF, CognitiveLogPolicy.ERRORS_ONLY)
     
-    def log_cognitive_state(self, operation: str, mental_context: Dict[str, Any]):
-        """Log cognitive state during operations"""
-        self.logger.info(f"COGNITIVE_OP: {operation} | CONTEXT: {json.dumps(mental_context)}")
+    def _should_emit(self, level: int) -> bool:
+        """Apply the policy before any context is built or formatted"""
+        policy = self.policy
+        if policy is CognitiveLogPolicy.OFF:
+            return False
+        if level >= logging.WARNING:
+            return self.logger.isEnabledFor(level)
+        if policy is CognitiveLogPolicy.ERRORS_ONLY:
+            return False
+        if policy is CognitiveLogPolicy.SAMPLED and next(self._sample_counter) % self.sample_every:
+            return False
+        return self.logger.isEnabledFor(level)
+    
+    def log_cognitive_state(
+        self,
+        operation: str,
+        mental_context: Union[Dict[str, Any], Callable[[], Dict[str, Any]]],
+        level: int = logging.INFO
+    ):
+        """
+        Log cognitive state during operations
+        
+        mental_context may be a zero-argument callable, so hot paths pay for
+        building the context only when the record is actually emitted.
+        """
+        if self._should_emit(level):
+            self.logger.log(level, "COGNITIVE_OP: %s | CONTEXT: %s", operation, _DeferredContext(mental_context))
     
     def log_introspective_reflection(self, reflection: str, certainty: float):
         """Log introspective reflections with certainty levels"""
-        self.logger.info(f"REFLECTION: {reflection} | CERTAINTY: {certainty}")
+        if self._should_emit(logging.INFO):
+            self.logger.info("REFLECTION: %s | CERTAINTY: %s", reflection, certainty)
+
+
+# Compiled once per process and shared by every parser and parser session
+_COGNITIVE_PATTERNS = {
+    # Reference only - parse_line reads all three ASL dialects through asl_frontend.scan_line()
+    'asl_comment': re.compile(r'#\s*\[ASL\]\s*(.+)', re.IGNORECASE),
+    'key_value': LEGACY_KEY_VALUE_PATTERN,
+    'mental_state_keywords': [state.value for state in MentalStateEnum],
+    'emotion_tone_keywords': [tone.value for tone in EmotionToneEnum],
+    'temporal_context_keywords': [context.value for context in TemporalContextEnum]
+}
+
+# Enum value lookups for _process_cognitive_value: key -> (known values, default, default name)
+_ENUM_VALUE_LOOKUPS = {
+    'mental_state': (frozenset(state.value for state in MentalStateEnum), MentalStateEnum.REFLECTIVE.value, "REFLECTIVE"),
+    'emotion_tone': (frozenset(tone.value for tone in EmotionToneEnum), EmotionToneEnum.NEUTRAL.value, "NEUTRAL"),
+    'temporal_context': (frozenset(context.value for context in TemporalContextEnum), TemporalContextEnum.PRESENT.value, "PRESENT"),
+}
 
 
 class ASLMetaParser:
@@ -53,15 +191,41 @@ class ASLMetaParser:
     transparent cognitive flows.
     """
     
-    def __init__(self):
-        self.introspective_logger = IntrospectiveLogger("ASLMetaParser")
-        self.cognitive_patterns = {
-            'asl_comment': re.compile(r'#\s*\[ASL\]\s*(.+)', re.IGNORECASE),
-            'key_value': re.compile(r'(\w+):\s*(.+?)(?=\s*\w+:|$)'),
-            'mental_state_keywords': [state.value for state in MentalStateEnum],
-            'emotion_tone_keywords': [tone.value for tone in EmotionToneEnum],
-            'temporal_context_keywords': [context.value for context in TemporalContextEnum]
-        }
+    def __init__(
+        self,
+        log_policy: Optional[Union[CognitiveLogPolicy, str]] = None,
+        log_sample_every: Optional[int] = None
+    ):
+        self.introspective_logger = IntrospectiveLogger("ASLMetaParser", log_policy, log_sample_every)
+        self.cognitive_patterns = _COGNITIVE_PATTERNS
+        self._batch_validator = ASLBatchValidator()
+        
+        # Unified comment / brace / inline front-end for the per-line hot path
+        self._scan_blocks = scan_line
+        
+        self._reset_session_state()
+    
+    def new_session(self) -> "ASLMetaParser":
+        """
+        Lightweight parser for one request or document
+        
+        The session shares this parser's compiled patterns, batch validator and
+        logger, but has its own session id, counters, validated_blocks and
+        failed_validations - concurrent sessions never see each other's state.
+        
+        Returns:
+            New ASLMetaParser session
+        """
+        session = object.__new__(type(self))
+        session.introspective_logger = self.introspective_logger
+        session.cognitive_patterns = self.cognitive_patterns
+        session._batch_validator = self._batch_validator
+        session._scan_blocks = self._scan_blocks
+        session._reset_session_state()
+        return session
+    
+    def _reset_session_state(self) -> None:
+        """Initialize the per-session introspective state"""
         self.parsing_session_id = datetime.now().isoformat()
         
         # Introspective state tracking
@@ -69,6 +233,13 @@ class ASLMetaParser:
         self.parsing_certainty = 1.0
         self.validated_blocks = []
         self.failed_validations = []
+        
+        # Aggregate counters - available even when blocks are not retained (streaming mode)
+        self.retain_blocks = True
+        self.total_lines_processed = 0
+        self.asl_blocks_found = 0
+        self.validated_count = 0
+        self.failed_count = 0
     
     def _reflect_on_parsing_state(self) -> Dict[str, Any]:
         """Internal introspective reflection on current parsing state"""
@@ -76,8 +247,8 @@ class ASLMetaParser:
             "cognitive_load": self.current_cognitive_load,
             "parsing_certainty": self.parsing_certainty,
             "session_id": self.parsing_session_id,
-            "validated_count": len(self.validated_blocks),
-            "failed_count": len(self.failed_validations)
+            "validated_count": self.validated_count,
+            "failed_count": self.failed_count
         }
         
         self.introspective_logger.log_cognitive_state(
@@ -88,40 +259,47 @@ class ASLMetaParser:
     def parse_line(self, line: str) -> Dict[str, Any]:
         """
         Parse a single line for ASL tags with introspective awareness
-        
+
+        All three dialects are recognized - ``# [ASL] key: value`` comments,
+        ``{key: value, ...}`` braces and ``[@key:value ...]`` inline blocks.
+        Several blocks on one line form one set of components; a later block
+        overrides keys of an earlier one.
+
         Args:
             line: Single line of text potentially containing ASL tags
-            
+
         Returns:
             Dictionary of parsed ASL components or empty dict if no valid ASL found
         """
         self.current_cognitive_load += 1
-        
-        # Cognitive pattern matching for ASL comments
-        asl_match = self.cognitive_patterns['asl_comment'].match(line.strip())
-        if not asl_match:
-            self.introspective_logger.log_cognitive_state(
-                "NO_ASL_PATTERN_DETECTED", {"line": line[:50]}
-            )
+
+        # One pass over the line for every ASL dialect
+        blocks = self._scan_blocks(line)
+        if not blocks:
+            if self.introspective_logger.enabled:
+                self.introspective_logger.log_cognitive_state(
+                    "NO_ASL_PATTERN_DETECTED", lambda: {"line": line[:50]}
+                )
             return {}
-        
-        # Extract and process ASL content
-        asl_content = asl_match.group(1).strip()
+
         parsed_components = {}
-        
-        # Introspective key-value extraction
-        kv_matches = self.cognitive_patterns['key_value'].findall(asl_content)
-        
-        for key, value in kv_matches:
-            # Cognitive value processing
-            processed_value = self._process_cognitive_value(key, value.strip())
-            parsed_components[key] = processed_value
-            
-            self.introspective_logger.log_cognitive_state(
-                "ASL_COMPONENT_EXTRACTED", 
-                {"key": key, "value": processed_value, "certainty": self.parsing_certainty}
-            )
-        
+        log_enabled = self.introspective_logger.enabled
+
+        for block in blocks:
+            for key, value in block.pairs:
+                # Cognitive value processing
+                processed_value = self._process_cognitive_value(key, value)
+                parsed_components[key] = processed_value
+
+                if log_enabled:
+                    self.introspective_logger.log_cognitive_state(
+                        "ASL_COMPONENT_EXTRACTED",
+                        lambda key=key, value=processed_value, dialect=block.dialect.value,
+                               certainty=self.parsing_certainty: {
+                            "key": key, "value": value, "dialect": dialect, "certainty": certainty
+                        }
+                    )
+
         return parsed_components
     
     def _process_cognitive_value(self, key: str, raw_value: str) -> Union[str, int, float]:
@@ -154,37 +332,15 @@ class ASLMetaParser:
                 self.parsing_certainty *= 0.8
                 return 0.5
         
-        elif key in ['mental_state', 'emotion_tone', 'temporal_context']:
-            # Map old field names to new ones if needed
-            if key == 'mental_state':
-                # Validate against MentalStateEnum
-                try:
-                    return MentalStateEnum(value).value
-                except ValueError:
-                    self.introspective_logger.log_introspective_reflection(
-                        f"Unknown mental_state: {value}, using REFLECTIVE as default", 0.7
-                    )
-                    return MentalStateEnum.REFLECTIVE.value
-            
-            elif key == 'emotion_tone':
-                # Validate against EmotionToneEnum
-                try:
-                    return EmotionToneEnum(value).value
-                except ValueError:
-                    self.introspective_logger.log_introspective_reflection(
-                        f"Unknown emotion_tone: {value}, using NEUTRAL as default", 0.7
-                    )
-                    return EmotionToneEnum.NEUTRAL.value
-            
-            elif key == 'temporal_context':
-                # Validate against TemporalContextEnum
-                try:
-                    return TemporalContextEnum(value).value
-                except ValueError:
-                    self.introspective_logger.log_introspective_reflection(
-                        f"Unknown temporal_context: {value}, using PRESENT as default", 0.7
-                    )
-                    return TemporalContextEnum.PRESENT.value
+        elif key in _ENUM_VALUE_LOOKUPS:
+            # Validate against the enum's precomputed value set
+            known_values, default_value, default_name = _ENUM_VALUE_LOOKUPS[key]
+            if value in known_values:
+                return value
+            self.introspective_logger.log_introspective_reflection(
+                f"Unknown {key}: {value}, using {default_name} as default", 0.7
+            )
+            return default_value
         
         # Handle field name mapping for compatibility
         elif key == 'statement':
@@ -221,7 +377,9 @@ class ASLMetaParser:
                     {"components": mapped_components, "certainty": self.parsing_certainty}
                 )
                 
-                self.validated_blocks.append(validated_model.dict())
+                self.validated_count += 1
+                if self.retain_blocks:
+                    self.validated_blocks.append(validated_model.dict())
                 return True, validated_model
             else:
                 # Fallback validation without Pydantic
@@ -231,7 +389,9 @@ class ASLMetaParser:
                         {"components": mapped_components, "certainty": self.parsing_certainty}
                     )
                     
-                    self.validated_blocks.append(mapped_components)
+                    self.validated_count += 1
+                    if self.retain_blocks:
+                        self.validated_blocks.append(mapped_components)
                     return True, mapped_components
                 else:
                     raise ValidationError("Basic validation failed")
@@ -240,28 +400,65 @@ class ASLMetaParser:
             # Introspective error analysis
             self.introspective_logger.log_cognitive_state(
                 "VALIDATION_FAILURE",
-                {
+                lambda error=e, certainty=self.parsing_certainty: {
                     "components": asl_components,
-                    "errors": str(e),
-                    "certainty": self.parsing_certainty,
+                    "errors": str(error),
+                    "certainty": certainty,
                     "pydantic_available": PYDANTIC_AVAILABLE
-                }
+                },
+                level=logging.WARNING
             )
             
-            self.failed_validations.append({
-                "components": asl_components,
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            })
+            self.failed_count += 1
+            if self.retain_blocks:
+                self.failed_validations.append({
+                    "components": asl_components,
+                    "error": str(e),
+                    "timestamp": datetime.now().isoformat()
+                })
             
             return False, None
     
-    def _map_legacy_fields(self, components: Dict[str, Any]) -> Dict[str, Any]:
+    def validate_asl_blocks(self, blocks: List[Dict[str, Any]]) -> BatchValidationResult:
+        """
+        Validate many ASL blocks in one columnar pass without per-row Pydantic models
+        
+        Applies the same legacy field mapping and defaults as validate_asl_block
+        and updates the session counters. Models are only built on demand via
+        BatchValidationResult.materialize().
+        
+        Args:
+            blocks: List of parsed ASL component dictionaries
+            
+        Returns:
+            BatchValidationResult with validity mask, errors and normalized columns
+        """
+        mapped_blocks = [self._map_legacy_fields(block, log_defaults=False) for block in blocks]
+        result = self._batch_validator.validate(mapped_blocks)
+        
+        valid_count = result.valid_count
+        self.validated_count += valid_count
+        self.failed_count += len(result) - valid_count
+        if self.retain_blocks:
+            timestamp = datetime.now().isoformat()
+            self.failed_validations.extend(
+                {"components": blocks[index], "error": error, "timestamp": timestamp}
+                for index, error in enumerate(result.errors) if error is not None
+            )
+        
+        self.introspective_logger.log_cognitive_state(
+            "BATCH_VALIDATION_COMPLETED",
+            lambda: {"batch_size": len(result), "valid": valid_count, "certainty": self.parsing_certainty}
+        )
+        return result
+    
+    def _map_legacy_fields(self, components: Dict[str, Any], log_defaults: bool = True) -> Dict[str, Any]:
         """
         Map legacy field names to new ASLCognitiveTag field names
         
         Args:
             components: Original parsed components
+            log_defaults: Log every applied default value (disabled for batch validation)
             
         Returns:
             Mapped components compatible with ASLCognitiveTag
@@ -290,13 +487,15 @@ class ASLMetaParser:
             'constitutional_law': 'transparency_principle'
         }
         
+        log_enabled = log_defaults and self.introspective_logger.enabled
         for field, default_value in defaults.items():
             if field not in mapped:
                 mapped[field] = default_value
-                self.introspective_logger.log_cognitive_state(
-                    "DEFAULT_VALUE_APPLIED",
-                    {"field": field, "default": default_value}
-                )
+                if log_enabled:
+                    self.introspective_logger.log_cognitive_state(
+                        "DEFAULT_VALUE_APPLIED",
+                        {"field": field, "default": default_value}
+                    )
         
         return mapped
     
@@ -354,36 +553,165 @@ class ASLMetaParser:
         )
         
         lines = document.split('\n')
-        parsing_results = []
+        parsing_results = list(self.iter_parse(lines))
+        
+        # Final introspective reflection
+        final_reflection = self._reflect_on_parsing_state()
         
-        for line_num, line in enumerate(lines, 1):
+        return {
+            "session_id": self.parsing_session_id,
+            "total_lines_processed": len(lines),
+            "asl_blocks_found": len(parsing_results),
+            "validated_blocks": self.validated_blocks,
+            "failed_validations": self.failed_validations,
+            "parsing_results": parsing_results,
+            "introspective_reflection": final_reflection,
+            "cognitive_transparency_report": self._generate_transparency_report()
+        }
+    
+    def iter_parse(self, stream: Union[str, bytes, Iterable, Any], encoding: str = "utf-8") -> Iterator[Dict[str, Any]]:
+        """
+        Stream ASL blocks from a document one line at a time
+        
+        Unlike parse_and_validate, nothing but the line currently being parsed is
+        held in memory - each ASL block is yielded as soon as it is validated.
+        Combine with retain_blocks = False to keep the parser itself at constant
+        memory and read the totals from get_parsing_summary() afterwards.
+        
+        Args:
+            stream: File-like object (text or binary), mmap, iterator of lines or a string
+            encoding: Encoding used to decode binary input
+            
+        Yields:
+            Per-line result in the same shape as parse_and_validate()["parsing_results"]
+        """
+        for line_num, line in enumerate(self._iter_stream_lines(stream, encoding), 1):
+            self.total_lines_processed += 1
             asl_components = self.parse_line(line)
             
             if asl_components:
+                self.asl_blocks_found += 1
                 is_valid, validated_model = self.validate_asl_block(asl_components)
                 
-                parsing_results.append({
+                yield {
                     "line_number": line_num,
                     "line_content": line,
                     "parsed_components": asl_components,
                     "is_valid": is_valid,
-                    "validated_model": validated_model.dict() if (validated_model and hasattr(validated_model, 'dict')) else validated_model
-                })
+                    "validated_model": self._dump_validated_model(validated_model)
+                }
+    
+    def _dump_validated_model(self, validated_model: Optional[Any]) -> Optional[Dict[str, Any]]:
+        """Dump a freshly validated model, reusing the dump stored in validated_blocks"""
+        if not (validated_model and hasattr(validated_model, 'dict')):
+            return validated_model
+        if self.retain_blocks and self.validated_blocks:
+            # validate_asl_block has just dumped this model - avoid a second .dict() round trip;
+            # the shallow copy keeps callers from mutating the retained block
+            return dict(self.validated_blocks[-1])
+        return validated_model.dict()
+    
+    def iter_parse_file(self, path: Union[str, os.PathLike], encoding: str = "utf-8") -> Iterator[Dict[str, Any]]:
+        """
+        Stream ASL blocks from a file on disk through a read-only memory map
         
-        # Final introspective reflection
-        final_reflection = self._reflect_on_parsing_state()
+        The operating system pages the file in and out on demand, so even
+        multi-GB session logs are parsed in bounded RSS.
+        
+        Args:
+            path: Path to the ASL document
+            encoding: Text encoding of the file
+            
+        Yields:
+            Per-line results as produced by iter_parse()
+        """
+        with open(path, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                # Empty files cannot be memory-mapped
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield from self.iter_parse(mapped, encoding=encoding)
+    
+    def parse_and_validate_parallel(self, document: str, max_workers: Optional[int] = None,
+                                    chunk_lines: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Parse and validate a large document in line chunks on a process pool
+        
+        Args:
+            document: Multi-line document potentially containing ASL tags
+            max_workers: Process count (None = CPU count, 1 = in-process)
+            chunk_lines: Lines per chunk (None = parallel_parsing.DEFAULT_CHUNK_LINES)
+            
+        Returns:
+            Same report as parse_and_validate(), merged into this session
+        """
+        from .parallel_parsing import parse_document_parallel, DEFAULT_CHUNK_LINES
+        return parse_document_parallel(document, self, max_workers, chunk_lines or DEFAULT_CHUNK_LINES)
+    
+    def parse_file_parallel(self, path: Union[str, os.PathLike], max_workers: Optional[int] = None,
+                            chunk_bytes: Optional[int] = None, encoding: str = "utf-8") -> Dict[str, Any]:
+        """
+        Parse and validate a multi-GB file in byte-range chunks on a process pool
+        
+        Args:
+            path: Path to the ASL document
+            max_workers: Process count (None = CPU count, 1 = in-process)
+            chunk_bytes: Target chunk size (None = parallel_parsing.DEFAULT_CHUNK_BYTES)
+            encoding: Text encoding of the file
+            
+        Returns:
+            Report in the parse_and_validate() shape with global line numbers,
+            merged into this session; lines are read as by iter_parse_file()
+        """
+        from .parallel_parsing import parse_file_parallel, DEFAULT_CHUNK_BYTES
+        return parse_file_parallel(path, self, max_workers, chunk_bytes or DEFAULT_CHUNK_BYTES, encoding)
+    
+    def get_parsing_summary(self) -> Dict[str, Any]:
+        """
+        Aggregate report for streamed parsing without the individual blocks
         
+        Returns:
+            Counts, final introspective reflection and transparency report
+        """
         return {
             "session_id": self.parsing_session_id,
-            "total_lines_processed": len(lines),
-            "asl_blocks_found": len(parsing_results),
-            "validated_blocks": self.validated_blocks,
-            "failed_validations": self.failed_validations,
-            "parsing_results": parsing_results,
-            "introspective_reflection": final_reflection,
+            "total_lines_processed": self.total_lines_processed,
+            "asl_blocks_found": self.asl_blocks_found,
+            "validated_count": self.validated_count,
+            "failed_count": self.failed_count,
+            "introspective_reflection": self._reflect_on_parsing_state(),
             "cognitive_transparency_report": self._generate_transparency_report()
         }
     
+    @staticmethod
+    def _iter_stream_lines(stream: Any, encoding: str = "utf-8") -> Iterator[str]:
+        """Normalize strings, file objects, mmaps and line iterators to text lines without line terminators"""
+        if isinstance(stream, (str, bytes)):
+            stream = stream.decode(encoding) if isinstance(stream, bytes) else stream
+            yield from stream.split('\n')
+            return
+        
+        readline = getattr(stream, "readline", None)
+        if readline is not None:
+            # File objects and mmaps - iterating an mmap yields single bytes, so go through readline
+            line = readline()
+            while line:
+                yield ASLMetaParser._strip_line_terminator(line, encoding)
+                line = readline()
+            return
+        
+        for line in stream:
+            yield ASLMetaParser._strip_line_terminator(line, encoding)
+    
+    @staticmethod
+    def _strip_line_terminator(line: Union[str, bytes], encoding: str) -> str:
+        """Decode a raw line and drop its trailing newline (CR is only dropped as part of CRLF)"""
+        if isinstance(line, bytes):
+            line = line.decode(encoding, errors="replace")
+        if line.endswith('\n'):
+            line = line[:-2] if line.endswith('\r\n') else line[:-1]
+        return line
+    
     def _generate_transparency_report(self) -> Dict[str, Any]:
         """Generate transparency report for cognitive accountability"""
         return {
@@ -396,7 +724,8 @@ class ASLMetaParser:
                 "Missing Pydantic dependency" if not PYDANTIC_AVAILABLE else None
             ],
             "cognitive_patterns_used": list(self.cognitive_patterns.keys()),
-            "introspective_logging_active": True,
+            "introspective_logging_active": self.introspective_logger.enabled,
+            "introspective_logging_policy": self.introspective_logger.policy.value,
             "dependency_status": {
                 "pydantic_available": PYDANTIC_AVAILABLE,
                 "fallback_validation": True
@@ -6,7 +6,9 @@ from datetime import datetime
 import json
 import logging
 
+from .bounded_history import BoundedHistory, HistoryPolicy
 from .metrics import CognitiveMetricsAnalyzer
+from .compact_tags import CompactCognitiveTag, CognitiveTagLike
 from .parser import ASLMetaParser
 from .models import ASLCognitiveTag, MentalStateEnum, EmotionToneEnum, TemporalContextEnum
 
@@ -19,7 +21,7 @@ class AetheroReflectionAgent:
     kognitívnych procesov systému.
     """
     
-    def __init__(self):
+    def __init__(self, history_policy: Optional[HistoryPolicy] = None):
         self.parser = ASLMetaParser()
         self.metrics_analyzer = CognitiveMetricsAnalyzer()
         self.agent_id = f"aethero_reflection_agent_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -28,9 +30,34 @@ class AetheroReflectionAgent:
         self.logger = logging.getLogger(f"AetheroReflectionAgent_{self.agent_id}")
         self.logger.setLevel(logging.INFO)
         
-        # Pamäť reflexívneho procesu
-        self.reflection_memory = []
-        self.consciousness_evolution_track = []
+        self.history_policy = history_policy or HistoryPolicy()
+        self._reset_session_state()
+    
+    def new_session(self) -> "AetheroReflectionAgent":
+        """
+        Reflexívny agent pre jednu požiadavku nad zdieľanými enginmi
+        
+        Parser and analyzer sessions share the compiled patterns, validator and
+        vectorized engine of this agent; the logger is reused instead of creating
+        a new named logger per agent. Reflection memory and counters are fresh.
+        """
+        session = object.__new__(type(self))
+        session.parser = self.parser.new_session()
+        session.metrics_analyzer = self.metrics_analyzer.new_session()
+        session.agent_id = f"aethero_reflection_agent_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        session.logger = self.logger
+        session.history_policy = self.history_policy
+        session._reset_session_state()
+        return session
+    
+    def _reset_session_state(self) -> None:
+        """Inicializácia pamäte a výkonnostných metrík agenta"""
+        # Pamäť reflexívneho procesu - ohraničená, staršie záznamy môžu ísť na disk
+        self.reflection_memory: BoundedHistory[Dict[str, Any]] = self.history_policy.create("reflection_memory")
+        self.consciousness_evolution_track: BoundedHistory[Dict[str, Any]] = self.history_policy.create(
+            "consciousness_evolution_track"
+        )
+        self._reflection_depth_sum = 0.0
         
         # Výkonnostné metriky agenta
         self.reflection_session_count = 0
@@ -60,7 +87,8 @@ class AetheroReflectionAgent:
         for result in parsed_data.get("parsing_results", []):
             if result.get("is_valid") and result.get("validated_model"):
                 try:
-                    tag = ASLCognitiveTag(**result["validated_model"])
+                    # Parser už model validoval - kompaktný tag bez opakovanej Pydantic validácie
+                    tag = CompactCognitiveTag.from_components(result["validated_model"])
                     validated_tags.append(tag)
                 except Exception as e:
                     self.logger.warning(f"Failed to reconstruct cognitive tag: {e}")
@@ -92,6 +120,7 @@ class AetheroReflectionAgent:
             "key_insights": actionable_insights[:3]  # Top 3 insights
         }
         self.reflection_memory.append(reflection_record)
+        self._reflection_depth_sum += reflection_record["reflection_depth"]
         
         # Aktualizácia evolučnej stopy
         if validated_tags:
@@ -128,7 +157,7 @@ class AetheroReflectionAgent:
     
     def _generate_deep_cognitive_reflections(
         self, 
-        cognitive_tags: List[ASLCognitiveTag], 
+        cognitive_tags: List[CognitiveTagLike], 
         parsing_data: Dict[str, Any], 
         metrics_report: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -229,7 +258,7 @@ class AetheroReflectionAgent:
         else:
             return f"Emotional landscape characterized by {dominant_emotion.value} suggests specific affective cognitive engagement"
     
-    def _assess_consciousness_evolution(self, cognitive_tags: List[ASLCognitiveTag]) -> Dict[str, Any]:
+    def _assess_consciousness_evolution(self, cognitive_tags: List[CognitiveTagLike]) -> Dict[str, Any]:
         """Hodnotenie evolúcie vedomia v rámci session"""
         if len(cognitive_tags) < 2:
             return {"evolution_assessment": "insufficient_data_for_evolution_analysis"}
@@ -362,15 +391,16 @@ class AetheroReflectionAgent:
     
     def _generate_agent_performance_summary(self) -> Dict[str, Any]:
         """Generovanie súhrnu výkonnosti agenta"""
+        # Priebežný priemer cez všetky sessions, bez prechodu pamäte
+        recorded_sessions = self.reflection_memory.total_appended
         self.average_reflection_depth = (
-            sum(r.get("reflection_depth", 0) for r in self.reflection_memory) / 
-            len(self.reflection_memory) if self.reflection_memory else 0.0
+            self._reflection_depth_sum / recorded_sessions if recorded_sessions else 0.0
         )
         
         return {
             "total_reflection_sessions": self.reflection_session_count,
             "average_reflection_depth": self.average_reflection_depth,
-            "consciousness_evolution_track_length": len(self.consciousness_evolution_track),
+            "consciousness_evolution_track_length": self.consciousness_evolution_track.total_appended,
             "agent_uptime_start": self.agent_id.split("_")[-1],
             "introspective_capability_level": "maximum" if self.average_reflection_depth > 0.8 else "developing"
         }
@@ -380,8 +410,8 @@ class AetheroReflectionAgent:
 class ReflectionAgent(AetheroReflectionAgent):
     """Legacy wrapper pre spätná kompatibilita"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, history_policy: Optional[HistoryPolicy] = None):
+        super().__init__(history_policy)
         
     def reflect_on_input(self, document: str) -> dict:
         """Legacy method wrapper"""
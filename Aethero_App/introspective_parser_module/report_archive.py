@@ -0,0 +1,508 @@
+"""
+Segmented append-only archive for ministerial memory reports
+
+Instead of a ``<ref_code>.md`` / ``<ref_code>.json`` pair per memory,
+reports are appended as records to rolling segment files:
+
+- ``segments/<number>.seg`` - records of a fixed header (magic, flags,
+  key/metadata/content lengths, CRC-32) followed by the ref_code, the
+  metadata JSON and the rendered report, each optionally zlib compressed;
+  a segment rolls over after ``segment_bytes``
+- ``index.tsv`` - append-only ``ref_code, segment, offset, length`` lines
+  (a negative length marks a deletion), loaded into a dict on open, so a
+  report is read with one lookup and one positioned read
+
+Re-archiving a ref_code appends a new record and the index points to it;
+delete() appends a tombstone. compact() copies the live records into new
+segments, replaces the index atomically and removes the old segments.
+Records that reached a segment but not the index (an interrupted append)
+are recovered from the segments on open; a torn record at the end is cut
+off. export() writes the individual file pairs again on demand.
+
+Several processes may share one archive: appends, recovery and compaction
+hold an exclusive ``fcntl.flock`` on ``archive.lock``. Under the lock a
+writer first reads the index lines other processes added (or reloads the
+index after a compaction), then appends at the real end of the newest
+segment.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+import json
+import logging
+import os
+import struct
+import threading
+import zlib
+
+try:
+    import fcntl
+except ImportError:  # Windows - no cross-process locking
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"AMR1"
+# magic, flags, ref_code length, metadata length, content length, CRC-32 of the payload
+_HEADER = struct.Struct("<4sBHIII")
+_COMPRESSED = 1
+_TOMBSTONE = 2
+_INDEX_FILE = "index.tsv"
+_LOCK_FILE = "archive.lock"
+_SEGMENTS_DIR = "segments"
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+
+
+class ArchivedReport(NamedTuple):
+    """Jeden archivovaný report - ref_code, vykreslený obsah a metadáta"""
+    ref_code: str
+    content: str
+    metadata: Dict[str, Any]
+
+
+class _Location(NamedTuple):
+    segment: int
+    offset: int
+    length: int
+
+
+class ReportArchive:
+    """
+    Segmentový archív pamäťových reportov s O(1) prístupom podľa ref_code.
+
+    Args:
+        directory: Archive directory (created on first use)
+        segment_bytes: Size after which appends roll over to a new segment
+        compress: zlib-compress metadata and content of new records
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+                 compress: bool = False):
+        self.directory = os.fspath(directory)
+        self.segment_bytes = segment_bytes
+        self.compress = compress
+        os.makedirs(os.path.join(self.directory, _SEGMENTS_DIR), exist_ok=True)
+        self._lock = threading.RLock()
+        self._lock_descriptor = os.open(os.path.join(self.directory, _LOCK_FILE), os.O_RDWR | os.O_CREAT, 0o644)
+        self._index: Dict[str, _Location] = {}
+        # Bytes of index.tsv applied to _index, and which index file they came from
+        self._index_position = 0
+        self._index_inode: Optional[int] = None
+        self._readers: Dict[int, int] = {}
+        self._writer = None
+        self._writer_segment = 0
+        self._index_writer = None
+        with self._exclusive():
+            self._load()
+
+    @classmethod
+    def from_env(cls, default_directory: Union[str, os.PathLike] = "aeth_mem_reports/archive") -> "ReportArchive":
+        """Archive in AETHERO_REPORT_ARCHIVE_DIR; AETHERO_REPORT_ARCHIVE_COMPRESS=1 compresses new records"""
+        return cls(
+            os.environ.get("AETHERO_REPORT_ARCHIVE_DIR", default_directory),
+            compress=os.environ.get("AETHERO_REPORT_ARCHIVE_COMPRESS", "0").lower() in ("1", "true", "yes"),
+        )
+
+    def _close_handles(self) -> None:
+        for handle in (self._writer, self._index_writer):
+            if handle is not None:
+                handle.close()
+        self._writer = self._index_writer = None
+        for descriptor in self._readers.values():
+            os.close(descriptor)
+        self._readers = {}
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_handles()
+            if self._lock_descriptor is not None:
+                os.close(self._lock_descriptor)
+                self._lock_descriptor = None
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Thread lock plus the cross-process lock on archive.lock"""
+        with self._lock:
+            if self._lock_descriptor is None:
+                raise ValueError("Report archive is closed")
+            if fcntl is not None:
+                fcntl.flock(self._lock_descriptor, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._lock_descriptor, fcntl.LOCK_UN)
+
+    def __enter__(self) -> "ReportArchive":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, ref_code: str) -> bool:
+        return ref_code in self._index
+
+    def refs(self) -> List[str]:
+        return list(self._index)
+
+    # Layout
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, _SEGMENTS_DIR, f"{segment:08d}.seg")
+
+    def _segments(self) -> List[int]:
+        names = os.listdir(os.path.join(self.directory, _SEGMENTS_DIR))
+        return sorted(int(name[:-4]) for name in names if name.endswith(".seg") and name[:-4].isdigit())
+
+    def _index_path(self) -> str:
+        return os.path.join(self.directory, _INDEX_FILE)
+
+    def _apply_index_lines(self, data: bytes, indexed_end: Optional[Dict[int, int]] = None) -> int:
+        """Apply complete index lines; returns the number of bytes consumed"""
+        consumed = data.rfind(b"\n") + 1
+        for line in data[:consumed].decode("utf-8").splitlines():
+            parts = line.split("\t")
+            if len(parts) != 4:
+                continue
+            ref_code, segment, offset, length = parts[0], int(parts[1]), int(parts[2]), int(parts[3])
+            if indexed_end is not None:
+                indexed_end[segment] = max(indexed_end.get(segment, 0), offset + abs(length))
+            if length > 0:
+                self._index[ref_code] = _Location(segment, offset, length)
+            else:
+                self._index.pop(ref_code, None)
+        return consumed
+
+    def _load(self) -> None:
+        """Read the index, then recover records appended after its last line (under the lock)"""
+        indexed_end: Dict[int, int] = {}
+        self._index = {}
+        self._index_position, self._index_inode = 0, None
+        index_path = self._index_path()
+        if os.path.exists(index_path):
+            with open(index_path, "r+b") as handle:
+                self._index_position = self._apply_index_lines(handle.read(), indexed_end)
+                # A torn last line would merge with the next appended one
+                handle.truncate(self._index_position)
+                self._index_inode = os.fstat(handle.fileno()).st_ino
+
+        last_indexed = max(indexed_end, default=-1)
+        recovered = []
+        for segment in self._segments():
+            if segment < last_indexed:
+                continue
+            start = indexed_end.get(segment, 0)
+            for ref_code, location, flags, _ in self._scan(segment, start, truncate=True):
+                recovered.append((ref_code, location, flags))
+        if recovered:
+            self._append_index_lines(recovered)
+            for ref_code, location, flags in recovered:
+                if flags & _TOMBSTONE:
+                    self._index.pop(ref_code, None)
+                else:
+                    self._index[ref_code] = location
+            logger.warning(f"Report archive recovered {len(recovered)} unindexed records")
+
+    def _sync(self) -> None:
+        """Catch up with index lines written by other processes (under the lock)"""
+        try:
+            stat = os.stat(self._index_path())
+        except FileNotFoundError:
+            stat = None
+        if stat is None or stat.st_ino != self._index_inode or stat.st_size < self._index_position:
+            if stat is None and self._index_inode is None:
+                return
+            # Compacted (index replaced) by another process - segments may be gone
+            self._close_handles()
+            self._load()
+            return
+        if stat.st_size > self._index_position:
+            with open(self._index_path(), "rb") as handle:
+                handle.seek(self._index_position)
+                self._index_position += self._apply_index_lines(handle.read())
+
+    def refresh(self) -> None:
+        """Pick up reports archived by other processes since the last append"""
+        with self._exclusive():
+            self._sync()
+
+    def _scan(self, segment: int, start: int = 0, truncate: bool = False) -> Iterator[Tuple[str, _Location, int, bytes]]:
+        """(ref_code, location, flags, record) from ``start``; a torn tail is truncated when ``truncate`` is set"""
+        path = self._segment_path(segment)
+        with open(path, "rb") as handle:
+            handle.seek(start)
+            offset = start
+            while True:
+                header = handle.read(_HEADER.size)
+                if not header:
+                    return
+                record = self._parse_header(header)
+                payload = handle.read(record[1] + record[2] + record[3]) if record else b""
+                if record is None or len(payload) < record[1] + record[2] + record[3] or zlib.crc32(payload) != record[4]:
+                    if truncate:
+                        logger.warning(f"Report archive segment {segment}: dropping torn record at {offset}")
+                        with open(path, "r+b") as writable:
+                            writable.truncate(offset)
+                    return
+                flags, key_length = record[0], record[1]
+                length = _HEADER.size + len(payload)
+                yield payload[:key_length].decode("utf-8"), _Location(segment, offset, length), flags, header + payload
+                offset += length
+
+    @staticmethod
+    def _parse_header(header: bytes) -> Optional[Tuple[int, int, int, int, int]]:
+        if len(header) < _HEADER.size:
+            return None
+        magic, flags, key_length, metadata_length, content_length, checksum = _HEADER.unpack(header)
+        if magic != _MAGIC:
+            return None
+        return flags, key_length, metadata_length, content_length, checksum
+
+    # Writing
+
+    def _encode(self, ref_code: str, content: str, metadata: Dict[str, Any], flags: int) -> bytes:
+        key = ref_code.encode("utf-8")
+        metadata_bytes = json.dumps(metadata, ensure_ascii=False, default=str).encode("utf-8")
+        content_bytes = content.encode("utf-8")
+        if flags & _COMPRESSED:
+            metadata_bytes, content_bytes = zlib.compress(metadata_bytes), zlib.compress(content_bytes)
+        payload = key + metadata_bytes + content_bytes
+        return _HEADER.pack(_MAGIC, flags, len(key), len(metadata_bytes), len(content_bytes), zlib.crc32(payload)) + payload
+
+    def _position_writer(self) -> None:
+        """Writer at the real end of the newest segment - other processes may have appended (under the lock)"""
+        segments = self._segments()
+        latest = segments[-1] if segments else 0
+        if self._writer is not None and latest != self._writer_segment:
+            self._writer.close()
+            self._writer = None
+        if self._writer is None:
+            self._writer_segment = latest
+            self._writer = open(self._segment_path(self._writer_segment), "ab")
+        self._writer.seek(0, os.SEEK_END)
+
+    def _open_writer(self, record_size: int) -> Tuple[int, int]:
+        """Current segment and append offset, rolling over to a new segment when full"""
+        offset = self._writer.tell()
+        if offset and offset + record_size > self.segment_bytes:
+            self._writer.close()
+            self._writer_segment += 1
+            self._writer = open(self._segment_path(self._writer_segment), "ab")
+            offset = 0
+        return self._writer_segment, offset
+
+    def _append_index_lines(self, entries: Iterable[Tuple[str, _Location, int]]) -> None:
+        if self._index_writer is None:
+            self._index_writer = open(self._index_path(), "a", encoding="utf-8")
+        self._index_writer.writelines(
+            f"{ref_code}\t{location.segment}\t{location.offset}\t{-location.length if flags & _TOMBSTONE else location.length}\n"
+            for ref_code, location, flags in entries
+        )
+        self._index_writer.flush()
+        # Everything up to here is applied: earlier lines by _sync(), these by the caller
+        stat = os.fstat(self._index_writer.fileno())
+        self._index_position, self._index_inode = stat.st_size, stat.st_ino
+
+    def _append(self, records: Iterable[Tuple[str, str, Dict[str, Any], int]]) -> int:
+        encoded = []
+        for ref_code, content, metadata, flags in records:
+            if "\t" in ref_code or "\n" in ref_code:
+                raise ValueError(f"Invalid ref_code for the report archive: {ref_code!r}")
+            encoded.append((ref_code, self._encode(ref_code, content, metadata, flags), flags))
+        if not encoded:
+            return 0
+        with self._exclusive():
+            self._sync()
+            self._position_writer()
+            entries = []
+            for ref_code, record, flags in encoded:
+                segment, offset = self._open_writer(len(record))
+                self._writer.write(record)
+                entries.append((ref_code, _Location(segment, offset, len(record)), flags))
+            # Segment data reaches the disk before the index lines that point to it
+            self._writer.flush()
+            self._append_index_lines(entries)
+            for ref_code, location, flags in entries:
+                if flags & _TOMBSTONE:
+                    self._index.pop(ref_code, None)
+                else:
+                    self._index[ref_code] = location
+            return len(entries)
+
+    def put(self, ref_code: str, content: str, metadata: Dict[str, Any]) -> None:
+        """Archive (or replace) one rendered report with its metadata"""
+        self.put_many([(content, metadata)], [ref_code])
+
+    def put_many(self, reports: Iterable[Tuple[str, Dict[str, Any]]], ref_codes: Optional[Iterable[str]] = None) -> int:
+        """
+        INTENT: Uloženie dávky reportov bez súboru na každú spomienku
+        ACTION: Pripojenie záznamov do segmentu a riadkov do indexu
+        OUTPUT: Počet archivovaných reportov
+        HOOK: report_archive_appended
+
+        Args:
+            reports: (rendered content, metadata) pairs
+            ref_codes: Keys of the reports (default: metadata["ref_code"])
+        """
+        flags = _COMPRESSED if self.compress else 0
+        if ref_codes is None:
+            return self._append((metadata["ref_code"], content, metadata, flags) for content, metadata in reports)
+        return self._append((ref_code, content, metadata, flags) for (content, metadata), ref_code in zip(reports, ref_codes))
+
+    def delete(self, ref_code: str) -> bool:
+        if ref_code not in self._index:
+            return False
+        self._append([(ref_code, "", {}, _TOMBSTONE)])
+        return True
+
+    # Reading
+
+    def _read(self, location: _Location) -> bytes:
+        descriptor = self._readers.get(location.segment)
+        if descriptor is None:
+            descriptor = self._readers[location.segment] = os.open(self._segment_path(location.segment), os.O_RDONLY)
+        return os.pread(descriptor, location.length, location.offset)
+
+    @staticmethod
+    def _decode(record: bytes) -> ArchivedReport:
+        flags, key_length, metadata_length, content_length, _ = ReportArchive._parse_header(record[:_HEADER.size])
+        position = _HEADER.size
+        ref_code = record[position:position + key_length].decode("utf-8")
+        position += key_length
+        metadata_bytes = record[position:position + metadata_length]
+        content_bytes = record[position + metadata_length:position + metadata_length + content_length]
+        if flags & _COMPRESSED:
+            metadata_bytes, content_bytes = zlib.decompress(metadata_bytes), zlib.decompress(content_bytes)
+        return ArchivedReport(ref_code, content_bytes.decode("utf-8"), json.loads(metadata_bytes))
+
+    def get(self, ref_code: str) -> Optional[ArchivedReport]:
+        """Report by ref_code - one dict lookup and one positioned read"""
+        with self._lock:
+            location = self._index.get(ref_code)
+            if location is None:
+                return None
+            if self._writer is not None and location.segment == self._writer_segment:
+                self._writer.flush()
+            try:
+                return self._decode(self._read(location))
+            except FileNotFoundError:
+                # Segment removed by a compaction in another process
+                self.refresh()
+                location = self._index.get(ref_code)
+                return self._decode(self._read(location)) if location is not None else None
+
+    def iter_reports(self) -> Iterator[ArchivedReport]:
+        """Live reports in archive (segment) order, reading every segment sequentially"""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.flush()
+            live = {(location.segment, location.offset) for location in self._index.values()}
+        for segment in self._segments():
+            for _, location, _, record in self._scan(segment):
+                if (segment, location.offset) in live:
+                    yield self._decode(record)
+
+    # Maintenance
+
+    def get_stats(self) -> Dict[str, Any]:
+        segments = self._segments()
+        total = sum(os.path.getsize(self._segment_path(segment)) for segment in segments)
+        live = sum(location.length for location in self._index.values())
+        return {
+            "directory": self.directory,
+            "reports": len(self._index),
+            "segments": len(segments),
+            "segment_bytes": total,
+            "live_bytes": live,
+            "garbage_bytes": total - live,
+        }
+
+    def compact(self, compress: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        INTENT: Uvoľnenie miesta po nahradených a zmazaných reportoch
+        ACTION: Prepis živých záznamov do nových segmentov, atómová výmena indexu
+        OUTPUT: Štatistiky archívu pred a po kompakcii
+        HOOK: report_archive_compacted
+
+        Args:
+            compress: Re-encode the records compressed or uncompressed
+                (None keeps every record as it is stored)
+        """
+        with self._exclusive():
+            self._sync()
+            before = self.get_stats()
+            old_segments = self._segments()
+            self._close_handles()
+
+            segment = (old_segments[-1] + 1) if old_segments else 0
+            new_index: Dict[str, _Location] = {}
+            writer = open(self._segment_path(segment), "wb")
+            try:
+                for ref_code, location in sorted(self._index.items(), key=lambda item: item[1]):
+                    record = self._read(location)
+                    if compress is not None and bool(record[4] & _COMPRESSED) != compress:
+                        report = self._decode(record)
+                        record = self._encode(ref_code, report.content, report.metadata, _COMPRESSED if compress else 0)
+                    if writer.tell() and writer.tell() + len(record) > self.segment_bytes:
+                        writer.close()
+                        segment += 1
+                        writer = open(self._segment_path(segment), "wb")
+                    new_index[ref_code] = _Location(segment, writer.tell(), len(record))
+                    writer.write(record)
+                writer.flush()
+                os.fsync(writer.fileno())
+            finally:
+                writer.close()
+                for descriptor in self._readers.values():
+                    os.close(descriptor)
+                self._readers = {}
+
+            index_path = os.path.join(self.directory, _INDEX_FILE)
+            with open(index_path + ".tmp", "w", encoding="utf-8") as handle:
+                handle.writelines(
+                    f"{ref_code}\t{location.segment}\t{location.offset}\t{location.length}\n"
+                    for ref_code, location in new_index.items()
+                )
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(index_path + ".tmp", index_path)
+            for old in old_segments:
+                os.remove(self._segment_path(old))
+            self._index = new_index
+            stat = os.stat(index_path)
+            self._index_position, self._index_inode = stat.st_size, stat.st_ino
+            if compress is not None:
+                self.compress = compress
+
+            after = self.get_stats()
+            logger.info(f"Report archive compacted: {before['segment_bytes']} -> {after['segment_bytes']} bytes "
+                        f"in {after['segments']} segments")
+            return {"before": before, "after": after}
+
+    def export(self, directory: Union[str, os.PathLike], ref_codes: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Write reports back as individual ``<ref_code>.md`` / ``<ref_code>.json`` files
+
+        Args:
+            directory: Target directory
+            ref_codes: Reports to export (default: all)
+
+        Returns:
+            list: Exported ref_codes (unknown ref_codes are skipped)
+        """
+        os.makedirs(directory, exist_ok=True)
+        reports = (self.get(ref_code) for ref_code in ref_codes) if ref_codes is not None else self.iter_reports()
+        exported = []
+        for report in reports:
+            if report is None:
+                continue
+            base = os.path.join(directory, report.ref_code)
+            with open(base + ".md", "w", encoding="utf-8") as handle:
+                handle.write(report.content)
+            with open(base + ".json", "w", encoding="utf-8") as handle:
+                json.dump(report.metadata, handle, indent=4)
+            exported.append(report.ref_code)
+        return exported
@@ -0,0 +1,159 @@
+"""
+Content-addressed result cache for cognitive processing
+
+Results are keyed by a SHA-256 of the input text, the job kind and the
+engine version, so a document that was already parsed, analyzed or reflected
+on is served without running the engines again. The local tier is an
+in-process LRU with TTL; an optional shared tier (any client with Redis-style
+get(key) / set(key, value, ex=seconds)) lets several workers share results.
+Values must be JSON-serializable to be stored in the shared tier.
+"""
+
+from typing import Any, Callable, Dict, Tuple
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Returned by ResultCache.get() on a miss - None is a valid cached result
+MISS = object()
+
+
+class ResultCache:
+    """
+    LRU + TTL cache výsledkov s voliteľnou zdieľanou vrstvou.
+
+    Args:
+        max_entries: Local LRU capacity (0 disables caching entirely)
+        ttl_seconds: Lifetime of an entry in both tiers
+        shared: Optional Redis-style client for the shared tier
+        version: Engine version mixed into every key - a new version never sees old results
+        namespace: Key prefix in the shared tier
+        clock: Time source in seconds, injectable for tests
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300.0,
+                 shared: Any = None, version: str = "", namespace: str = "aethero:result",
+                 clock: Callable[[], float] = time.time):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.shared = shared
+        self.version = version
+        self.namespace = namespace
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.shared_errors = 0
+
+    @classmethod
+    def from_env(cls, shared: Any = None, version: str = "") -> "ResultCache":
+        """Cache configured from AETHERO_RESULT_CACHE_* environment variables"""
+        return cls(
+            max_entries=int(os.environ.get("AETHERO_RESULT_CACHE_SIZE", "1024")),
+            ttl_seconds=float(os.environ.get("AETHERO_RESULT_CACHE_TTL_SECONDS", "300")),
+            shared=shared,
+            version=version
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def key(self, kind: str, text: str) -> str:
+        """Kľúč adresovaný obsahom - verzia, druh úlohy a SHA-256 textu"""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.namespace}:{self.version}:{kind}:{digest}"
+
+    def get(self, key: str) -> Any:
+        """
+        INTENT: Vyhľadanie výsledku bez spustenia enginov
+        ACTION: Lokálna LRU vrstva, potom zdieľaná vrstva
+        OUTPUT: Uložený výsledok alebo MISS
+        HOOK: result_cache_lookup
+        """
+        if not self.enabled:
+            return MISS
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+        value = self._shared_get(key)
+        with self._lock:
+            if value is MISS:
+                self.misses += 1
+                return MISS
+            self.shared_hits += 1
+            self._store(key, value, now)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._store(key, value, self.clock())
+        self._shared_set(key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _store(self, key: str, value: Any, now: float) -> None:
+        self._entries[key] = (now + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _shared_get(self, key: str) -> Any:
+        if self.shared is None:
+            return MISS
+        try:
+            raw = self.shared.get(key)
+        except Exception as e:
+            # The shared tier is best-effort - an unavailable Redis only costs a recomputation
+            self.shared_errors += 1
+            logger.warning(f"Shared result cache unavailable: {str(e)}")
+            return MISS
+        return MISS if raw is None else json.loads(raw)
+
+    def _shared_set(self, key: str, value: Any) -> None:
+        if self.shared is None:
+            return
+        try:
+            self.shared.set(key, json.dumps(value, separators=(",", ":"), ensure_ascii=False),
+                            ex=max(1, int(self.ttl_seconds)))
+        except Exception as e:
+            self.shared_errors += 1
+            logger.warning(f"Shared result cache unavailable: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.shared_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "shared_tier": self.shared is not None,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.shared_hits) / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "shared_errors": self.shared_errors
+        }
@@ -0,0 +1,303 @@
+"""
+Secondary indexes and queries over a ColumnarTagStore
+
+Indexes are built from the memmapped columns and kept in memory:
+
+- bitmap indexes (packed bits, one bitmap per enum code) on mental_state,
+  emotion_tone and temporal_context
+- sorted indexes (stable argsort + sorted values) on creation_moment,
+  cognitive_load and certainty_level
+- a hash index aeth_mem_link -> row numbers
+
+A query is planned from the estimated cardinality of each predicate: the
+most selective index produces the candidate rows, the other predicates are
+checked only on those rows by gathering their column values. Enum
+predicates are intersected on the bitmaps before that. The store is
+append-only, so refresh() only indexes the new rows: their bitmaps are
+packed and concatenated to the existing ones, and the sorted new rows are
+merged into the sorted indexes with searchsorted.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import os
+import threading
+
+from .compact_tags import CompactCognitiveTag, MENTAL_STATES, EMOTION_TONES, TEMPORAL_CONTEXTS, _MENTAL_CODES, _EMOTION_CODES, _TEMPORAL_CODES
+from .metrics import AetheroCognitiveAnalyzer, CognitiveMetrics, CognitiveMetricsBackend
+from .tag_store import ColumnarTagStore
+from .vectorized_metrics import CognitiveTagArrays, _require_numpy, np
+
+logger = logging.getLogger(__name__)
+
+ENUM_INDEXES = {
+    "mental_state": (MENTAL_STATES, _MENTAL_CODES),
+    "emotion_tone": (EMOTION_TONES, _EMOTION_CODES),
+    "temporal_context": (TEMPORAL_CONTEXTS, _TEMPORAL_CODES),
+}
+SORTED_INDEXES = ("creation_moment", "cognitive_load", "certainty_level")
+
+
+@dataclass
+class TagQuery:
+    """
+    Filter nad uloženými tagmi - všetky podmienky musia platiť súčasne.
+
+    Enum filters match any of the listed values. Ranges are half-open:
+    ``min_*`` / ``since`` are inclusive, ``max_*`` / ``until`` exclusive.
+    """
+    mental_states: Optional[Sequence[str]] = None
+    emotion_tones: Optional[Sequence[str]] = None
+    temporal_contexts: Optional[Sequence[str]] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    min_cognitive_load: Optional[int] = None
+    max_cognitive_load: Optional[int] = None
+    min_certainty: Optional[float] = None
+    max_certainty: Optional[float] = None
+    aeth_mem_link: Optional[str] = None
+
+    def enum_filters(self) -> Dict[str, Sequence[str]]:
+        filters = {
+            "mental_state": self.mental_states,
+            "emotion_tone": self.emotion_tones,
+            "temporal_context": self.temporal_contexts,
+        }
+        return {column: values for column, values in filters.items() if values is not None}
+
+    def range_filters(self) -> Dict[str, tuple]:
+        ranges = {
+            "creation_moment": (
+                self.since.timestamp() if self.since is not None else None,
+                self.until.timestamp() if self.until is not None else None
+            ),
+            "cognitive_load": (self.min_cognitive_load, self.max_cognitive_load),
+            "certainty_level": (self.min_certainty, self.max_certainty),
+        }
+        return {column: bounds for column, bounds in ranges.items() if bounds != (None, None)}
+
+
+@dataclass
+class _Predicate:
+    """Jedna podmienka plánu - odhad počtu riadkov, generátor kandidátov a filter"""
+    estimate: int
+    candidates: Callable[[], "np.ndarray"]
+    matches: Callable[["np.ndarray"], "np.ndarray"]
+
+
+class TagQueryEngine:
+    """
+    Dotazovací engine nad stĺpcovým úložiskom tagov.
+
+    Args:
+        store: ColumnarTagStore or a store directory; a missing directory is
+            treated as an empty store until tags are appended to it
+    """
+
+    def __init__(self, store: Union[ColumnarTagStore, str, os.PathLike]):
+        _require_numpy()
+        if isinstance(store, ColumnarTagStore):
+            self.directory = store.directory
+            self._store: Optional[ColumnarTagStore] = store
+        else:
+            self.directory = os.fspath(store)
+            self._store = None
+        self._lock = threading.Lock()
+        self._indexed_rows = 0
+        self._bitmaps: Dict[str, List["np.ndarray"]] = {}
+        self._bitmap_counts: Dict[str, "np.ndarray"] = {}
+        self._sorted: Dict[str, tuple] = {}
+        self._links: Dict[str, array] = {}
+
+    @classmethod
+    def from_env(cls) -> "TagQueryEngine":
+        """Engine over the store in AETHERO_TAG_STORE_DIR"""
+        return cls(os.environ.get("AETHERO_TAG_STORE_DIR", "aethero_asl_tag_store"))
+
+    def __len__(self) -> int:
+        return self._indexed_rows
+
+    # Index maintenance
+
+    def refresh(self) -> int:
+        """
+        INTENT: Udržanie indexov v súlade s úložiskom
+        ACTION: Indexovanie riadkov pripojených od posledného obnovenia
+        OUTPUT: Počet indexovaných riadkov
+        HOOK: tag_indexes_refreshed
+        """
+        with self._lock:
+            if self._store is None:
+                if not os.path.isdir(self.directory):
+                    return self._indexed_rows
+                self._store = ColumnarTagStore(self.directory)
+            else:
+                self._store.refresh()
+            count = len(self._store)
+            if count != self._indexed_rows:
+                self._extend_indexes(self._indexed_rows, count)
+                self._indexed_rows = count
+                logger.info(f"Tag indexes cover {count} stored tags")
+            return count
+
+    def _extend_indexes(self, start: int, stop: int) -> None:
+        store = self._store
+        # Packed bitmaps concatenate on byte boundaries - the last partial byte is packed again
+        aligned = start - start % 8
+        for column, (members, _) in ENUM_INDEXES.items():
+            codes = store.column(column)[aligned:stop]
+            previous = self._bitmaps.get(column)
+            self._bitmaps[column] = [
+                np.concatenate((previous[code][:aligned // 8], np.packbits(codes == code))) if previous
+                else np.packbits(codes == code)
+                for code in range(len(members))
+            ]
+            counts = np.bincount(codes[start - aligned:], minlength=len(members))
+            self._bitmap_counts[column] = self._bitmap_counts[column] + counts if previous else counts
+
+        for column in SORTED_INDEXES:
+            values = store.column(column)[start:stop]
+            order = np.argsort(values, kind="stable")
+            new_values, new_order = values[order], order + start
+            if column in self._sorted:
+                # New rows go after equal old values, which keeps the merge stable
+                old_values, old_order = self._sorted[column]
+                positions = np.searchsorted(old_values, new_values, side="right")
+                new_values = np.insert(old_values, positions, new_values)
+                new_order = np.insert(old_order, positions, new_order)
+            self._sorted[column] = (new_values, new_order)
+
+        for offset, link in enumerate(store.strings("aeth_mem_link", start, stop), start):
+            rows = self._links.get(link)
+            if rows is None:
+                rows = self._links[link] = array("q")
+            rows.append(offset)
+
+    # Planning
+
+    def _enum_predicate(self, filters: Dict[str, Sequence[str]], total: int) -> _Predicate:
+        codes = {}
+        for column, values in filters.items():
+            lookup = ENUM_INDEXES[column][1]
+            try:
+                codes[column] = sorted({lookup[value] for value in values})
+            except KeyError as error:
+                raise ValueError(f"Unknown {column} value: {error.args[0]}") from None
+
+        def column_bitmap(column: str) -> "np.ndarray":
+            bitmaps = [self._bitmaps[column][code] for code in codes[column]]
+            if not bitmaps:
+                return np.zeros((total + 7) // 8, dtype=np.uint8)
+            return np.bitwise_or.reduce(bitmaps)
+
+        def candidates() -> "np.ndarray":
+            combined = np.bitwise_and.reduce([column_bitmap(column) for column in codes])
+            return np.flatnonzero(np.unpackbits(combined, count=total))
+
+        def matches(rows: "np.ndarray") -> "np.ndarray":
+            mask = np.ones(len(rows), dtype=bool)
+            for column, column_codes in codes.items():
+                mask &= np.isin(self._store.column(column)[rows], column_codes)
+            return mask
+
+        estimate = min(int(self._bitmap_counts[column][column_codes].sum()) for column, column_codes in codes.items())
+        return _Predicate(estimate, candidates, matches)
+
+    def _range_predicate(self, column: str, low: Optional[float], high: Optional[float]) -> _Predicate:
+        values, order = self._sorted[column]
+        start = int(np.searchsorted(values, low, side="left")) if low is not None else 0
+        stop = int(np.searchsorted(values, high, side="left")) if high is not None else len(values)
+        stop = max(start, stop)
+
+        def matches(rows: "np.ndarray") -> "np.ndarray":
+            gathered = self._store.column(column)[rows]
+            mask = np.ones(len(rows), dtype=bool)
+            if low is not None:
+                mask &= gathered >= low
+            if high is not None:
+                mask &= gathered < high
+            return mask
+
+        return _Predicate(stop - start, lambda: np.sort(order[start:stop]), matches)
+
+    def _link_predicate(self, link: str) -> _Predicate:
+        rows = self._links.get(link)
+        # Copy - a live view would keep the array from growing on the next refresh
+        linked = np.frombuffer(rows, dtype=np.int64).copy() if rows is not None else np.empty(0, dtype=np.int64)
+        return _Predicate(len(linked), lambda: linked, lambda candidates: np.isin(candidates, linked))
+
+    def rows(self, query: TagQuery) -> "np.ndarray":
+        """
+        INTENT: Nájdenie riadkov bez plného prechodu úložiskom
+        ACTION: Najselektívnejší index dá kandidátov, ostatné podmienky ich filtrujú
+        OUTPUT: Vzostupné čísla riadkov vyhovujúcich tagov
+        HOOK: tag_query_executed
+        """
+        self.refresh()
+        total = self._indexed_rows
+        predicates = []
+        if total:
+            enum_filters = query.enum_filters()
+            if enum_filters:
+                predicates.append(self._enum_predicate(enum_filters, total))
+            for column, (low, high) in query.range_filters().items():
+                predicates.append(self._range_predicate(column, low, high))
+            if query.aeth_mem_link is not None:
+                predicates.append(self._link_predicate(query.aeth_mem_link))
+
+        if not predicates:
+            return np.arange(total, dtype=np.int64)
+        predicates.sort(key=lambda predicate: predicate.estimate)
+        rows = predicates[0].candidates()
+        for predicate in predicates[1:]:
+            if len(rows) == 0:
+                break
+            rows = rows[predicate.matches(rows)]
+        return rows
+
+    # Results
+
+    def count(self, query: TagQuery) -> int:
+        return len(self.rows(query))
+
+    def find(self, query: TagQuery, limit: Optional[int] = None, newest_first: bool = False) -> List[CompactCognitiveTag]:
+        """Matching tags in storage order (or newest first), at most ``limit``"""
+        return self.take(self.rows(query), limit, newest_first)
+
+    def take(self, rows: "np.ndarray", limit: Optional[int] = None, newest_first: bool = False) -> List[CompactCognitiveTag]:
+        """Tags for row numbers returned by rows()"""
+        if newest_first:
+            rows = rows[::-1]
+        if limit is not None:
+            rows = rows[:limit]
+        return self._store.take(rows) if len(rows) else []
+
+    def tag_arrays(self, rows: "np.ndarray") -> CognitiveTagArrays:
+        """Columns of the given rows for analyze_tag_arrays()"""
+        if len(rows) == 0:
+            return CognitiveTagArrays.from_tags([])
+        return CognitiveTagArrays(
+            mental_state=self._store.column("mental_state")[rows],
+            emotion_tone=self._store.column("emotion_tone")[rows],
+            temporal_context=self._store.column("temporal_context")[rows],
+            cognitive_load=self._store.column("cognitive_load")[rows].astype(np.float64),
+            certainty_level=self._store.column("certainty_level")[rows],
+        )
+
+    def metrics(self, query: TagQuery, analyzer: Optional[AetheroCognitiveAnalyzer] = None) -> CognitiveMetrics:
+        """Cognitive metrics over the matching tags, computed on their columns"""
+        return self.analyze_rows(self.rows(query), analyzer)
+
+    def analyze_rows(self, rows: "np.ndarray", analyzer: Optional[AetheroCognitiveAnalyzer] = None) -> CognitiveMetrics:
+        analyzer = analyzer or AetheroCognitiveAnalyzer(backend=CognitiveMetricsBackend.NUMPY)
+        return analyzer.analyze_tag_arrays(self.tag_arrays(rows))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "directory": self.directory,
+            "indexed_tags": self._indexed_rows,
+            "distinct_memory_links": len(self._links),
+        }
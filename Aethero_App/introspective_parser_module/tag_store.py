@@ -0,0 +1,359 @@
+"""
+Append-only columnar store for validated cognitive tags
+
+A store is a directory with one file per column:
+
+- fixed-width little-endian columns (enum codes, cognitive load, certainty,
+  levels, creation timestamp) - ``<name>.col``
+- string columns as a UTF-8 heap plus int64 end offsets -
+  ``<name>.heap`` / ``<name>.offsets``; nullable strings get an int8
+  ``<name>.present`` column
+- ``store.json`` with the schema and the committed row count
+
+Appends write every column first and commit the new count last (atomic
+replace), so a crashed append leaves at most trailing bytes that the next
+append truncates. Readers map the columns with numpy.memmap and compute
+metrics directly on them via CognitiveTagArrays - nothing is deserialized.
+JSON and CSV stay available through export_json() / export_csv().
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+from array import array
+import csv
+import json
+import os
+import sys
+import threading
+
+from .compact_tags import CompactCognitiveTag, CognitiveTagLike, compact_tags, MENTAL_STATES, EMOTION_TONES, TEMPORAL_CONTEXTS
+from .vectorized_metrics import CognitiveTagArrays, _require_numpy, np
+
+STORE_FORMAT = "aethero-columnar-tags"
+STORE_VERSION = 1
+_META_FILE = "store.json"
+
+# name -> (array typecode for writing, numpy dtype for reading)
+FIXED_COLUMNS = {
+    "mental_state": ("b", "<i1"),
+    "emotion_tone": ("b", "<i1"),
+    "temporal_context": ("b", "<i1"),
+    "cognitive_load": ("b", "<i1"),
+    "certainty_level": ("d", "<f8"),
+    "consciousness_level": ("d", "<f8"),
+    "introspective_depth": ("d", "<f8"),
+    "creation_moment": ("d", "<f8"),
+}
+STRING_COLUMNS = (
+    "thought_stream", "aeth_mem_link", "constitutional_law", "entity_id",
+    "enhancement_suggestion", "diplomatic_enhancement", "consciousness_resonance",
+)
+NULLABLE_COLUMNS = frozenset(("enhancement_suggestion", "diplomatic_enhancement", "consciousness_resonance"))
+
+# Export column order - same fields as ASLCognitiveTag.dict()
+EXPORT_FIELDS = (
+    "entity_id", "creation_moment", "consciousness_level", "thought_stream",
+    "mental_state", "emotion_tone", "cognitive_load", "temporal_context",
+    "certainty_level", "aeth_mem_link", "constitutional_law",
+    "enhancement_suggestion", "diplomatic_enhancement", "introspective_depth",
+    "consciousness_resonance",
+)
+
+
+def _fixed_values(name: str, tag: CompactCognitiveTag) -> Union[int, float]:
+    if name == "mental_state":
+        return tag.mental_state_code
+    if name == "emotion_tone":
+        return tag.emotion_tone_code
+    if name == "temporal_context":
+        return tag.temporal_context_code
+    if name == "creation_moment":
+        return tag._created_at
+    return getattr(tag, name)
+
+
+def _string_value(name: str, tag: CompactCognitiveTag) -> Optional[str]:
+    if name == "consciousness_resonance":
+        return json.dumps(tag._resonance, ensure_ascii=False, default=str) if tag._resonance else None
+    return getattr(tag, name)
+
+
+def export_row(tag: CognitiveTagLike) -> Dict[str, Any]:
+    """JSON-ready dict of a tag - ASLCognitiveTag.dict() with enum values and an ISO timestamp"""
+    row = tag.dict()
+    row["creation_moment"] = row["creation_moment"].isoformat()
+    for field in ("mental_state", "emotion_tone", "temporal_context"):
+        row[field] = row[field].value
+    return row
+
+
+def write_tags_csv(tags: Iterable[CognitiveTagLike], path: Union[str, os.PathLike]) -> int:
+    """Tags as CSV in EXPORT_FIELDS order; consciousness_resonance is JSON encoded"""
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=EXPORT_FIELDS)
+        writer.writeheader()
+        for tag in tags:
+            row = export_row(tag)
+            row["consciousness_resonance"] = json.dumps(row["consciousness_resonance"], ensure_ascii=False, default=str)
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+class ColumnarTagStore:
+    """
+    Stĺpcové úložisko tagov s pripájaním na koniec a memmap čítaním.
+
+    Args:
+        directory: Store directory (created on first use)
+        text_index: Optional CognitiveTextIndex that receives every appended tag
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], text_index: Optional[Any] = None):
+        self.directory = os.fspath(directory)
+        self.text_index = text_index
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._maps: Dict[str, Any] = {}
+        self._count = self._read_meta()["count"]
+
+    # Layout
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.directory, filename)
+
+    def _read_meta(self) -> Dict[str, Any]:
+        path = self._path(_META_FILE)
+        if not os.path.exists(path):
+            return {"format": STORE_FORMAT, "version": STORE_VERSION, "count": 0}
+        with open(path, encoding="utf-8") as handle:
+            meta = json.load(handle)
+        if meta.get("format") != STORE_FORMAT or meta.get("version") != STORE_VERSION:
+            raise ValueError(f"Unsupported tag store format in {self.directory}: {meta.get('format')} v{meta.get('version')}")
+        return meta
+
+    def _commit(self, count: int) -> None:
+        meta = {
+            "format": STORE_FORMAT,
+            "version": STORE_VERSION,
+            "count": count,
+            "fixed_columns": {name: dtype for name, (_, dtype) in FIXED_COLUMNS.items()},
+            "string_columns": list(STRING_COLUMNS),
+            "nullable_columns": sorted(NULLABLE_COLUMNS),
+        }
+        temporary = self._path(_META_FILE + ".tmp")
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump(meta, handle, indent=2)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, self._path(_META_FILE))
+        self._count = count
+        self._maps.clear()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def refresh(self) -> bool:
+        """Pick up appends committed by another writer; True if the row count changed"""
+        count = self._read_meta()["count"]
+        if count == self._count:
+            return False
+        self._count = count
+        self._maps.clear()
+        return True
+
+    # Writing
+
+    def _truncate_uncommitted(self) -> Dict[str, int]:
+        """Drop bytes of an append that never committed; returns the committed heap sizes"""
+        count = self._count
+        heap_sizes = {}
+        for name, (typecode, _) in FIXED_COLUMNS.items():
+            self._truncate(f"{name}.col", count * array(typecode).itemsize)
+        for name in STRING_COLUMNS:
+            self._truncate(f"{name}.offsets", count * 8)
+            if name in NULLABLE_COLUMNS:
+                self._truncate(f"{name}.present", count)
+            heap_sizes[name] = self._last_offset(name) if count else 0
+            self._truncate(f"{name}.heap", heap_sizes[name])
+        return heap_sizes
+
+    def _truncate(self, filename: str, size: int) -> None:
+        path = self._path(filename)
+        if os.path.exists(path) and os.path.getsize(path) > size:
+            with open(path, "r+b") as handle:
+                handle.truncate(size)
+
+    def _last_offset(self, name: str) -> int:
+        with open(self._path(f"{name}.offsets"), "rb") as handle:
+            handle.seek((self._count - 1) * 8)
+            return int.from_bytes(handle.read(8), "little", signed=True)
+
+    @staticmethod
+    def _write_array(handle, values: array) -> None:
+        if sys.byteorder != "little":
+            values.byteswap()
+        values.tofile(handle)
+
+    def append(self, tags: Iterable[Union[CognitiveTagLike, Dict[str, Any]]]) -> int:
+        """
+        INTENT: Trvalé uloženie validovaných tagov
+        ACTION: Pripojenie každého stĺpca na koniec, potom atomický zápis počtu
+        OUTPUT: Počet pripojených tagov
+        HOOK: tag_store_appended
+
+        Args:
+            tags: ASLCognitiveTag, CompactCognitiveTag or validated model dumps
+        """
+        tags = compact_tags(tags)
+        if not tags:
+            return 0
+        with self._lock:
+            self.refresh()
+            heap_sizes = self._truncate_uncommitted()
+
+            for name, (typecode, _) in FIXED_COLUMNS.items():
+                with open(self._path(f"{name}.col"), "ab") as handle:
+                    self._write_array(handle, array(typecode, (_fixed_values(name, tag) for tag in tags)))
+
+            for name in STRING_COLUMNS:
+                values = [_string_value(name, tag) for tag in tags]
+                encoded = [value.encode("utf-8") if value is not None else b"" for value in values]
+                offsets = array("q")
+                end = heap_sizes[name]
+                for data in encoded:
+                    end += len(data)
+                    offsets.append(end)
+                with open(self._path(f"{name}.heap"), "ab") as handle:
+                    handle.write(b"".join(encoded))
+                with open(self._path(f"{name}.offsets"), "ab") as handle:
+                    self._write_array(handle, offsets)
+                if name in NULLABLE_COLUMNS:
+                    with open(self._path(f"{name}.present"), "ab") as handle:
+                        handle.write(bytes(value is not None for value in values))
+
+            self._commit(self._count + len(tags))
+        if self.text_index is not None:
+            self.text_index.add_tags(tags, source=self.directory)
+        return len(tags)
+
+    # Reading
+
+    def _map(self, filename: str, dtype: str, length: int) -> "np.ndarray":
+        key = filename
+        mapped = self._maps.get(key)
+        if mapped is None:
+            _require_numpy()
+            if length == 0:
+                mapped = np.empty(0, dtype=dtype)
+            else:
+                mapped = np.memmap(self._path(filename), dtype=dtype, mode="r", shape=(length,))
+            self._maps[key] = mapped
+        return mapped
+
+    def column(self, name: str) -> "np.ndarray":
+        """Read-only memmap of a fixed-width column (enum columns hold codes)"""
+        if name not in FIXED_COLUMNS:
+            raise KeyError(f"Not a fixed-width column: {name}")
+        return self._map(f"{name}.col", FIXED_COLUMNS[name][1], self._count)
+
+    def _heap(self, name: str) -> "np.ndarray":
+        offsets = self._map(f"{name}.offsets", "<i8", self._count)
+        size = int(offsets[-1]) if len(offsets) else 0
+        return self._map(f"{name}.heap", "u1", size)
+
+    def strings(self, name: str, start: int = 0, stop: Optional[int] = None) -> List[Optional[str]]:
+        """Decode a slice of a string column"""
+        start, stop, _ = slice(start, stop).indices(self._count)
+        return self.strings_at(name, np.arange(start, max(start, stop)))
+
+    def strings_at(self, name: str, rows: Sequence[int]) -> List[Optional[str]]:
+        """Decode a string column at arbitrary row numbers"""
+        if name not in STRING_COLUMNS:
+            raise KeyError(f"Not a string column: {name}")
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) == 0:
+            return []
+        offsets = self._map(f"{name}.offsets", "<i8", self._count)
+        heap = self._heap(name)
+        ends = offsets[rows].tolist()
+        begins = np.where(rows > 0, offsets[np.maximum(rows - 1, 0)], 0).tolist()
+        values = [heap[begin:end].tobytes().decode("utf-8") for begin, end in zip(begins, ends)]
+        if name in NULLABLE_COLUMNS:
+            present = self._map(f"{name}.present", "<i1", self._count)[rows]
+            values = [value if flag else None for value, flag in zip(values, present.tolist())]
+        return values
+
+    def tag_arrays(self, start: int = 0, stop: Optional[int] = None) -> CognitiveTagArrays:
+        """
+        Columns of a row range as CognitiveTagArrays for AetheroCognitiveAnalyzer.analyze_tag_arrays()
+
+        Enum codes and certainty are memmap slices; only cognitive load is
+        widened to float64.
+        """
+        rows = slice(start, stop)
+        return CognitiveTagArrays(
+            mental_state=self.column("mental_state")[rows],
+            emotion_tone=self.column("emotion_tone")[rows],
+            temporal_context=self.column("temporal_context")[rows],
+            cognitive_load=self.column("cognitive_load")[rows].astype(np.float64),
+            certainty_level=self.column("certainty_level")[rows],
+        )
+
+    def take(self, rows: Sequence[int]) -> List[CompactCognitiveTag]:
+        """Rebuild the given row numbers as CompactCognitiveTag (index query results)"""
+        rows = np.asarray(rows, dtype=np.int64)
+        fixed = {name: self.column(name)[rows].tolist() for name in FIXED_COLUMNS}
+        strings = {name: self.strings_at(name, rows) for name in STRING_COLUMNS}
+        tags = []
+        for row in range(len(rows)):
+            resonance = strings["consciousness_resonance"][row]
+            tags.append(CompactCognitiveTag(
+                strings["thought_stream"][row],
+                MENTAL_STATES[fixed["mental_state"][row]],
+                EMOTION_TONES[fixed["emotion_tone"][row]],
+                fixed["cognitive_load"][row],
+                TEMPORAL_CONTEXTS[fixed["temporal_context"][row]],
+                fixed["certainty_level"][row],
+                strings["aeth_mem_link"][row],
+                strings["constitutional_law"][row],
+                strings["enhancement_suggestion"][row],
+                strings["diplomatic_enhancement"][row],
+                fixed["consciousness_level"][row],
+                fixed["introspective_depth"][row],
+                strings["entity_id"][row],
+                fixed["creation_moment"][row],
+                json.loads(resonance) if resonance is not None else None
+            ))
+        return tags
+
+    def iter_tags(self, start: int = 0, stop: Optional[int] = None, batch_size: int = 4096) -> Iterator[CompactCognitiveTag]:
+        """Rebuild stored rows as CompactCognitiveTag, batch by batch"""
+        start, stop, _ = slice(start, stop).indices(self._count)
+        for batch_start in range(start, stop, batch_size):
+            yield from self.take(np.arange(batch_start, min(stop, batch_start + batch_size)))
+
+    def __getitem__(self, index: int) -> CompactCognitiveTag:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("tag store index out of range")
+        return self.take([index])[0]
+
+    # Export formats
+
+    def export_json(self, path: Union[str, os.PathLike], indent: Optional[int] = None) -> int:
+        """Stream all tags to a JSON array; returns the number of exported tags"""
+        count = 0
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write("[")
+            for tag in self.iter_tags():
+                handle.write(",\n" if count else "\n")
+                handle.write(json.dumps(export_row(tag), indent=indent, ensure_ascii=False, default=str))
+                count += 1
+            handle.write("\n]\n")
+        return count
+
+    def export_csv(self, path: Union[str, os.PathLike]) -> int:
+        """All tags as CSV with ASLCognitiveTag field names; returns the number of exported tags"""
+        return write_tags_csv(self.iter_tags(), path)
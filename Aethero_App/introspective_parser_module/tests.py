@@ -2,14 +2,36 @@ import unittest
 from unittest.mock import patch, MagicMock
 from datetime import datetime
 import json
+import io
+import os
+import tempfile
+import shutil
+import logging
 
-from introspective_parser_module.parser import ASLMetaParser, IntrospectiveLogger
+from introspective_parser_module.parser import ASLMetaParser, IntrospectiveLogger, CognitiveLogPolicy
 from introspective_parser_module.models import (
     ASLCognitiveTag, ASLTagModel, MentalStateEnum, 
     EmotionToneEnum, TemporalContextEnum, AetheroIntrospectiveEntity
 )
-from introspective_parser_module.metrics import CognitiveMetricsAnalyzer
+from introspective_parser_module.metrics import CognitiveMetricsAnalyzer, AetheroCognitiveAnalyzer, CognitiveMetricsBackend
+from introspective_parser_module.vectorized_metrics import CognitiveTagArrays, np
+from introspective_parser_module.online_metrics import OnlineCognitiveAnalyzer
+from introspective_parser_module.bounded_history import BoundedHistory, HistoryPolicy
+from introspective_parser_module.batch_validation import ASLBatchValidator
+from introspective_parser_module.benchmarks import generate_components
 from introspective_parser_module.reflection_agent import AetheroReflectionAgent, ReflectionAgent
+from introspective_parser_module.engines import CognitiveEngines
+from introspective_parser_module.result_cache import ResultCache, MISS
+from introspective_parser_module.asl_scanner import scan_key_values, LEGACY_KEY_VALUE_PATTERN
+from introspective_parser_module.asl_frontend import ASLDialect, scan_line, iter_asl_blocks
+from introspective_parser_module.parallel_parsing import plan_file_chunks
+from introspective_parser_module.incremental_parsing import IncrementalASLParser
+from introspective_parser_module.compact_tags import CompactCognitiveTag, compact_tags
+from introspective_parser_module.tag_store import ColumnarTagStore
+from introspective_parser_module.tag_query import TagQuery, TagQueryEngine
+from introspective_parser_module.text_index import CognitiveTextIndex, build_match_query
+from introspective_parser_module.memory_recall import MemoryRecallIndex, HashingVectorizer
+from introspective_parser_module.report_archive import ReportArchive
 
 class TestASLCognitiveTag(unittest.TestCase):
     def test_create_valid_tag(self):
@@ -107,6 +129,56 @@ class TestIntrospectiveLogger(unittest.TestCase):
         # Should complete without error
         self.assertTrue(True)
 
+class TestCognitiveLogPolicy(unittest.TestCase):
+    """Testy pre politiku logovania kognitívneho toku"""
+
+    def test_off_policy_never_builds_context(self):
+        """Vypnuté logovanie nevolá ani builder kontextu"""
+        logger = IntrospectiveLogger("PolicyOff", policy=CognitiveLogPolicy.OFF)
+        builder = MagicMock(return_value={"key": "value"})
+
+        with self.assertNoLogs(logger.logger, level="DEBUG"):
+            logger.log_cognitive_state("TEST_OPERATION", builder)
+            logger.log_cognitive_state("TEST_FAILURE", builder, level=logging.WARNING)
+        builder.assert_not_called()
+
+    def test_sampled_policy_emits_one_in_n(self):
+        """Vzorkované logovanie zapíše každý N-tý záznam"""
+        logger = IntrospectiveLogger("PolicySampled", policy="sampled", sample_every=5)
+
+        with self.assertLogs(logger.logger, level="INFO") as log:
+            for i in range(20):
+                logger.log_cognitive_state("TEST_OPERATION", {"i": i})
+        self.assertEqual(len(log.output), 4)
+
+    def test_errors_only_policy(self):
+        """Režim errors_only prepustí len varovania a chyby"""
+        parser = ASLMetaParser(log_policy=CognitiveLogPolicy.ERRORS_ONLY)
+        self.assertFalse(parser.introspective_logger.enabled)
+
+        with self.assertLogs(parser.introspective_logger.logger, level="INFO") as log:
+            parser.parse_and_validate("# [ASL] thought_stream: Bad mental_state: calm cognitive_load: 9")
+        self.assertEqual(len(log.output), 1)
+        self.assertIn("VALIDATION_FAILURE", log.output[0])
+
+    def test_file_handler_installed_once(self):
+        """Opakované vytváranie parsera nepridáva ďalšie handlery"""
+        ASLMetaParser()
+        handler_count = len(logging.getLogger("ASLMetaParser").handlers)
+        for _ in range(5):
+            ASLMetaParser()
+        self.assertEqual(len(logging.getLogger("ASLMetaParser").handlers), handler_count)
+
+    def test_invalid_environment_falls_back(self):
+        """Neplatné hodnoty v prostredí sa nahradia predvolenými, veľkosť písmen sa ignoruje"""
+        from introspective_parser_module.parser import _env_log_defaults
+        with patch.dict(os.environ, {"AETHERO_COGNITIVE_LOG_POLICY": "Sampled", "AETHERO_COGNITIVE_LOG_SAMPLE_EVERY": "7"}):
+            self.assertEqual(_env_log_defaults(), (CognitiveLogPolicy.SAMPLED, 7))
+        with patch.dict(os.environ, {"AETHERO_COGNITIVE_LOG_POLICY": "verbose", "AETHERO_COGNITIVE_LOG_SAMPLE_EVERY": "abc"}):
+            with self.assertLogs("introspective_parser_module.parser", level="WARNING") as log:
+                self.assertEqual(_env_log_defaults(), (CognitiveLogPolicy.FULL, 100))
+        self.assertEqual(len(log.output), 2)
+
 class TestASLCognitiveTagModel(unittest.TestCase):
     """Komplexné testy pre ASL kognitívny tag model"""
     
@@ -269,6 +341,1250 @@ class TestASLMetaParser(unittest.TestCase):
         result = self.parser.parse_and_validate(invalid_input)
         self.assertEqual(len(result["validated_blocks"]), 0)
 
+class TestASLScanner(unittest.TestCase):
+    """Testy pre lineárny key/value skener"""
+
+    CORPUS_PATH = os.path.join(os.path.dirname(__file__), "asl_scanner_corpus.txt")
+
+    def test_regression_corpus_matches_legacy_regex(self):
+        """Každý riadok korpusu sa rozdelí rovnako ako pôvodným regexom"""
+        parser = ASLMetaParser()
+        with open(self.CORPUS_PATH, encoding="utf-8") as corpus:
+            for line in corpus:
+                match = parser.cognitive_patterns['asl_comment'].match(line.strip())
+                if not match:
+                    continue
+                content = match.group(1).strip()
+                with self.subTest(line=content):
+                    self.assertEqual(scan_key_values(content), LEGACY_KEY_VALUE_PATTERN.findall(content))
+
+    def test_fuzz_matches_legacy_regex(self):
+        """Náhodné riadky bez úvodzoviek - zhoda s regexom vrátane okrajových prípadov"""
+        import random
+        rng = random.Random(7)
+        alphabet = ["a", "k", "_", "7", ":", " ", " ", "\t", "-", ",", "é", "\xa0",
+                    "ab:", "x:", "mental_state: ", " :"]
+        for _ in range(5000):
+            content = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+            self.assertEqual(scan_key_values(content), LEGACY_KEY_VALUE_PATTERN.findall(content), repr(content))
+
+    def test_quoted_value_keeps_inner_keys(self):
+        """Hodnota v úvodzovkách končí až za uzatváracou úvodzovkou"""
+        pairs = scan_key_values('thought_stream: "note: see below" mental_state: calm')
+        self.assertEqual(pairs, [("thought_stream", '"note: see below"'), ("mental_state", "calm")])
+
+        parsed = ASLMetaParser().parse_line('# [ASL] thought_stream: "ratio: 3 to 4" cognitive_load: 4')
+        self.assertEqual(parsed["thought_stream"], "ratio: 3 to 4")
+        self.assertEqual(parsed["cognitive_load"], 4)
+
+    def test_long_unbroken_value_is_linear(self):
+        """10 KB hodnota bez medzier sa spracuje bez kvadratického spomalenia"""
+        import time
+        content = "thought_stream: " + "a" * 10240 + " mental_state: focused"
+        start = time.perf_counter()
+        pairs = scan_key_values(content)
+        self.assertLess(time.perf_counter() - start, 0.05)
+        self.assertEqual(pairs, [("thought_stream", "a" * 10240), ("mental_state", "focused")])
+
+
+
+class TestASLFrontend(unittest.TestCase):
+    """Testy pre spoločný front-end troch ASL dialektov"""
+
+    INLINE_LINE = "[@cognitive_load:7 @certainty:0.85 @mental_state:focused @emotion:analytical] Test ASL parsing."
+
+    def test_inline_dialect_is_normalized(self):
+        """Inline blok - kanonické kľúče a voľný text ako thought_stream"""
+        blocks = scan_line(self.INLINE_LINE)
+        self.assertEqual([block.dialect for block in blocks], [ASLDialect.INLINE])
+        self.assertEqual(blocks[0].pairs, [
+            ("cognitive_load", "7"), ("certainty_level", "0.85"), ("mental_state", "focused"),
+            ("emotion_tone", "analytical"), ("thought_stream", "Test ASL parsing.")
+        ])
+
+    def test_comment_dialect_matches_scanner(self):
+        """Komentárový dialekt dáva rovnaké páry ako scan_key_values"""
+        content = "thought_stream: Deep analysis mental_state: focused cognitive_load: 6"
+        blocks = scan_line("   # [ASL] " + content)
+        self.assertEqual([block.dialect for block in blocks], [ASLDialect.COMMENT])
+        self.assertEqual(blocks[0].pairs, scan_key_values(content))
+        # Iba celý riadok môže byť ASL komentár
+        self.assertEqual(scan_line("code()  # [ASL] mental_state: calm"), [])
+
+    def test_mixed_line_and_non_asl_text(self):
+        """Viac dialektov na jednom riadku, bežný text a dict literály nie sú ASL"""
+        blocks = scan_line("see {mental_state: 'calm', cognitive_load: 3} then [@emotion:neutral] done")
+        self.assertEqual([block.dialect for block in blocks], [ASLDialect.BRACE, ASLDialect.INLINE])
+        self.assertEqual(blocks[1].pairs, [("emotion_tone", "neutral"), ("thought_stream", "done")])
+        for line in ['config = {"a": 1}', "items[0] = {x}", "{ unclosed: 1", "[@open:1", "plain text"]:
+            self.assertEqual(scan_line(line), [], line)
+
+    def test_code_and_prose_are_not_asl(self):
+        """Dict literály v kóde a hranaté zátvorky v próze bez ASL polí nie sú bloky"""
+        for line in [
+            "const cfg = {timeout: 30};",
+            "def f(): return {a: 1}",
+            "email me [@bob: hi] later",
+            "style = {color: red, margin: 0}",
+            "see [@note: thought_stream is the field name] below",
+        ]:
+            self.assertEqual(scan_line(line), [], line)
+        report = ASLMetaParser().parse_and_validate("const cfg = {timeout: 30};\nemail me [@bob: hi] later")
+        self.assertEqual(report["asl_blocks_found"], 0)
+        # Stačí jedno známe pole alebo alias
+        self.assertEqual(len(scan_line("{statement: 'legacy', extra: 1}")), 1)
+        self.assertEqual(len(scan_line("[@certainty:0.4] short form")), 1)
+
+    def test_parser_validates_every_dialect(self):
+        """Parser validuje bloky všetkých dialektov v jednom dokumente"""
+        document = "\n".join([
+            "# [ASL] thought_stream: Comment block mental_state: focused emotion_tone: analytical",
+            "Brace {thought_stream: 'Brace block', mental_state: 'calm', cognitive_load: 4}",
+            self.INLINE_LINE,
+            "Plain prose"
+        ])
+        self.assertEqual([number for number, _ in iter_asl_blocks(document.split("\n"))], [1, 2, 3])
+
+        report = ASLMetaParser().parse_and_validate(document)
+        self.assertEqual(report["asl_blocks_found"], 3)
+        self.assertTrue(all(result["is_valid"] for result in report["parsing_results"]))
+        inline = report["parsing_results"][2]["validated_model"]
+        self.assertEqual(inline["thought_stream"], "Test ASL parsing.")
+        self.assertEqual(inline["cognitive_load"], 7)
+        self.assertEqual(inline["certainty_level"], 0.85)
+
+    def test_scan_is_linear_on_unclosed_openers(self):
+        """Tisíce neuzavretých '{' a '[@' na riadku bez kvadratického spomalenia"""
+        import time
+        line = "{ [@" * 20000
+        start = time.perf_counter()
+        self.assertEqual(scan_line(line), [])
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+class TestStreamingParser(unittest.TestCase):
+    """Testy pre streamovacie parsovanie s konštantnou pamäťou"""
+
+    DOCUMENT = (
+        "# [ASL] thought_stream: First mental_state: focused emotion_tone: analytical\n"
+        "plain text line\n"
+        "# [ASL] thought_stream: Second mental_state: calm cognitive_load: 9\n"
+        "# [ASL] thought_stream: Third certainty_level: 0.4\n"
+    )
+
+    def setUp(self):
+        self.parser = ASLMetaParser()
+
+    def test_iter_parse_matches_parse_and_validate(self):
+        """Streamované výsledky zodpovedajú parse_and_validate"""
+        batch = ASLMetaParser().parse_and_validate(self.DOCUMENT)
+        streamed = list(self.parser.iter_parse(io.StringIO(self.DOCUMENT)))
+
+        self.assertEqual(
+            [(r["line_number"], r["line_content"], r["is_valid"]) for r in streamed],
+            [(r["line_number"], r["line_content"], r["is_valid"]) for r in batch["parsing_results"]]
+        )
+
+    def test_results_do_not_share_retained_blocks(self):
+        """Úprava validated_model vo výsledku nemení uložený validated_blocks"""
+        results = list(self.parser.iter_parse(io.StringIO(self.DOCUMENT)))
+        dumped = results[0]["validated_model"]
+        self.assertEqual(dumped, self.parser.validated_blocks[0])
+        dumped["thought_stream"] = "changed"
+        self.assertEqual(self.parser.validated_blocks[0]["thought_stream"], "First")
+
+    def test_streaming_keeps_counts_without_blocks(self):
+        """Bez uchovávania blokov ostávajú k dispozícii len agregované počty"""
+        self.parser.retain_blocks = False
+        for _ in self.parser.iter_parse(iter(self.DOCUMENT.splitlines(keepends=True))):
+            pass
+
+        summary = self.parser.get_parsing_summary()
+        self.assertEqual(summary["total_lines_processed"], 4)
+        self.assertEqual(summary["asl_blocks_found"], 3)
+        self.assertEqual(summary["validated_count"], 2)
+        self.assertEqual(summary["failed_count"], 1)
+        self.assertEqual(self.parser.validated_blocks, [])
+        self.assertEqual(self.parser.failed_validations, [])
+
+    def test_iter_parse_file_uses_memory_map(self):
+        """Parsovanie súboru cez mmap vrátane CRLF a prázdneho súboru"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "session.asl")
+            with open(path, "wb") as handle:
+                handle.write(self.DOCUMENT.replace("\n", "\r\n").encode("utf-8"))
+
+            results = list(self.parser.iter_parse_file(path))
+            self.assertEqual([r["line_number"] for r in results], [1, 3, 4])
+            self.assertFalse(results[0]["line_content"].endswith("\r"))
+
+            empty_path = os.path.join(tmp_dir, "empty.asl")
+            open(empty_path, "wb").close()
+            self.assertEqual(list(self.parser.iter_parse_file(empty_path)), [])
+
+class TestParallelParsing(unittest.TestCase):
+    """Testy pre paralelné parsovanie po chunkoch"""
+
+    def setUp(self):
+        lines = []
+        for index in range(300):
+            state = "calm" if index % 7 == 0 else "focused"
+            load = 9 if index % 7 == 0 else index % 10
+            lines.append(f"# [ASL] thought_stream: chunk line {index} mental_state: {state} cognitive_load: {load}")
+            if index % 5 == 0:
+                lines.append("Plain text between tags")
+        self.lines = lines
+
+    @staticmethod
+    def comparable(report):
+        return [
+            (result["line_number"], result["line_content"], result["is_valid"], result["parsed_components"])
+            for result in report["parsing_results"]
+        ]
+
+    def test_document_parallel_matches_sequential(self):
+        """Globálne čísla riadkov, poradie a počty sa zhodujú so sekvenčným parsovaním"""
+        document = "\n".join(self.lines)
+        sequential = ASLMetaParser().parse_and_validate(document)
+        parallel = ASLMetaParser().parse_and_validate_parallel(document, max_workers=2, chunk_lines=37)
+
+        self.assertEqual(self.comparable(parallel), self.comparable(sequential))
+        for key in ("total_lines_processed", "asl_blocks_found"):
+            self.assertEqual(parallel[key], sequential[key])
+        self.assertEqual(len(parallel["failed_validations"]), len(sequential["failed_validations"]))
+        self.assertGreater(len(parallel["failed_validations"]), 0)
+        self.assertEqual(parallel["introspective_reflection"]["validated_count"],
+                         sequential["introspective_reflection"]["validated_count"])
+
+    def test_file_parallel_matches_iter_parse_file(self):
+        """Súbor s CRLF a neukončeným posledným riadkom - rovnaké výsledky ako iter_parse_file"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "large.asl")
+            with open(path, "wb") as handle:
+                handle.write("\r\n".join(self.lines).encode("utf-8"))
+
+            chunks = plan_file_chunks(path, 1000)
+            self.assertGreater(len(chunks), 5)
+            with open(path, "rb") as handle:
+                data = handle.read()
+            self.assertEqual(chunks[0][0], 0)
+            self.assertEqual(chunks[-1][1], len(data))
+            for (_, end), (start, _) in zip(chunks, chunks[1:]):
+                self.assertEqual(end, start)
+                self.assertEqual(data[end - 1:end], b"\n")
+
+            streaming_parser = ASLMetaParser()
+            streamed = list(streaming_parser.iter_parse_file(path))
+            parallel_parser = ASLMetaParser()
+            report = parallel_parser.parse_file_parallel(path, max_workers=2, chunk_bytes=1000)
+
+        self.assertEqual(self.comparable(report), self.comparable({"parsing_results": streamed}))
+        self.assertEqual(report["total_lines_processed"], streaming_parser.total_lines_processed)
+        self.assertEqual(parallel_parser.validated_count, streaming_parser.validated_count)
+        self.assertEqual(parallel_parser.failed_count, streaming_parser.failed_count)
+
+
+class TestIncrementalParsing(unittest.TestCase):
+    """Testy pre inkrementálne parsovanie upravovaných dokumentov"""
+
+    def setUp(self):
+        self.lines = [
+            f"# [ASL] thought_stream: line {index} mental_state: {'calm' if index % 6 == 0 else 'focused'} "
+            f"cognitive_load: {9 if index % 6 == 0 else index % 10} certainty_level: {'high' if index % 9 == 0 else 0.6}"
+            if index % 4 else "Plain text"
+            for index in range(400)
+        ]
+        self.incremental = IncrementalASLParser(ASLMetaParser())
+
+    def assert_matches_full_parse(self, report):
+        expected = ASLMetaParser().parse_and_validate("\n".join(self.lines))
+        comparable = lambda data: [
+            (result["line_number"], result["line_content"], result["is_valid"], result["parsed_components"])
+            for result in data["parsing_results"]
+        ]
+        self.assertEqual(comparable(report), comparable(expected))
+        self.assertEqual(report["total_lines_processed"], expected["total_lines_processed"])
+        self.assertEqual([block["thought_stream"] for block in report["validated_blocks"]],
+                         [block["thought_stream"] for block in expected["validated_blocks"]])
+        self.assertEqual([failure["components"] for failure in report["failed_validations"]],
+                         [failure["components"] for failure in expected["failed_validations"]])
+        self.assertAlmostEqual(report["introspective_reflection"]["parsing_certainty"],
+                               expected["introspective_reflection"]["parsing_certainty"])
+
+    def parse(self):
+        return self.incremental.parse("doc", "\n".join(self.lines))
+
+    def test_edits_only_reparse_changed_lines(self):
+        """Úprava, vloženie, zmazanie a presun riadkov - rovnaký report ako úplné parsovanie"""
+        self.assert_matches_full_parse(self.parse())
+        session = self.incremental.get_session("doc")
+        self.assertEqual(session.last_reparsed_lines, 400)
+
+        self.lines[200] = "# [ASL] thought_stream: edited line mental_state: decisive"
+        self.assert_matches_full_parse(self.parse())
+        self.assertEqual(session.last_reparsed_lines, 1)
+
+        self.lines.insert(10, "# [ASL] thought_stream: inserted cognitive_load: heavy")
+        self.assert_matches_full_parse(self.parse())
+        self.assertEqual(session.last_reparsed_lines, 1)
+
+        del self.lines[300]
+        self.assert_matches_full_parse(self.parse())
+        self.assertEqual(session.last_reparsed_lines, 0)
+
+        # Presunuté ASL riadky sa berú z cache riadkov, riadky bez tagu sa len znova prečítajú
+        moved = self.lines[101:104]
+        self.lines[50:50] = moved
+        self.assert_matches_full_parse(self.parse())
+        self.assertEqual(session.last_reparsed_lines, sum(1 for line in moved if "[ASL]" not in line))
+        self.assertEqual(session.revisions, 5)
+
+    def test_unchanged_resubmission(self):
+        """Nezmenený dokument nespracuje žiadny riadok"""
+        first = self.parse()
+        second = self.parse()
+        self.assertEqual(self.incremental.get_session("doc").last_reparsed_lines, 0)
+        self.assertEqual(second["parsing_results"], first["parsing_results"])
+
+    def test_documents_are_isolated_and_bounded(self):
+        """Každý dokument má vlastnú session, najstaršie sú vyradené"""
+        incremental = IncrementalASLParser(ASLMetaParser(), max_documents=2)
+        incremental.parse("a", "# [ASL] thought_stream: first mental_state: calm")
+        incremental.parse("b", "# [ASL] thought_stream: second mental_state: calm")
+        incremental.parse("c", "# [ASL] thought_stream: third mental_state: calm")
+
+        self.assertIsNone(incremental.get_session("a"))
+        report = incremental.parse("b", "# [ASL] thought_stream: second mental_state: calm")
+        self.assertEqual(report["parsing_results"][0]["parsed_components"]["thought_stream"], "second")
+        self.assertEqual(incremental.get_session("b").last_reparsed_lines, 0)
+
+
+class TestBatchValidation(unittest.TestCase):
+    """Testy pre stĺpcovú dávkovú validáciu"""
+
+    def setUp(self):
+        self.validator = ASLBatchValidator()
+
+    def test_matches_per_row_pydantic_validation(self):
+        """Dávková validácia dáva rovnaký výsledok ako ASLCognitiveTag"""
+        components = generate_components(500, seed=7)
+        components += [
+            {**components[0], "cognitive_load": 5.5},
+            {**components[0], "certainty_level": "0.3"},
+            {**components[0], "thought_stream": 5},
+            {**components[0], "mental_state": "FOCUSED"},
+            {**components[0], "enhancement_suggestion": 3},
+            {**components[0], "introspective_depth": 1.5},
+            {key: value for key, value in components[0].items() if key != "aeth_mem_link"},
+        ]
+        result = self.validator.validate(components)
+
+        for index, row in enumerate(components):
+            try:
+                ASLCognitiveTag(**row)
+                expected = True
+            except ValueError:
+                expected = False
+            self.assertEqual(result.valid[index], expected, (row, result.errors[index]))
+
+    def test_materialize_on_demand(self):
+        """Modely sa vytvárajú až na požiadanie"""
+        components = [
+            {"thought_stream": "ok", "mental_state": "focused", "emotion_tone": "analytical",
+             "cognitive_load": 6, "temporal_context": "present", "certainty_level": 0.8,
+             "aeth_mem_link": "m", "constitutional_law": "c"},
+            {"thought_stream": "bad", "mental_state": "calm", "emotion_tone": "neutral",
+             "cognitive_load": 9, "temporal_context": "present", "certainty_level": 0.8,
+             "aeth_mem_link": "m", "constitutional_law": "c"},
+        ]
+        result = self.validator.validate(components)
+
+        self.assertEqual(result.valid, [True, False])
+        self.assertIn("pokojným stavom", result.errors[1])
+        tag = result.materialize(0)
+        self.assertIsInstance(tag, ASLCognitiveTag)
+        self.assertEqual(tag.mental_state, MentalStateEnum.FOCUSED)
+        self.assertEqual(tag.model_dump()["cognitive_load"], 6)
+        with self.assertRaises(ValueError):
+            result.materialize(1)
+
+    def test_parser_batch_updates_counters(self):
+        """ASLMetaParser.validate_asl_blocks aplikuje mapovanie a počítadlá"""
+        parser = ASLMetaParser()
+        blocks = [
+            {"statement": "Legacy statement", "mental_state": "focused"},
+            {"thought_stream": "Bad", "mental_state": "uncertain", "certainty_level": 0.9},
+        ]
+        result = parser.validate_asl_blocks(blocks)
+
+        self.assertEqual(result.valid, [True, False])
+        self.assertEqual(result.row(0)["thought_stream"], "Legacy statement")
+        self.assertEqual(parser.validated_count, 1)
+        self.assertEqual(parser.failed_count, 1)
+        self.assertEqual(len(parser.failed_validations), 1)
+
+class TestVectorizedMetrics(unittest.TestCase):
+    """Testy pre vektorizovaný NumPy backend kognitívnych metrík"""
+
+    METRIC_FIELDS = (
+        "consciousness_coherence_rate", "cognitive_complexity_index", "mental_stability_factor",
+        "emotional_resonance_depth", "temporal_awareness_level", "introspective_clarity_score",
+        "overall_cognitive_health",
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        result = ASLBatchValidator().validate(generate_components(1500, seed=11))
+        cls.batch = result
+        cls.tags = list(result.iter_valid_models())
+
+    def assert_backends_match(self, tags):
+        python_analyzer = AetheroCognitiveAnalyzer(backend=CognitiveMetricsBackend.PYTHON)
+        numpy_analyzer = AetheroCognitiveAnalyzer(backend=CognitiveMetricsBackend.NUMPY)
+        expected = python_analyzer.analyze_cognitive_tags(tags)
+        actual = numpy_analyzer.analyze_cognitive_tags(tags)
+
+        self.assertFalse(expected.session_id.startswith("error_"))
+        self.assertFalse(actual.session_id.startswith("error_"))
+        for name in self.METRIC_FIELDS:
+            self.assertAlmostEqual(getattr(actual, name), getattr(expected, name), places=12, msg=name)
+
+        expected_pattern = python_analyzer.cognitive_flow_patterns[-1]
+        actual_pattern = numpy_analyzer.cognitive_flow_patterns[-1]
+        for key in ("tag_count", "dominant_mental_state", "dominant_emotion"):
+            self.assertEqual(actual_pattern[key], expected_pattern[key])
+        self.assertAlmostEqual(actual_pattern["avg_certainty"], expected_pattern["avg_certainty"], places=12)
+
+    def test_numpy_backend_matches_python_backend(self):
+        """NumPy backend je numericky ekvivalentný s Python cestou"""
+        self.assert_backends_match(self.tags)
+
+    def test_edge_cases(self):
+        """Jeden tag, dva tagy a konštantný mentálny stav"""
+        self.assert_backends_match(self.tags[:1])
+        self.assert_backends_match(self.tags[:2])
+        focused = [tag for tag in self.tags if tag.mental_state == MentalStateEnum.FOCUSED][:10]
+        self.assert_backends_match(focused)
+
+    def test_from_batch_matches_from_tags(self):
+        """Kódovanie priamo z dávkovej validácie dáva rovnaké metriky"""
+        analyzer = AetheroCognitiveAnalyzer(backend=CognitiveMetricsBackend.NUMPY)
+        from_batch = analyzer.analyze_tag_arrays(CognitiveTagArrays.from_batch(self.batch))
+        from_tags = analyzer.analyze_tag_arrays(CognitiveTagArrays.from_tags(self.tags))
+
+        for name in self.METRIC_FIELDS:
+            self.assertEqual(getattr(from_batch, name), getattr(from_tags, name))
+
+    def test_load_temporal_coherence_per_context(self):
+        """Koherencia záťaže sa počíta podľa temporálneho horizontu kontextu"""
+        analyzer = AetheroCognitiveAnalyzer()
+        expected = {
+            TemporalContextEnum.PRESENT: 0.25,
+            TemporalContextEnum.PAST: 0.625,
+            TemporalContextEnum.FUTURE: 0.625,
+            TemporalContextEnum.TIMELESS: 1.0,
+            TemporalContextEnum.CYCLICAL: 1.0,
+        }
+        for context, value in expected.items():
+            self.assertAlmostEqual(analyzer._assess_load_temporal_coherence(9, context), value, msg=context)
+
+    def test_lookup_tables_follow_analyzer_helpers(self):
+        """Lookup tabuľky sa odvodzujú z helperov analyzátora, aj prepísaných v podtriede"""
+        class ShiftedAnalyzer(AetheroCognitiveAnalyzer):
+            def _get_load_complexity(self, cognitive_load):
+                return min(cognitive_load / 5.0, 1.0)
+
+            def _assess_load_temporal_coherence(self, cognitive_load, temporal_context):
+                return 0.5
+
+        python_analyzer = ShiftedAnalyzer(backend=CognitiveMetricsBackend.PYTHON)
+        numpy_analyzer = ShiftedAnalyzer(backend=CognitiveMetricsBackend.NUMPY)
+        expected = python_analyzer.analyze_cognitive_tags(self.tags[:200])
+        actual = numpy_analyzer.analyze_cognitive_tags(self.tags[:200])
+        for name in self.METRIC_FIELDS:
+            self.assertAlmostEqual(getattr(actual, name), getattr(expected, name), places=12, msg=name)
+
+    def test_auto_backend_threshold(self):
+        """AUTO backend použije NumPy až od nastavenej veľkosti dávky"""
+        analyzer = AetheroCognitiveAnalyzer()
+        self.assertFalse(analyzer._use_vectorized_backend(analyzer.vectorized_min_tags - 1))
+        self.assertTrue(analyzer._use_vectorized_backend(analyzer.vectorized_min_tags))
+
+class TestCompactCognitiveTag(unittest.TestCase):
+    """Testy pre kompaktný slotovaný tag"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.models = list(ASLBatchValidator().validate(generate_components(400, seed=5)).iter_valid_models())
+        cls.compact = compact_tags(cls.models)
+
+    def test_round_trip_preserves_fields(self):
+        """Konverzia tam a späť zachová všetky polia vrátane entity_id"""
+        model = self.models[0]
+        model.resonate_with_memory({"memory": "link"})
+        compact = CompactCognitiveTag.from_model(model)
+        self.assertEqual(compact.dict(), model.dict())
+        self.assertEqual(compact.to_model().dict(), model.dict())
+        self.assertEqual(CompactCognitiveTag.from_components(model.model_dump(mode="json")), compact)
+        self.assertFalse(hasattr(compact, "__dict__"))
+
+    def test_entity_id_is_lazy(self):
+        """entity_id sa vygeneruje až pri prvom prístupe a potom sa nemení"""
+        tag = CompactCognitiveTag("t", "focused", "analytical", 6, "present", 0.8, "m", "c")
+        self.assertIsNone(tag._entity_id)
+        entity_id = tag.entity_id
+        self.assertEqual(tag.entity_id, entity_id)
+        self.assertEqual(tag.mental_state, MentalStateEnum.FOCUSED)
+
+    def test_analyzer_accepts_compact_tags(self):
+        """Python aj NumPy backend dávajú pre kompaktné tagy rovnaké metriky"""
+        for backend in (CognitiveMetricsBackend.PYTHON, CognitiveMetricsBackend.NUMPY):
+            expected = AetheroCognitiveAnalyzer(backend=backend).analyze_cognitive_tags(self.models)
+            actual = AetheroCognitiveAnalyzer(backend=backend).analyze_cognitive_tags(self.compact)
+            self.assertFalse(actual.session_id.startswith("error_"))
+            for name in TestVectorizedMetrics.METRIC_FIELDS:
+                self.assertAlmostEqual(getattr(actual, name), getattr(expected, name), places=12, msg=name)
+
+    def test_reflection_on_compact_tags(self):
+        """Reflexívny agent pracuje s kompaktnými tagmi"""
+        document = "# [ASL] thought_stream: Compact mental_state: focused emotion_tone: analytical cognitive_load: 6"
+        reflection = AetheroReflectionAgent().reflect_on_input(document)
+        self.assertEqual(len(reflection["validated_cognitive_tags"]), 1)
+        self.assertEqual(reflection["validated_cognitive_tags"][0]["mental_state"], MentalStateEnum.FOCUSED)
+
+    def test_memory_per_tag_is_five_times_smaller(self):
+        """Kompaktný tag zaberá aspoň 5x menej pamäte než Pydantic model"""
+        import gc
+        import tracemalloc
+        components = generate_components(2000, seed=3)
+        valid = [row for row in components if ASLBatchValidator().validate([row]).valid[0]]
+
+        def allocated(build):
+            gc.collect()
+            tracemalloc.start()
+            objects = [build(row) for row in valid]
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            return size, objects
+
+        model_size, models = allocated(lambda row: ASLCognitiveTag(**row))
+        compact_size, _ = allocated(lambda row: CompactCognitiveTag.from_components(row))
+        self.assertGreaterEqual(model_size / compact_size, 5.0)
+
+
+class TestColumnarTagStore(unittest.TestCase):
+    """Testy pre stĺpcové úložisko tagov"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tags = compact_tags(ASLBatchValidator().validate(generate_components(300, seed=11)).iter_valid_models())
+        cls.tags[0].resonate_with_memory({"memory": "link"})
+        cls.tags[1].enhancement_suggestion = "Zvýšiť hĺbku ✨"
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = ColumnarTagStore(os.path.join(self.tmp.name, "tags"))
+
+    def test_round_trip_across_reopen(self):
+        """Pripájanie v dávkach a znovuotvorenie zachová všetky polia"""
+        self.store.append(self.tags[:100])
+        self.store.append(self.tags[100:])
+        reopened = ColumnarTagStore(self.store.directory)
+        self.assertEqual(len(reopened), len(self.tags))
+        self.assertEqual(list(reopened.iter_tags(batch_size=64)), self.tags)
+        self.assertEqual(reopened[-1], self.tags[-1])
+        self.assertEqual(reopened.strings("enhancement_suggestion", 0, 2)[1], "Zvýšiť hĺbku ✨")
+
+    def test_metrics_from_memmapped_columns(self):
+        """Metriky zo stĺpcov sa zhodujú s analýzou tagov v pamäti"""
+        self.store.append(self.tags)
+        arrays = self.store.tag_arrays()
+        self.assertIsInstance(self.store.column("certainty_level"), np.memmap)
+        analyzer = AetheroCognitiveAnalyzer(backend=CognitiveMetricsBackend.NUMPY)
+        expected = analyzer.analyze_cognitive_tags(self.tags)
+        actual = analyzer.analyze_tag_arrays(arrays)
+        for name in TestVectorizedMetrics.METRIC_FIELDS:
+            self.assertAlmostEqual(getattr(actual, name), getattr(expected, name), places=12, msg=name)
+
+    def test_uncommitted_append_is_discarded(self):
+        """Nedokončený zápis (bez commitu počtu) sa pri ďalšom pripojení zahodí"""
+        self.store.append(self.tags[:10])
+        with open(os.path.join(self.store.directory, "thought_stream.heap"), "ab") as handle:
+            handle.write(b"torn write")
+        with open(os.path.join(self.store.directory, "cognitive_load.col"), "ab") as handle:
+            handle.write(b"\x07\x07")
+        self.store.append(self.tags[10:20])
+        self.assertEqual(list(ColumnarTagStore(self.store.directory).iter_tags()), self.tags[:20])
+
+    def test_json_and_csv_exports(self):
+        """JSON aj CSV export zostávajú dostupné"""
+        import csv
+        self.store.append(self.tags[:25])
+        json_path = os.path.join(self.tmp.name, "tags.json")
+        csv_path = os.path.join(self.tmp.name, "tags.csv")
+        self.assertEqual(self.store.export_json(json_path), 25)
+        self.assertEqual(self.store.export_csv(csv_path), 25)
+        with open(json_path, encoding="utf-8") as handle:
+            exported = json.load(handle)
+        self.assertEqual(CompactCognitiveTag.from_components(exported[0]), self.tags[0])
+        with open(csv_path, encoding="utf-8", newline="") as handle:
+            rows = list(csv.DictReader(handle))
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(json.loads(rows[0]["consciousness_resonance"]), {"memory": "link"})
+        self.assertEqual(rows[3]["mental_state"], self.tags[3].mental_state.value)
+
+    def test_empty_store(self):
+        """Prázdne úložisko vracia prázdne stĺpce"""
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(len(self.store.tag_arrays()), 0)
+        self.assertEqual(list(self.store.iter_tags()), [])
+
+
+class TestTagQueryEngine(unittest.TestCase):
+    """Testy pre indexy a dotazy nad stĺpcovým úložiskom"""
+
+    @classmethod
+    def setUpClass(cls):
+        import random
+        rng = random.Random(21)
+        start = datetime(2025, 6, 1).timestamp()
+        cls.tags = [
+            CompactCognitiveTag(
+                f"thought {i}", rng.choice(list(MentalStateEnum)), rng.choice(list(EmotionToneEnum)),
+                rng.randint(1, 10), rng.choice(list(TemporalContextEnum)), rng.random(),
+                f"aeth_mem_{rng.randint(0, 9)}", "transparency", creation_moment=start + i * 3600
+            )
+            for i in range(600)
+        ]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = ColumnarTagStore(os.path.join(self.tmp.name, "tags"))
+        self.store.append(self.tags)
+        self.engine = TagQueryEngine(self.store.directory)
+
+    def expected_rows(self, predicate):
+        return [row for row, tag in enumerate(self.tags) if predicate(tag)]
+
+    def test_combined_query_matches_full_scan(self):
+        """Kombinácia enum, rozsahových a hash podmienok dá rovnaké riadky ako plný prechod"""
+        since = datetime(2025, 6, 8)
+        query = TagQuery(mental_states=["focused", "reflective"], emotion_tones=["analytical", "neutral"],
+                         max_certainty=0.6, since=since, aeth_mem_link="aeth_mem_3")
+        expected = self.expected_rows(lambda tag: tag.mental_state.value in ("focused", "reflective")
+                                      and tag.emotion_tone.value in ("analytical", "neutral")
+                                      and tag.certainty_level < 0.6 and tag.creation_moment >= since
+                                      and tag.aeth_mem_link == "aeth_mem_3")
+        self.assertTrue(expected)
+        self.assertEqual(self.engine.rows(query).tolist(), expected)
+        self.assertEqual(self.engine.find(query), [self.tags[row] for row in expected])
+
+    def test_single_index_queries(self):
+        """Každý index samostatne"""
+        cases = [
+            (TagQuery(temporal_contexts=["future"]), lambda tag: tag.temporal_context.value == "future"),
+            (TagQuery(min_cognitive_load=3, max_cognitive_load=6), lambda tag: 3 <= tag.cognitive_load < 6),
+            (TagQuery(until=datetime(2025, 6, 3)), lambda tag: tag.creation_moment < datetime(2025, 6, 3)),
+            (TagQuery(aeth_mem_link="aeth_mem_7"), lambda tag: tag.aeth_mem_link == "aeth_mem_7"),
+            (TagQuery(aeth_mem_link="missing"), lambda tag: False),
+            (TagQuery(), lambda tag: True),
+        ]
+        for query, predicate in cases:
+            self.assertEqual(self.engine.rows(query).tolist(), self.expected_rows(predicate), msg=str(query))
+
+    def test_metrics_over_query(self):
+        """Metriky nad výsledkom dotazu sa zhodujú s analýzou vyfiltrovaných tagov"""
+        query = TagQuery(mental_states=["focused"])
+        expected = AetheroCognitiveAnalyzer(backend=CognitiveMetricsBackend.NUMPY).analyze_cognitive_tags(
+            [tag for tag in self.tags if tag.mental_state == MentalStateEnum.FOCUSED])
+        actual = self.engine.metrics(query)
+        for name in TestVectorizedMetrics.METRIC_FIELDS:
+            self.assertAlmostEqual(getattr(actual, name), getattr(expected, name), places=12, msg=name)
+
+    def test_indexes_follow_appends(self):
+        """Po pripojení nových tagov indexy obsahujú aj nové riadky"""
+        query = TagQuery(aeth_mem_link="aeth_mem_2", mental_states=["calm"])
+        before = self.engine.count(query)
+        ColumnarTagStore(self.store.directory).append(self.tags[:100])
+        extra = sum(1 for tag in self.tags[:100]
+                    if tag.aeth_mem_link == "aeth_mem_2" and tag.mental_state == MentalStateEnum.CALM)
+        self.assertEqual(self.engine.count(query), before + extra)
+        self.assertEqual(len(self.engine), 700)
+
+    def test_incremental_indexes_match_rebuild(self):
+        """Indexy rozšírené po dávkach (aj mimo hranice bajtu) sa zhodujú s indexmi postavenými naraz"""
+        directory = os.path.join(self.tmp.name, "batched")
+        store = ColumnarTagStore(directory)
+        engine = TagQueryEngine(directory)
+        for start, stop in [(0, 13), (13, 16), (16, 251), (251, 252), (252, 600)]:
+            store.append(self.tags[start:stop])
+            engine.refresh()
+        self.engine.refresh()
+        for column in ("mental_state", "emotion_tone", "temporal_context"):
+            for built, rebuilt in zip(engine._bitmaps[column], self.engine._bitmaps[column]):
+                np.testing.assert_array_equal(built, rebuilt)
+            np.testing.assert_array_equal(engine._bitmap_counts[column], self.engine._bitmap_counts[column])
+        for column in ("creation_moment", "cognitive_load", "certainty_level"):
+            for built, rebuilt in zip(engine._sorted[column], self.engine._sorted[column]):
+                np.testing.assert_array_equal(built, rebuilt)
+
+    def test_missing_store_and_unknown_values(self):
+        """Neexistujúce úložisko je prázdne, neznáma enum hodnota je chyba"""
+        empty = TagQueryEngine(os.path.join(self.tmp.name, "missing"))
+        self.assertEqual(empty.count(TagQuery(mental_states=["calm"])), 0)
+        self.assertEqual(empty.find(TagQuery()), [])
+        with self.assertRaises(ValueError):
+            self.engine.rows(TagQuery(mental_states=["sleepy"]))
+
+
+class TestCognitiveTextIndex(unittest.TestCase):
+    """Testy pre fulltextový index myšlienok a reportov"""
+
+    def setUp(self):
+        self.index = CognitiveTextIndex()
+        self.addCleanup(self.index.close)
+        self.tags = [
+            CompactCognitiveTag("Transparentná reflexia pamäťových štruktúr", "reflective", "analytical", 6, "present", 0.3, "aeth_mem_0001", "transparency"),
+            CompactCognitiveTag("Reflexia rozhodnutí a transparentná analýza", "focused", "analytical", 7, "present", 0.9, "aeth_mem_0002", "transparency"),
+            CompactCognitiveTag("Plánovanie budúcej architektúry systému", "focused", "positive", 5, "future", 0.35, "aeth_mem_0001", "evolution"),
+        ]
+        self.index.add_tags(self.tags)
+
+    def refs(self, hits):
+        return [hit.ref for hit in hits]
+
+    def test_keyword_and_phrase_queries(self):
+        """Kľúčové slová (bez diakritiky), frázy a prefixy"""
+        self.assertEqual(set(self.refs(self.index.search("reflexia transparentna"))), {self.tags[0].entity_id, self.tags[1].entity_id})
+        self.assertEqual(self.refs(self.index.search('"transparentná reflexia"')), [self.tags[0].entity_id])
+        self.assertEqual(self.refs(self.index.search("architekt*")), [self.tags[2].entity_id])
+        self.assertEqual(self.index.count("plánovanie analýza", match_any=True), 2)
+        self.assertIn("[", self.index.search("architektúry")[0].snippet)
+
+    def test_metadata_filters(self):
+        """Výsledky sa dajú filtrovať metadátami tagov"""
+        hits = self.index.search("transparentná", TagQuery(mental_states=["focused"]))
+        self.assertEqual(self.refs(hits), [self.tags[1].entity_id])
+        hits = self.index.search("reflexia plánovanie", TagQuery(aeth_mem_link="aeth_mem_0001", max_certainty=0.5), match_any=True)
+        self.assertEqual(set(self.refs(hits)), {self.tags[0].entity_id, self.tags[2].entity_id})
+        self.assertEqual(hits[0].metadata["aeth_mem_link"], "aeth_mem_0001")
+
+    def test_incremental_updates(self):
+        """Opätovné pridanie nahradí záznam, reporty sa indexujú vedľa tagov"""
+        self.tags[0].thought_stream = "Prepísaná myšlienka o konštitúcii"
+        self.index.add_tags([self.tags[0]])
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(self.index.count('"transparentná reflexia"'), 0)
+        self.assertEqual(self.refs(self.index.search("konštitúcii")), [self.tags[0].entity_id])
+
+        self.index.add_report("AETH-MEM-2025-0001", "Ministerial report on memory reflexia",
+                              {"inferred_tags": {"mental_state": "focused"}, "date": "2025-06-01"})
+        self.assertEqual(self.refs(self.index.search("ministerial", kind="report")), ["AETH-MEM-2025-0001"])
+        self.assertEqual(self.index.count("reflexia", kind="tag"), 1)
+        self.assertTrue(self.index.remove("report", "AETH-MEM-2025-0001"))
+        self.assertEqual(self.index.count("ministerial"), 0)
+
+    def test_tag_store_feeds_index(self):
+        """Tagy pripojené do stĺpcového úložiska sa hneď dajú vyhľadať"""
+        with tempfile.TemporaryDirectory() as directory:
+            index = CognitiveTextIndex()
+            ColumnarTagStore(os.path.join(directory, "tags"), text_index=index).append(self.tags)
+            self.assertEqual(index.count("systému"), 1)
+            index.close()
+
+    def test_query_syntax_is_escaped(self):
+        """Operátory FTS5 vo vstupe sa neinterpretujú"""
+        self.assertEqual(build_match_query('a "b c" d*'), '"a" "b c" "d"*')
+        self.assertEqual(self.index.count('NEAR( reflexia'), 0)
+        with self.assertRaises(ValueError):
+            self.index.search('  ""  ')
+
+
+class TestMemoryRecallIndex(unittest.TestCase):
+    """Testy pre offline vektorový index spomienok"""
+
+    def setUp(self):
+        self.texts = [
+            "Transparentná reflexia pamäťových štruktúr",
+            "Plánovanie budúcej architektúry systému",
+            "Etický audit rozhodnutí ministerstva",
+        ]
+
+    def random_vectors(self, count, dim=32, seed=7):
+        rng = np.random.default_rng(seed)
+        vectors = rng.normal(size=(count, dim)).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    def test_vectorizer_is_deterministic(self):
+        """Rovnaký text dá rovnaký vektor, diakritika sa ignoruje"""
+        vectorizer = HashingVectorizer(64)
+        vector = vectorizer.transform_one("Pamäťová reflexia")
+        np.testing.assert_array_equal(vector, HashingVectorizer(64).transform_one("pamatova REFLEXIA"))
+        self.assertAlmostEqual(float(np.linalg.norm(vector)), 1.0, places=5)
+        self.assertFalse(vectorizer.transform_one("").any())
+
+    def test_exact_search_ranks_by_similarity(self):
+        """Pod prahom trénovania sa hľadá presne"""
+        recall = MemoryRecallIndex()
+        ids = recall.add_many(self.texts, ["reflexia", "architektura", "audit"])
+        hits = recall.search("reflexia pamäťových štruktúr", k=2)
+        self.assertEqual(hits[0].id, "reflexia")
+        self.assertGreater(hits[0].score, hits[1].score)
+        self.assertEqual(len(recall.search("audit", k=10)), len(ids))
+        self.assertFalse(recall.is_trained)
+
+    def test_store_and_index_merge_one_memory(self):
+        """Volania store/index ArchivusAgenta zapíšu jednu spomienku"""
+        recall = MemoryRecallIndex()
+        data = {"content": self.texts[2], "author": "archivus"}
+        memory_id = recall.index(data, tags={"certainty_level": 0.9})
+        self.assertEqual(recall.store(data, collection="aethero_memory"), memory_id)
+        self.assertEqual(len(recall), 1)
+        hit = recall.get(memory_id)
+        self.assertEqual(hit.metadata["tags"]["certainty_level"], 0.9)
+        self.assertEqual(hit.metadata["collection"], "aethero_memory")
+        self.assertEqual(recall.search("etický audit", collection="aethero_memory")[0].id, memory_id)
+        self.assertEqual(recall.search("etický audit", collection="other"), [])
+
+    def test_ivf_search_matches_exact_search(self):
+        """Prehľadanie všetkých zoznamov dá rovnaký výsledok ako presné hľadanie"""
+        vectors = self.random_vectors(2000)
+        recall = MemoryRecallIndex(vectorizer=HashingVectorizer(32), n_lists=16, n_probe=4, train_threshold=1000)
+        recall.add_vectors(vectors, [f"m{row}" for row in range(len(vectors))])
+        self.assertTrue(recall.is_trained)
+
+        query = vectors[123]
+        exact = np.argsort(vectors @ query)[::-1][:10]
+        hits = recall.search(query, k=10, n_probe=16)
+        self.assertEqual([hit.id for hit in hits], [f"m{row}" for row in exact])
+        self.assertEqual(recall.search(query, k=1)[0].id, "m123")
+
+    def test_incremental_adds_after_training(self):
+        """Nové spomienky sú vyhľadateľné bez pretrénovania"""
+        recall = MemoryRecallIndex(vectorizer=HashingVectorizer(32), n_lists=16, n_probe=2, train_threshold=1000)
+        recall.add_vectors(self.random_vectors(1000), [f"m{row}" for row in range(1000)])
+        extra = self.random_vectors(50, seed=11)
+        recall.add_vectors(extra, [f"new{row}" for row in range(50)])
+        self.assertEqual(recall._trained_count, 1000)
+        for row in (0, 25, 49):
+            self.assertEqual(recall.search(extra[row], k=1)[0].id, f"new{row}")
+
+    def test_save_and_load(self):
+        """Uložený index sa načíta s rovnakými výsledkami"""
+        recall = MemoryRecallIndex(vectorizer=HashingVectorizer(32), n_lists=8, train_threshold=200)
+        recall.add_many([f"spomienka {row} {self.texts[row % 3]}" for row in range(300)])
+        recall.add("Dodatočná myšlienka o konštitúcii", "extra", {"collection": "notes"})
+        with tempfile.TemporaryDirectory() as directory:
+            recall.save(directory)
+            with patch.dict(os.environ, {"AETHERO_RECALL_DIR": directory}):
+                loaded = MemoryRecallIndex.from_env()
+        self.assertEqual(len(loaded), len(recall))
+        self.assertTrue(loaded.is_trained)
+        self.assertEqual(loaded.search("konštitúcii", k=1, collection="notes")[0].id, "extra")
+        self.assertEqual([hit.id for hit in loaded.search("architektúry", k=5)],
+                         [hit.id for hit in recall.search("architektúry", k=5)])
+
+    def test_flush_appends_to_log(self):
+        """flush() pripája zmeny do logu, snapshot prepíše až keď log narastie"""
+        recall = MemoryRecallIndex(vectorizer=HashingVectorizer(32), n_lists=8, train_threshold=200)
+        first = recall.add_many([f"spomienka {row} {self.texts[row % 3]}" for row in range(300)])[0]
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(recall.flush(directory), 300)
+            snapshot = sorted(os.listdir(directory))
+            self.assertEqual(snapshot, ["centroids-1.npy", "recall.json", "vectors-1.npy"])
+
+            recall.add("Dodatočná myšlienka o konštitúcii", "extra", {"collection": "notes"})
+            recall.add("spomienka 0 prepísaná", first, {"revised": True})
+            self.assertEqual(recall.flush(directory), 2)
+            self.assertEqual(recall.flush(directory), 0)
+            self.assertEqual(sorted(os.listdir(directory)), sorted(snapshot + ["recall-1.log"]))
+
+            loaded = MemoryRecallIndex.load(directory)
+            self.assertEqual(len(loaded), 301)
+            self.assertEqual(loaded.search("konštitúcii", k=1, collection="notes")[0].id, "extra")
+            self.assertEqual([hit.id for hit in loaded.search("architektúry", k=5)],
+                             [hit.id for hit in recall.search("architektúry", k=5)])
+            self.assertEqual(loaded._metadata[loaded._rows[first]]["revised"], True)
+
+            with patch.multiple("introspective_parser_module.memory_recall", SNAPSHOT_MIN_LOG=3, SNAPSHOT_LOG_RATIO=0):
+                loaded.add("tretia zmena v logu", "extra-2")
+                loaded.flush(directory)
+            self.assertEqual(sorted(os.listdir(directory)), ["centroids-2.npy", "recall.json", "vectors-2.npy"])
+            self.assertEqual(len(MemoryRecallIndex.load(directory)), 302)
+
+    def test_torn_log_and_failed_snapshot(self):
+        """Neúplný riadok logu sa odreže a neúspešný snapshot nechá predošlý stav"""
+        recall = MemoryRecallIndex(vectorizer=HashingVectorizer(32))
+        recall.add_many(["prvá spomienka", "druhá spomienka"])
+        with tempfile.TemporaryDirectory() as directory:
+            recall.save(directory)
+            recall.add("tretia spomienka", "third")
+            recall.flush(directory)
+            with open(os.path.join(directory, "recall-1.log"), "a", encoding="utf-8") as handle:
+                handle.write('{"id": "torn", "text": "nedopí')
+
+            loaded = MemoryRecallIndex.load(directory)
+            self.assertEqual(len(loaded), 3)
+            loaded.add("štvrtá spomienka", "fourth")
+            loaded.flush(directory)
+            self.assertEqual(len(MemoryRecallIndex.load(directory)), 4)
+
+            real_replace = os.replace
+
+            def crash_on_snapshot(source, target):
+                if target.endswith("recall.json"):
+                    raise OSError("disk full")
+                real_replace(source, target)
+
+            loaded.add("piata spomienka", "fifth")
+            with patch("introspective_parser_module.memory_recall.os.replace", crash_on_snapshot):
+                with self.assertRaises(OSError):
+                    loaded.save(directory)
+            restored = MemoryRecallIndex.load(directory)
+            self.assertEqual(len(restored), 4)
+            self.assertNotIn("fifth", restored._rows)
+
+
+def _archive_writer(directory, prefix, count, start):
+    """Samostatný proces zapisujúci do zdieľaného archívu"""
+    with ReportArchive(directory, segment_bytes=4096) as archive:
+        start.wait()
+        for i in range(count):
+            archive.put(f"{prefix}{i}", f"{prefix} obsah {i}", {"ref_code": f"{prefix}{i}"})
+
+
+class TestReportArchive(unittest.TestCase):
+    """Testy pre segmentový archív pamäťových reportov"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def reports(self, count, start=0):
+        return [(f"### REPORT {i}\n" + "obsah pamäte " * 20, {"ref_code": f"AETH-MEM-{i:04d}", "tags": ["test"]})
+                for i in range(start, start + count)]
+
+    def test_put_get_and_rollover(self):
+        """Reporty sa čítajú podľa ref_code naprieč segmentmi"""
+        with ReportArchive(self.directory, segment_bytes=2048) as archive:
+            self.assertEqual(archive.put_many(self.reports(50)), 50)
+            self.assertGreater(archive.get_stats()["segments"], 1)
+            report = archive.get("AETH-MEM-0042")
+            self.assertEqual(report.metadata["tags"], ["test"])
+            self.assertTrue(report.content.startswith("### REPORT 42"))
+            self.assertIsNone(archive.get("AETH-MEM-9999"))
+
+        with ReportArchive(self.directory) as reopened:
+            self.assertEqual(len(reopened), 50)
+            self.assertEqual([report.ref_code for report in reopened.iter_reports()][:2], ["AETH-MEM-0000", "AETH-MEM-0001"])
+
+    def test_replace_delete_and_compact(self):
+        """Kompakcia odstráni nahradené a zmazané záznamy"""
+        with ReportArchive(self.directory, segment_bytes=4096) as archive:
+            archive.put_many(self.reports(30))
+            archive.put("AETH-MEM-0001", "nový obsah", {"ref_code": "AETH-MEM-0001"})
+            self.assertTrue(archive.delete("AETH-MEM-0002"))
+            self.assertGreater(archive.get_stats()["garbage_bytes"], 0)
+
+            stats = archive.compact(compress=True)
+            self.assertEqual(stats["after"]["garbage_bytes"], 0)
+            self.assertLess(stats["after"]["segment_bytes"], stats["before"]["segment_bytes"])
+            self.assertEqual(archive.get("AETH-MEM-0001").content, "nový obsah")
+
+        with ReportArchive(self.directory) as reopened:
+            self.assertEqual(len(reopened), 29)
+            self.assertNotIn("AETH-MEM-0002", reopened)
+            self.assertEqual(reopened.get("AETH-MEM-0029").metadata["ref_code"], "AETH-MEM-0029")
+
+    def test_recovery_after_interrupted_append(self):
+        """Záznamy mimo indexu sa obnovia, roztrhnutý koniec sa odreže"""
+        with ReportArchive(self.directory) as archive:
+            archive.put_many(self.reports(5))
+        index_path = os.path.join(self.directory, "index.tsv")
+        with open(index_path) as handle:
+            lines = handle.readlines()
+        with open(index_path, "w") as handle:
+            handle.writelines(lines[:3])
+        segment = os.path.join(self.directory, "segments", "00000000.seg")
+        with open(segment, "ab") as handle:
+            handle.write(b"AMR1\x00torn")
+
+        with ReportArchive(self.directory) as recovered:
+            self.assertEqual(len(recovered), 5)
+            recovered.put_many(self.reports(1, start=5))
+            self.assertTrue(recovered.get("AETH-MEM-0005").content.startswith("### REPORT 5"))
+
+    def test_two_writers_interleaved(self):
+        """Dve inštancie nad jedným archívom si neprepíšu záznamy"""
+        with ReportArchive(self.directory) as first, ReportArchive(self.directory) as second:
+            first.put("A1", "obsah A1", {})
+            second.put("B1", "obsah B1", {})
+            first.put("A2", "obsah A2", {})
+            self.assertEqual(first.get("A2").content, "obsah A2")
+            self.assertEqual(first.get("B1").content, "obsah B1")
+            second.refresh()
+            self.assertEqual(second.get("A2").content, "obsah A2")
+
+            second.compact()
+            first.put("A3", "obsah A3", {})
+            self.assertEqual(first.get("B1").content, "obsah B1")
+
+        with ReportArchive(self.directory) as reopened:
+            self.assertEqual(sorted(reopened.refs()), ["A1", "A2", "A3", "B1"])
+            self.assertEqual([reopened.get(ref).content for ref in ("A1", "A2", "A3", "B1")],
+                             ["obsah A1", "obsah A2", "obsah A3", "obsah B1"])
+
+    def test_concurrent_writer_processes(self):
+        """Súbežné procesy zapisujú pod zámkom archive.lock"""
+        import multiprocessing
+        start = multiprocessing.Event()
+        processes = [multiprocessing.Process(target=_archive_writer, args=(self.directory, prefix, 400, start))
+                     for prefix in ("A", "B")]
+        for process in processes:
+            process.start()
+        start.set()
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+
+        with ReportArchive(self.directory) as archive:
+            self.assertEqual(len(archive), 800)
+            for prefix in ("A", "B"):
+                for i in range(400):
+                    self.assertEqual(archive.get(f"{prefix}{i}").content, f"{prefix} obsah {i}")
+
+    def test_export_individual_files(self):
+        """Export vytvorí pôvodné páry .md/.json"""
+        with ReportArchive(self.directory, compress=True) as archive:
+            archive.put_many(self.reports(3))
+            target = os.path.join(self.directory, "export")
+            self.assertEqual(archive.export(target, ["AETH-MEM-0001", "neznámy"]), ["AETH-MEM-0001"])
+            with open(os.path.join(target, "AETH-MEM-0001.json")) as handle:
+                self.assertEqual(json.load(handle)["ref_code"], "AETH-MEM-0001")
+            self.assertEqual(len(archive.export(target)), 3)
+
+
+class TestOnlineCognitiveAnalyzer(unittest.TestCase):
+    """Testy pre online analyzátor s O(1) aktualizáciou"""
+
+    @classmethod
+    def setUpClass(cls):
+        result = ASLBatchValidator().validate(generate_components(400, seed=23))
+        cls.tags = list(result.iter_valid_models())
+
+    def assert_matches_batch(self, snapshot, tags):
+        expected = AetheroCognitiveAnalyzer(backend=CognitiveMetricsBackend.PYTHON).analyze_cognitive_tags(tags)
+        for name in TestVectorizedMetrics.METRIC_FIELDS:
+            self.assertAlmostEqual(getattr(snapshot, name), getattr(expected, name), places=12, msg=name)
+
+    def test_snapshot_matches_batch_analyzer(self):
+        """Snapshot po každom tagu zodpovedá dávkovej analýze rovnakého okna"""
+        analyzer = OnlineCognitiveAnalyzer()
+        for count, tag in enumerate(self.tags[:25], start=1):
+            analyzer.update(tag)
+            self.assert_matches_batch(analyzer.snapshot(), self.tags[:count])
+
+        analyzer.update_many(self.tags[25:])
+        self.assert_matches_batch(analyzer.snapshot(), self.tags)
+
+    def test_snapshot_history_and_reset(self):
+        """Snapshot bez record nezapisuje históriu; reset začína nové okno"""
+        analyzer = OnlineCognitiveAnalyzer()
+        self.assertEqual(analyzer.snapshot().overall_cognitive_health, 0.0)
+
+        analyzer.update_many(self.tags[:10])
+        analyzer.snapshot()
+        self.assertEqual(len(analyzer.analysis_history), 0)
+        analyzer.snapshot(record=True)
+        self.assertEqual(len(analyzer.analysis_history), 1)
+        self.assertEqual(analyzer.cognitive_flow_patterns[-1]["tag_count"], 10)
+
+        analyzer.reset()
+        analyzer.update_many(self.tags[10:20])
+        self.assert_matches_batch(analyzer.snapshot(), self.tags[10:20])
+
+class TestBoundedHistory(unittest.TestCase):
+    """Testy pre ohraničenú históriu"""
+
+    def test_capacity_and_list_access(self):
+        """Kapacita vyraďuje najstaršie záznamy, indexovanie funguje ako pri liste"""
+        history = BoundedHistory(capacity=3)
+        history.extend(range(10))
+
+        self.assertEqual(len(history), 3)
+        self.assertEqual(list(history), [7, 8, 9])
+        self.assertEqual(history[0], 7)
+        self.assertEqual(history[-1], 9)
+        self.assertEqual(history[-2:], [8, 9])
+        self.assertEqual(history[-10:], [7, 8, 9])
+        self.assertEqual(history.latest(2), [8, 9])
+        self.assertEqual(history.total_appended, 10)
+        self.assertEqual(history.evicted_count, 7)
+
+    def test_time_retention(self):
+        """Záznamy staršie ako max_age_seconds sú vyradené"""
+        now = [1000.0]
+        history = BoundedHistory(capacity=10, max_age_seconds=60, clock=lambda: now[0])
+        history.append("old")
+        now[0] += 30
+        history.append("recent")
+        now[0] += 45
+
+        self.assertEqual(list(history), ["recent"])
+        now[0] += 100
+        self.assertEqual(len(history), 0)
+        self.assertFalse(history)
+
+    def test_spill_to_disk(self):
+        """Vyradené záznamy sa zapisujú ako kompaktné JSON riadky"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            history = HistoryPolicy(capacity=2, spill_dir=tmp_dir).create("metrics")
+            for i in range(5):
+                history.append({"i": i})
+
+            with open(os.path.join(tmp_dir, "metrics.jsonl"), encoding="utf-8") as spill_file:
+                records = [json.loads(line) for line in spill_file]
+        self.assertEqual([record["item"]["i"] for record in records], [0, 1, 2])
+        self.assertEqual(history.spilled_count, 3)
+
+    def test_analyzer_history_is_bounded(self):
+        """Analyzátor drží len nakonfigurovaný počet analýz, trendy pokrývajú celú session"""
+        tags = list(ASLBatchValidator().validate(generate_components(40, seed=3)).iter_valid_models())
+        analyzer = AetheroCognitiveAnalyzer(history_policy=HistoryPolicy(capacity=4))
+        for _ in range(10):
+            analyzer.analyze_cognitive_tags(tags)
+
+        self.assertEqual(len(analyzer.analysis_history), 4)
+        trends = analyzer.get_cognitive_trends()
+        self.assertEqual(trends["session_count"], 10)
+        self.assertAlmostEqual(trends["average_health"], analyzer.analysis_history[-1].overall_cognitive_health)
+        self.assertEqual(len(analyzer.export_session_data()["cognitive_flow_patterns"]), 4)
+
+class TestCognitiveSessions(unittest.TestCase):
+    """Testy pre zdieľané enginy a ich sessions"""
+
+    def setUp(self):
+        self.engines = CognitiveEngines()
+
+    def test_parser_sessions_share_setup_but_not_state(self):
+        """Session zdieľa logger a validátor, stav parsovania je oddelený"""
+        first = self.engines.parser_session()
+        second = self.engines.parser_session()
+
+        self.assertIs(first.introspective_logger, self.engines.parser.introspective_logger)
+        self.assertIs(first._batch_validator, second._batch_validator)
+
+        first.parse_and_validate("# [ASL] thought_stream: Prvá session mental_state: focused")
+        self.assertEqual(len(first.validated_blocks), 1)
+        self.assertEqual(len(second.validated_blocks), 0)
+        self.assertEqual(len(self.engines.parser.validated_blocks), 0)
+
+    def test_reflection_sessions_reuse_logger(self):
+        """Reflexná session nepridáva handlery a má vlastnú pamäť"""
+        handler_count = len(logging.getLogger().handlers)
+        first = self.engines.reflection_session()
+        second = self.engines.reflection_session()
+
+        self.assertIs(first.logger, second.logger)
+        self.assertIsNot(first.reflection_memory, second.reflection_memory)
+        self.assertEqual(len(logging.getLogger().handlers), handler_count)
+
+    def test_analyzer_session_shares_vectorized_engine(self):
+        """Analyzátor session zdieľa predzahriaty vektorizovaný engine"""
+        prototype = self.engines.metrics_analyzer
+        session = self.engines.analyzer_session()
+
+        self.assertIs(session._analyzer._vectorized_engine, prototype._analyzer._vectorized_engine)
+        self.assertIsNot(session._analyzer.analysis_history, prototype._analyzer.analysis_history)
+
+
+class FakeSharedCache:
+    """Lokálna náhrada Redis klienta - get/set(ex=) nad slovníkom"""
+
+    def __init__(self):
+        self.store = {}
+        self.expiries = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value.encode("utf-8")
+        self.expiries[key] = ex
+
+
+class TestResultCache(unittest.TestCase):
+    """Testy pre cache výsledkov adresovanú obsahom"""
+
+    def setUp(self):
+        self.now = 1000.0
+        self.cache = ResultCache(max_entries=2, ttl_seconds=10, clock=lambda: self.now)
+
+    def test_hit_miss_and_ttl(self):
+        """Záznam platí do uplynutia TTL"""
+        key = self.cache.key("parse", "text")
+        self.assertIs(self.cache.get(key), MISS)
+        self.cache.set(key, {"value": 1})
+        self.assertEqual(self.cache.get(key), {"value": 1})
+
+        self.now += 11
+        self.assertIs(self.cache.get(key), MISS)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_none_is_a_cached_result(self):
+        """None výsledok (napr. dokument bez tagov) je tiež cache hit"""
+        key = self.cache.key("metrics", "plain text")
+        self.cache.set(key, None)
+        self.assertIsNone(self.cache.get(key))
+
+    def test_lru_eviction(self):
+        """Najdlhšie nepoužitý záznam je vyradený ako prvý"""
+        first, second, third = (self.cache.key("parse", text) for text in ("a", "b", "c"))
+        self.cache.set(first, 1)
+        self.cache.set(second, 2)
+        self.cache.get(first)
+        self.cache.set(third, 3)
+
+        self.assertIs(self.cache.get(second), MISS)
+        self.assertEqual(self.cache.get(first), 1)
+        self.assertEqual(self.cache.evictions, 1)
+
+    def test_key_depends_on_kind_and_version(self):
+        """Iný druh úlohy alebo verzia enginu nikdy nezdieľa kľúč"""
+        other_version = ResultCache(version="other")
+        self.assertNotEqual(self.cache.key("parse", "text"), self.cache.key("metrics", "text"))
+        self.assertNotEqual(self.cache.key("parse", "text"), other_version.key("parse", "text"))
+
+    def test_shared_tier(self):
+        """Výsledok uložený jedným workerom je dostupný druhému cez zdieľanú vrstvu"""
+        shared = FakeSharedCache()
+        producer = ResultCache(shared=shared, ttl_seconds=60)
+        consumer = ResultCache(shared=shared, ttl_seconds=60)
+        key = producer.key("parse", "text")
+        producer.set(key, {"validated_blocks": []})
+
+        self.assertEqual(shared.expiries[key], 60)
+        self.assertEqual(consumer.get(key), {"validated_blocks": []})
+        self.assertEqual(consumer.shared_hits, 1)
+        # Druhé čítanie ide z lokálnej vrstvy
+        self.assertEqual(consumer.get(key), {"validated_blocks": []})
+        self.assertEqual(consumer.hits, 1)
+
+    def test_unavailable_shared_tier_is_a_miss(self):
+        """Nedostupná zdieľaná vrstva nespôsobí chybu, len prepočet"""
+        broken = MagicMock()
+        broken.get.side_effect = ConnectionError("down")
+        broken.set.side_effect = ConnectionError("down")
+        cache = ResultCache(shared=broken)
+        key = cache.key("parse", "text")
+
+        self.assertIs(cache.get(key), MISS)
+        cache.set(key, {"value": 1})
+        self.assertEqual(cache.get(key), {"value": 1})
+        self.assertEqual(cache.shared_errors, 2)
+
+
 class TestCognitiveMetricsAnalyzer(unittest.TestCase):
     """Testy pre analyzátor kognitívnych metrík"""
     
@@ -0,0 +1,295 @@
+"""
+Full-text index over thought_stream and memory reports
+
+SQLite FTS5 (stdlib sqlite3): an ``entries`` table with the tag metadata
+(enums, cognitive load, certainty, aeth_mem_link, creation time) and an
+``entries_fts`` table with the searchable text under the same rowid. Tags
+are keyed by entity_id and reports by ref_code, so re-adding an entry
+replaces it - the index is maintained incrementally, one small
+transaction per batch.
+
+Queries are ranked with bm25. Plain words must all match (or any of them
+with match_any=True), "quoted text" is a phrase and a trailing * is a
+prefix; metadata filters reuse TagQuery.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+from datetime import datetime
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+
+from .compact_tags import CognitiveTagLike
+from .tag_query import TagQuery
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    ref TEXT NOT NULL,
+    mental_state TEXT,
+    emotion_tone TEXT,
+    temporal_context TEXT,
+    cognitive_load INTEGER,
+    certainty_level REAL,
+    aeth_mem_link TEXT,
+    created_at REAL,
+    source TEXT,
+    UNIQUE (kind, ref)
+);
+CREATE INDEX IF NOT EXISTS entries_mental_state ON entries (mental_state);
+CREATE INDEX IF NOT EXISTS entries_aeth_mem_link ON entries (aeth_mem_link);
+CREATE INDEX IF NOT EXISTS entries_created_at ON entries (created_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5 (
+    body, tokenize = "unicode61 remove_diacritics 2"
+);
+"""
+
+_METADATA_COLUMNS = (
+    "mental_state", "emotion_tone", "temporal_context", "cognitive_load",
+    "certainty_level", "aeth_mem_link", "created_at", "source",
+)
+
+_UPSERT = f"""
+INSERT INTO entries (kind, ref, {", ".join(_METADATA_COLUMNS)})
+VALUES (?, ?, {", ".join("?" for _ in _METADATA_COLUMNS)})
+ON CONFLICT (kind, ref) DO UPDATE SET
+    {", ".join(f"{column} = excluded.{column}" for column in _METADATA_COLUMNS)}
+"""
+
+_QUERY_TOKEN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+class TextSearchHit(NamedTuple):
+    """Jeden výsledok fulltextového vyhľadávania"""
+    kind: str
+    ref: str
+    score: float
+    snippet: str
+    metadata: Dict[str, Any]
+
+
+def build_match_query(text: str, match_any: bool = False) -> str:
+    """
+    FTS5 MATCH expression for a user query
+
+    Every term and phrase is quoted, so FTS5 operators and punctuation in
+    the input are matched literally instead of being interpreted.
+    """
+    parts = []
+    for phrase, word in _QUERY_TOKEN.findall(text):
+        token = phrase if phrase else word
+        prefix = not phrase and token.endswith("*") and len(token) > 1
+        token = token.rstrip("*") if prefix else token
+        if token.strip():
+            parts.append('"' + token.replace('"', '""') + '"' + ("*" if prefix else ""))
+    if not parts:
+        raise ValueError("Search query has no terms")
+    return (" OR " if match_any else " ").join(parts)
+
+
+def _report_timestamp(metadata: Mapping[str, Any]) -> Optional[float]:
+    date = metadata.get("date")
+    if not date:
+        return None
+    try:
+        return datetime.fromisoformat(str(date)).timestamp()
+    except ValueError:
+        return None
+
+
+class CognitiveTextIndex:
+    """
+    Inkrementálny fulltextový index nad tagmi a pamäťovými reportmi.
+
+    Args:
+        path: SQLite database file, or ":memory:"
+    """
+
+    def __init__(self, path: Union[str, os.PathLike] = ":memory:"):
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        if self.path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    @classmethod
+    def from_env(cls, default_path: Union[str, os.PathLike] = "aethero_text_index.sqlite3") -> "CognitiveTextIndex":
+        """Index in AETHERO_TEXT_INDEX_PATH - set it to share one index between tags and memory reports"""
+        return cls(os.environ.get("AETHERO_TEXT_INDEX_PATH", default_path))
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT count(*) FROM entries").fetchone()[0]
+
+    # Indexing
+
+    def _entry_ids(self, kind: str, refs: List[str]) -> Dict[str, int]:
+        ids = {}
+        for start in range(0, len(refs), 500):
+            chunk = refs[start:start + 500]
+            ids.update(self._connection.execute(
+                f"SELECT ref, id FROM entries WHERE kind = ? AND ref IN ({', '.join('?' for _ in chunk)})",
+                [kind] + chunk
+            ).fetchall())
+        return ids
+
+    def _upsert(self, kind: str, rows: Iterable[Tuple[str, Tuple[Any, ...], str]]) -> int:
+        """Batch upsert - metadata rows first, then the FTS rows under the same ids"""
+        # Last occurrence of a ref wins, as with one-by-one upserts
+        rows = list({ref: (ref, metadata, body) for ref, metadata, body in rows}.values())
+        if not rows:
+            return 0
+        refs = [ref for ref, _, _ in rows]
+        with self._lock, self._connection:
+            replaced = self._entry_ids(kind, refs)
+            self._connection.executemany(_UPSERT, [(kind, ref) + metadata for ref, metadata, _ in rows])
+            if replaced:
+                self._connection.executemany("DELETE FROM entries_fts WHERE rowid = ?", [(entry_id,) for entry_id in replaced.values()])
+            ids = self._entry_ids(kind, refs)
+            self._connection.executemany(
+                "INSERT INTO entries_fts (rowid, body) VALUES (?, ?)",
+                [(ids[ref], body) for ref, _, body in rows]
+            )
+        return len(rows)
+
+    def add_tags(self, tags: Iterable[CognitiveTagLike], source: Optional[str] = None) -> int:
+        """
+        INTENT: Sprístupnenie myšlienkových prúdov vyhľadávaniu
+        ACTION: Vloženie alebo nahradenie tagov podľa entity_id v jednej transakcii
+        OUTPUT: Počet indexovaných tagov
+        HOOK: text_index_tags_added
+        """
+        return self._upsert("tag", (
+            (tag.entity_id, (
+                tag.mental_state.value, tag.emotion_tone.value, tag.temporal_context.value,
+                tag.cognitive_load, tag.certainty_level, tag.aeth_mem_link,
+                tag.creation_moment.timestamp(), source
+            ), tag.thought_stream)
+            for tag in tags
+        ))
+
+    @staticmethod
+    def _report_row(ref_code: str, content: str, metadata: Mapping[str, Any], source: Optional[str]) -> Tuple[str, Tuple[Any, ...], str]:
+        inferred = metadata.get("inferred_tags") or {}
+        return (ref_code, (
+            inferred.get("mental_state"), inferred.get("emotion_tone"), None, None, None, None,
+            _report_timestamp(metadata), source or metadata.get("source")
+        ), content)
+
+    def add_report(self, ref_code: str, content: str, metadata: Optional[Mapping[str, Any]] = None,
+                   source: Optional[str] = None) -> None:
+        """Index (or re-index) one memory report; inferred_tags fill the metadata filters"""
+        self._upsert("report", [self._report_row(ref_code, content, metadata or {}, source)])
+
+    def add_reports(self, reports: Iterable[Tuple[str, Mapping[str, Any], Optional[str]]]) -> int:
+        """Index a batch of (content, metadata, source) reports in one transaction"""
+        return self._upsert("report", (
+            self._report_row(metadata["ref_code"], content, metadata, source)
+            for content, metadata, source in reports
+        ))
+
+    def add_reports_directory(self, directory: Union[str, os.PathLike]) -> int:
+        """Backfill from aeth_ingest output - every <ref_code>.md with its optional .json metadata"""
+        rows = []
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".md"):
+                continue
+            base = os.path.join(directory, name[:-3])
+            with open(base + ".md", encoding="utf-8") as handle:
+                content = handle.read()
+            metadata = {}
+            if os.path.exists(base + ".json"):
+                with open(base + ".json", encoding="utf-8") as handle:
+                    metadata = json.load(handle)
+            rows.append(self._report_row(metadata.get("ref_code", name[:-3]), content, metadata, base + ".md"))
+        return self._upsert("report", rows)
+
+    def remove(self, kind: str, ref: str) -> bool:
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT id FROM entries WHERE kind = ? AND ref = ?", (kind, ref)).fetchone()
+            if row is None:
+                return False
+            self._connection.execute("DELETE FROM entries_fts WHERE rowid = ?", (row[0],))
+            self._connection.execute("DELETE FROM entries WHERE id = ?", (row[0],))
+            return True
+
+    # Searching
+
+    @staticmethod
+    def _filter_clauses(filters: Optional[TagQuery], kind: Optional[str]) -> Tuple[List[str], List[Any]]:
+        clauses, params = [], []
+        if kind is not None:
+            clauses.append("entries.kind = ?")
+            params.append(kind)
+        if filters is None:
+            return clauses, params
+        for column, values in filters.enum_filters().items():
+            values = [getattr(value, "value", value) for value in values]
+            clauses.append(f"entries.{column} IN ({', '.join('?' for _ in values)})" if values else "0")
+            params.extend(values)
+        for column, (low, high) in filters.range_filters().items():
+            column = "created_at" if column == "creation_moment" else column
+            if low is not None:
+                clauses.append(f"entries.{column} >= ?")
+                params.append(low)
+            if high is not None:
+                clauses.append(f"entries.{column} < ?")
+                params.append(high)
+        if filters.aeth_mem_link is not None:
+            clauses.append("entries.aeth_mem_link = ?")
+            params.append(filters.aeth_mem_link)
+        return clauses, params
+
+    def search(self, text: str, filters: Optional[TagQuery] = None, kind: Optional[str] = None,
+               limit: int = 20, match_any: bool = False) -> List[TextSearchHit]:
+        """
+        INTENT: Rýchle nájdenie myšlienok a reportov podľa obsahu
+        ACTION: FTS5 MATCH, filter metadát a bm25 poradie
+        OUTPUT: Najrelevantnejšie záznamy (nižšie score = lepšia zhoda)
+        HOOK: text_index_searched
+
+        Args:
+            text: Words, "quoted phrases" and prefix* terms
+            filters: Tag metadata filter (TagQuery)
+            kind: "tag" or "report" to search only one kind of entry
+        """
+        clauses, params = self._filter_clauses(filters, kind)
+        where = "".join(f" AND {clause}" for clause in clauses)
+        sql = f"""
+            SELECT entries.*, entries_fts.rank AS score,
+                   snippet(entries_fts, 0, '[', ']', '…', 16) AS snippet
+            FROM entries_fts JOIN entries ON entries.id = entries_fts.rowid
+            WHERE entries_fts MATCH ?{where}
+            ORDER BY entries_fts.rank
+            LIMIT ?
+        """
+        with self._lock:
+            rows = self._connection.execute(sql, [build_match_query(text, match_any)] + params + [limit]).fetchall()
+        return [
+            TextSearchHit(row["kind"], row["ref"], row["score"], row["snippet"],
+                          {column: row[column] for column in _METADATA_COLUMNS if row[column] is not None})
+            for row in rows
+        ]
+
+    def count(self, text: str, filters: Optional[TagQuery] = None, kind: Optional[str] = None,
+              match_any: bool = False) -> int:
+        clauses, params = self._filter_clauses(filters, kind)
+        where = "".join(f" AND {clause}" for clause in clauses)
+        sql = f"""
+            SELECT count(*) FROM entries_fts JOIN entries ON entries.id = entries_fts.rowid
+            WHERE entries_fts MATCH ?{where}
+        """
+        with self._lock:
+            return self._connection.execute(sql, [build_match_query(text, match_any)] + params).fetchone()[0]
@@ -0,0 +1,159 @@
+"""
+Keyword Lexicon - zdieľaný kompilovaný klasifikátor kľúčových slov
+
+One compiled pattern for every keyword of every category. All terms are
+folded into a single trie-shaped regular expression, anchored at word
+starts, so a text is scanned once no matter how many categories and
+keywords the lexicon holds. The batch API joins many short texts (shell
+history lines, commit subjects) into one buffer and scans that once.
+
+Matching starts at word boundaries: "fix" matches "fixed" and "fix-up",
+but not "prefix". Categories listed in ``whole_words`` must also end on
+a word boundary ("is" matches "is" but not "issue").
+
+Stdlib only - cheap to import from API handlers and worker processes.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    """Regex for a character trie; longer continuations are tried first"""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return "(?:" + body + ")?" if "" in node else body
+
+
+class KeywordLexicon:
+    """
+    Kategórie kľúčových slov skompilované do jedného automatu.
+
+    Args:
+        categories: Category name -> keywords; case-insensitive, may contain spaces
+        whole_words: True, or the names of categories whose keywords must
+            also end on a word boundary (by default suffixes are allowed)
+    """
+
+    def __init__(self, categories: Mapping[str, Iterable[str]],
+                 whole_words: Union[bool, Iterable[str]] = False):
+        self.categories: Dict[str, List[str]] = {}
+        self._term_categories: Dict[str, List[str]] = {}
+        for category, keywords in categories.items():
+            terms = list(dict.fromkeys(keyword.lower() for keyword in keywords))
+            for term in terms:
+                if not term.strip() or "\n" in term:
+                    raise ValueError(f"Invalid keyword {term!r} in category {category!r}")
+                self._term_categories.setdefault(term, []).append(category)
+            self.categories[category] = terms
+        if whole_words is True:
+            self._whole_words: Set[str] = set(self.categories)
+        else:
+            self._whole_words = set(whole_words or ())
+
+        trie: Dict[str, dict] = {}
+        for term in self._term_categories:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        # Zero-width lookahead: every word start is tried, matches may overlap
+        self._pattern = re.compile(r"(?<!\w)(?=(" + _trie_pattern(trie) + "))") if trie else None
+        # Every match at a position is a prefix of the longest one found there:
+        # longest term -> (length, category, term, needs a word boundary after it)
+        self._expansions: Dict[str, List[Tuple[int, str, str, bool]]] = {
+            term: [
+                (len(other), category, other, category in self._whole_words)
+                for other in self._term_categories if term.startswith(other)
+                for category in self._term_categories[other]
+            ]
+            for term in self._term_categories
+        }
+
+    def __len__(self) -> int:
+        return len(self._term_categories)
+
+    def _scan(self, lowered: str, offsets: Optional[List[int]] = None) -> List[Dict[str, Set[str]]]:
+        """One pass over the (joined) text; hits are split per text by offset"""
+        offsets = offsets or [0]
+        results: List[Dict[str, Set[str]]] = [{} for _ in offsets]
+        if self._pattern is None:
+            return results
+        expansions, size = self._expansions, len(lowered)
+        index, hits = 0, results[0]
+        next_offset = offsets[1] if len(offsets) > 1 else size + 1
+        for match in self._pattern.finditer(lowered):
+            start = match.start()
+            if start >= next_offset:
+                # Matches come in text order - advance to the text holding this one
+                index = bisect_right(offsets, start) - 1
+                hits = results[index]
+                next_offset = offsets[index + 1] if index + 1 < len(offsets) else size + 1
+            for length, category, term, whole_word in expansions[match.group(1)]:
+                if whole_word:
+                    end = start + length
+                    if end < size and (lowered[end].isalnum() or lowered[end] == "_"):
+                        continue
+                if category in hits:
+                    hits[category].add(term)
+                else:
+                    hits[category] = {term}
+        return results
+
+    def terms_in(self, text: str) -> Dict[str, Set[str]]:
+        """Matched keywords per category (only categories with a hit)"""
+        return self._scan(text.lower())[0]
+
+    def terms_many(self, texts: Sequence[str]) -> List[Dict[str, Set[str]]]:
+        """terms_in for many texts in a single scan"""
+        if not texts:
+            return []
+        offsets, position, lowered = [], 0, []
+        for text in texts:
+            text = text.lower()
+            offsets.append(position)
+            lowered.append(text)
+            position += len(text) + 1
+        return self._scan("\n".join(lowered), offsets)
+
+    def _score(self, hits: Dict[str, Set[str]]) -> Dict[str, int]:
+        scores = dict.fromkeys(self.categories, 0)
+        for category, terms in hits.items():
+            scores[category] = len(terms)
+        return scores
+
+    def scores(self, text: str) -> Dict[str, int]:
+        """
+        INTENT: Ohodnotenie všetkých kategórií jedným prechodom
+        ACTION: Jeden scan textu kompilovaným automatom
+        OUTPUT: Počet rôznych nájdených kľúčových slov pre každú kategóriu
+        HOOK: keyword_lexicon_scored
+        """
+        return self._score(self.terms_in(text))
+
+    def scores_many(self, texts: Sequence[str]) -> List[Dict[str, int]]:
+        """scores for many texts in a single scan"""
+        return [self._score(hits) for hits in self.terms_many(texts)]
+
+    @staticmethod
+    def first_category(scores: Mapping[str, Any], order: Iterable[str],
+                       default: Optional[str] = None) -> Optional[str]:
+        """First category in priority order with a hit in scores() or terms_in() output"""
+        for category in order:
+            if scores.get(category):
+                return category
+        return default
+
+    def classify(self, text: str, order: Optional[Iterable[str]] = None,
+                 default: Optional[str] = None) -> Optional[str]:
+        """Priority classification - categories are tried in order (default: definition order)"""
+        return self.first_category(self.terms_in(text), self.categories if order is None else order, default)
+
+    def classify_many(self, texts: Sequence[str], order: Optional[Iterable[str]] = None,
+                      default: Optional[str] = None) -> List[Optional[str]]:
+        """classify for many texts in a single scan"""
+        order = tuple(self.categories if order is None else order)
+        return [self.first_category(hits, order, default) for hits in self.terms_many(texts)]
@@ -1,2 +1,31 @@
-# Placeholder for ./Aethero_App/redis_config.py
-# Generated by autofix_engine.py on 2025-06-05T22:57:28.504776
+# Redis configuration for ./Aethero_App
+# Shared cache tier for the Syntaxator API - optional, the service runs without it
+
+import logging
+import os
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# e.g. redis://localhost:6379/0 - unset disables the shared tier
+REDIS_URL = os.environ.get("AETHERO_REDIS_URL")
+
+
+def get_redis_client(url=None):
+    """
+    Redis client for the configured URL, or None when no URL is set
+    or the redis package is not installed.
+    """
+    url = url or REDIS_URL
+    if not url:
+        return None
+    if not REDIS_AVAILABLE:
+        logger.warning("AETHERO_REDIS_URL is set but the redis package is not installed - shared cache disabled")
+        return None
+    return redis.Redis.from_url(url, socket_timeout=0.5)
@@ -9,6 +9,8 @@ import logging
 from datetime import datetime
 import asyncio
 
+from keyword_lexicon import KeywordLexicon
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -75,24 +77,34 @@ async def lazy_load_classifier():
     
     return emotion_classifier
 
+# Keyword lexicons for the lightweight analysis - compiled once, one scan per text
+EMOTION_KEYWORDS = {
+    "joy": ["happy", "joy", "excited", "cheerful", "delighted", "pleased", "glad", "elated"],
+    "sadness": ["sad", "depressed", "melancholy", "sorrowful", "grief", "dejected", "gloomy"],
+    "anger": ["angry", "furious", "rage", "irritated", "mad", "frustrated", "annoyed"],
+    "fear": ["afraid", "scared", "terrified", "anxious", "worried", "panic", "nervous"],
+    "surprise": ["surprised", "amazed", "astonished", "shocked", "startled", "stunned"],
+    "love": ["love", "affection", "adore", "cherish", "devoted", "caring", "tender"]
+}
+EMOTION_LEXICON = KeywordLexicon(EMOTION_KEYWORDS)
+
+TEMPORAL_FOCI = ("past", "future", "present")
+# Temporal indicators are short function words ("is", "am") - whole words only
+INSIGHT_LEXICON = KeywordLexicon({
+    "past": ["was", "were", "had", "did", "before", "yesterday"],
+    "future": ["will", "shall", "going", "tomorrow", "soon", "later"],
+    "present": ["is", "are", "am", "now", "currently", "today"],
+    "constitutional": ["transparent", "honest", "introspect", "reflect", "validate", "truth", "authentic"]
+}, whole_words=TEMPORAL_FOCI)
+
 def fallback_emotion_analysis(text: str) -> List[Dict[str, Any]]:
     """Lightweight emotion analysis using keyword matching"""
-    emotion_keywords = {
-        "joy": ["happy", "joy", "excited", "cheerful", "delighted", "pleased", "glad", "elated"],
-        "sadness": ["sad", "depressed", "melancholy", "sorrowful", "grief", "dejected", "gloomy"],
-        "anger": ["angry", "furious", "rage", "irritated", "mad", "frustrated", "annoyed"],
-        "fear": ["afraid", "scared", "terrified", "anxious", "worried", "panic", "nervous"],
-        "surprise": ["surprised", "amazed", "astonished", "shocked", "startled", "stunned"],
-        "love": ["love", "affection", "adore", "cherish", "devoted", "caring", "tender"]
-    }
-    
-    text_lower = text.lower()
+    keyword_scores = EMOTION_LEXICON.scores(text)
     scores = {}
     
-    for emotion, keywords in emotion_keywords.items():
-        score = sum(1 for keyword in keywords if keyword in text_lower)
-        if score > 0:
-            scores[emotion] = score / len(keywords)
+    for emotion, keywords in EMOTION_KEYWORDS.items():
+        if keyword_scores[emotion] > 0:
+            scores[emotion] = keyword_scores[emotion] / len(keywords)
     
     if not scores:
         scores["neutral"] = 1.0
@@ -114,24 +126,14 @@ def generate_introspective_insights(text: str, emotions: List[Dict[str, Any]]) -
     cognitive_load = min(10, max(1, len(words) // 10))
     emotional_complexity = min(1.0, emotion_diversity / 6.0)
     
-    # Temporal focus analysis (optimized)
-    temporal_indicators = {
-        "past": ["was", "were", "had", "did", "before", "yesterday"],
-        "future": ["will", "shall", "going", "tomorrow", "soon", "later"],
-        "present": ["is", "are", "am", "now", "currently", "today"]
-    }
-    
-    text_lower = text.lower()
-    temporal_scores = {}
-    
-    for focus, indicators in temporal_indicators.items():
-        temporal_scores[focus] = sum(1 for indicator in indicators if indicator in text_lower)
+    # Temporal focus and constitutional keywords in one pass
+    keyword_scores = INSIGHT_LEXICON.scores(text)
+    temporal_scores = {focus: keyword_scores[focus] for focus in TEMPORAL_FOCI}
     
     temporal_focus = max(temporal_scores, key=temporal_scores.get) if any(temporal_scores.values()) else "present"
     
     # Constitutional alignment (AetheroOS specific)
-    constitutional_keywords = ["transparent", "honest", "introspect", "reflect", "validate", "truth", "authentic"]
-    constitutional_score = sum(1 for keyword in constitutional_keywords if keyword in text_lower)
+    constitutional_score = keyword_scores["constitutional"]
     constitutional_alignment = min(1.0, constitutional_score / 3.0)
     
     return {
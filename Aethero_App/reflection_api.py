@@ -15,6 +15,8 @@ from typing import List, Dict, Any
 import logging
 from datetime import datetime
 
+from keyword_lexicon import KeywordLexicon
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -79,25 +81,34 @@ class ReflectionOutput(BaseModel):
     analysis_timestamp: str
     introspective_insights: Dict[str, Any]
 
+# Keyword lexicons for the fallback analysis - compiled once, one scan per text
+EMOTION_KEYWORDS = {
+    "joy": ["happy", "joy", "excited", "cheerful", "delighted", "pleased"],
+    "sadness": ["sad", "depressed", "melancholy", "sorrowful", "grief"],
+    "anger": ["angry", "furious", "rage", "irritated", "mad", "frustrated"],
+    "fear": ["afraid", "scared", "terrified", "anxious", "worried", "panic"],
+    "surprise": ["surprised", "amazed", "astonished", "shocked", "startled"],
+    "love": ["love", "affection", "adore", "cherish", "devoted", "caring"]
+}
+EMOTION_LEXICON = KeywordLexicon(EMOTION_KEYWORDS)
+
+# Temporal indicators are short function words ("is", "am") - whole words only
+INSIGHT_LEXICON = KeywordLexicon({
+    "past": ["was", "were", "had", "did", "before", "yesterday"],
+    "future": ["will", "shall", "going to", "tomorrow", "soon", "later"],
+    "present": ["is", "are", "am", "now", "currently", "today"],
+    "constitutional": ["transparent", "honest", "introspect", "reflect", "validate", "truth"]
+}, whole_words={"past", "future", "present"})
+
 # Fallback emotion analysis
 def fallback_emotion_analysis(text: str) -> List[Dict[str, Any]]:
     """Basic emotion analysis using keyword matching"""
-    emotion_keywords = {
-        "joy": ["happy", "joy", "excited", "cheerful", "delighted", "pleased"],
-        "sadness": ["sad", "depressed", "melancholy", "sorrowful", "grief"],
-        "anger": ["angry", "furious", "rage", "irritated", "mad", "frustrated"],
-        "fear": ["afraid", "scared", "terrified", "anxious", "worried", "panic"],
-        "surprise": ["surprised", "amazed", "astonished", "shocked", "startled"],
-        "love": ["love", "affection", "adore", "cherish", "devoted", "caring"]
-    }
-    
-    text_lower = text.lower()
+    keyword_scores = EMOTION_LEXICON.scores(text)
     scores = {}
     
-    for emotion, keywords in emotion_keywords.items():
-        score = sum(1 for keyword in keywords if keyword in text_lower)
-        if score > 0:
-            scores[emotion] = score / len(keywords)
+    for emotion, keywords in EMOTION_KEYWORDS.items():
+        if keyword_scores[emotion] > 0:
+            scores[emotion] = keyword_scores[emotion] / len(keywords)
     
     if not scores:
         scores["neutral"] = 1.0
@@ -115,15 +126,11 @@ def generate_insights(text: str, emotions: List[Dict[str, Any]]) -> Dict[str, An
     cognitive_load = min(10, max(1, len(text.split()) // 10))
     emotional_complexity = min(1.0, emotion_diversity / 6.0)
     
-    # Temporal focus analysis
-    past_indicators = ["was", "were", "had", "did", "before", "yesterday"]
-    future_indicators = ["will", "shall", "going to", "tomorrow", "soon", "later"]
-    present_indicators = ["is", "are", "am", "now", "currently", "today"]
-    
-    text_lower = text.lower()
-    past_count = sum(1 for indicator in past_indicators if indicator in text_lower)
-    future_count = sum(1 for indicator in future_indicators if indicator in text_lower)
-    present_count = sum(1 for indicator in present_indicators if indicator in text_lower)
+    # Temporal focus and constitutional keywords in one pass
+    keyword_scores = INSIGHT_LEXICON.scores(text)
+    past_count = keyword_scores["past"]
+    future_count = keyword_scores["future"]
+    present_count = keyword_scores["present"]
     
     temporal_focus = "present"
     if past_count > max(future_count, present_count):
@@ -131,8 +138,7 @@ def generate_insights(text: str, emotions: List[Dict[str, Any]]) -> Dict[str, An
     elif future_count > max(past_count, present_count):
         temporal_focus = "future"
     
-    constitutional_keywords = ["transparent", "honest", "introspect", "reflect", "validate", "truth"]
-    constitutional_score = sum(1 for keyword in constitutional_keywords if keyword in text_lower)
+    constitutional_score = keyword_scores["constitutional"]
     constitutional_alignment = min(1.0, constitutional_score / 3.0)
     
     return {
@@ -10,6 +10,8 @@ import logging
 from datetime import datetime
 import uvicorn
 
+from keyword_lexicon import KeywordLexicon
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -36,25 +38,26 @@ class ReflectionOutput(BaseModel):
     confidence: float
     timestamp: str
 
+# Slovník emócií - skompilovaný raz, jeden prechod textom
+EMOTION_KEYWORDS = {
+    "radosť": ["šťastný", "radostný", "nadšený", "spokojný", "veselý"],
+    "smútok": ["smutný", "deprimovaný", "melancholický", "zarmútený"],
+    "hnev": ["nahnevaný", "rozčúlený", "rozhorčený", "frustrovaný"],
+    "strach": ["vystrašený", "uzkostlivý", "znepokojený", "nervózny"],
+    "prekvapenie": ["prekvapený", "ohromený", "šokovaný", "udivený"],
+    "láska": ["láska", "náklonnosť", "zbožňujem", "milujem"]
+}
+EMOTION_LEXICON = KeywordLexicon(EMOTION_KEYWORDS)
+
 # Jednoduchá analýza emócií
 def simple_emotion_analysis(text: str) -> List[Dict[str, Any]]:
     """Základná analýza emócií pomocou kľúčových slov"""
-    emotion_keywords = {
-        "radosť": ["šťastný", "radostný", "nadšený", "spokojný", "veselý"],
-        "smútok": ["smutný", "deprimovaný", "melancholický", "zarmútený"],
-        "hnev": ["nahnevaný", "rozčúlený", "rozhorčený", "frustrovaný"],
-        "strach": ["vystrašený", "uzkostlivý", "znepokojený", "nervózny"],
-        "prekvapenie": ["prekvapený", "ohromený", "šokovaný", "udivený"],
-        "láska": ["láska", "náklonnosť", "zbožňujem", "milujem"]
-    }
-    
-    text_lower = text.lower()
+    keyword_scores = EMOTION_LEXICON.scores(text)
     scores = {}
     
-    for emotion, keywords in emotion_keywords.items():
-        score = sum(1 for keyword in keywords if keyword in text_lower)
-        if score > 0:
-            scores[emotion] = score / len(keywords)
+    for emotion, keywords in EMOTION_KEYWORDS.items():
+        if keyword_scores[emotion] > 0:
+            scores[emotion] = keyword_scores[emotion] / len(keywords)
     
     if not scores:
         scores["neutrálne"] = 1.0
@@ -8,26 +8,62 @@ ritualized ministerial reports with metadata, tags, and optional PDF output.
 Features:
 - Multiple input formats (text, file, JSON)
 - Automated tag generation
+- Content-addressed deduplication (optionally MinHash near-duplicates)
 - Templated report generation
 - Multiple output formats (MD, JSON, PDF)
+- Segmented report archive as an alternative to one file pair per memory
 - Blackbox validation integration
 
 Usage:
     python aeth_ingest.py --text "Memory content"
     python aeth_ingest.py --file input.txt
     python aeth_ingest.py --json '{"content": "Memory"}'
+    python aeth_ingest.py --bulk memories/ --workers 4
+    python aeth_ingest.py --bulk "notes/**/*.md"
+    cat memories.ndjson | python aeth_ingest.py --bulk -
+    python aeth_ingest.py --bulk memories/ --store segments --compress
+    python aeth_ingest.py --export_archive exported/ --refs AETH-MEM-2025-0001
 """
 
 import os
+import re
+import sys
+import glob
+import time
+import zlib
+import hashlib
+import importlib
 import uuid
 import argparse
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union, Any
 from jinja2 import Template, TemplateError
 
+try:
+    from keyword_lexicon import KeywordLexicon
+except ImportError:
+    # Aethero_App is not importable - generate_tags() falls back to one regex per keyword
+    KeywordLexicon = None
+
+# Aethero_App (introspective_parser_module) sits next to src/ - it is not on
+# sys.path when this file runs as a script
+_APP_DIR = str(Path(__file__).resolve().parent.parent)
+
+def _import_app_module(name: str):
+    """Import an Aethero_App module, adding Aethero_App to sys.path only if the plain import fails"""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        if _APP_DIR in sys.path:
+            raise
+        sys.path.append(_APP_DIR)
+        return importlib.import_module(name)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,6 +74,44 @@ logger = logging.getLogger("aeth_ingest")
 # Constants
 REPORTS_DIR = Path("./aeth_mem_reports/")
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+# Full-text index of saved reports (AETHERO_TEXT_INDEX_PATH overrides the location)
+SEARCH_INDEX_PATH = REPORTS_DIR / "search_index.sqlite3"
+# Bulk ingestion: memories per worker task and per write/index batch
+BULK_CHUNK_SIZE = 256
+BULK_BATCH_SIZE = 2048
+BULK_FILE_SUFFIXES = (".txt", ".md", ".json")
+# Deduplication index files in REPORTS_DIR (rebuildable from the reports)
+CONTENT_INDEX_FILE = "content_hashes.tsv"
+CONTENT_MINHASH_FILE = "content_minhash.tsv"
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16
+# Report storage: "files" (<ref_code>.md/.json pairs) or "segments" (ReportArchive
+# in REPORTS_DIR/archive); AETHERO_REPORT_STORE selects the default
+REPORT_STORES = ("files", "segments")
+REPORT_ARCHIVE_DIRNAME = "archive"
+# ref_codes name report files - letters, digits, '_', '.', '-' and never only dots
+REF_CODE_PATTERN = re.compile(r"(?!\.+$)[A-Za-z0-9_.-]{1,128}")
+# Inferred tag keywords - values in priority order, compiled into one lexicon
+TAG_KEYWORDS = {
+    "intent_vector": {
+        "analysis": ["analyze", "examine", "study"],
+        "creation": ["create", "generate", "build"],
+        "resolution": ["fix", "repair", "solve"],
+    },
+    "mental_state": {
+        "alert": ["error", "warning", "issue"],
+        "satisfied": ["success", "complete", "done"],
+    },
+    "emotion_tone": {
+        "concerned": ["error", "fail", "issue"],
+        "positive": ["success", "excellent", "perfect"],
+    },
+}
+TAG_CATEGORIES = {
+    f"{tag}:{value}": keywords
+    for tag, values in TAG_KEYWORDS.items() for value, keywords in values.items()
+}
+TAG_LEXICON = KeywordLexicon(TAG_CATEGORIES) if KeywordLexicon is not None else None
 
 # Default Jinja2 template for ministerial reports
 DEFAULT_TEMPLATE = """
@@ -132,36 +206,56 @@ def generate_tags(content: str) -> Dict[str, str]:
         "emotion_tone": "neutral"
     }
 
-    # Basic content analysis
-    content_lower = content.lower()
-    
-    # Intent vector detection
-    if any(word in content_lower for word in ["analyze", "examine", "study"]):
-        tags["intent_vector"] = "analysis"
-    elif any(word in content_lower for word in ["create", "generate", "build"]):
-        tags["intent_vector"] = "creation"
-    elif any(word in content_lower for word in ["fix", "repair", "solve"]):
-        tags["intent_vector"] = "resolution"
-
-    # Mental state detection
-    if any(word in content_lower for word in ["error", "warning", "issue"]):
-        tags["mental_state"] = "alert"
-    elif any(word in content_lower for word in ["success", "complete", "done"]):
-        tags["mental_state"] = "satisfied"
-
-    # Emotion tone detection
-    if any(word in content_lower for word in ["error", "fail", "issue"]):
-        tags["emotion_tone"] = "concerned"
-    elif any(word in content_lower for word in ["success", "excellent", "perfect"]):
-        tags["emotion_tone"] = "positive"
+    # Basic content analysis - one scan, the first matching value wins
+    hits = TAG_LEXICON.terms_in(content) if TAG_LEXICON is not None else _scan_tag_keywords(content)
+    for tag, values in TAG_KEYWORDS.items():
+        for value in values:
+            if hits.get(f"{tag}:{value}"):
+                tags[tag] = value
+                break
 
     logger.debug(f"Generated tags: {tags}")
     return tags
 
+_TAG_PATTERNS: Dict[str, "re.Pattern"] = {}
+
+def _scan_tag_keywords(content: str) -> Dict[str, bool]:
+    """Fallback for TAG_LEXICON - same word-start matching, one pattern per category"""
+    if not _TAG_PATTERNS:
+        for category, keywords in TAG_CATEGORIES.items():
+            _TAG_PATTERNS[category] = re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, keywords)) + ")")
+    lowered = content.lower()
+    return {category: True for category, pattern in _TAG_PATTERNS.items() if pattern.search(lowered)}
+
+def load_template(template_path: Optional[str] = None) -> Template:
+    """
+    Compile the report template once, for reuse across many reports.
+
+    Args:
+        template_path: Optional path to custom template file
+
+    Returns:
+        Template: Compiled Jinja2 template
+
+    Raises:
+        IngestionError: If the template cannot be read or compiled
+    """
+    try:
+        return Template(_read_template_source(template_path))
+    except (IOError, TemplateError) as e:
+        raise IngestionError(f"Failed to load template: {str(e)}")
+
+def _read_template_source(template_path: Optional[str]) -> str:
+    if template_path:
+        with open(template_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    return DEFAULT_TEMPLATE
+
 def render_report(
     content: str,
     metadata: Dict[str, Any],
-    template_path: Optional[str] = None
+    template_path: Optional[str] = None,
+    template: Optional[Template] = None
 ) -> str:
     """
     Render content and metadata into a ritualized report using Jinja2 templates.
@@ -170,6 +264,7 @@ def render_report(
         content: Report content
         metadata: Report metadata including ref_code, date, author, etc.
         template_path: Optional path to custom template file
+        template: Precompiled template (see load_template); overrides template_path
 
     Returns:
         str: Rendered report content
@@ -184,13 +279,9 @@ def render_report(
         raise IngestionError(f"Missing required metadata fields: {', '.join(missing_fields)}")
 
     try:
-        if template_path:
-            logger.info(f"Using custom template: {template_path}")
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template = Template(f.read())
-        else:
-            logger.info("Using default template")
-            template = Template(DEFAULT_TEMPLATE)
+        if template is None:
+            logger.info(f"Using custom template: {template_path}" if template_path else "Using default template")
+            template = Template(_read_template_source(template_path))
 
         # Convert tags to string if present, otherwise use empty string
         tags_str = ", ".join(metadata.get("tags", []))
@@ -212,10 +303,75 @@ def render_report(
     except (IOError, TemplateError) as e:
         raise IngestionError(f"Failed to render report: {str(e)}")
 
+def report_store(store: Optional[str] = None) -> str:
+    """
+    Resolve the report storage backend.
+
+    Args:
+        store: "files" or "segments" (None = AETHERO_REPORT_STORE, default "files")
+
+    Raises:
+        IngestionError: If the store name is unknown
+    """
+    store = store or os.environ.get("AETHERO_REPORT_STORE", "files")
+    if store not in REPORT_STORES:
+        raise IngestionError(f"Unknown report store: {store} (expected one of {', '.join(REPORT_STORES)})")
+    return store
+
+def open_report_archive(compress: Optional[bool] = None):
+    """
+    Open the segmented report archive (AETHERO_REPORT_ARCHIVE_DIR or REPORTS_DIR/archive).
+
+    Args:
+        compress: Compress new records (None = AETHERO_REPORT_ARCHIVE_COMPRESS)
+
+    Returns:
+        ReportArchive: Open archive - close() it when done
+
+    Raises:
+        IngestionError: If introspective_parser_module is not available
+    """
+    try:
+        ReportArchive = _import_app_module("introspective_parser_module.report_archive").ReportArchive
+    except ImportError:
+        raise IngestionError("introspective_parser_module is required for the segmented report store")
+    archive = ReportArchive.from_env(default_directory=REPORTS_DIR / REPORT_ARCHIVE_DIRNAME)
+    if compress is not None:
+        archive.compress = compress
+    return archive
+
+def validate_ref_code(ref_code: Any) -> str:
+    """
+    Check that a ref_code is safe to use as a report file name.
+
+    Raises:
+        IngestionError: If the ref_code is not a string matching REF_CODE_PATTERN
+    """
+    if not isinstance(ref_code, str) or not REF_CODE_PATTERN.fullmatch(ref_code):
+        raise IngestionError(f"Invalid ref_code {ref_code!r}: use letters, digits, '_', '.' and '-'")
+    return ref_code
+
+def _archive_source(archive, ref_code: str) -> str:
+    return f"{archive.directory}#{ref_code}"
+
+def save_pdf(content: str, pdf_path: str) -> Optional[str]:
+    """Render a report to PDF with pdfkit; returns the path, or None if it was not generated"""
+    try:
+        import pdfkit
+        logger.info(f"Generating PDF: {pdf_path}")
+        pdfkit.from_string(content, pdf_path)
+        return str(pdf_path)
+    except ImportError:
+        logger.warning("pdfkit not installed - skipping PDF generation")
+    except Exception as e:
+        logger.error(f"PDF generation failed: {str(e)}")
+    return None
+
 def save_report(
     content: str,
     metadata: Dict[str, Any],
-    as_pdf: bool = False
+    as_pdf: bool = False,
+    store: Optional[str] = None
 ) -> Dict[str, Optional[str]]:
     """
     Save the report in multiple formats (MD, JSON, optionally PDF).
@@ -224,18 +380,34 @@ def save_report(
         content: Report content
         metadata: Report metadata
         as_pdf: Whether to generate PDF output
+        store: "files" or "segments" (None = AETHERO_REPORT_STORE, default "files")
 
     Returns:
-        dict: Paths to saved files
+        dict: Paths to saved files; with the segments store "archive" holds the
+            archive location and "markdown"/"json" stay None
 
     Raises:
-        IngestionError: If saving fails
+        IngestionError: If saving fails or the ref_code is invalid
     """
+    store = report_store(store)
+    ref_code = validate_ref_code(metadata.get("ref_code"))
     try:
-        ref_code = metadata["ref_code"]
         file_base = REPORTS_DIR / ref_code
         saved_files = {"markdown": None, "json": None, "pdf": None}
 
+        if store == "segments":
+            archive = open_report_archive()
+            try:
+                archive.put(ref_code, content, metadata)
+                saved_files["archive"] = _archive_source(archive, ref_code)
+            finally:
+                archive.close()
+            logger.info(f"Report archived: {saved_files['archive']}")
+            if as_pdf:
+                saved_files["pdf"] = save_pdf(content, f"{file_base}.pdf")
+            index_report(content, metadata, saved_files["archive"])
+            return saved_files
+
         # Save Markdown
         md_path = f"{file_base}.md"
         logger.info(f"Saving markdown to: {md_path}")
@@ -252,21 +424,58 @@ def save_report(
 
         # Save PDF if requested
         if as_pdf:
-            try:
-                import pdfkit
-                pdf_path = f"{file_base}.pdf"
-                logger.info(f"Generating PDF: {pdf_path}")
-                pdfkit.from_string(content, pdf_path)
-                saved_files["pdf"] = str(pdf_path)
-            except ImportError:
-                logger.warning("pdfkit not installed - skipping PDF generation")
-            except Exception as e:
-                logger.error(f"PDF generation failed: {str(e)}")
+            saved_files["pdf"] = save_pdf(content, f"{file_base}.pdf")
+
+        index_report(content, metadata, saved_files["markdown"])
 
         return saved_files
     except Exception as e:
         raise IngestionError(f"Failed to save report: {str(e)}")
 
+def index_report(content: str, metadata: Dict[str, Any], source: Optional[str] = None) -> bool:
+    """
+    Add a saved report to the full-text search index.
+
+    Indexing is best effort - a missing or broken index never fails the save.
+
+    Args:
+        content: Rendered report content
+        metadata: Report metadata (ref_code, inferred_tags, date, ...)
+        source: Path of the saved Markdown file
+
+    Returns:
+        bool: True if the report was indexed
+    """
+    if index_reports([(content, metadata, source)]):
+        logger.info(f"Report indexed for search: {metadata['ref_code']}")
+        return True
+    return False
+
+def index_reports(reports: List[Tuple[str, Dict[str, Any], Optional[str]]]) -> int:
+    """
+    Add a batch of saved reports to the full-text search index in one transaction.
+
+    Args:
+        reports: (rendered content, metadata, Markdown path) of every report
+
+    Returns:
+        int: Number of indexed reports (0 if indexing is unavailable or failed)
+    """
+    try:
+        CognitiveTextIndex = _import_app_module("introspective_parser_module.text_index").CognitiveTextIndex
+    except ImportError:
+        logger.warning("introspective_parser_module not available - skipping search indexing")
+        return 0
+    try:
+        index = CognitiveTextIndex.from_env(default_path=SEARCH_INDEX_PATH)
+        try:
+            return index.add_reports(reports)
+        finally:
+            index.close()
+    except Exception as e:
+        logger.error(f"Search indexing failed: {str(e)}")
+        return 0
+
 def trigger_blackbox(report_path: str) -> None:
     """
     Trigger Blackbox validation subprocess.
@@ -278,6 +487,509 @@ def trigger_blackbox(report_path: str) -> None:
     # TODO: Implement actual Blackbox integration
     # Example: subprocess.run(["blackbox", "--analyze", report_path])
 
+# Deduplication
+#
+# Every memory is keyed by a 128-bit BLAKE2b hash of its normalized content.
+# CONTENT_INDEX_FILE is an append-only "hash<TAB>ref_code" log loaded into a
+# dict, so a duplicate is recognised in O(1) before anything is rendered or
+# written. The optional near-duplicate mode adds MinHash signatures of word
+# shingles, bucketed by LSH bands; only memories sharing a bucket are compared.
+
+_MINHASH_PRIME = 4294967311  # smallest prime above 2**32
+_SHINGLE_WORD = re.compile(r"\w+")
+_REPORT_CONTENT = re.compile(r"#### \*\*🪶 CONTENT\*\*[ \t]*\n(.*)\n\n---\n\n#### \*\*🪶 INFERRED TAGS", re.DOTALL)
+
+def content_hash(content: str) -> str:
+    """
+    Content address of a memory - hex BLAKE2b-128 of the content.
+
+    Outer whitespace, line endings and trailing spaces are normalized, so
+    the same memory read from different files or platforms hashes equally.
+    """
+    normalized = "\n".join(line.rstrip() for line in content.strip().splitlines())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise IngestionError("Near-duplicate detection requires numpy")
+    return numpy
+
+def minhash_signature(content: str, num_perm: int = MINHASH_PERMUTATIONS, shingle_size: int = 3):
+    """
+    MinHash signature of the word shingles of a memory.
+
+    Args:
+        content: Memory content
+        num_perm: Signature length (hash permutations)
+        shingle_size: Words per shingle
+
+    Returns:
+        numpy.ndarray: uint32 signature; equal positions estimate Jaccard similarity
+    """
+    np = _require_numpy()
+    words = _SHINGLE_WORD.findall(content.lower())
+    shingles = {" ".join(words[i:i + shingle_size]) for i in range(max(1, len(words) - shingle_size + 1))}
+    hashes = np.fromiter((zlib.crc32(shingle.encode("utf-8")) for shingle in shingles), dtype=np.uint64)
+    # Fixed permutations so signatures stay comparable across runs and processes
+    rng = np.random.default_rng(num_perm)
+    a = rng.integers(1, 2 ** 32, num_perm, dtype=np.uint64)
+    b = rng.integers(0, 2 ** 32, num_perm, dtype=np.uint64)
+    permuted = (a[:, None] * hashes[None, :] + b[:, None]) % np.uint64(_MINHASH_PRIME)
+    return permuted.min(axis=1).astype(np.uint32)
+
+def report_content(markdown: str) -> str:
+    """Original content of a report rendered with DEFAULT_TEMPLATE (whole report otherwise)"""
+    match = _REPORT_CONTENT.search(markdown)
+    return match.group(1) if match else markdown
+
+class ContentDedupIndex:
+    """
+    Content hash -> ref_code index of ingested memories.
+
+    Args:
+        directory: Directory with the reports and index files (default REPORTS_DIR)
+        near_threshold: Estimated Jaccard similarity from which a memory counts
+            as a near-duplicate (None = exact duplicates only)
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None, near_threshold: Optional[float] = None):
+        self.directory = Path(directory) if directory is not None else REPORTS_DIR
+        self.near_threshold = near_threshold
+        self._hashes: Optional[Dict[bytes, str]] = None
+        self._signatures: Dict[str, Any] = {}
+        self._buckets: Dict[bytes, List[str]] = {}
+        self._pending: List[Tuple[str, str, Any]] = []
+
+    @property
+    def hashes(self) -> Dict[bytes, str]:
+        """Digest -> ref_code, loaded from CONTENT_INDEX_FILE on first use"""
+        if self._hashes is None:
+            self._load()
+        return self._hashes
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def _load(self) -> None:
+        self._hashes = {}
+        path = self.directory / CONTENT_INDEX_FILE
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    digest, _, ref_code = line.rstrip("\n").partition("\t")
+                    if ref_code:
+                        # First ingestion of a content stays its canonical report
+                        self._hashes.setdefault(bytes.fromhex(digest), ref_code)
+        if self.near_threshold is not None:
+            np = _require_numpy()
+            path = self.directory / CONTENT_MINHASH_FILE
+            if path.exists():
+                with open(path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        ref_code, _, signature = line.rstrip("\n").partition("\t")
+                        if signature:
+                            self._add_signature(ref_code, np.frombuffer(bytes.fromhex(signature), dtype=np.uint32))
+            if len(self._signatures) < len(self._hashes):
+                logger.warning(f"{len(self._hashes) - len(self._signatures)} indexed memories have no MinHash signature - "
+                               "rebuild the index with --near_duplicates to compare against them")
+        logger.debug(f"Loaded deduplication index: {len(self._hashes)} memories")
+
+    def _band_keys(self, signature) -> List[bytes]:
+        rows = len(signature) // MINHASH_BANDS
+        return [bytes([band]) + signature[band * rows:(band + 1) * rows].tobytes() for band in range(MINHASH_BANDS)]
+
+    def _add_signature(self, ref_code: str, signature) -> None:
+        self._signatures[ref_code] = signature
+        for key in self._band_keys(signature):
+            self._buckets.setdefault(key, []).append(ref_code)
+
+    def signature(self, content: str):
+        """MinHash signature for the near-duplicate mode, None when it is off"""
+        return minhash_signature(content) if self.near_threshold is not None else None
+
+    def lookup(self, digest: str) -> Optional[str]:
+        """ref_code of an exact duplicate"""
+        return self.hashes.get(bytes.fromhex(digest))
+
+    def find_near(self, signature) -> Optional[str]:
+        """ref_code of the most similar memory at or above near_threshold"""
+        if signature is None or self.near_threshold is None:
+            return None
+        if self._hashes is None:
+            self._load()
+        candidates = {ref_code for key in self._band_keys(signature) for ref_code in self._buckets.get(key, ())}
+        best, best_similarity = None, self.near_threshold
+        for ref_code in candidates:
+            similarity = float((self._signatures[ref_code] == signature).mean())
+            if similarity >= best_similarity:
+                best, best_similarity = ref_code, similarity
+        return best
+
+    def find_duplicate(self, digest: str, signature=None) -> Optional[str]:
+        """ref_code of an exact or (in near mode) near duplicate of a memory"""
+        return self.lookup(digest) or self.find_near(signature)
+
+    def add(self, digest: str, ref_code: str, signature=None) -> None:
+        """Register an ingested memory; written to disk by flush()"""
+        key = bytes.fromhex(digest)
+        if key in self.hashes:
+            return
+        self.hashes[key] = ref_code
+        if signature is not None:
+            self._add_signature(ref_code, signature)
+        self._pending.append((digest, ref_code, signature))
+
+    def flush(self) -> None:
+        """Append registered memories to the index files"""
+        if not self._pending:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / CONTENT_INDEX_FILE, "a", encoding="utf-8") as f:
+            f.writelines(f"{digest}\t{ref_code}\n" for digest, ref_code, _ in self._pending)
+        signatures = [(ref_code, signature) for _, ref_code, signature in self._pending if signature is not None]
+        if signatures:
+            with open(self.directory / CONTENT_MINHASH_FILE, "a", encoding="utf-8") as f:
+                f.writelines(f"{ref_code}\t{signature.tobytes().hex()}\n" for ref_code, signature in signatures)
+        self._pending = []
+
+    def rebuild(self) -> int:
+        """
+        Rebuild the index files from the saved reports - the JSON (and
+        Markdown) files and the segmented report archive, if there is one.
+
+        Reports carry their content_hash in the metadata; older reports are
+        hashed from the content section of their Markdown.
+
+        Returns:
+            int: Number of indexed memories
+        """
+        self._hashes, self._signatures, self._buckets, self._pending = {}, {}, {}, []
+        for json_path in sorted(self.directory.glob("*.json")):
+            try:
+                with open(json_path, "r", encoding="utf-8") as f:
+                    metadata = json.load(f)
+            except (IOError, json.JSONDecodeError):
+                continue
+            if not isinstance(metadata, dict) or "ref_code" not in metadata:
+                continue
+            digest = metadata.get("content_hash")
+            content = None
+            if not digest or self.near_threshold is not None:
+                md_path = json_path.with_suffix(".md")
+                if not md_path.exists():
+                    continue
+                content = report_content(md_path.read_text(encoding="utf-8"))
+                digest = digest or content_hash(content)
+            self.add(digest, metadata["ref_code"], self.signature(content) if content is not None else None)
+
+        if os.environ.get("AETHERO_REPORT_ARCHIVE_DIR") or (self.directory / REPORT_ARCHIVE_DIRNAME).is_dir():
+            archive = open_report_archive()
+            try:
+                for report in archive.iter_reports():
+                    digest = report.metadata.get("content_hash")
+                    content = report_content(report.content) if not digest or self.near_threshold is not None else None
+                    self.add(digest or content_hash(content), report.ref_code,
+                             self.signature(content) if content is not None else None)
+            finally:
+                archive.close()
+
+        for name in (CONTENT_INDEX_FILE, CONTENT_MINHASH_FILE):
+            (self.directory / name).unlink(missing_ok=True)
+        self.flush()
+        logger.info(f"Deduplication index rebuilt: {len(self._hashes)} memories")
+        return len(self._hashes)
+
+# Bulk ingestion
+#
+# Memories are read, tagged and rendered in a process pool (one compiled
+# template per worker, BULK_CHUNK_SIZE memories per task); the parent writes
+# the finished reports in batches and indexes every batch in one transaction.
+# Workers skip memories whose content hash is already indexed; duplicates
+# within the run (and near-duplicates) are caught by the parent before writing.
+
+# Per-process bulk settings - compiled template, metadata defaults, known hashes
+_bulk_worker: Dict[str, Any] = {}
+
+def iter_bulk_records(source: str) -> Iterator[Dict[str, Any]]:
+    """
+    Expand a bulk source into memory records.
+
+    Args:
+        source: Directory (its .txt/.md/.json files, recursively), glob pattern,
+            NDJSON file (.ndjson/.jsonl) or "-" for NDJSON on stdin. An NDJSON
+            record is a memory object with "content" and optional "ref_code",
+            "author", "tags" and "source"; an object without "content" is
+            ingested as JSON, like --json.
+
+    Yields:
+        dict: {"path": ...} for files, the parsed object for NDJSON lines
+
+    Raises:
+        IngestionError: If an NDJSON line is not a JSON object
+    """
+    if source == "-" or source.endswith((".ndjson", ".jsonl")):
+        stream = sys.stdin if source == "-" else open(source, "r", encoding="utf-8")
+        try:
+            for line_number, line in enumerate(stream, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise IngestionError(f"Invalid NDJSON on line {line_number}: {str(e)}")
+                if not isinstance(record, dict):
+                    raise IngestionError(f"NDJSON line {line_number} is not an object")
+                yield record
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+        return
+
+    if os.path.isdir(source):
+        paths = (
+            os.path.join(root, name)
+            for root, _, names in os.walk(source)
+            for name in sorted(names)
+            if name.endswith(BULK_FILE_SUFFIXES)
+        )
+    else:
+        paths = sorted(glob.iglob(source, recursive=True))
+    for path in paths:
+        if os.path.isfile(path):
+            yield {"path": path}
+
+def _init_bulk_worker(template_source: str, defaults: Dict[str, Any],
+                      known: Optional[Dict[bytes, str]] = None, near: bool = False) -> None:
+    _bulk_worker["template"] = Template(template_source)
+    _bulk_worker["defaults"] = defaults
+    _bulk_worker["known"] = known
+    _bulk_worker["near"] = near
+
+def _bulk_ref_code(year: str) -> str:
+    # 12 hex digits - the 4-digit single-run code collides quickly at bulk volumes
+    return f"AETH-MEM-{year}-{uuid.uuid4().hex[:12].upper()}"
+
+def _prepare_record(record: Dict[str, Any]) -> Tuple[str, Any]:
+    """Worker: ("ok", (report, metadata, signature)) or ("duplicate", (source, ref_code))"""
+    defaults = _bulk_worker["defaults"]
+    # Same rules as parse_input, without its per-input log lines
+    if "path" in record:
+        try:
+            with open(record["path"], 'r', encoding='utf-8') as f:
+                content = f.read()
+        except (IOError, UnicodeDecodeError) as e:
+            raise IngestionError(f"Failed to parse input: {str(e)}")
+        source = record["path"]
+    elif isinstance(record.get("content"), str):
+        content = record["content"]
+        source = record.get("source", defaults["source"])
+    else:
+        content = json.dumps(record, indent=4)
+        source = defaults["source"]
+    if not content.strip():
+        raise IngestionError("Input content is empty")
+
+    digest = content_hash(content)
+    known = _bulk_worker["known"]
+    if known is not None and bytes.fromhex(digest) in known:
+        return "duplicate", (source, known[bytes.fromhex(digest)])
+
+    metadata = {
+        "ref_code": validate_ref_code(record["ref_code"]) if record.get("ref_code") else _bulk_ref_code(defaults["date"][:4]),
+        "date": defaults["date"],
+        "author": record.get("author", defaults["author"]),
+        "tags": record.get("tags", defaults["tags"]),
+        "source": source,
+        "inferred_tags": generate_tags(content)
+    }
+    if known is not None:
+        metadata["content_hash"] = digest
+    signature = minhash_signature(content) if _bulk_worker["near"] else None
+    return "ok", (render_report(content, metadata, template=_bulk_worker["template"]), metadata, signature)
+
+def _prepare_chunk(records: List[Dict[str, Any]]) -> List[Tuple[str, Any]]:
+    """Worker: _prepare_record() result or ("failed", error message) per record"""
+    results = []
+    for record in records:
+        try:
+            results.append(_prepare_record(record))
+        except IngestionError as e:
+            results.append(("failed", f"{record.get('path') or record.get('ref_code') or 'record'}: {str(e)}"))
+    return results
+
+def _chunked(records: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _prepared_chunks(chunks: Iterator[List[Dict[str, Any]]], worker_args: tuple,
+                     max_workers: int) -> Iterator[List[Tuple[str, Any]]]:
+    """Prepared chunks in input order - in-process for one worker"""
+    if max_workers == 1:
+        # In-process the worker sees the live hash index, including this run's memories
+        _init_bulk_worker(*worker_args)
+        yield from map(_prepare_chunk, chunks)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_bulk_worker,
+                             initargs=worker_args) as pool:
+        # Bounded read-ahead keeps an NDJSON stream from being loaded whole
+        pending = []
+        for chunk in chunks:
+            pending.append(pool.submit(_prepare_chunk, chunk))
+            if len(pending) >= 4 * max_workers:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+def write_reports(reports: List[Tuple[str, Dict[str, Any]]], archive=None) -> List[Tuple[str, Dict[str, Any], Optional[str]]]:
+    """
+    Write a batch of rendered reports (MD + JSON) and index them together.
+
+    Args:
+        reports: (rendered content, metadata) pairs
+        archive: Open ReportArchive - append the batch to it instead of writing files
+
+    Returns:
+        list: (content, metadata, Markdown path or archive location) of every written report
+
+    Raises:
+        IngestionError: If writing fails or a ref_code is invalid
+    """
+    for _, metadata in reports:
+        validate_ref_code(metadata.get("ref_code"))
+    written = []
+    try:
+        if archive is not None:
+            archive.put_many(reports)
+            written = [(content, metadata, _archive_source(archive, metadata["ref_code"])) for content, metadata in reports]
+            return written
+        for content, metadata in reports:
+            file_base = REPORTS_DIR / metadata["ref_code"]
+            md_path = f"{file_base}.md"
+            with open(md_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            with open(f"{file_base}.json", "w", encoding="utf-8") as f:
+                json.dump(metadata, f, indent=4)
+            written.append((content, metadata, md_path))
+    except (IOError, OSError) as e:
+        raise IngestionError(f"Failed to save report batch: {str(e)}")
+    finally:
+        if written:
+            index_reports(written)
+    return written
+
+def ingest_bulk(
+    source: str,
+    author: str = "AetheroGPT",
+    tags: Optional[List[str]] = None,
+    origin: str = "unknown",
+    template_path: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    batch_size: int = BULK_BATCH_SIZE,
+    chunk_size: int = BULK_CHUNK_SIZE,
+    deduplicate: bool = True,
+    near_threshold: Optional[float] = None,
+    store: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Ingest many memories in one run.
+
+    Args:
+        source: Directory, glob pattern, NDJSON file or "-" (see iter_bulk_records)
+        author: Default author of the reports
+        tags: Default custom tags of the reports
+        origin: Default source of NDJSON memories without their own "source"
+        template_path: Optional path to custom template file
+        max_workers: Process count (None = CPU count, 1 = in-process)
+        batch_size: Reports written and indexed per batch
+        chunk_size: Memories per worker task
+        deduplicate: Skip memories whose content was already ingested
+        near_threshold: Also skip near-duplicates from this MinHash similarity
+        store: "files" or "segments" (None = AETHERO_REPORT_STORE, default "files")
+
+    Returns:
+        dict: Counts of ingested, duplicate and failed memories, the duplicates
+            (source and existing ref_code) and failures, elapsed seconds and
+            throughput in memories per second
+
+    Raises:
+        IngestionError: If the template or the source cannot be read, or writing fails
+    """
+    try:
+        template_source = _read_template_source(template_path)
+        Template(template_source)  # a broken template fails here, not in every worker
+    except (IOError, TemplateError) as e:
+        raise IngestionError(f"Failed to load template: {str(e)}")
+    defaults = {
+        "author": author,
+        "tags": list(tags or []),
+        "source": origin,
+        "date": datetime.now().strftime("%Y-%m-%d")
+    }
+    max_workers = max_workers or os.cpu_count() or 1
+    archive = open_report_archive() if report_store(store) == "segments" else None
+    dedup = ContentDedupIndex(near_threshold=near_threshold) if deduplicate else None
+    worker_args = (template_source, defaults, dedup.hashes if dedup is not None else None, near_threshold is not None and deduplicate)
+    chunks = _chunked(iter_bulk_records(source), chunk_size)
+
+    started = time.perf_counter()
+    ingested, duplicates, failures, batch = 0, [], [], []
+
+    def flush_batch() -> int:
+        written = len(write_reports(batch, archive))
+        if dedup is not None:
+            dedup.flush()
+        return written
+
+    try:
+        for results in _prepared_chunks(chunks, worker_args, max_workers):
+            for status, payload in results:
+                if status == "ok":
+                    report, metadata, signature = payload
+                    if dedup is not None:
+                        existing = dedup.find_duplicate(metadata["content_hash"], signature)
+                        if existing:
+                            duplicates.append({"source": metadata["source"], "duplicate_of": existing})
+                            continue
+                        dedup.add(metadata["content_hash"], metadata["ref_code"], signature)
+                    batch.append((report, metadata))
+                elif status == "duplicate":
+                    duplicates.append({"source": payload[0], "duplicate_of": payload[1]})
+                else:
+                    failures.append(payload)
+            if len(batch) >= batch_size:
+                ingested += flush_batch()
+                batch = []
+                elapsed = time.perf_counter() - started
+                logger.info(f"Ingested {ingested} memories ({ingested / elapsed:.0f}/s, {len(duplicates)} duplicates)")
+        if batch:
+            ingested += flush_batch()
+    finally:
+        if archive is not None:
+            archive.close()
+
+    elapsed = time.perf_counter() - started
+    for failure in failures[:20]:
+        logger.warning(f"Skipped memory - {failure}")
+    stats = {
+        "ingested": ingested,
+        "duplicate_count": len(duplicates),
+        "duplicates": duplicates,
+        "failed": len(failures),
+        "failures": failures,
+        "seconds": round(elapsed, 3),
+        "per_second": round(ingested / elapsed, 1) if elapsed > 0 else 0.0,
+        "workers": max_workers
+    }
+    logger.info(f"Bulk ingestion finished: {ingested} memories in {stats['seconds']}s "
+                f"({stats['per_second']}/s, {len(duplicates)} duplicates, {len(failures)} failed, {max_workers} workers)")
+    return stats
+
 def main() -> None:
     """Main entry point for the AetheroOS Memory Ingestion Agent."""
     parser = argparse.ArgumentParser(
@@ -302,6 +1014,28 @@ def main() -> None:
                        help="Generate PDF output")
     parser.add_argument("--debug", action="store_true",
                        help="Enable debug logging")
+    parser.add_argument("--bulk", type=str,
+                       help="Bulk input: directory, glob pattern, NDJSON file or - for NDJSON on stdin")
+    parser.add_argument("--workers", type=int,
+                       help="Bulk worker processes (default: CPU count)")
+    parser.add_argument("--batch_size", type=int, default=BULK_BATCH_SIZE,
+                       help="Bulk reports written and indexed per batch")
+    parser.add_argument("--allow_duplicates", action="store_true",
+                       help="Ingest content that was already ingested")
+    parser.add_argument("--near_duplicates", type=float, metavar="THRESHOLD",
+                       help="Also skip near-duplicates (MinHash similarity, e.g. 0.8)")
+    parser.add_argument("--rebuild_dedup_index", action="store_true",
+                       help="Rebuild the deduplication index from the saved reports and exit")
+    parser.add_argument("--store", type=str, choices=REPORT_STORES,
+                       help="Report storage: files (default) or segments (AETHERO_REPORT_STORE)")
+    parser.add_argument("--compress", action="store_true",
+                       help="Compress reports written to the segments store")
+    parser.add_argument("--compact_archive", action="store_true",
+                       help="Compact the segmented report archive and exit")
+    parser.add_argument("--export_archive", type=str, metavar="DIR",
+                       help="Export archived reports as .md/.json files (with --pdf also PDF) and exit")
+    parser.add_argument("--refs", type=str, nargs="*",
+                       help="ref_codes to export (default: all archived reports)")
 
     args = parser.parse_args()
 
@@ -309,6 +1043,58 @@ def main() -> None:
     if args.debug:
         logger.setLevel(logging.DEBUG)
 
+    if args.compress:
+        os.environ["AETHERO_REPORT_ARCHIVE_COMPRESS"] = "1"
+
+    if args.compact_archive or args.export_archive:
+        try:
+            archive = open_report_archive()
+            try:
+                if args.compact_archive:
+                    stats = archive.compact(compress=True if args.compress else None)
+                    logger.info(f"Archive compacted: {stats['after']}")
+                if args.export_archive:
+                    exported = archive.export(args.export_archive, args.refs)
+                    if args.pdf:
+                        for ref_code in exported:
+                            save_pdf(archive.get(ref_code).content, os.path.join(args.export_archive, f"{ref_code}.pdf"))
+                    logger.info(f"Exported {len(exported)} reports to {args.export_archive}")
+            finally:
+                archive.close()
+        except (IngestionError, OSError) as e:
+            logger.error(f"Archive maintenance failed: {str(e)}")
+            exit(1)
+        return
+
+    if args.rebuild_dedup_index:
+        try:
+            ContentDedupIndex(near_threshold=args.near_duplicates).rebuild()
+        except IngestionError as e:
+            logger.error(f"Rebuilding the deduplication index failed: {str(e)}")
+            exit(1)
+        return
+
+    if args.bulk:
+        try:
+            stats = ingest_bulk(
+                args.bulk,
+                author=args.author,
+                tags=args.tags,
+                origin=args.source,
+                template_path=args.template,
+                max_workers=args.workers,
+                batch_size=args.batch_size,
+                deduplicate=not args.allow_duplicates,
+                near_threshold=args.near_duplicates,
+                store=args.store
+            )
+        except IngestionError as e:
+            logger.error(f"Bulk ingestion failed: {str(e)}")
+            exit(1)
+        if stats["failed"]:
+            exit(1)
+        return
+
     try:
         # Parse input
         content = parse_input(
@@ -317,6 +1103,16 @@ def main() -> None:
             input_text=args.text
         )
 
+        # Skip content that is already in the archive - nothing is rendered or written
+        dedup = None if args.allow_duplicates else ContentDedupIndex(near_threshold=args.near_duplicates)
+        if dedup is not None:
+            digest = content_hash(content)
+            signature = dedup.signature(content)
+            existing = dedup.find_duplicate(digest, signature)
+            if existing:
+                logger.info(f"Duplicate of {existing} - nothing written")
+                return
+
         # Generate metadata
         ref_code = args.ref_code or f"AETH-MEM-{datetime.now().strftime('%Y')}-{str(uuid.uuid4().int)[:4]}"
         metadata = {
@@ -327,6 +1123,8 @@ def main() -> None:
             "source": args.source,
             "inferred_tags": generate_tags(content)
         }
+        if dedup is not None:
+            metadata["content_hash"] = digest
 
         # Render report
         rendered_content = render_report(
@@ -336,12 +1134,15 @@ def main() -> None:
         )
 
         # Save report
-        saved_files = save_report(rendered_content, metadata, as_pdf=args.pdf)
+        saved_files = save_report(rendered_content, metadata, as_pdf=args.pdf, store=args.store)
         logger.info(f"Report saved: {saved_files}")
+        if dedup is not None:
+            dedup.add(digest, ref_code, signature)
+            dedup.flush()
 
         # Trigger Blackbox if validation is requested
         if args.validate:
-            trigger_blackbox(saved_files["markdown"])
+            trigger_blackbox(saved_files["markdown"] or saved_files["archive"])
 
     except IngestionError as e:
         logger.error(f"Ingestion failed: {str(e)}")
@@ -3,7 +3,22 @@ from typing import Dict, Any, Optional, List, Callable
 import logging
 from datetime import datetime
 from dataclasses import dataclass
+import hashlib
 import json
+import re
+
+from ..history import BoundedHistory, HistoryPolicy
+
+# Topics usable verbatim in a spill file name; others are sanitized and hashed
+_SAFE_TOPIC = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def history_name(topic: str) -> str:
+    """History (spill file) name for a topic - never a path, unique per topic"""
+    if _SAFE_TOPIC.fullmatch(topic):
+        return f"agent_bus_{topic}"
+    digest = hashlib.sha256(topic.encode("utf-8")).hexdigest()[:16]
+    return f"agent_bus_{re.sub(r'[^A-Za-z0-9_-]', '_', topic)[:48]}-{digest}"
 
 @dataclass
 class Message:
@@ -25,11 +40,14 @@ class Message:
         }
 
 class AgentBus:
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(self, logger: Optional[logging.Logger] = None,
+                 history_policy: Optional[HistoryPolicy] = None):
         self.logger = logger or logging.getLogger('agent_bus')
         self.topics: Dict[str, List[asyncio.Queue]] = {}
         self.subscribers: Dict[str, List[Callable]] = {}
-        self.message_history: Dict[str, List[Message]] = {}
+        # Per-topic bounded history; evicted messages spill to <spill_dir>/<history_name(topic)>.jsonl
+        self.history_policy = history_policy or HistoryPolicy()
+        self.message_history: Dict[str, BoundedHistory[Message]] = {}
         self.running = True
 
     async def publish(self, topic: str, message: Dict[str, Any], asl_tags: Dict[str, Any]) -> None:
@@ -48,7 +66,7 @@ class AgentBus:
 
             # Store in history
             if topic not in self.message_history:
-                self.message_history[topic] = []
+                self.message_history[topic] = self.history_policy.create(history_name(topic))
             self.message_history[topic].append(msg)
 
             # Deliver to topic queues
@@ -91,16 +109,13 @@ class AgentBus:
         if topic not in self.message_history:
             return []
         
-        messages = self.message_history[topic]
-        if limit:
-            return messages[-limit:]
-        return messages
+        return self.message_history[topic].latest(limit)
 
     async def clear_history(self, topic: Optional[str] = None) -> None:
         """Clear message history for a topic or all topics."""
         if topic:
             if topic in self.message_history:
-                self.message_history[topic] = []
+                self.message_history[topic].clear()
                 self.logger.info(f"Cleared history for topic {topic}")
         else:
             self.message_history = {}
@@ -1,22 +1,36 @@
-from typing import Dict, List, Optional, Union
-import re
-import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+from array import array
 from datetime import datetime, UTC
+import bisect
+import codecs
+import heapq
+import mmap
+import os
+
+# Default read size for streams and memory-mapped files
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
 
 class ASLTag:
     """
     Represents a single ASL (Aethero Syntax Language) tag
+
+    Tags parsed from one brace block share their position dict, and all tags
+    of one parse share the timestamp string.
     """
+    __slots__ = ("tag_name", "value", "position", "timestamp")
+
     def __init__(
         self,
         tag_name: str,
         value: Union[str, int, float, bool, dict],
-        position: Optional[Dict[str, int]] = None
+        position: Optional[Dict[str, int]] = None,
+        timestamp: Optional[str] = None
     ):
         self.tag_name = tag_name
         self.value = value
         self.position = position or {}
-        self.timestamp = datetime.now(UTC).isoformat()
+        self.timestamp = timestamp or datetime.now(UTC).isoformat()
 
     def to_dict(self) -> Dict:
         """Convert tag to dictionary representation"""
@@ -36,141 +50,321 @@ class ASLTag:
             position=data.get("position", {})
         )
 
+
+class LineIndex:
+    """
+    Offsets of every newline seen so far, built incrementally chunk by chunk
+
+    line_of() is a bisect over the sorted offsets - O(log n) instead of
+    counting newlines in the prefix of the document.
+    """
+
+    def __init__(self):
+        self.newline_offsets = array('q')
+
+    def add_text(self, text: str, offset: int) -> None:
+        """Index the newlines of text that starts at character offset"""
+        find = text.find
+        append = self.newline_offsets.append
+        index = find('\n')
+        while index != -1:
+            append(offset + index)
+            index = find('\n', index + 1)
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number of a character offset"""
+        return bisect.bisect_left(self.newline_offsets, offset) + 1
+
+
+def _convert_value(value: str) -> Union[str, int, float, bool]:
+    """Handle different value types - numbers, booleans and quoted strings"""
+    try:
+        # Try to convert to number if possible
+        if value.replace('.', '').isdigit():
+            value = float(value) if '.' in value else int(value)
+        elif value.lower() == 'true':
+            value = True
+        elif value.lower() == 'false':
+            value = False
+        elif value.startswith("'") and value.endswith("'"):
+            value = value[1:-1]  # Remove quotes
+        elif value.startswith('"') and value.endswith('"'):
+            value = value[1:-1]  # Remove quotes
+    except ValueError:
+        # Keep as string if conversion fails
+        if value.startswith("'") and value.endswith("'"):
+            value = value[1:-1]
+        elif value.startswith('"') and value.endswith('"'):
+            value = value[1:-1]
+    return value
+
+
+def _iter_text_chunks(source: Any, encoding: str, chunk_size: int) -> Iterator[str]:
+    """Normalize strings, bytes, mmaps, file objects and chunk iterators to text chunks"""
+    if isinstance(source, str):
+        yield source
+        return
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        for offset in range(0, len(source), chunk_size):
+            yield decoder.decode(source[offset:offset + chunk_size])
+        yield decoder.decode(b"", final=True)
+        return
+
+    read = getattr(source, "read", None)
+    chunks: Iterable = iter(lambda: read(chunk_size), "") if read is not None else source
+    for chunk in chunks:
+        if not chunk:
+            if read is not None:
+                break
+            continue
+        yield decoder.decode(chunk) if isinstance(chunk, (bytes, bytearray)) else chunk
+    yield decoder.decode(b"", final=True)
+
+
 class ASLParser:
-    """Parser for ASL (Aethero Syntax Language) tags"""
-    
+    """
+    Parser for ASL (Aethero Syntax Language) tags
+
+    Brace blocks are found in a single pass over the input, which may be a
+    string, a stream or a memory-mapped file, and line numbers come from an
+    incrementally built LineIndex. Parsed tags are indexed by name, by value
+    type and by start position, so the extract_* and range queries cost
+    O(log n + k) instead of a scan over self.tags.
+    """
+
     def __init__(self):
         self.tags: List[ASLTag] = []
-        self._tag_pattern = re.compile(r'{([^}]+)}')
-    
+        self.line_index = LineIndex()
+        self._reset_indexes()
+
+    def _reset_indexes(self) -> None:
+        self._by_name: Dict[str, List[int]] = {}
+        self._by_value_type: Dict[type, List[int]] = {}
+        self._starts = array('q')
+
+    def _add_tag(self, tag: ASLTag) -> None:
+        index = len(self.tags)
+        self.tags.append(tag)
+        self._by_name.setdefault(tag.tag_name, []).append(index)
+        self._by_value_type.setdefault(type(tag.value), []).append(index)
+        self._starts.append(tag.position["start"])
+
     def parse(self, content: str) -> List[Dict]:
         """
         Parse ASL tags from content
-        
+
         Args:
             content: String containing ASL tags
-            
+
         Returns:
             List of parsed tags as dictionaries
         """
+        return list(self.iter_parse(content))
+
+    def parse_file(self, path: Union[str, os.PathLike], encoding: str = "utf-8",
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Dict]:
+        """
+        Parse ASL tags from a file through a read-only memory map
+
+        Args:
+            path: Path to the document
+            encoding: Text encoding of the file
+            chunk_size: Characters decoded per step
+
+        Returns:
+            List of parsed tags as dictionaries; positions are character offsets
+        """
+        return list(self.iter_parse_file(path, encoding, chunk_size))
+
+    def iter_parse_file(self, path: Union[str, os.PathLike], encoding: str = "utf-8",
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict]:
+        """Stream tags from a memory-mapped file - see iter_parse()"""
+        with open(path, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                # Empty files cannot be memory-mapped
+                yield from self.iter_parse("")
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield from self.iter_parse(mapped, encoding, chunk_size)
+
+    def iter_parse(self, source: Any, encoding: str = "utf-8",
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict]:
+        """
+        Stream ASL tags from a string, bytes, mmap, file object or iterator of chunks
+
+        A brace block is '{' followed by at least one character other than
+        '}' and a closing '}'. Only the text of a block that is still open
+        at the end of a chunk is buffered, so memory stays bounded by the
+        longest block rather than by the document.
+
+        Args:
+            source: Input document
+            encoding: Encoding used to decode binary input
+            chunk_size: Read size for streams and memory maps
+
+        Yields:
+            Parsed tags as dictionaries, in document order
+        """
         self.tags = []
-        matches = self._tag_pattern.finditer(content)
-        
-        for match in matches:
-            try:
-                tag_content = match.group(1).strip()
-                # Split the tag content into key-value pairs
-                pairs = [pair.strip() for pair in tag_content.split(',')]
-                tag_dict = {}
-                
-                for pair in pairs:
-                    if ':' in pair:
-                        key, value = [p.strip() for p in pair.split(':', 1)]
-                        # Handle different value types
-                        try:
-                            # Try to convert to number if possible
-                            if value.replace('.', '').isdigit():
-                                value = float(value) if '.' in value else int(value)
-                            elif value.lower() == 'true':
-                                value = True
-                            elif value.lower() == 'false':
-                                value = False
-                            elif value.startswith("'") and value.endswith("'"):
-                                value = value[1:-1]  # Remove quotes
-                            elif value.startswith('"') and value.endswith('"'):
-                                value = value[1:-1]  # Remove quotes
-                        except ValueError:
-                            # Keep as string if conversion fails
-                            if value.startswith("'") and value.endswith("'"):
-                                value = value[1:-1]
-                            elif value.startswith('"') and value.endswith('"'):
-                                value = value[1:-1]
-                        
-                        tag_dict[key] = value
-                
-                # Extract position information
-                position = {
-                    "start": match.start(),
-                    "end": match.end(),
-                    "line": content[:match.start()].count('\n') + 1
-                }
-                
-                # Create and store tag for each key-value pair
-                for tag_name, value in tag_dict.items():
-                    tag = ASLTag(
-                        tag_name=tag_name,
-                        value=value,
-                        position=position
-                    )
-                    self.tags.append(tag)
-                    
-            except Exception as e:
-                print(f"Warning: Invalid tag format at position {match.start()}: {str(e)}")
+        self.line_index = LineIndex()
+        self._reset_indexes()
+        # One timestamp per parse instead of one clock read per tag
+        timestamp = datetime.now(UTC).isoformat()
+
+        # Chunks of a block still open at a chunk end: its '{' and the text
+        # after it, none of it holding a '}'. They are joined once, when
+        # a chunk brings the '}', so a long block is copied only once.
+        pending: List[str] = []
+        pending_offset = 0     # document offset of pending[0]
+        pending_length = 0
+        consumed = 0           # characters read so far
+
+        for chunk in _iter_text_chunks(source, encoding, chunk_size):
+            if not chunk:
                 continue
-                
-        return [tag.to_dict() for tag in self.tags]
-    
+            self.line_index.add_text(chunk, consumed)
+            chunk_offset = consumed
+            consumed += len(chunk)
+
+            if pending:
+                pending.append(chunk)
+                if '}' not in chunk:
+                    pending_length += len(chunk)
+                    continue
+                # '}' cannot occur in the pending text before this chunk
+                close_search_from = pending_length
+                buffer, buffer_offset = "".join(pending), pending_offset
+                pending = []
+            else:
+                buffer, buffer_offset, close_search_from = chunk, chunk_offset, 0
+
+            position = 0
+            while True:
+                open_index = buffer.find('{', position)
+                if open_index == -1:
+                    break
+                close_index = buffer.find('}', max(open_index + 1, close_search_from))
+                if close_index == -1:
+                    # Block still open - keep it for the next chunk
+                    pending = [buffer[open_index:]]
+                    pending_offset = buffer_offset + open_index
+                    pending_length = len(buffer) - open_index
+                    break
+                close_search_from = 0
+                if close_index == open_index + 1:
+                    # Empty braces are not a block
+                    position = open_index + 1
+                    continue
+                yield from self._parse_block(
+                    buffer[open_index + 1:close_index],
+                    buffer_offset + open_index,
+                    buffer_offset + close_index + 1,
+                    timestamp
+                )
+                position = close_index + 1
+        # A block still open at the end has no '}' after it - neither has any later '{'
+
+    def _parse_block(self, block: str, start: int, end: int, timestamp: str) -> Iterator[Dict]:
+        """Split one brace block into tags that share position and timestamp"""
+        try:
+            tag_content = block.strip()
+            # Split the tag content into key-value pairs
+            pairs = [pair.strip() for pair in tag_content.split(',')]
+            tag_dict = {}
+
+            for pair in pairs:
+                if ':' in pair:
+                    key, value = [p.strip() for p in pair.split(':', 1)]
+                    tag_dict[key] = _convert_value(value)
+
+            # Extract position information
+            position = {
+                "start": start,
+                "end": end,
+                "line": self.line_index.line_of(start)
+            }
+
+            # Create and store tag for each key-value pair
+            tags = [
+                ASLTag(tag_name=tag_name, value=value, position=position, timestamp=timestamp)
+                for tag_name, value in tag_dict.items()
+            ]
+        except Exception as e:
+            print(f"Warning: Invalid tag format at position {start}: {str(e)}")
+            return
+
+        for tag in tags:
+            self._add_tag(tag)
+            yield tag.to_dict()
+
     def validate_tag_structure(self, tag: Dict) -> bool:
         """
         Validate ASL tag structure
-        
+
         Args:
             tag: Dictionary containing tag data
-            
+
         Returns:
             bool: True if tag is valid, False otherwise
         """
         required_fields = ["tag_name", "value", "position"]
         if not all(field in tag for field in required_fields):
             return False
-            
+
         # Validate position structure
         position = tag.get("position", {})
         required_position_fields = ["start", "end", "line"]
         if not all(field in position for field in required_position_fields):
             return False
-            
+
         return True
-    
+
     def extract_tags_by_name(self, tag_name: str) -> List[Dict]:
         """
         Extract all tags with a specific name
-        
+
         Args:
             tag_name: Name of tags to extract
-            
+
         Returns:
             List of matching tags
         """
-        return [tag.to_dict() for tag in self.tags if tag.tag_name == tag_name]
-    
+        return [self.tags[index].to_dict() for index in self._by_name.get(tag_name, ())]
+
     def extract_tags_by_value_type(self, value_type: type) -> List[Dict]:
         """
         Extract all tags with values of a specific type
-        
+
         Args:
-            value_type: Type of values to extract
-            
+            value_type: Type of values to extract (isinstance semantics, so int also matches bool)
+
         Returns:
-            List of matching tags
+            List of matching tags in document order
         """
-        return [tag.to_dict() for tag in self.tags if isinstance(tag.value, value_type)]
-    
+        matching = [
+            indexes for stored_type, indexes in self._by_value_type.items()
+            if issubclass(stored_type, value_type)
+        ]
+        ordered = matching[0] if len(matching) == 1 else heapq.merge(*matching)
+        return [self.tags[index].to_dict() for index in ordered]
+
     def get_tags_in_range(self, start: int, end: int) -> List[Dict]:
         """
         Get all tags within a position range
-        
+
         Args:
             start: Start position
             end: End position
-            
+
         Returns:
             List of tags within range
         """
-        return [
-            tag.to_dict() for tag in self.tags 
-            if start <= tag.position.get("start", 0) <= end
-        ]
+        first = bisect.bisect_left(self._starts, start)
+        last = bisect.bisect_right(self._starts, end)
+        return [self.tags[index].to_dict() for index in range(first, last)]
+
 
 def create_asl_tag(
     tag_name: str,
@@ -179,12 +373,12 @@ def create_asl_tag(
 ) -> Dict:
     """
     Create a new ASL tag
-    
+
     Args:
         tag_name: Name of the tag
         value: Tag value
         position: Optional position information
-        
+
     Returns:
         Dictionary containing tag data
     """
@@ -198,11 +392,11 @@ if __name__ == "__main__":
     This is a test content with {mental_state: 'focused', certainty_level: 0.85}
     and another tag {emotion_tone: 'neutral', context_id: 'conv_123'}
     """
-    
+
     # Create parser and parse content
     parser = ASLParser()
     tags = parser.parse(content)
-    
+
     # Print parsed tags
     for tag in tags:
         print(f"Found tag: {tag}")
@@ -0,0 +1,51 @@
+"""
+Bounded histories for the agent bus and the monitor
+
+BoundedHistory and HistoryPolicy come from introspective_parser_module when
+it can be imported (the package needs pydantic). Without it a deque-backed
+fallback with the same append/latest/clear surface keeps the histories
+bounded by capacity - without time retention and without spill to disk.
+"""
+
+import itertools
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+try:
+    from introspective_parser_module.bounded_history import BoundedHistory, HistoryPolicy
+    BOUNDED_HISTORY_AVAILABLE = True
+except ImportError:
+    BOUNDED_HISTORY_AVAILABLE = False
+
+    class BoundedHistory(deque):
+        """Ohraničená história bez retencie a spillu - kruhový buffer nad deque"""
+
+        def __init__(self, capacity: int = 1000):
+            if capacity < 1:
+                raise ValueError("capacity must be at least 1")
+            super().__init__(maxlen=capacity)
+
+        @property
+        def capacity(self) -> int:
+            return self.maxlen
+
+        def latest(self, limit: Optional[int] = None) -> List[Any]:
+            """Posledných `limit` záznamov (všetky pre None/0)"""
+            if not limit or limit >= len(self):
+                return list(self)
+            return list(itertools.islice(reversed(self), limit))[::-1]
+
+        def to_list(self) -> List[Any]:
+            return list(self)
+
+    @dataclass
+    class HistoryPolicy:
+        """Konfigurácia ohraničených histórií; max_age_seconds a spill_dir sa bez balíka ignorujú"""
+        capacity: int = 1000
+        max_age_seconds: Optional[float] = None
+        spill_dir: Optional[str] = None
+
+        def create(self, name: str, capacity: Optional[int] = None,
+                   serializer: Optional[Callable[[Any], Any]] = None) -> BoundedHistory:
+            return BoundedHistory(capacity or self.capacity)
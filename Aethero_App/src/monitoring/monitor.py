@@ -7,6 +7,8 @@ from dataclasses import dataclass
 import psutil
 import os
 
+from ..history import BoundedHistory, HistoryPolicy
+
 @dataclass
 class SystemMetrics:
     cpu_percent: float
@@ -50,10 +52,12 @@ class AgentMetrics:
         }
 
 class AetheroMonitor:
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(self, logger: Optional[logging.Logger] = None,
+                 history_policy: Optional[HistoryPolicy] = None):
         self.logger = logger or logging.getLogger('aethero_monitor')
         self.agent_metrics: Dict[str, AgentMetrics] = {}
-        self.system_metrics: List[SystemMetrics] = []
+        self.history_policy = history_policy or HistoryPolicy()
+        self.system_metrics: BoundedHistory[SystemMetrics] = self.history_policy.create("system_metrics")
         self.alert_thresholds = {
             "cpu_percent": 80.0,
             "memory_percent": 80.0,
@@ -114,10 +118,7 @@ class AetheroMonitor:
 
     def get_system_metrics(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get system metrics history."""
-        metrics = self.system_metrics
-        if limit:
-            metrics = metrics[-limit:]
-        return [m.to_dict() for m in metrics]
+        return [m.to_dict() for m in self.system_metrics.latest(limit)]
 
     def get_agent_metrics(self, agent_id: Optional[str] = None) -> Dict[str, Any]:
         """Get metrics for a specific agent or all agents."""
@@ -1,12 +1,29 @@
 from fastapi import FastAPI, WebSocket, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from introspective_parser_module.parser import ASLMetaParser
-from introspective_parser_module.metrics import CognitiveMetricsAnalyzer
-from introspective_parser_module.reflection_agent import AetheroReflectionAgent
+from typing import Any, AsyncIterator, Callable, Dict, List, Literal, Optional
+from introspective_parser_module import __version__ as cognitive_engine_version
+from introspective_parser_module.engines import get_shared_engines
+from introspective_parser_module.executor import (
+    CognitiveExecutor,
+    ExecutorSaturatedError,
+    run_parse_job,
+    run_incremental_parse_job,
+    run_metrics_job,
+    run_reflection_job
+)
+from introspective_parser_module.result_cache import MISS, ResultCache
+from introspective_parser_module.tag_query import TagQuery, TagQueryEngine
+from introspective_parser_module.tag_store import export_row
+from redis_config import get_redis_client
 from crewai.team_api import router as crewai_router
 import asyncio
+from contextlib import asynccontextmanager
+import json
 import logging
 import traceback
 from datetime import datetime
@@ -30,12 +47,80 @@ request_stats = {
     "parse_requests": 0,
     "metrics_requests": 0,
     "reflect_requests": 0,
+    "batch_requests": 0,
+    "batch_documents": 0,
+    "tag_query_requests": 0,
     "health_checks": 0,
     "errors": 0,
+    "rejected_requests": 0,
     "start_time": datetime.now()
 }
 
+# CPU-bound work runs inline for small payloads, otherwise on the configured worker pool
+cognitive_executor = CognitiveExecutor.from_env()
+
+# Repeated documents are served from a content-addressed cache (local LRU + optional Redis tier)
+result_cache = ResultCache.from_env(shared=get_redis_client(), version=cognitive_engine_version)
+
+# Indexed queries over the columnar tag store (AETHERO_TAG_STORE_DIR)
+tag_query_engine = TagQueryEngine.from_env()
+
+# Shared, pre-warmed cognitive engines - each request works on its own lightweight session
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_shared_engines()
+    logger.info("Cognitive engines pre-warmed")
+    yield
+    cognitive_executor.shutdown()
+
+def service_unavailable(error: ExecutorSaturatedError) -> HTTPException:
+    """503 with Retry-After when the cognitive job queue is full"""
+    request_stats["rejected_requests"] += 1
+    logger.warning(str(error))
+    return HTTPException(
+        status_code=503,
+        detail="Cognitive processing queue is full, retry later",
+        headers={"Retry-After": str(error.retry_after_seconds)}
+    )
+
+async def run_cached_job(kind: str, job: Callable[[str], Any], text: str) -> Any:
+    """Cached result for the document, or run the job and cache its JSON-ready result"""
+    key = result_cache.key(kind, text)
+    result = result_cache.get(key)
+    if result is MISS:
+        result = jsonable_encoder(await cognitive_executor.run(job, text))
+        result_cache.set(key, result)
+    return result
+
+def parse_response(result: dict) -> dict:
+    return {"parsed_data": result, "status": "success"}
+
+def metrics_response(report, data: str) -> dict:
+    # If no valid tags were found, create a basic analysis
+    if report is None:
+        logger.warning("No valid cognitive tags found, creating basic analysis")
+        return {
+            "analysis_report": {
+                "message": "No cognitive tags detected in input text",
+                "basic_analysis": {
+                    "text_length": len(data),
+                    "timestamp": datetime.now().isoformat()
+                }
+            },
+            "status": "basic_analysis"
+        }
+    return {"analysis_report": report, "status": "success"}
+
+def reflect_response(reflection_result: dict, context: str) -> dict:
+    return {
+        "reflection_result": reflection_result,
+        "context": context,
+        "timestamp": datetime.now().isoformat(),
+        "status": "success"
+    }
+
 app = FastAPI(
+    lifespan=lifespan,
     title="Aethero Cognitive Flow API",
     description="Advanced cognitive parsing and introspective analysis system",
     version="1.0.0",
@@ -91,11 +176,14 @@ async def log_requests(request: Request, call_next):
 # Pydantic models for request validation
 class ParseRequest(BaseModel):
     text: str
+    # Stable id of an edited document - resubmissions only re-parse changed lines
+    document_id: Optional[str] = None
     
     class Config:
         schema_extra = {
             "example": {
-                "text": "[@cognitive_load:7 @certainty:0.85 @mental_state:focused @emotion:analytical] This is a test of ASL parsing."
+                "text": "[@cognitive_load:7 @certainty:0.85 @mental_state:focused @emotion:analytical] This is a test of ASL parsing.",
+                "document_id": "dashboard-session-notes"
             }
         }
 
@@ -121,6 +209,34 @@ class ReflectRequest(BaseModel):
             }
         }
 
+class TagQueryRequest(BaseModel):
+    mental_states: Optional[List[str]] = None
+    emotion_tones: Optional[List[str]] = None
+    temporal_contexts: Optional[List[str]] = None
+    # Ranges are half-open: since/min_* inclusive, until/max_* exclusive
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    min_cognitive_load: Optional[int] = None
+    max_cognitive_load: Optional[int] = None
+    min_certainty: Optional[float] = None
+    max_certainty: Optional[float] = None
+    aeth_mem_link: Optional[str] = None
+    result: Literal["tags", "metrics", "count"] = "tags"
+    limit: int = 100
+    newest_first: bool = False
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "mental_states": ["focused"],
+                "emotion_tones": ["analytical"],
+                "max_certainty": 0.4,
+                "since": "2025-06-01T00:00:00",
+                "aeth_mem_link": "aeth_mem_0042",
+                "result": "metrics"
+            }
+        }
+
 # Response models
 class HealthResponse(BaseModel):
     status: str
@@ -156,14 +272,19 @@ def read_root():
           description="Parse and validate ASL (Aethero Semantic Language) text with cognitive pattern recognition",
           response_model=ParseResponse,
           tags=["Cognitive Processing"])
-def parse_asl(request: ParseRequest):
+async def parse_asl(request: ParseRequest):
     try:
         request_stats["parse_requests"] += 1
         logger.info(f"Parsing request received: {len(request.text)} characters")
-        parser = ASLMetaParser()
-        result = parser.parse_and_validate(request.text)
+        if request.document_id:
+            # The line cache lives in this process, so incremental parsing bypasses the worker pool
+            result = await run_in_threadpool(run_incremental_parse_job, request.document_id, request.text)
+        else:
+            result = await run_cached_job("parse", run_parse_job, request.text)
         logger.info("Parse completed successfully")
-        return {"parsed_data": result, "status": "success"}
+        return parse_response(result)
+    except ExecutorSaturatedError as e:
+        raise service_unavailable(e)
     except Exception as e:
         request_stats["errors"] += 1
         logger.error(f"Parse error: {str(e)}")
@@ -175,42 +296,17 @@ def parse_asl(request: ParseRequest):
           description="Generate comprehensive introspective cognitive analysis and consciousness coherence metrics",
           response_model=MetricsResponse,
           tags=["Cognitive Processing"])
-def analyze_metrics(request: MetricsRequest):
+async def analyze_metrics(request: MetricsRequest):
     try:
         request_stats["metrics_requests"] += 1
         logger.info(f"Metrics analysis request received: {len(request.data)} characters")
         
-        # First parse the text to get cognitive tags
-        parser = ASLMetaParser()
-        parsed_result = parser.parse_and_validate(request.data)
-        
-        # Extract cognitive tags from parsed result
-        cognitive_tags = []
-        if parsed_result and 'parsing_results' in parsed_result:
-            for result in parsed_result['parsing_results']:
-                if result.get('is_valid') and result.get('validated_model'):
-                    cognitive_tags.append(result['validated_model'])
-        
-        # If no valid tags found, create a basic analysis
-        if not cognitive_tags:
-            logger.warning("No valid cognitive tags found, creating basic analysis")
-            return {
-                "analysis_report": {
-                    "message": "No cognitive tags detected in input text",
-                    "basic_analysis": {
-                        "text_length": len(request.data),
-                        "timestamp": datetime.now().isoformat()
-                    }
-                },
-                "status": "basic_analysis"
-            }
-        
-        # Generate analysis with cognitive tags
-        analyzer = CognitiveMetricsAnalyzer()
-        report = analyzer.generate_introspective_report(cognitive_tags)
+        # Parse the text and analyze its valid cognitive tags
+        report = await run_cached_job("metrics", run_metrics_job, request.data)
         logger.info("Metrics analysis completed successfully")
-        
-        return {"analysis_report": report, "status": "success"}
+        return metrics_response(report, request.data)
+    except ExecutorSaturatedError as e:
+        raise service_unavailable(e)
     except Exception as e:
         request_stats["errors"] += 1
         logger.error(f"Metrics analysis error: {str(e)}")
@@ -222,30 +318,148 @@ def analyze_metrics(request: MetricsRequest):
           description="Generate deep introspective analysis using AetheroReflectionAgent for consciousness evolution tracking",
           response_model=ReflectResponse,
           tags=["Cognitive Processing"])
-def reflect_analysis(request: ReflectRequest):
+async def reflect_analysis(request: ReflectRequest):
     try:
         request_stats["reflect_requests"] += 1
         logger.info(f"Reflection request received: {len(request.text)} characters, context: {request.context}")
         
-        # Initialize reflection agent
-        reflection_agent = AetheroReflectionAgent()
-        
-        # Perform introspective analysis using the correct method signature
-        reflection_result = reflection_agent.reflect_on_input(request.text)
+        # Request-scoped reflection agent on top of the shared engines
+        reflection_result = await run_cached_job("reflect", run_reflection_job, request.text)
         
         logger.info("Reflection analysis completed successfully")
-        return {
-            "reflection_result": reflection_result,
-            "context": request.context,
-            "timestamp": datetime.now().isoformat(),
-            "status": "success"
-        }
+        return reflect_response(reflection_result, request.context)
+    except ExecutorSaturatedError as e:
+        raise service_unavailable(e)
     except Exception as e:
         request_stats["errors"] += 1
         logger.error(f"Reflection error: {str(e)}")
         logger.error(traceback.format_exc())
         raise HTTPException(status_code=500, detail=f"Reflection error: {str(e)}")
 
+# Batch processing - JSON array / {"documents": [...]} or NDJSON in, NDJSON out as documents complete
+async def read_batch_documents(request: Request) -> List[Dict[str, Any]]:
+    """Normalize a batch body to [{"text": ..., "context": ...}, ...]"""
+    body = await request.body()
+    try:
+        if "ndjson" in request.headers.get("content-type", ""):
+            entries = [json.loads(line) for line in body.decode("utf-8").splitlines() if line.strip()]
+            default_context = "general"
+        else:
+            payload = json.loads(body or b"null")
+            if isinstance(payload, dict):
+                default_context = payload.get("context", "general")
+                payload = payload.get("documents")
+            else:
+                default_context = "general"
+            if not isinstance(payload, list):
+                raise ValueError("expected a JSON array or an object with a 'documents' array")
+            entries = payload
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid batch body: {str(e)}")
+
+    documents = []
+    for index, entry in enumerate(entries):
+        if isinstance(entry, dict):
+            text = entry.get("text", entry.get("data"))
+            context = entry.get("context", default_context)
+        else:
+            text, context = entry, default_context
+        if not isinstance(text, str):
+            raise HTTPException(status_code=400, detail=f"Document {index} has no 'text' string")
+        documents.append({"text": text, "context": context})
+    return documents
+
+async def stream_batch(kind: str, job: Callable[[str], Any], documents: List[Dict[str, Any]],
+                       build_response: Callable[[Any, Dict[str, Any]], dict]) -> AsyncIterator[str]:
+    """One NDJSON line per document - cached documents first, the rest in completion order"""
+    pending = []
+    for index, document in enumerate(documents):
+        document["cache_key"] = result_cache.key(kind, document["text"])
+        result = result_cache.get(document["cache_key"])
+        if result is MISS:
+            pending.append(index)
+        else:
+            yield json.dumps({"index": index, **build_response(result, document)}, ensure_ascii=False) + "\n"
+
+    texts = [documents[index]["text"] for index in pending]
+    async for position, result, error in cognitive_executor.map_unordered(job, texts):
+        index = pending[position]
+        if error is None:
+            result = jsonable_encoder(result)
+            result_cache.set(documents[index]["cache_key"], result)
+            line = {"index": index, **build_response(result, documents[index])}
+        elif isinstance(error, ExecutorSaturatedError):
+            line = {"index": index, "status": "rejected", "error": str(error),
+                    "retry_after": error.retry_after_seconds}
+        else:
+            request_stats["errors"] += 1
+            logger.error(f"Batch document {index} error: {str(error)}")
+            line = {"index": index, "status": "error", "error": str(error)}
+        yield json.dumps(jsonable_encoder(line), ensure_ascii=False) + "\n"
+
+async def batch_response(request: Request, kind: str, job: Callable[[str], Any],
+                         build_response: Callable[[Any, Dict[str, Any]], dict]) -> StreamingResponse:
+    documents = await read_batch_documents(request)
+    try:
+        cognitive_executor.check_capacity()
+    except ExecutorSaturatedError as e:
+        raise service_unavailable(e)
+    request_stats["batch_requests"] += 1
+    request_stats["batch_documents"] += len(documents)
+    logger.info(f"Batch request received: {len(documents)} documents")
+    return StreamingResponse(stream_batch(kind, job, documents, build_response), media_type="application/x-ndjson")
+
+@app.post("/parse/batch",
+          summary="Parse ASL Documents in Batch",
+          description="Parse many documents in parallel; results are streamed as NDJSON lines tagged with the document index",
+          tags=["Cognitive Processing"])
+async def parse_batch(request: Request):
+    return await batch_response(request, "parse", run_parse_job, lambda result, document: parse_response(result))
+
+@app.post("/metrics/batch",
+          summary="Analyze Cognitive Metrics in Batch",
+          description="Analyze many documents in parallel; results are streamed as NDJSON lines tagged with the document index",
+          tags=["Cognitive Processing"])
+async def metrics_batch(request: Request):
+    return await batch_response(request, "metrics", run_metrics_job,
+                                lambda report, document: metrics_response(report, document["text"]))
+
+@app.post("/reflect/batch",
+          summary="Introspective Reflection in Batch",
+          description="Reflect on many documents in parallel; results are streamed as NDJSON lines tagged with the document index",
+          tags=["Cognitive Processing"])
+async def reflect_batch(request: Request):
+    return await batch_response(request, "reflect", run_reflection_job,
+                                lambda result, document: reflect_response(result, document["context"]))
+
+def run_tag_query(request: TagQueryRequest) -> dict:
+    """Rows from the tag indexes, then tags, metrics or just the count"""
+    query = TagQuery(**request.dict(exclude={"result", "limit", "newest_first"}))
+    rows = tag_query_engine.rows(query)
+    response = {"total_matches": len(rows), "result": request.result, "status": "success"}
+    if request.result == "tags":
+        tags = tag_query_engine.take(rows, request.limit, request.newest_first)
+        response["tags"] = [export_row(tag) for tag in tags]
+    elif request.result == "metrics":
+        response["metrics"] = tag_query_engine.analyze_rows(rows).to_dict()
+    return response
+
+@app.post("/tags/query",
+          summary="Query Stored Cognitive Tags",
+          description="Filter stored tags through bitmap, sorted and hash indexes; returns the tags, metrics over them or their count",
+          tags=["Cognitive Storage"])
+async def query_tags(request: TagQueryRequest):
+    try:
+        request_stats["tag_query_requests"] += 1
+        return await run_in_threadpool(run_tag_query, request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        request_stats["errors"] += 1
+        logger.error(f"Tag query error: {str(e)}")
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"Tag query error: {str(e)}")
+
 @app.get("/health", 
          summary="Health Check", 
          description="Check API health status with comprehensive system metrics and uptime information",
@@ -279,11 +493,15 @@ def get_system_metrics():
                 "parse": request_stats["parse_requests"],
                 "metrics": request_stats["metrics_requests"],
                 "reflect": request_stats["reflect_requests"],
+                "batch": request_stats["batch_requests"],
                 "health": request_stats["health_checks"]
             },
             "error_rate": request_stats["errors"] / max(request_stats["total_requests"], 1),
             "average_requests_per_minute": request_stats["total_requests"] / max(uptime.total_seconds() / 60, 1)
         },
+        "execution": cognitive_executor.get_stats(),
+        "result_cache": result_cache.get_stats(),
+        "tag_indexes": tag_query_engine.get_stats(),
         "timestamp": datetime.now().isoformat()
     }
 
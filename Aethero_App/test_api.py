@@ -12,6 +12,15 @@ from syntaxator_fastapi import app
 # Create test client
 client = TestClient(app)
 
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    """Empty result cache so that earlier requests are not served from it"""
+    import syntaxator_fastapi
+    from introspective_parser_module.result_cache import ResultCache
+    cache = ResultCache()
+    monkeypatch.setattr(syntaxator_fastapi, "result_cache", cache)
+    return cache
+
 class TestAetheroAPI:
     """Unit tests for Aethero Cognitive Flow API"""
     
@@ -52,7 +61,19 @@ class TestAetheroAPI:
         assert data["status"] == "success"
         assert "parsed_data" in data
         assert "session_id" in data["parsed_data"]
-    
+
+    def test_inline_dialect_is_parsed_and_analyzed(self, fresh_cache):
+        """Test that [@key:value] blocks reach validation and metrics"""
+        text = "[@cognitive_load:6 @certainty:0.8 @mental_state:focused @emotion:analytical] Inline dialect check."
+        parsed = client.post("/parse", json={"text": text}).json()["parsed_data"]
+        assert parsed["asl_blocks_found"] == 1
+        assert parsed["parsing_results"][0]["is_valid"]
+        assert parsed["parsing_results"][0]["validated_model"]["thought_stream"] == "Inline dialect check."
+
+        metrics = client.post("/metrics", json={"data": text}).json()
+        assert metrics["status"] == "success"
+        assert "consciousness_coherence_rate" in metrics["analysis_report"]
+
     def test_parse_endpoint_invalid_input(self):
         """Test the parse endpoint with invalid input"""
         test_data = {
@@ -180,6 +201,281 @@ class TestAetheroAPIIntegration:
         assert reflect_result["status"] == "success"
         assert reflect_result["context"] == "pipeline_test"
 
+class TestSharedEngines:
+    """Shared engines with request-scoped parser sessions"""
+    
+    def test_parse_requests_do_not_add_log_handlers(self):
+        """Repeated /parse calls reuse the pre-warmed parser logger"""
+        import logging
+        client.post("/parse", json={"text": "# [ASL] mental_state: focused"})
+        handler_count = len(logging.getLogger("ASLMetaParser").handlers)
+        for _ in range(5):
+            client.post("/parse", json={"text": "# [ASL] mental_state: focused"})
+        assert len(logging.getLogger("ASLMetaParser").handlers) == handler_count
+    
+    def test_concurrent_parse_requests_are_isolated(self):
+        """Each request only sees its own validated blocks"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def parse(count):
+            text = "\n".join(f"# [ASL] thought_stream: request {count} line {i}" for i in range(count))
+            return count, client.post("/parse", json={"text": text}).json()["parsed_data"]
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(parse, [1, 2, 3, 4, 5, 6, 7, 8] * 3))
+        
+        for count, parsed in results:
+            assert len(parsed["validated_blocks"]) == count
+            assert all(f"request {count} " in block["thought_stream"] for block in parsed["validated_blocks"])
+
+class TestExecutionBackend:
+    """Worker pool dispatch and back-pressure for CPU-bound endpoints"""
+    
+    def test_large_payload_runs_on_pool(self, monkeypatch, fresh_cache):
+        """Payloads above the inline threshold are dispatched to the pool"""
+        import syntaxator_fastapi
+        from introspective_parser_module.executor import CognitiveExecutor
+        executor = CognitiveExecutor(max_workers=2, inline_max_chars=64)
+        monkeypatch.setattr(syntaxator_fastapi, "cognitive_executor", executor)
+        
+        client.post("/parse", json={"text": "# [ASL] mental_state: focused"})
+        text = "\n".join(f"# [ASL] thought_stream: pooled line {i}" for i in range(10))
+        response = client.post("/parse", json={"text": text})
+        executor.shutdown()
+        
+        assert response.status_code == 200
+        assert len(response.json()["parsed_data"]["validated_blocks"]) == 10
+        assert executor.threadpool_jobs == 1
+        assert executor.pooled_jobs == 1
+        assert executor.inline_jobs == 0
+    
+    def test_small_jobs_leave_the_event_loop(self):
+        """Small jobs run off the event loop thread; only the inline backend runs on it"""
+        import asyncio
+        import threading
+        from introspective_parser_module.executor import CognitiveExecutor, ExecutionBackend
+        
+        async def job_thread(executor):
+            loop_thread = threading.get_ident()
+            return loop_thread, await executor.run(lambda text: threading.get_ident(), "small")
+        
+        threaded = CognitiveExecutor(max_workers=1)
+        loop_thread, job_thread_id = asyncio.run(job_thread(threaded))
+        threaded.shutdown()
+        assert job_thread_id != loop_thread
+        assert (threaded.threadpool_jobs, threaded.inline_jobs, threaded.pooled_jobs) == (1, 0, 0)
+        
+        inline = CognitiveExecutor(ExecutionBackend.INLINE)
+        loop_thread, job_thread_id = asyncio.run(job_thread(inline))
+        assert job_thread_id == loop_thread
+        assert inline.get_stats()["inline_jobs"] == 1
+    
+    def test_saturated_queue_returns_503(self, monkeypatch, fresh_cache):
+        """A full job queue is answered with 503 and Retry-After"""
+        import syntaxator_fastapi
+        from introspective_parser_module.executor import CognitiveExecutor
+        executor = CognitiveExecutor(max_workers=1, inline_max_chars=0, max_pending=2, retry_after_seconds=3)
+        executor.pending = executor.max_pending
+        monkeypatch.setattr(syntaxator_fastapi, "cognitive_executor", executor)
+        
+        response = client.post("/parse", json={"text": "# [ASL] mental_state: focused"})
+        
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+        assert executor.rejected_jobs == 1
+        assert client.get("/metrics").json()["execution"]["rejected_jobs"] == 1
+    
+    def test_process_backend_matches_inline(self):
+        """Process pool workers produce the same parse result as inline execution"""
+        import asyncio
+        from introspective_parser_module.executor import CognitiveExecutor, ExecutionBackend, run_parse_job
+        text = "\n".join(f"# [ASL] thought_stream: process line {i} mental_state: focused" for i in range(20))
+        executor = CognitiveExecutor(ExecutionBackend.PROCESS, max_workers=1, inline_max_chars=0)
+        try:
+            pooled = asyncio.run(executor.run(run_parse_job, text))
+        finally:
+            executor.shutdown()
+        inline = run_parse_job(text)
+        
+        assert executor.pooled_jobs == 1
+        assert [block["thought_stream"] for block in pooled["validated_blocks"]] == \
+            [block["thought_stream"] for block in inline["validated_blocks"]]
+        assert pooled["failed_validations"] == inline["failed_validations"]
+
+class TestBatchEndpoints:
+    """NDJSON-streamed batch processing"""
+    
+    @staticmethod
+    def read_lines(response):
+        import json
+        return [json.loads(line) for line in response.text.splitlines() if line]
+    
+    def test_parse_batch_json_array(self, monkeypatch, fresh_cache):
+        """Every document gets one result line with its index"""
+        import syntaxator_fastapi
+        from introspective_parser_module.executor import CognitiveExecutor
+        executor = CognitiveExecutor(max_workers=4, inline_max_chars=0)
+        monkeypatch.setattr(syntaxator_fastapi, "cognitive_executor", executor)
+        documents = [
+            "\n".join(f"# [ASL] thought_stream: doc {count} line {i}" for i in range(count))
+            for count in range(1, 9)
+        ]
+        
+        response = client.post("/parse/batch", json={"documents": documents})
+        executor.shutdown()
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = self.read_lines(response)
+        assert sorted(line["index"] for line in lines) == list(range(8))
+        for line in lines:
+            assert line["status"] == "success"
+            assert len(line["parsed_data"]["validated_blocks"]) == line["index"] + 1
+        assert executor.pooled_jobs == 8
+    
+    def test_batch_accepts_ndjson(self):
+        """NDJSON bodies with strings or objects are accepted"""
+        body = "\n".join([
+            '"# [ASL] mental_state: focused"',
+            '{"text": "# [ASL] mental_state: calm", "context": "ndjson_test"}',
+            ""
+        ])
+        response = client.post("/reflect/batch", content=body,
+                               headers={"Content-Type": "application/x-ndjson"})
+        
+        assert response.status_code == 200
+        lines = sorted(self.read_lines(response), key=lambda line: line["index"])
+        assert [line["index"] for line in lines] == [0, 1]
+        assert all("status" in line for line in lines)
+    
+    def test_metrics_batch_without_tags(self):
+        """Documents without tags get the same basic analysis as /metrics"""
+        response = client.post("/metrics/batch", json=["plain text", "more plain text"])
+        
+        lines = self.read_lines(response)
+        assert len(lines) == 2
+        assert all(line["status"] == "basic_analysis" for line in lines)
+    
+    def test_invalid_batch_body(self):
+        """Bodies without a document array are rejected"""
+        assert client.post("/parse/batch", json={"text": "single"}).status_code == 400
+        assert client.post("/parse/batch", json=[{"context": "no text"}]).status_code == 400
+    
+    def test_saturated_batch_returns_503(self, monkeypatch):
+        """A batch is rejected up front when the job queue is full"""
+        import syntaxator_fastapi
+        from introspective_parser_module.executor import CognitiveExecutor
+        executor = CognitiveExecutor(max_workers=1, max_pending=1, retry_after_seconds=2)
+        executor.pending = executor.max_pending
+        monkeypatch.setattr(syntaxator_fastapi, "cognitive_executor", executor)
+        
+        response = client.post("/parse/batch", json=["# [ASL] mental_state: focused"])
+        
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "2"
+
+class TestResultCache:
+    """Content-addressed cache in front of the cognitive engines"""
+    
+    def test_repeated_document_skips_processing(self, monkeypatch, fresh_cache):
+        """A resent document is served from the cache without running a job"""
+        import syntaxator_fastapi
+        from introspective_parser_module.executor import run_parse_job
+        calls = []
+        
+        def counting_parse_job(text):
+            calls.append(text)
+            return run_parse_job(text)
+        
+        monkeypatch.setattr(syntaxator_fastapi, "run_parse_job", counting_parse_job)
+        text = "# [ASL] thought_stream: cached document mental_state: focused"
+        first = client.post("/parse", json={"text": text}).json()
+        second = client.post("/parse", json={"text": text}).json()
+        
+        assert len(calls) == 1
+        assert first == second
+        stats = client.get("/metrics").json()["result_cache"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+    
+    def test_batch_uses_cache(self, fresh_cache):
+        """Documents cached by single requests are not reprocessed in a batch"""
+        client.post("/parse", json={"text": "# [ASL] thought_stream: batch cached"})
+        response = client.post("/parse/batch", json=[
+            "# [ASL] thought_stream: batch cached",
+            "# [ASL] thought_stream: batch new"
+        ])
+        
+        assert len(response.text.splitlines()) == 2
+        assert fresh_cache.hits == 1
+        assert fresh_cache.misses == 2
+    
+    def test_kinds_are_cached_separately(self, fresh_cache):
+        """The same text cached for /parse is not returned by /metrics"""
+        client.post("/parse", json={"text": "plain text"})
+        response = client.post("/metrics", json={"data": "plain text"})
+        
+        assert response.json()["status"] == "basic_analysis"
+        assert fresh_cache.hits == 0
+
+class TestIncrementalParse:
+    """/parse with a document_id re-parses only edited lines"""
+    
+    def test_resubmitted_document_reuses_lines(self):
+        from syntaxator_fastapi import get_shared_engines
+        lines = [f"# [ASL] thought_stream: dashboard line {i} mental_state: focused" for i in range(50)]
+        first = client.post("/parse", json={"text": "\n".join(lines), "document_id": "api-incremental"})
+        lines[25] = "# [ASL] thought_stream: edited dashboard line mental_state: calm"
+        second = client.post("/parse", json={"text": "\n".join(lines), "document_id": "api-incremental"})
+        
+        assert first.status_code == second.status_code == 200
+        session = get_shared_engines().incremental_parser.get_session("api-incremental")
+        assert session.last_reparsed_lines == 1
+        blocks = second.json()["parsed_data"]["validated_blocks"]
+        assert len(blocks) == 50
+        assert blocks[25]["thought_stream"] == "edited dashboard line"
+
+class TestTagQuery:
+    """/tags/query answers from the indexes over the columnar tag store"""
+    
+    @pytest.fixture
+    def stored_tags(self, monkeypatch, tmp_path):
+        import syntaxator_fastapi
+        from introspective_parser_module.compact_tags import CompactCognitiveTag
+        from introspective_parser_module.tag_query import TagQueryEngine
+        from introspective_parser_module.tag_store import ColumnarTagStore
+        tags = [
+            CompactCognitiveTag(f"stored thought {i}", "focused" if i % 2 else "calm", "analytical",
+                                1 + i % 10, "present", i / 40, f"aeth_mem_{i % 4}", "transparency")
+            for i in range(40)
+        ]
+        ColumnarTagStore(tmp_path / "tags").append(tags)
+        monkeypatch.setattr(syntaxator_fastapi, "tag_query_engine", TagQueryEngine(tmp_path / "tags"))
+        return tags
+    
+    def test_filters_tags(self, stored_tags):
+        response = client.post("/tags/query", json={
+            "mental_states": ["focused"], "max_certainty": 0.4, "aeth_mem_link": "aeth_mem_1"
+        })
+        assert response.status_code == 200
+        data = response.json()
+        expected = [tag.thought_stream for tag in stored_tags
+                    if tag.mental_state.value == "focused" and tag.certainty_level < 0.4 and tag.aeth_mem_link == "aeth_mem_1"]
+        assert data["total_matches"] == len(expected)
+        assert [tag["thought_stream"] for tag in data["tags"]] == expected
+    
+    def test_metrics_and_count(self, stored_tags):
+        metrics = client.post("/tags/query", json={"emotion_tones": ["analytical"], "result": "metrics"}).json()
+        assert metrics["total_matches"] == 40
+        assert 0.0 <= metrics["metrics"]["overall_cognitive_health"] <= 1.0
+        count = client.post("/tags/query", json={"min_cognitive_load": 9, "result": "count"}).json()
+        assert count["total_matches"] == 8
+        assert "tags" not in count
+    
+    def test_unknown_enum_value_is_rejected(self, stored_tags):
+        response = client.post("/tags/query", json={"mental_states": ["sleepy"]})
+        assert response.status_code == 400
+
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__, "-v"])
@@ -0,0 +1,67 @@
+import pytest
+import sys
+import os
+
+# Add current directory to path to import keyword_lexicon
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from keyword_lexicon import KeywordLexicon
+
+
+@pytest.fixture
+def lexicon():
+    return KeywordLexicon({
+        "vcs": ["git", "git commit", "git push"],
+        "fix": ["fix", "bug"],
+        "time": ["is", "going to"],
+    }, whole_words={"time"})
+
+
+class TestKeywordLexicon:
+    """Unit tests for the shared compiled keyword lexicon"""
+
+    def test_word_start_matching(self, lexicon):
+        """Keywords match at word starts, suffixes allowed, case-insensitive"""
+        assert lexicon.terms_in("Fixed the BUGS") == {"fix": {"fix", "bug"}}
+        assert lexicon.terms_in("prefix debug") == {}
+
+    def test_overlapping_terms(self, lexicon):
+        """A longer term and its prefixes are all counted"""
+        assert lexicon.terms_in("git commit -m 'x'") == {"vcs": {"git", "git commit"}}
+        assert lexicon.scores("git push; git commit")["vcs"] == 3
+
+    def test_whole_word_categories(self, lexicon):
+        """whole_words categories must also end on a word boundary"""
+        assert lexicon.scores("this issue")["time"] == 0
+        assert lexicon.scores("it is going to rain")["time"] == 2
+        assert lexicon.scores("going together")["time"] == 0
+
+    def test_scores_cover_all_categories(self, lexicon):
+        """Categories without a hit score zero"""
+        assert lexicon.scores("nothing here") == {"vcs": 0, "fix": 0, "time": 0}
+
+    def test_classify_priority(self, lexicon):
+        """First category in priority order wins"""
+        assert lexicon.classify("git fix") == "vcs"
+        assert lexicon.classify("git fix", order=["fix", "vcs"]) == "fix"
+        assert lexicon.classify("plain text", default="general") == "general"
+
+    def test_batch_matches_single(self, lexicon):
+        """Batch API gives the same result as one call per text"""
+        texts = ["git push", "", "it is a bug", "prefix", "GIT COMMIT fix", "is"]
+        assert lexicon.terms_many(texts) == [lexicon.terms_in(text) for text in texts]
+        assert lexicon.scores_many(texts) == [lexicon.scores(text) for text in texts]
+        assert lexicon.classify_many(texts, default="none") == [lexicon.classify(text, default="none") for text in texts]
+        assert lexicon.terms_many([]) == []
+
+    def test_unicode_keywords(self):
+        """Slovak keywords with diacritics"""
+        lexicon = KeywordLexicon({"radosť": ["šťastný", "veselý"]})
+        assert lexicon.scores("Som ŠŤASTNÝ a veselý")["radosť"] == 2
+
+    def test_invalid_keyword(self):
+        """Empty or multi-line keywords are rejected"""
+        with pytest.raises(ValueError):
+            KeywordLexicon({"bad": ["a\nb"]})
+        with pytest.raises(ValueError):
+            KeywordLexicon({"bad": [" "]})
@@ -46,6 +46,54 @@ class TestASLParser(unittest.TestCase):
         self.assertIs(type_map['float_tag'], float)
         self.assertIs(type_map['bool_tag'], bool)
 
+    def test_line_numbers_and_shared_timestamp(self):
+        """Test line index and one timestamp per parse"""
+        content = "first {a: 1}\nsecond\nthird {b: 'x', c: true}\n{d: 2.5}"
+        tags = self.parser.parse(content)
+        self.assertEqual([tag['position']['line'] for tag in tags], [1, 3, 3, 4])
+        self.assertEqual(len({tag['timestamp'] for tag in tags}), 1)
+
+    def test_streamed_input_matches_string(self):
+        """Test that streams, bytes and mapped files parse like strings"""
+        import io
+        import tempfile
+        content = "intro {a: 1, b: 'two'}\n{}{c: false}\nlong {d: " + "x" * 50 + "}\n{open"
+        expected = [(t['tag_name'], t['value'], t['position']) for t in self.parser.parse(content)]
+
+        streamed = self.parser.iter_parse(io.StringIO(content), chunk_size=3)
+        self.assertEqual([(t['tag_name'], t['value'], t['position']) for t in streamed], expected)
+        encoded = self.parser.iter_parse(content.encode('utf-8'), chunk_size=5)
+        self.assertEqual([(t['tag_name'], t['value'], t['position']) for t in encoded], expected)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'doc.asl'
+            path.write_text(content, encoding='utf-8')
+            mapped = self.parser.parse_file(path, chunk_size=7)
+        self.assertEqual([(t['tag_name'], t['value'], t['position']) for t in mapped], expected)
+
+    def test_long_open_block_is_linear(self):
+        """Test that a block spanning many chunks is not re-copied per chunk"""
+        import io
+        import time
+        content = "{a: '" + "x" * 8_000_000 + "', b: 2}\n{c: 3}"
+        started = time.perf_counter()
+        tags = list(self.parser.iter_parse(io.StringIO(content), chunk_size=256))
+        elapsed = time.perf_counter() - started
+        self.assertEqual([(t['tag_name'], len(str(t['value']))) for t in tags], [('a', 8_000_000), ('b', 1), ('c', 1)])
+        # Re-copying the open block per chunk takes tens of seconds here
+        self.assertLess(elapsed, 3.0)
+
+    def test_indexed_queries(self):
+        """Test name, value type and range queries"""
+        content = "{a: 1, flag: true}\n{a: 'x'}\n{b: 2.0}"
+        self.parser.parse(content)
+        self.assertEqual([t['value'] for t in self.parser.extract_tags_by_name('a')], [1, 'x'])
+        # bool is an int subclass - order follows the document
+        self.assertEqual([t['tag_name'] for t in self.parser.extract_tags_by_value_type(int)], ['a', 'flag'])
+        self.assertEqual([t['value'] for t in self.parser.extract_tags_by_value_type(str)], ['x'])
+        self.assertEqual([t['tag_name'] for t in self.parser.get_tags_in_range(1, 19)], ['a'])
+        self.assertEqual(self.parser.extract_tags_by_name('missing'), [])
+
 class TestAgentConfigurations(unittest.TestCase):
     def setUp(self):
         self.config_dir = Path("config")
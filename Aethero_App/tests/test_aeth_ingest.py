@@ -3,7 +3,9 @@ Tests for the AetheroOS Memory Ingestion Agent
 """
 
 import os
+import sys
 import json
+import subprocess
 import tempfile
 import pytest
 from pathlib import Path
@@ -13,6 +15,10 @@ from src.aeth_ingest import (
     generate_tags,
     render_report,
     save_report,
+    ingest_bulk,
+    iter_bulk_records,
+    content_hash,
+    ContentDedupIndex,
     IngestionError,
     REPORTS_DIR
 )
@@ -112,6 +118,14 @@ class TestGenerateTags:
         assert tags["mental_state"] == "satisfied"
         assert tags["emotion_tone"] == "positive"
 
+    def test_fallback_without_lexicon(self, monkeypatch):
+        """Test that tags match when keyword_lexicon cannot be imported"""
+        texts = ["Simple test content", "Let's fix this ERROR", "prefix debug", "Build done, perfect",
+                 "failed to study the warning", ""]
+        expected = [generate_tags(text) for text in texts]
+        monkeypatch.setattr("src.aeth_ingest.TAG_LEXICON", None)
+        assert [generate_tags(text) for text in texts] == expected
+
 class TestRenderReport:
     def test_default_template(self, test_content, test_metadata):
         """Test rendering with default template"""
@@ -184,6 +198,244 @@ class TestSaveReport:
             # Restore permissions
             os.chmod(self.test_dir, 0o755)
 
+    def test_saved_report_is_searchable(self, test_content, test_metadata, tmp_path, monkeypatch):
+        """Test that save_report adds the report to the full-text index"""
+        from introspective_parser_module.text_index import CognitiveTextIndex
+        monkeypatch.setenv("AETHERO_TEXT_INDEX_PATH", str(tmp_path / "index.sqlite3"))
+        save_report(f"{test_content} about ministerial archives", test_metadata)
+        index = CognitiveTextIndex(tmp_path / "index.sqlite3")
+        hits = index.search('"ministerial archives"')
+        index.close()
+        assert [hit.ref for hit in hits] == [test_metadata["ref_code"]]
+        assert hits[0].metadata["mental_state"] == "focused"
+
+class TestBulkIngest:
+    @pytest.fixture(autouse=True)
+    def reports_dir(self, tmp_path, monkeypatch):
+        """Redirect reports and the search index into a temporary directory"""
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        monkeypatch.setattr("src.aeth_ingest.REPORTS_DIR", reports)
+        monkeypatch.setenv("AETHERO_TEXT_INDEX_PATH", str(tmp_path / "index.sqlite3"))
+        return reports
+
+    @pytest.fixture
+    def ndjson_file(self, tmp_path):
+        records = [{"content": f"Memory {i} about success", "ref_code": f"BULK-{i:03d}"} for i in range(10)]
+        records.append({"content": "   ", "ref_code": "BULK-EMPTY"})
+        records.append({"event": "deploy", "status": "done"})
+        path = tmp_path / "memories.ndjson"
+        path.write_text("\n".join(json.dumps(record) for record in records) + "\n\n", encoding="utf-8")
+        return path
+
+    def test_ndjson_bulk(self, ndjson_file, reports_dir, tmp_path):
+        """Test bulk ingestion of an NDJSON stream with small batches"""
+        stats = ingest_bulk(str(ndjson_file), tags=["bulk"], max_workers=1, batch_size=4, chunk_size=3)
+        assert stats["ingested"] == 11
+        assert stats["failed"] == 1 and "BULK-EMPTY" in stats["failures"][0]
+        assert stats["per_second"] > 0
+
+        metadata = json.loads((reports_dir / "BULK-007.json").read_text())
+        assert metadata["tags"] == ["bulk"]
+        assert metadata["inferred_tags"]["mental_state"] == "satisfied"
+        assert "Memory 7 about success" in (reports_dir / "BULK-007.md").read_text()
+        assert len(list(reports_dir.glob("*.md"))) == 11
+
+        from introspective_parser_module.text_index import CognitiveTextIndex
+        index = CognitiveTextIndex(tmp_path / "index.sqlite3")
+        assert index.count("success", kind="report") == 10
+        assert index.count("deploy") == 1
+        index.close()
+
+    def test_directory_and_glob_sources(self, tmp_path):
+        """Test expanding directories and glob patterns into input files"""
+        inputs = tmp_path / "inputs"
+        (inputs / "nested").mkdir(parents=True)
+        (inputs / "a.txt").write_text("First memory")
+        (inputs / "nested" / "b.md").write_text("Second memory")
+        (inputs / "ignored.bin").write_text("binary")
+        assert len(list(iter_bulk_records(str(inputs)))) == 2
+        assert [r["path"] for r in iter_bulk_records(str(inputs / "**" / "*.md"))] == [str(inputs / "nested" / "b.md")]
+
+    def test_process_pool(self, ndjson_file, reports_dir):
+        """Test that worker processes produce the same reports"""
+        stats = ingest_bulk(str(ndjson_file), max_workers=2, chunk_size=2)
+        assert stats["ingested"] == 11 and stats["workers"] == 2
+        assert (reports_dir / "BULK-000.md").exists()
+
+    def test_invalid_ref_codes_fail(self, tmp_path, reports_dir, test_metadata):
+        """Test that ref_codes which are not plain file names are reported as failures"""
+        bad = ["../escape", "nested/ref", "..", "back\\slash", 42, "x" * 129]
+        records = [{"content": f"Memory {i}", "ref_code": ref_code} for i, ref_code in enumerate(bad)]
+        records.append({"content": "Valid memory", "ref_code": "AETH-MEM-2025.v2_1"})
+        path = tmp_path / "refs.ndjson"
+        path.write_text("\n".join(json.dumps(record) for record in records), encoding="utf-8")
+
+        stats = ingest_bulk(str(path), max_workers=1, deduplicate=False)
+        assert stats["ingested"] == 1 and stats["failed"] == len(bad)
+        assert all("Invalid ref_code" in failure for failure in stats["failures"])
+        assert sorted(p.name for p in reports_dir.iterdir() if p.suffix == ".md") == ["AETH-MEM-2025.v2_1.md"]
+        assert not (tmp_path / "escape.md").exists()
+
+        with pytest.raises(IngestionError):
+            save_report("content", {**test_metadata, "ref_code": "../escape"})
+        assert not (tmp_path / "escape.json").exists()
+
+    def test_invalid_ndjson(self, tmp_path):
+        """Test that malformed NDJSON fails the run"""
+        path = tmp_path / "broken.ndjson"
+        path.write_text('{"content": "ok"}\n[1, 2]\n')
+        with pytest.raises(IngestionError):
+            ingest_bulk(str(path), max_workers=1)
+
+
+class TestDeduplication:
+    @pytest.fixture(autouse=True)
+    def reports_dir(self, tmp_path, monkeypatch):
+        """Redirect reports and the search index into a temporary directory"""
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        monkeypatch.setattr("src.aeth_ingest.REPORTS_DIR", reports)
+        monkeypatch.setenv("AETHERO_TEXT_INDEX_PATH", str(tmp_path / "index.sqlite3"))
+        return reports
+
+    def write_ndjson(self, path, contents):
+        path.write_text("".join(json.dumps({"content": c}) + "\n" for c in contents), encoding="utf-8")
+        return str(path)
+
+    def test_content_hash_normalization(self):
+        """Test that whitespace and line endings do not change the hash"""
+        assert content_hash("line one\r\nline two  \n") == content_hash("  line one\nline two")
+        assert content_hash("line one") != content_hash("line two")
+
+    def test_bulk_skips_duplicates(self, tmp_path, reports_dir):
+        """Test that duplicates within and across runs are not written"""
+        source = self.write_ndjson(tmp_path / "m.ndjson", ["alpha memory", "beta memory", "alpha memory  "])
+        stats = ingest_bulk(source, max_workers=1)
+        assert stats["ingested"] == 2 and stats["duplicate_count"] == 1
+        first = stats["duplicates"][0]["duplicate_of"]
+
+        stats = ingest_bulk(source, max_workers=1)
+        assert stats["ingested"] == 0 and stats["duplicate_count"] == 3
+        assert {d["duplicate_of"] for d in stats["duplicates"]} >= {first}
+        assert len(list(reports_dir.glob("*.md"))) == 2
+
+        assert ingest_bulk(source, max_workers=1, deduplicate=False)["ingested"] == 3
+
+    def test_near_duplicates(self, tmp_path, reports_dir):
+        """Test MinHash near-duplicate detection"""
+        pytest.importorskip("numpy")
+        base = "the ministry archived a long reflection about transparent decisions and memory structures today"
+        source = self.write_ndjson(tmp_path / "m.ndjson", [base, base + " again", "an unrelated note about rivers and gardens in spring"])
+        stats = ingest_bulk(source, max_workers=1, near_threshold=0.7)
+        assert stats["ingested"] == 2 and stats["duplicate_count"] == 1
+
+        index = ContentDedupIndex(near_threshold=0.7)
+        assert index.find_near(index.signature(base + " once more")) is not None
+        assert index.find_near(index.signature("completely different words entirely here")) is None
+
+    def test_rebuild_from_reports(self, tmp_path, reports_dir):
+        """Test that the index can be rebuilt from the report files"""
+        source = self.write_ndjson(tmp_path / "m.ndjson", ["alpha memory", "beta memory"])
+        ingest_bulk(source, max_workers=1)
+        expected = ContentDedupIndex().hashes
+
+        (reports_dir / "content_hashes.tsv").unlink()
+        # Reports saved before deduplication carry no content_hash
+        legacy = reports_dir / next(iter(expected.values()))
+        metadata = json.loads(legacy.with_suffix(".json").read_text())
+        del metadata["content_hash"]
+        legacy.with_suffix(".json").write_text(json.dumps(metadata))
+
+        assert ContentDedupIndex().rebuild() == 2
+        assert ContentDedupIndex().hashes == expected
+        assert ingest_bulk(source, max_workers=1)["duplicate_count"] == 2
+
+
+class TestSegmentStore:
+    @pytest.fixture(autouse=True)
+    def reports_dir(self, tmp_path, monkeypatch):
+        """Redirect reports, the search index and the archive into a temporary directory"""
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        monkeypatch.setattr("src.aeth_ingest.REPORTS_DIR", reports)
+        monkeypatch.setenv("AETHERO_TEXT_INDEX_PATH", str(tmp_path / "index.sqlite3"))
+        monkeypatch.delenv("AETHERO_REPORT_ARCHIVE_DIR", raising=False)
+        return reports
+
+    def test_save_report_to_segments(self, test_content, test_metadata, reports_dir):
+        """Test that the segments store writes no per-report files"""
+        from introspective_parser_module.report_archive import ReportArchive
+        result = save_report(test_content, test_metadata, store="segments")
+        assert result["markdown"] is None and result["archive"].endswith(test_metadata["ref_code"])
+        assert not list(reports_dir.glob("*.md"))
+        with ReportArchive(reports_dir / "archive") as archive:
+            assert archive.get(test_metadata["ref_code"]).content == test_content
+
+    def test_unknown_store(self, test_content, test_metadata):
+        """Test that an unknown store name is rejected"""
+        with pytest.raises(IngestionError):
+            save_report(test_content, test_metadata, store="tape")
+
+    def test_bulk_to_segments_and_rebuild(self, tmp_path, reports_dir):
+        """Test bulk ingestion into the archive and deduplication against it"""
+        from introspective_parser_module.report_archive import ReportArchive
+        source = tmp_path / "m.ndjson"
+        source.write_text("".join(json.dumps({"content": f"archived memory {i}"}) + "\n" for i in range(20)))
+        stats = ingest_bulk(str(source), max_workers=1, batch_size=8, store="segments")
+        assert stats["ingested"] == 20
+        with ReportArchive(reports_dir / "archive") as archive:
+            assert len(archive) == 20
+
+        (reports_dir / "content_hashes.tsv").unlink()
+        assert ContentDedupIndex().rebuild() == 20
+        assert ingest_bulk(str(source), max_workers=1, store="segments")["duplicate_count"] == 20
+
+
+class TestCommandLine:
+    """The script as documented (python aeth_ingest.py ...), outside the test sys.path"""
+    SCRIPT = Path(__file__).resolve().parent.parent / "src" / "aeth_ingest.py"
+
+    @pytest.fixture
+    def run_cli(self, tmp_path):
+        env = {key: value for key, value in os.environ.items()
+               if key not in ("PYTHONPATH", "AETHERO_TEXT_INDEX_PATH") and not key.startswith("AETHERO_REPORT_")}
+
+        def run(*args):
+            result = subprocess.run([sys.executable, str(self.SCRIPT), *args], cwd=tmp_path, env=env,
+                                    capture_output=True, text=True, timeout=120)
+            assert "introspective_parser_module is required" not in result.stderr, result.stderr
+            return result
+        return run
+
+    def test_segments_store_from_script(self, run_cli, tmp_path):
+        """Test --store segments, --compact_archive and --export_archive from the script"""
+        result = run_cli("--text", "Archived from the command line", "--ref_code", "CLI-SEG-1", "--store", "segments")
+        assert result.returncode == 0, result.stderr
+        assert (tmp_path / "aeth_mem_reports" / "archive").is_dir()
+
+        assert run_cli("--compact_archive").returncode == 0
+        assert run_cli("--export_archive", str(tmp_path / "exported")).returncode == 0
+        assert "Archived from the command line" in (tmp_path / "exported" / "CLI-SEG-1.md").read_text()
+
+    def test_saved_reports_are_indexed_from_script(self, run_cli, tmp_path):
+        """Test that single and bulk saves from the script reach the full-text index"""
+        from introspective_parser_module.text_index import CognitiveTextIndex
+        result = run_cli("--text", "Ministerial archives from the command line", "--ref_code", "CLI-IDX-1")
+        assert result.returncode == 0, result.stderr
+        source = tmp_path / "memories.ndjson"
+        source.write_text(json.dumps({"content": "Bulk ministerial archives", "ref_code": "CLI-IDX-2"}) + "\n")
+        result = run_cli("--bulk", str(source), "--workers", "1")
+        assert result.returncode == 0, result.stderr
+        assert "skipping search indexing" not in result.stderr
+
+        index = CognitiveTextIndex(tmp_path / "aeth_mem_reports" / "search_index.sqlite3")
+        hits = sorted(hit.ref for hit in index.search('"ministerial archives"'))
+        index.close()
+        assert hits == ["CLI-IDX-1", "CLI-IDX-2"]
+
+
+
 def test_integration(test_content, test_metadata, temp_template):
     """Test full integration of parse, render, and save"""
     # Parse input
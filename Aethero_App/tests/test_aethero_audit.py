@@ -0,0 +1,96 @@
+"""
+Tests for the streaming git log extraction of the Aethero Audit System
+"""
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+import pytest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+import aethero_audit
+from aethero_audit import AetheroAuditSystem, GIT_FIELD_SEPARATOR as US, GIT_RECORD_SEPARATOR as RS
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def record(subject="Add feature", body="", numstat="", date="2025-06-01T10:00:00+02:00", commit_hash="abc123"):
+    return US.join([commit_hash, "Author | Name", "a@b.c", date, subject, body, "\n" + numstat])
+
+
+def commit(repo, message, author_date):
+    with open(os.path.join(repo, "file.txt"), "a") as handle:
+        handle.write(message + "\n")
+    env = dict(os.environ, GIT_AUTHOR_DATE=author_date.isoformat(), GIT_COMMITTER_DATE=datetime.now().isoformat())
+    subprocess.run(["git", "add", "file.txt"], cwd=repo, check=True)
+    subprocess.run(["git", "-c", "user.name=Test", "-c", "user.email=t@t", "commit", "-q", "-m", message],
+                   cwd=repo, check=True, env=env)
+
+
+@pytest.fixture
+def audit(tmp_path):
+    return AetheroAuditSystem(git_repo_path=str(tmp_path), shell_history_path=str(tmp_path / "history"))
+
+
+class TestGitRecords:
+    def test_records_split_across_chunks(self, monkeypatch):
+        """Records are reassembled when separators fall anywhere in the read chunks"""
+        records = [record(subject=f"commit {i}", body="x" * i) for i in range(20)]
+        stream_text = "".join(RS + text for text in records)
+        for chunk in (1, 3, 7, 64):
+            monkeypatch.setattr(aethero_audit, "GIT_READ_CHUNK", chunk)
+            parsed = [text for text in AetheroAuditSystem._iter_git_records(io.StringIO(stream_text)) if text]
+            assert parsed == records
+
+    def test_parse_subject_with_pipes_and_multiline_body(self):
+        """Pipes in the subject and author and multi-line bodies survive parsing"""
+        parsed = AetheroAuditSystem._parse_git_commit(record(
+            subject="fix | pipe | subject", body="first line\nsecond | line\n"))
+        assert parsed["subject"] == "fix | pipe | subject"
+        assert parsed["author"] == "Author | Name"
+        assert parsed["body"] == "first line\nsecond | line"
+        assert parsed["date"] == datetime(2025, 6, 1, 10, 0)
+
+    def test_parse_numstat(self):
+        """numstat lines add up; binary files count as changed without lines"""
+        parsed = AetheroAuditSystem._parse_git_commit(record(numstat="3\t1\ta.py\n-\t-\timage.png\n10\t0\tb.py\n"))
+        assert parsed["files_changed"] == ["a.py", "image.png", "b.py"]
+        assert (parsed["lines_added"], parsed["lines_removed"]) == (13, 1)
+
+    def test_malformed_record_is_skipped(self):
+        assert AetheroAuditSystem._parse_git_commit("") is None
+        assert AetheroAuditSystem._parse_git_commit(record(date="not a date")) is None
+
+
+@requires_git
+class TestGitStreaming:
+    def test_git_failure_yields_nothing(self, audit, capsys):
+        """A non-zero git exit (not a repository) is reported, not raised"""
+        assert audit.extract_git_development_data() == []
+        assert "Git log extraction failed" in capsys.readouterr().out
+
+    def test_streamed_commits(self, audit, tmp_path):
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        base = datetime.now().replace(microsecond=0) - timedelta(days=1)
+        for minutes in (0, 20, 40):
+            commit(tmp_path, f"feat | step {minutes}", base + timedelta(minutes=minutes))
+        commits = list(audit.iter_git_commits(days_back=7))
+        assert [c["subject"] for c in commits] == ["feat | step 0", "feat | step 20", "feat | step 40"]
+        assert audit.git_commit_count == 3
+        assert all(c["files_changed"] == ["file.txt"] for c in commits)
+
+    def test_out_of_order_author_dates(self, audit, tmp_path):
+        """Streamed sessions match the sorted list even when author dates go back in time"""
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        day = (datetime.now() - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        for hour, minute in ((9, 0), (9, 20), (13, 0), (9, 40), (13, 20)):
+            commit(tmp_path, f"commit {hour}:{minute}", day + timedelta(hours=hour, minutes=minute))
+
+        expected = audit.calculate_development_sessions(audit.extract_git_development_data(7), [])
+        streamed = audit.calculate_development_sessions(audit.iter_git_commits(7), [])
+        assert len(expected) == 1
+        assert streamed == expected
+        assert [c["subject"] for c in streamed[0].commits] == ["commit 9:0", "commit 9:20", "commit 9:40"]
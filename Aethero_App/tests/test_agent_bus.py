@@ -0,0 +1,57 @@
+"""
+Tests for the AgentBus topic histories
+"""
+
+import asyncio
+import importlib
+import json
+import sys
+import pytest
+from src import history
+from src.agents.agent_bus import AgentBus, history_name
+from src.history import HistoryPolicy
+
+
+def test_history_name_is_never_a_path():
+    """Topics with separators or dots become unique, flat file names"""
+    assert history_name("tasks") == "agent_bus_tasks"
+    hostile = ["../../etc/passwd", "a/b", "a\\b", "..", "x" * 200, "tasks/", "úloha"]
+    names = [history_name(topic) for topic in hostile]
+    for name in names:
+        assert "/" not in name and "\\" not in name and ".." not in name
+        assert len(name) < 100
+    assert len(set(names)) == len(names)
+    assert history_name("a/b") != history_name("a_b")
+
+
+def test_spill_stays_in_spill_dir(tmp_path):
+    """Evicted messages of a hostile topic spill into spill_dir"""
+    if not history.BOUNDED_HISTORY_AVAILABLE:
+        pytest.skip("spill to disk needs introspective_parser_module")
+    bus = AgentBus(history_policy=HistoryPolicy(capacity=1, spill_dir=str(tmp_path / "spill")))
+    asyncio.run(bus.publish("../escape", {"n": 1}, {}))
+    asyncio.run(bus.publish("../escape", {"n": 2}, {}))
+
+    spilled = list((tmp_path / "spill").iterdir())
+    assert [path.name for path in spilled] == [history_name("../escape") + ".jsonl"]
+    assert json.loads(spilled[0].read_text())["item"]["content"] == {"n": 1}
+    assert not (tmp_path / "escape.jsonl").exists()
+    assert [m.content for m in bus.get_history("../escape")] == [{"n": 2}]
+
+
+def test_deque_fallback_without_parser_module(monkeypatch):
+    """Without introspective_parser_module the histories fall back to a bounded deque"""
+    monkeypatch.setitem(sys.modules, "introspective_parser_module.bounded_history", None)
+    fallback = importlib.reload(history)
+    try:
+        assert not fallback.BOUNDED_HISTORY_AVAILABLE
+        buffer = fallback.HistoryPolicy(capacity=3).create("topic")
+        for value in range(5):
+            buffer.append(value)
+        assert buffer.latest() == [2, 3, 4]
+        assert buffer.latest(2) == [3, 4]
+        buffer.clear()
+        assert buffer.latest() == []
+    finally:
+        monkeypatch.undo()
+        importlib.reload(history)
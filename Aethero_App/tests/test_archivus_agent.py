@@ -0,0 +1,87 @@
+"""
+Tests for ArchivusAgent on the local memory recall index
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+# conftest puts Aethero_App/src first on sys.path, where `agents` is src/agents
+_spec = importlib.util.spec_from_file_location("archivus_agent", os.path.join(ROOT, "agents", "archivus_agent.py"))
+archivus_agent = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(archivus_agent)
+ArchivusAgent = archivus_agent.ArchivusAgent
+
+
+class FakeBackend:
+    def __init__(self):
+        self.calls = []
+
+    def index(self, data, tags=None):
+        self.calls.append(("index", data))
+
+    def store(self, data, collection=None):
+        self.calls.append(("store", data))
+
+
+def test_recall_module_is_imported_lazily(tmp_path):
+    """Importing the agent or running it on external backends does not load the recall index"""
+    script = (
+        "import sys\n"
+        f"sys.path.insert(0, {ROOT!r})\n"
+        "from agents.archivus_agent import ArchivusAgent\n"
+        "path_before = list(sys.path)\n"
+        "class Backend:\n"
+        "    def index(self, data, tags=None): pass\n"
+        "    def store(self, data, collection=None): pass\n"
+        "agent = ArchivusAgent(chroma=Backend(), llama=Backend())\n"
+        "agent.archive({'content': 'x'})\n"
+        "print('introspective_parser_module' in sys.modules, sys.path == path_before, agent.flush())\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], cwd=tmp_path, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["False", "True", "False"]
+
+
+def test_archive_saves_to_recall_dir(tmp_path, monkeypatch):
+    """Archived memories survive a restart through AETHERO_RECALL_DIR"""
+    pytest.importorskip("numpy")
+    monkeypatch.setenv("AETHERO_RECALL_DIR", str(tmp_path / "recall"))
+    agent = ArchivusAgent()
+    agent.archive({"id": "mem-1", "content": "Konštitúcia Aethera a jej zákony"})
+
+    restarted = ArchivusAgent()
+    assert len(restarted.recall) == 1
+    assert restarted.recall_memories("konštitúcia", k=1)[0]["id"] == "mem-1"
+
+
+def test_flush_saves_batched_archives(tmp_path):
+    """With save_every the index is written every n archives or on flush()"""
+    pytest.importorskip("numpy")
+    directory = tmp_path / "recall"
+    agent = ArchivusAgent(recall_dir=str(directory), save_every=3)
+    agent.archive({"id": "a", "content": "prvá spomienka"})
+    agent.archive({"id": "b", "content": "druhá spomienka"})
+    assert not directory.exists()
+
+    assert agent.flush() is True
+    assert agent.flush() is False
+    assert len(ArchivusAgent(recall_dir=str(directory)).recall) == 2
+
+    # Later archives go to the log - the snapshot is not rewritten
+    vectors = directory / "vectors-1.npy"
+    written = vectors.stat().st_mtime_ns
+    for name in "cde":
+        agent.archive({"id": name, "content": f"spomienka {name}"})
+    assert vectors.stat().st_mtime_ns == written
+    assert len((directory / "recall-1.log").read_text().splitlines()) == 3
+    assert len(ArchivusAgent(recall_dir=str(directory)).recall) == 5
+
+    chroma, llama = FakeBackend(), FakeBackend()
+    external = ArchivusAgent(chroma=chroma, llama=llama, recall_dir=str(directory))
+    external.archive({"id": "c", "content": "externá"})
+    assert external.recall is None and external.flush() is False
+    assert [name for name, _ in chroma.calls + llama.calls] == ["store", "index"]
@@ -20,6 +20,9 @@ from introspective_parser_module.models import (
     TemporalContextEnum, AetheroIntrospectiveEntity
 )
 from introspective_parser_module.metrics import CognitiveMetricsAnalyzer
+from introspective_parser_module.compact_tags import CompactCognitiveTag
+from introspective_parser_module.tag_store import ColumnarTagStore, write_tags_csv
+from introspective_parser_module.text_index import CognitiveTextIndex
 
 class DevelopmentActivityAnalyzer:
     """
@@ -348,6 +351,7 @@ class AetheroASLGenerator:
     """
     Hlavný generátor ASL cognitive tagov pre audit systém
     """
+    TAG_STORE_DIR = "aethero_asl_tag_store"
     
     def __init__(self):
         self.activity_analyzer = DevelopmentActivityAnalyzer()
@@ -362,8 +366,8 @@ class AetheroASLGenerator:
             print(f"[ERROR] Failed to load audit data: {e}")
             return None
     
-    def generate_asl_tags_from_audit(self, audit_data: Dict[str, Any]) -> List[ASLCognitiveTag]:
-        """Generovanie ASL tagov z audit dát"""
+    def generate_asl_tags_from_audit(self, audit_data: Dict[str, Any]) -> List[CompactCognitiveTag]:
+        """Generovanie ASL tagov z audit dát - validované tagy sa držia v kompaktnej forme"""
         asl_tags = []
         
         # Processing development sessions
@@ -400,7 +404,7 @@ class AetheroASLGenerator:
                 asl_tag = self.activity_analyzer.generate_asl_cognitive_tag(
                     commit_data, pattern, current_time
                 )
-                asl_tags.append(asl_tag)
+                asl_tags.append(CompactCognitiveTag.from_model(asl_tag))
                 current_time += activity_interval
             
             # Generovanie command tagov
@@ -417,12 +421,12 @@ class AetheroASLGenerator:
                 asl_tag = self.activity_analyzer.generate_asl_cognitive_tag(
                     command_data, pattern, current_time
                 )
-                asl_tags.append(asl_tag)
+                asl_tags.append(CompactCognitiveTag.from_model(asl_tag))
                 current_time += activity_interval
         
         return asl_tags
     
-    def calculate_cognitive_coherence_metrics(self, asl_tags: List[ASLCognitiveTag]) -> Dict[str, Any]:
+    def calculate_cognitive_coherence_metrics(self, asl_tags: List[CompactCognitiveTag]) -> Dict[str, Any]:
         """Výpočet cognitive coherence metrík"""
         if not asl_tags:
             return {}
@@ -466,9 +470,29 @@ class AetheroASLGenerator:
             }
         }
     
-    def export_asl_tags(self, asl_tags: List[ASLCognitiveTag], 
-                       coherence_metrics: Dict[str, Any]) -> str:
-        """Export ASL tagov do JSON súboru"""
+    def export_asl_tags(self, asl_tags: List[CompactCognitiveTag], 
+                       coherence_metrics: Dict[str, Any],
+                       export_format: str = "json") -> str:
+        """
+        Export ASL tagov - JSON (default), CSV alebo stĺpcové úložisko
+
+        "columnar" appends to the ColumnarTagStore in TAG_STORE_DIR, which
+        the analyzer reads via numpy.memmap without re-parsing the tags, and
+        adds the thought streams to the full-text index.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if export_format == "columnar":
+            store = ColumnarTagStore(self.TAG_STORE_DIR, text_index=CognitiveTextIndex.from_env())
+            store.append(asl_tags)
+            print(f"[ASL] Appended {len(asl_tags)} cognitive tags to: {store.directory} ({len(store)} stored)")
+            return store.directory
+        if export_format == "csv":
+            filename = f"aethero_asl_cognitive_tags_{timestamp}.csv"
+            write_tags_csv(asl_tags, filename)
+            print(f"[ASL] Exported {len(asl_tags)} cognitive tags to: {filename}")
+            return filename
+        if export_format != "json":
+            raise ValueError(f"Unknown export format: {export_format}")
         
         # Konverzia ASL tagov na serializovateľné objekty
         tags_data = []
@@ -505,7 +529,6 @@ class AetheroASLGenerator:
         }
         
         # Zápis súboru
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"aethero_asl_cognitive_tags_{timestamp}.json"
         
         with open(filename, 'w', encoding='utf-8') as f:
@@ -514,7 +537,7 @@ class AetheroASLGenerator:
         print(f"[ASL] Exported {len(asl_tags)} cognitive tags to: {filename}")
         return filename
     
-    def run_asl_generation(self, audit_file: str = None) -> Optional[str]:
+    def run_asl_generation(self, audit_file: str = None, export_format: str = "json") -> Optional[str]:
         """Spustenie celého ASL generation procesu"""
         
         # Hľadanie najnovšieho audit súboru ak nie je špecifikovaný
@@ -547,7 +570,7 @@ class AetheroASLGenerator:
         
         # Export
         print("💾 Exporting ASL cognitive tags...")
-        export_file = self.export_asl_tags(asl_tags, coherence_metrics)
+        export_file = self.export_asl_tags(asl_tags, coherence_metrics, export_format)
         
         # Súhrn
         print("\n" + "="*50)
@@ -566,11 +589,13 @@ def main():
     
     parser = argparse.ArgumentParser(description='Aethero ASL Cognitive Tag Generator')
     parser.add_argument('--audit-file', type=str, help='Specific audit file to process')
+    parser.add_argument('--format', choices=['json', 'csv', 'columnar'], default='json',
+                        help='Export format (columnar appends to the memmap-readable tag store)')
     
     args = parser.parse_args()
     
     generator = AetheroASLGenerator()
-    result = generator.run_asl_generation(args.audit_file)
+    result = generator.run_asl_generation(args.audit_file, args.format)
     
     if result:
         print(f"\n✅ ASL generation completed successfully!")
@@ -7,12 +7,14 @@ Slovak Healthcare Worker Solo Development Efficiency Measurement
 """
 
 import json
+import heapq
 import subprocess
+import tempfile
 import re
 import os
 import sys
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from collections import defaultdict, Counter
@@ -28,6 +30,78 @@ from introspective_parser_module.models import (
     ASLCognitiveTag, MentalStateEnum, EmotionToneEnum, 
     TemporalContextEnum, AetheroIntrospectiveEntity
 )
+from keyword_lexicon import KeywordLexicon
+
+# Kľúčové slová pre klasifikáciu príkazov - jeden lexikón, jeden prechod históriou
+DEV_KEYWORDS = [
+    'git', 'npm', 'pip', 'python', 'node', 'yarn', 'pnpm',
+    'docker', 'kubectl', 'terraform', 'ansible',
+    'vim', 'nvim', 'emacs', 'code', 'subl',
+    'make', 'cmake', 'cargo', 'mvn', 'gradle',
+    'pytest', 'jest', 'mocha', 'cypress',
+    'cd', 'ls', 'find', 'grep', 'cat', 'tail', 'head',
+    'curl', 'wget', 'ssh', 'scp', 'rsync'
+]
+# Kategórie v poradí priority - vyhráva prvá zhoda
+COMMAND_CATEGORIES = {
+    'version_control': ['git commit', 'git push', 'git pull'],
+    'dependency_management': ['npm install', 'pip install', 'yarn add'],
+    'execution': ['python', 'node', 'npm run', 'yarn'],
+    'editing': ['vim', 'nvim', 'code', 'emacs'],
+    'testing': ['test', 'pytest', 'jest', 'mocha'],
+    'infrastructure': ['docker', 'kubectl', 'terraform']
+}
+# Zložitosť príkazu - vyhráva prvý indikátor v poradí
+COMPLEXITY_INDICATORS = {
+    'git rebase': 8.0,
+    'docker-compose': 7.0,
+    'kubectl': 6.0,
+    'terraform': 7.0,
+    'pip install': 3.0,
+    'npm install': 3.0,
+    'git commit': 4.0,
+    'git push': 3.0,
+    'python': 5.0,
+    'vim': 6.0,
+    'grep': 4.0,
+    'find': 5.0
+}
+CATEGORY_ORDER = tuple(f'category:{category}' for category in COMMAND_CATEGORIES)
+COMPLEXITY_ORDER = tuple(f'complexity:{indicator}' for indicator in COMPLEXITY_INDICATORS)
+COMMAND_LEXICON = KeywordLexicon({
+    'dev': DEV_KEYWORDS,
+    **{f'category:{category}': keywords for category, keywords in COMMAND_CATEGORIES.items()},
+    **{f'complexity:{indicator}': [indicator] for indicator in COMPLEXITY_INDICATORS}
+})
+# Koherencia commit-u podľa typu zmeny (poradie = priorita)
+COMMIT_COHERENCE = {
+    'fix': (['fix', 'bug', 'error'], 0.3),  # Problémové riešenie = nižšia koherencia
+    'feature': (['feature', 'add', 'implement'], 0.8),  # Nová funkcionalita = vyššia koherencia
+    'refactor': (['refactor', 'clean', 'optimize'], 0.9)  # Optimalizácia = najvyššia koherencia
+}
+COMMIT_LEXICON = KeywordLexicon({kind: keywords for kind, (keywords, _) in COMMIT_COHERENCE.items()})
+
+# Git log záznam: RS pred každým commit-om, US medzi poľami, za posledným US nasleduje --numstat.
+# Oddeľovače sa v subjekte ani tele commit-u prakticky nevyskytujú (na rozdiel od '|').
+GIT_RECORD_SEPARATOR = '\x1e'
+GIT_FIELD_SEPARATOR = '\x1f'
+GIT_LOG_FORMAT = '%x1e' + '%x1f'.join(['%H', '%an', '%ae', '%aI', '%s', '%b', ''])
+GIT_READ_CHUNK = 64 * 1024
+
+class _OutOfOrderError(Exception):
+    """Prúd aktivít nie je zoradený podľa času"""
+
+
+def _chronological(items: Iterator[Dict[str, Any]], key: str, seen: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Položky v poradí podľa ``key``; každá odovzdaná (aj chybná) skončí v ``seen``"""
+    previous = None
+    for item in items:
+        seen.append(item)
+        if previous is not None and item[key] < previous:
+            raise _OutOfOrderError(key)
+        previous = item[key]
+        yield item
+
 
 @dataclass
 class AetheronUnit:
@@ -77,6 +151,7 @@ class AetheroAuditSystem:
         self.shell_history_path = shell_history_path or os.path.expanduser("~/.zsh_history")
         self.cognitive_analyzer = CognitiveMetricsAnalyzer()
         self.audit_session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.git_commit_count = 0  # Počet commit-ov z posledného iter_git_commits
         
         # Definícia oficiálnej Aetheron jednotky
         self.AETHERON_DEFINITION = {
@@ -94,84 +169,112 @@ class AetheroAuditSystem:
         """
         Extrahovanie dát z git logu za posledné dni
         """
+        return list(self.iter_git_commits(days_back))
+    
+    def iter_git_commits(self, days_back: int = 30) -> Iterator[Dict[str, Any]]:
+        """
+        Streamované čítanie git logu - commit-y od najstaršieho, jeden záznam v pamäti
+        
+        git log beží ako subprocess a jeho výstup sa parsuje priebežne z pipe,
+        takže ani repozitár so 100k+ commit-mi sa nenačíta celý do pamäte.
+        Po vyčerpaní je počet commit-ov v self.git_commit_count.
+        """
         since_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+        # Git log s podrobnými informáciami, podľa času autora od najstaršieho
+        git_cmd = [
+            "git", "log",
+            f"--since={since_date}",
+            f"--pretty=format:{GIT_LOG_FORMAT}",
+            "--author-date-order", "--reverse",
+            "--numstat"
+        ]
         
-        try:
-            # Git log s podrobnými informáciami
-            git_cmd = [
-                "git", "log", 
-                f"--since={since_date}",
-                "--pretty=format:%H|%an|%ae|%ad|%s|%b",
-                "--date=iso",
-                "--numstat"
-            ]
-            
-            result = subprocess.run(
-                git_cmd, 
-                cwd=self.git_repo_path,
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
+        self.git_commit_count = 0
+        with tempfile.TemporaryFile() as stderr:
+            try:
+                process = subprocess.Popen(
+                    git_cmd,
+                    cwd=self.git_repo_path,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
+                    text=True,
+                    encoding='utf-8',
+                    errors='replace'
+                )
+            except OSError as e:
+                print(f"[ERROR] Git log extraction failed: {e}")
+                return
             
-            commits = self._parse_git_log_output(result.stdout)
-            print(f"[AUDIT] Extrahovaných {len(commits)} commit-ov za posledných {days_back} dní")
-            return commits
+            try:
+                for record in self._iter_git_records(process.stdout):
+                    commit = self._parse_git_commit(record)
+                    if commit:
+                        self.git_commit_count += 1
+                        yield commit
+            finally:
+                # Predčasne ukončený odber (break, výnimka) nesmie nechať git bežať
+                if process.poll() is None:
+                    process.kill()
+                process.stdout.close()
+                returncode = process.wait()
             
-        except subprocess.CalledProcessError as e:
-            print(f"[ERROR] Git log extraction failed: {e}")
-            return []
+            if returncode != 0:
+                stderr.seek(0)
+                message = stderr.read().decode('utf-8', errors='replace').strip()
+                print(f"[ERROR] Git log extraction failed ({returncode}): {message}")
+                return
+        
+        print(f"[AUDIT] Extrahovaných {self.git_commit_count} commit-ov za posledných {days_back} dní")
     
-    def _parse_git_log_output(self, git_output: str) -> List[Dict[str, Any]]:
-        """Parsovanie výstupu git log"""
-        commits = []
-        lines = git_output.strip().split('\n')
-        
-        current_commit = None
-        for line in lines:
-            if '|' in line and len(line.split('|')) == 6:
-                # Nový commit
-                if current_commit:
-                    commits.append(current_commit)
-                
-                parts = line.split('|')
-                # Parse date properly handling timezone
-                date_str = parts[3].replace(' +0100', '').replace(' +0200', '')
-                if '+' in date_str:
-                    date_str = date_str.split('+')[0]
-                try:
-                    commit_date = datetime.fromisoformat(date_str)
-                except:
-                    # Fallback parsing
-                    from dateutil import parser
-                    commit_date = parser.parse(parts[3]).replace(tzinfo=None)
-                
-                current_commit = {
-                    'hash': parts[0],
-                    'author': parts[1],
-                    'email': parts[2],
-                    'date': commit_date,
-                    'subject': parts[4],
-                    'body': parts[5],
-                    'files_changed': [],
-                    'lines_added': 0,
-                    'lines_removed': 0
-                }
-            elif current_commit and '\t' in line:
-                # Štatistiky súborov
-                parts = line.split('\t')
-                if len(parts) == 3:
-                    added, removed, filename = parts
-                    current_commit['files_changed'].append(filename)
-                    if added.isdigit():
-                        current_commit['lines_added'] += int(added)
-                    if removed.isdigit():
-                        current_commit['lines_removed'] += int(removed)
-        
-        if current_commit:
-            commits.append(current_commit)
-            
-        return commits
+    @staticmethod
+    def _iter_git_records(stream) -> Iterator[str]:
+        """Záznamy oddelené GIT_RECORD_SEPARATOR, čítané po blokoch z pipe"""
+        pending = []
+        for chunk in iter(lambda: stream.read(GIT_READ_CHUNK), ''):
+            parts = chunk.split(GIT_RECORD_SEPARATOR)
+            pending.append(parts[0])
+            if len(parts) == 1:
+                continue
+            yield ''.join(pending)
+            yield from parts[1:-1]
+            pending = [parts[-1]]
+        yield ''.join(pending)
+    
+    @staticmethod
+    def _parse_git_commit(record: str) -> Optional[Dict[str, Any]]:
+        """Parsovanie jedného git log záznamu (hlavička + --numstat riadky)"""
+        fields = record.split(GIT_FIELD_SEPARATOR, 6)
+        if len(fields) != 7:
+            return None
+        commit_hash, author, email, date, subject, body, numstat = fields
+        try:
+            # Miestny čas autora bez časovej zóny
+            commit_date = datetime.fromisoformat(date).replace(tzinfo=None)
+        except ValueError:
+            return None
+        
+        commit = {
+            'hash': commit_hash.strip(),
+            'author': author,
+            'email': email,
+            'date': commit_date,
+            'subject': subject,
+            'body': body.strip(),
+            'files_changed': [],
+            'lines_added': 0,
+            'lines_removed': 0
+        }
+        # Štatistiky súborov
+        for line in numstat.split('\n'):
+            parts = line.split('\t')
+            if len(parts) == 3:
+                added, removed, filename = parts
+                commit['files_changed'].append(filename)
+                if added.isdigit():
+                    commit['lines_added'] += int(added)
+                if removed.isdigit():
+                    commit['lines_removed'] += int(removed)
+        return commit
     
     def extract_shell_development_commands(self, days_back: int = 30) -> List[Dict[str, Any]]:
         """
@@ -185,6 +288,7 @@ class AetheroAuditSystem:
         commands = []
         
         try:
+            entries = []
             with open(self.shell_history_path, 'r', encoding='utf-8', errors='ignore') as f:
                 for line in f:
                     line = line.strip()
@@ -193,16 +297,19 @@ class AetheroAuditSystem:
                         match = re.match(r': (\d+):\d+;(.+)', line)
                         if match:
                             timestamp = int(match.group(1))
-                            command = match.group(2)
-                            
                             if timestamp >= since_timestamp:
-                                if self._is_development_command(command):
-                                    commands.append({
-                                        'timestamp': datetime.fromtimestamp(timestamp),
-                                        'command': command,
-                                        'category': self._categorize_command(command),
-                                        'complexity_score': self._assess_command_complexity(command)
-                                    })
+                                entries.append((timestamp, match.group(2)))
+            
+            # Všetky príkazy jedným prechodom lexikónu
+            matches = COMMAND_LEXICON.terms_many([command for _, command in entries])
+            for (timestamp, command), hits in zip(entries, matches):
+                if self._is_development_command(command, hits):
+                    commands.append({
+                        'timestamp': datetime.fromtimestamp(timestamp),
+                        'command': command,
+                        'category': self._categorize_command(command, hits),
+                        'complexity_score': self._assess_command_complexity(command, hits)
+                    })
             
             print(f"[AUDIT] Extrahovaných {len(commands)} vývojových príkazov")
             return sorted(commands, key=lambda x: x['timestamp'])
@@ -211,86 +318,67 @@ class AetheroAuditSystem:
             print(f"[ERROR] Shell history parsing failed: {e}")
             return []
     
-    def _is_development_command(self, command: str) -> bool:
+    def _is_development_command(self, command: str, hits: Optional[Dict[str, Set[str]]] = None) -> bool:
         """Identifikácia, či príkaz súvisí s vývojom"""
-        dev_keywords = [
-            'git', 'npm', 'pip', 'python', 'node', 'yarn', 'pnpm',
-            'docker', 'kubectl', 'terraform', 'ansible',
-            'vim', 'nvim', 'emacs', 'code', 'subl',
-            'make', 'cmake', 'cargo', 'mvn', 'gradle',
-            'pytest', 'jest', 'mocha', 'cypress',
-            'cd', 'ls', 'find', 'grep', 'cat', 'tail', 'head',
-            'curl', 'wget', 'ssh', 'scp', 'rsync'
-        ]
-        
-        return any(keyword in command.lower() for keyword in dev_keywords)
+        hits = COMMAND_LEXICON.terms_in(command) if hits is None else hits
+        return 'dev' in hits
     
-    def _categorize_command(self, command: str) -> str:
+    def _categorize_command(self, command: str, hits: Optional[Dict[str, Set[str]]] = None) -> str:
         """Kategorizácia vývojového príkazu"""
-        if any(kw in command.lower() for kw in ['git commit', 'git push', 'git pull']):
-            return 'version_control'
-        elif any(kw in command.lower() for kw in ['npm install', 'pip install', 'yarn add']):
-            return 'dependency_management'
-        elif any(kw in command.lower() for kw in ['python', 'node', 'npm run', 'yarn']):
-            return 'execution'
-        elif any(kw in command.lower() for kw in ['vim', 'nvim', 'code', 'emacs']):
-            return 'editing'
-        elif any(kw in command.lower() for kw in ['test', 'pytest', 'jest', 'mocha']):
-            return 'testing'
-        elif any(kw in command.lower() for kw in ['docker', 'kubectl', 'terraform']):
-            return 'infrastructure'
-        else:
-            return 'general'
+        hits = COMMAND_LEXICON.terms_in(command) if hits is None else hits
+        category = COMMAND_LEXICON.first_category(hits, CATEGORY_ORDER)
+        return category.split(':', 1)[1] if category else 'general'
     
-    def _assess_command_complexity(self, command: str) -> float:
+    def _assess_command_complexity(self, command: str, hits: Optional[Dict[str, Set[str]]] = None) -> float:
         """Hodnotenie zložitosti príkazu (1.0 - 10.0)"""
-        complexity_indicators = {
-            'git rebase': 8.0,
-            'docker-compose': 7.0,
-            'kubectl': 6.0,
-            'terraform': 7.0,
-            'pip install': 3.0,
-            'npm install': 3.0,
-            'git commit': 4.0,
-            'git push': 3.0,
-            'python': 5.0,
-            'vim': 6.0,
-            'grep': 4.0,
-            'find': 5.0
-        }
-        
-        for indicator, score in complexity_indicators.items():
-            if indicator in command.lower():
-                # Úprava skóre podľa dĺžky príkazu
-                length_multiplier = min(1.5, len(command) / 50)
-                return min(10.0, score * length_multiplier)
+        hits = COMMAND_LEXICON.terms_in(command) if hits is None else hits
+        indicator = COMMAND_LEXICON.first_category(hits, COMPLEXITY_ORDER)
+        if indicator:
+            # Úprava skóre podľa dĺžky príkazu
+            length_multiplier = min(1.5, len(command) / 50)
+            return min(10.0, COMPLEXITY_INDICATORS[indicator.split(':', 1)[1]] * length_multiplier)
         
         return 3.0  # Základné skóre pre nerozpoznané príkazy
     
-    def calculate_development_sessions(self, commits: List[Dict], commands: List[Dict]) -> List[DevelopmentSession]:
+    def calculate_development_sessions(self, commits: Iterable[Dict], commands: Iterable[Dict]) -> List[DevelopmentSession]:
         """
         Identifikácia a analýza vývojových relácií
         Relácia = kontinuálny blok vývojovej aktivity
         """
         sessions = []
-        all_activities = []
-        
-        # Zlúčenie commit-ov a príkazov do časovej osi
-        for commit in commits:
-            all_activities.append({
-                'timestamp': commit['date'],
-                'type': 'commit',
-                'data': commit
-            })
         
-        for command in commands:
-            all_activities.append({
-                'timestamp': command['timestamp'],
-                'type': 'command',
-                'data': command
-            })
+        # Zoznamy sa zoradia; iterátory (iter_git_commits) sa zlučujú priebežne
+        if isinstance(commits, list):
+            commits = sorted(commits, key=lambda commit: commit['date'])
+        if isinstance(commands, list):
+            commands = sorted(commands, key=lambda command: command['timestamp'])
+        commits, commands = iter(commits), iter(commands)
+        
+        # Zlúčenie commit-ov a príkazov do časovej osi - priebežne, bez materializácie.
+        # git log --author-date-order nezaručuje poradie podľa dátumu autora (rebase,
+        # cherry-pick, časové zóny), preto sa poradie kontroluje; odovzdané položky
+        # sa pamätajú iba ako referencie pre prípadný návrat k zoradeniu.
+        seen_commits, seen_commands = [], []
+        all_activities = heapq.merge(
+            ({'timestamp': commit['date'], 'type': 'commit', 'data': commit}
+             for commit in _chronological(commits, 'date', seen_commits)),
+            ({'timestamp': command['timestamp'], 'type': 'command', 'data': command}
+             for command in _chronological(commands, 'timestamp', seen_commands)),
+            key=lambda x: x['timestamp']
+        )
         
-        all_activities.sort(key=lambda x: x['timestamp'])
+        try:
+            sessions = self._detect_sessions(all_activities)
+        except _OutOfOrderError:
+            print("[AUDIT] Aktivity mimo časového poradia - relácie sa počítajú zo zoradeného zoznamu")
+            return self.calculate_development_sessions(seen_commits + list(commits), seen_commands + list(commands))
+        
+        print(f"[AUDIT] Identifikovaných {len(sessions)} vývojových relácií")
+        return sessions
+    
+    def _detect_sessions(self, all_activities: Iterable[Dict[str, Any]]) -> List[DevelopmentSession]:
+        """Relácie z chronologického prúdu aktivít"""
+        sessions = []
         
         # Identifikácia relácií (gap viac ako 2 hodiny = nová relácia)
         session_gap_threshold = timedelta(hours=2)
@@ -317,7 +405,6 @@ class AetheroAuditSystem:
             session = self._create_development_session(current_session_activities)
             sessions.append(session)
         
-        print(f"[AUDIT] Identifikovaných {len(sessions)} vývojových relácií")
         return sessions
     
     def _create_development_session(self, activities: List[Dict]) -> DevelopmentSession:
@@ -367,18 +454,9 @@ class AetheroAuditSystem:
         Integrácia s existujúcim ASL systémom
         """
         # Analýza vzorcov v commit správach
-        commit_complexity = []
-        for commit in commits:
-            subject = commit.get('subject', '')
-            # Hodnotenie na základe ASL kritérií
-            if any(word in subject.lower() for word in ['fix', 'bug', 'error']):
-                commit_complexity.append(0.3)  # Problémové riešenie = nižšia koherencia
-            elif any(word in subject.lower() for word in ['feature', 'add', 'implement']):
-                commit_complexity.append(0.8)  # Nová funkcionalita = vyššia koherencia
-            elif any(word in subject.lower() for word in ['refactor', 'clean', 'optimize']):
-                commit_complexity.append(0.9)  # Optimalizácia = najvyššia koherencia
-            else:
-                commit_complexity.append(0.5)
+        # Hodnotenie na základe ASL kritérií - všetky subjekty jedným prechodom
+        kinds = COMMIT_LEXICON.classify_many([commit.get('subject', '') for commit in commits])
+        commit_complexity = [COMMIT_COHERENCE[kind][1] if kind else 0.5 for kind in kinds]
         
         # Analýza diverzity príkazov
         command_categories = [cmd.get('category', 'general') for cmd in commands]
@@ -573,7 +651,7 @@ class AetheroAuditSystem:
         
         # 1. Extrahovanie git dát
         print("📊 Extrakcia git commit histórie...")
-        commits = self.extract_git_development_data(days_back)
+        commits = self.iter_git_commits(days_back)  # číta sa až počas kalkulácie relácií
         
         # 2. Extrahovanie shell dát
         print("💻 Extrakcia shell command histórie...")
@@ -596,7 +674,7 @@ class AetheroAuditSystem:
         print(f"\n✅ AUDIT DOKONČENÝ")
         print(f"📈 Celkovo vygenerovaných: {total_aetherony:.2f} Aetheron jednotiek")
         print(f"🕐 Počet vývojových relácií: {len(sessions)}")
-        print(f"📝 Analyzovaných commit-ov: {len(commits)}")
+        print(f"📝 Analyzovaných commit-ov: {self.git_commit_count}")
         print(f"💻 Analyzovaných príkazov: {len(commands)}")
         print(f"\n📁 Súbory:")
         print(f"   JSON: {file_paths['json_file']}")
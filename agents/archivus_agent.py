@@ -1,14 +1,46 @@
 # AETH-TASK-006 :: ROLE: Archivus :: GOAL: Archive and audit data
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+import os
+import sys
+
+if TYPE_CHECKING:
+    from introspective_parser_module.memory_recall import MemoryRecallIndex
 # [INTENT: Archive data]
-# [ACTION: Store in ChromaDB and LlamaIndex, tag with ASL]
+# [ACTION: Store in ChromaDB and LlamaIndex (or the local recall index), tag with ASL]
 # [OUTPUT: JSON/CSV exports]
 # [HOOK: archivus_log_archivus]
 
+
+def _recall_index_class():
+    """MemoryRecallIndex from Aethero_App - imported only when the local index is needed"""
+    try:
+        from introspective_parser_module.memory_recall import MemoryRecallIndex
+    except ImportError:
+        app_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Aethero_App'))
+        if app_dir not in sys.path:
+            sys.path.append(app_dir)
+        from introspective_parser_module.memory_recall import MemoryRecallIndex
+    return MemoryRecallIndex
+
+
 class ArchivusAgent:
-    def __init__(self, chroma, llama):
-        self.chroma = chroma
-        self.llama = llama
+    def __init__(self, chroma=None, llama=None, recall: Optional["MemoryRecallIndex"] = None,
+                 recall_dir: Optional[str] = None, save_every: Optional[int] = None):
+        # The local index is loaded from recall_dir (default AETHERO_RECALL_DIR); every `save_every`
+        # archives and on flush() new memories are appended to its log, not rewritten in full
+        self.recall_dir = recall_dir or os.environ.get("AETHERO_RECALL_DIR")
+        # Without external backends both roles fall back to the offline recall index
+        if (chroma is None or llama is None) and recall is None:
+            index_class = _recall_index_class()
+            if self.recall_dir and os.path.exists(os.path.join(self.recall_dir, "recall.json")):
+                recall = index_class.load(self.recall_dir)
+            else:
+                recall = index_class.from_env()
+        self.recall = recall
+        self.chroma = chroma if chroma is not None else recall
+        self.llama = llama if llama is not None else recall
+        self.save_every = max(1, save_every or int(os.environ.get("AETHERO_RECALL_SAVE_EVERY", "1")))
+        self._unsaved = 0
 
     def archive(self, data: Dict[str, Any]) -> Dict[str, Any]:
         asl_tags = {
@@ -17,10 +49,27 @@ class ArchivusAgent:
         }
         self.llama.index(data, tags=asl_tags)
         self.chroma.store(data, collection="aethero_memory")
+        self._unsaved += 1
+        if self._unsaved >= self.save_every:
+            self.flush()
         return {
             "module": "archivus",
             "action": "archive",
             "purpose": "Store and audit data",
             "inputs": [data],
             "outputs": ["JSON/CSV exports"]
-        }
\ No newline at end of file
+        }
+
+    def flush(self) -> bool:
+        """Persist unsaved archives of the local recall index to recall_dir; True if it was written"""
+        if self.recall is None or not self.recall_dir or not self._unsaved:
+            return False
+        self.recall.flush(self.recall_dir)
+        self._unsaved = 0
+        return True
+
+    def recall_memories(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
+        """Top-k archived memories for a query from the local recall index"""
+        if self.recall is None:
+            raise RuntimeError("ArchivusAgent runs on external backends - no local recall index")
+        return [hit._asdict() for hit in self.recall.search(query, k=k)]